@@ -0,0 +1,180 @@
+# batch_pricing.py
+"""
+Çok sayıda siparişin toplamını, tür ayarlamasını, kargo kademesini ve kargo ücretini
+sütunlu veri üzerinde tek geçişte hesaplayan toplu fiyatlama motoru.
+
+Gece yeniden fiyatlama ve teklif işleri için tasarlanmıştır; sonuçlar nesne tabanlı yol
+(Order.calculate_total, choose_optimal_shipping_strategy, BaseOrder.get_total_cost) ile
+birebir aynıdır. NumPy kuruluysa tür ayarlaması ve kargo hesabı vektörel yapılır,
+değilse aynı hesap saf Python ile yapılır. Kargo kademeleri ShippingRegistry'deki geçerli
+tablodan, tür ayarlamaları PricingRegistry'deki geçerli plandan okunur. Plan satır, müşteri
+veya adet koşullu kurallar içeriyorsa (sütunlarda bu bilgiler yoktur) price_batch ValueError
+fırlatır.
+"""
+from array import array
+from operator import mul
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from order_factory import OrderFactory
+from pricing_rules import PricingPlan, PricingRegistry
+from shipping_registry import ShippingRegistry, ShippingTierTable, load_numpy
+
+
+class OrderBatch:
+    """
+    Siparişlerin sütunlu (CSR benzeri) gösterimi.
+    i. siparişin satırları prices/quantities dizilerinde offsets[i]:offsets[i + 1] aralığındadır.
+    Sipariş türleri, batch'e ilk eklenme sırasıyla verilen kodlarla tutulur (type_names[kod]).
+    """
+    def __init__(self):
+        self.order_ids: List[str] = []
+        self.type_names: List[str] = [] # {kod: Order.get_type() değeri}
+        self._type_codes: Dict[str, int] = {} # {Order.get_type() değeri: kod}
+        self.type_codes = array("H")
+        self.offsets = array("q", [0])
+        self.prices = array("d")
+        self.quantities = array("q")
+
+    def add(self, order_id: str, order_type: str, lines: Sequence[Tuple[float, int]]):
+        """
+        Toplu hesaba bir sipariş ekler.
+
+        Args:
+            order_id (str): Sipariş ID'si.
+            order_type (str): Order.get_type() değeri (Standard, Express, ... veya register_order_type
+                ile sınıfıyla kaydedilen bir türün değeri).
+            lines: (birim fiyat, adet) çiftleri.
+        """
+        code = self._type_codes.get(order_type)
+        if code is None:
+            if OrderFactory.order_class(order_type) is None:
+                raise ValueError(f"Geçersiz sipariş türü: '{order_type}'. "
+                                 f"Desteklenen türler: {', '.join(OrderFactory.type_names())}.")
+            code = self._type_codes[order_type] = len(self.type_names)
+            self.type_names.append(order_type)
+        self.order_ids.append(order_id)
+        self.type_codes.append(code)
+        for price, quantity in lines:
+            self.prices.append(price)
+            self.quantities.append(quantity)
+        self.offsets.append(len(self.prices))
+
+    @classmethod
+    def from_orders(cls, orders) -> "OrderBatch":
+        """
+        Mevcut Order (veya dekore edilmiş sipariş) nesnelerinden toplu hesap verisi oluşturur.
+        """
+        batch = cls()
+        for order in orders:
+            batch.add(order.order_id, order.get_type(), [(product.price, qty) for product, qty in order.products])
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.type_codes)
+
+
+class BatchPricingResult:
+    """
+    Toplu fiyatlama sonuçları. Her sütunun i. elemanı batch'teki i. siparişe aittir.
+    """
+    def __init__(self, order_ids: List[str], base_totals, totals, shipping_tiers, shipping_costs, total_costs,
+                 tier_table: ShippingTierTable):
+        self.order_ids = order_ids
+        self.base_totals = base_totals # Ürünlerin fiyat * adet toplamı
+        self.totals = totals # Tür ayarlaması sonrası toplam (Order.total)
+        self.shipping_tiers = shipping_tiers # tier_table içindeki kademe indeksi
+        self.shipping_costs = shipping_costs
+        self.total_costs = total_costs # Kargo dahil toplam (BaseOrder.get_total_cost)
+        self.tier_table = tier_table # Fiyatlamada kullanılan kademe tablosu
+
+    def shipping_name(self, index: int) -> str:
+        """
+        i. siparişe seçilen kargo stratejisinin adını döndürür.
+        """
+        return self.tier_table.strategies[int(self.shipping_tiers[index])].get_name()
+
+    def __len__(self) -> int:
+        return len(self.order_ids)
+
+
+def _base_totals(batch: OrderBatch) -> List[float]:
+    """
+    Her siparişin ürün toplamını hesaplar. Toplama, Order.calculate_total ile aynı sırada
+    ve aynı sum() çağrısıyla yapılır; böylece kayan nokta sonuçları bit düzeyinde eşleşir.
+    """
+    prices, quantities, offsets = batch.prices, batch.quantities, batch.offsets
+    return [sum(map(mul, prices[start:end], quantities[start:end]))
+            for start, end in zip(offsets, offsets[1:])]
+
+
+def _type_adjustments(batch: OrderBatch, plan: PricingPlan) -> List[tuple]:
+    """
+    Tür kodu sırasıyla batch'teki her sipariş türünün (subtotal_over, çarpan, tutar) ayarlamaları.
+    """
+    return [plan.type_adjustments(order_type) for order_type in batch.type_names]
+
+
+def _price_python(batch: OrderBatch, base_totals: List[float], tier_table: ShippingTierTable, plan: PricingPlan):
+    totals = array("d")
+    adjustments = _type_adjustments(batch, plan)
+
+    for code, base in zip(batch.type_codes, base_totals):
+        total = base
+        for threshold, multiplier, amount in adjustments[code]: # PricingPlan.order_total ile aynı sıra ve işlemler
+            if threshold is None or base > threshold:
+                total = total * multiplier + amount if amount else total * multiplier
+        totals.append(total if total > 0 else 0.0)
+
+    tiers, shipping = tier_table.quote_many(totals, use_numpy=False)
+    shipping_costs = array("d", shipping)
+    total_costs = array("d", map(float.__add__, totals, shipping_costs))
+    return totals, array("i", tiers), shipping_costs, total_costs
+
+
+def _price_numpy(batch: OrderBatch, base_totals: List[float], tier_table: ShippingTierTable, plan: PricingPlan):
+    np = load_numpy()
+    base = np.asarray(base_totals, dtype=np.float64)
+    codes = np.frombuffer(batch.type_codes, dtype=np.uint16)
+
+    totals = base.copy()
+    for code, adjustments in enumerate(_type_adjustments(batch, plan)):
+        if not adjustments:
+            continue
+        selected = codes == code
+        for threshold, multiplier, amount in adjustments:
+            mask = selected if threshold is None else selected & (base > threshold)
+            totals[mask] = totals[mask] * multiplier + amount if amount else totals[mask] * multiplier
+    np.maximum(totals, 0.0, out=totals)
+
+    tiers, shipping_costs = tier_table.quote_many(totals)
+    shipping_costs = np.asarray(shipping_costs, dtype=np.float64)
+    return totals, np.asarray(tiers), shipping_costs, totals + shipping_costs
+
+
+def price_batch(batch: OrderBatch, use_numpy: Optional[bool] = None) -> BatchPricingResult:
+    """
+    Batch'teki tüm siparişlerin toplamlarını ve kargo ücretlerini hesaplar.
+
+    Args:
+        batch (OrderBatch): Fiyatlanacak siparişler.
+        use_numpy (bool | None): None ise NumPy kuruluysa kullanılır. True verilip NumPy
+            kurulu değilse ImportError fırlatılır.
+
+    Returns:
+        BatchPricingResult: Sütunlu sonuçlar.
+    """
+    if use_numpy is not False and load_numpy() is None:
+        if use_numpy:
+            raise ImportError("NumPy kurulu değil; use_numpy=False ile saf Python yolu kullanılabilir.")
+        use_numpy = False
+    elif use_numpy is None:
+        use_numpy = True
+
+    tier_table = ShippingRegistry.get_instance().table
+    plan = PricingRegistry.get_instance().plan
+    base_totals = _base_totals(batch)
+    if use_numpy:
+        totals, tiers, shipping_costs, total_costs = _price_numpy(batch, base_totals, tier_table, plan)
+    else:
+        totals, tiers, shipping_costs, total_costs = _price_python(batch, base_totals, tier_table, plan)
+    return BatchPricingResult(batch.order_ids, base_totals, totals, tiers, shipping_costs, total_costs, tier_table)
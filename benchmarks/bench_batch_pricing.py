@@ -0,0 +1,95 @@
+# benchmarks/bench_batch_pricing.py
+"""
+Nesne tabanlı sipariş fiyatlaması ile batch_pricing.price_batch'i karşılaştırır ve
+sonuçların birebir aynı olduğunu doğrular.
+
+Kullanım:
+    python benchmarks/bench_batch_pricing.py --orders 200000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_pricing import OrderBatch, price_batch
+from customer import Customer
+from order import Order, ExpressOrder, SubscriptionOrder, PreOrder, GiftOrder, BulkOrder
+from order_decorator import BaseOrder
+from product import PhysicalProduct
+from shipping_registry import load_numpy
+from shipping_selector import choose_optimal_shipping_strategy
+
+ORDER_CLASSES = [Order, ExpressOrder, SubscriptionOrder, BulkOrder, PreOrder, GiftOrder]
+
+
+def make_orders(order_count: int, seed: int):
+    """
+    Rastgele fiyatlı ürünlerden 1-5 satırlı sentetik siparişler üretir.
+    """
+    rng = random.Random(seed)
+    customer = Customer("c-1", "Test Müşteri", "test@example.com")
+    products = [PhysicalProduct(i, f"Ürün {i}", "Kırtasiye", round(rng.uniform(1, 900), 2), 10**9) for i in range(1, 1001)]
+    orders = []
+    for i in range(order_count):
+        cls = rng.choice(ORDER_CLASSES)
+        lines = [(rng.choice(products), rng.randint(1, 4)) for _ in range(rng.randint(1, 5))]
+        if cls is PreOrder:
+            order = cls(f"o-{i}", customer, lines, "2026-12-31")
+        elif cls is GiftOrder:
+            order = cls(f"o-{i}", customer, lines, "not")
+        else:
+            order = cls(f"o-{i}", customer, lines)
+        orders.append(order)
+    return orders
+
+
+def price_objects(orders):
+    """
+    Nesne tabanlı yol: her sipariş için toplam, kargo seçimi ve toplam maliyet.
+    """
+    results = []
+    for order in orders:
+        order.total = order.calculate_total()
+        strategy = choose_optimal_shipping_strategy(order, verbose=False)
+        order.set_shipping_strategy(strategy)
+        results.append((order.total, strategy.get_name(), order.get_shipping_cost(), BaseOrder(order).get_total_cost()))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Toplu fiyatlama karşılaştırması")
+    parser.add_argument("--orders", type=int, default=200_000, help="Sipariş sayısı")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    orders = make_orders(args.orders, args.seed)
+    batch = OrderBatch.from_orders(orders)
+
+    start = time.perf_counter()
+    expected = price_objects(orders)
+    object_seconds = time.perf_counter() - start
+    print(f"Nesne tabanlı yol     : {object_seconds:8.3f} sn ({args.orders / object_seconds:>12,.0f} sipariş/sn)")
+
+    modes = [False] + ([True] if load_numpy() is not None else [])
+    for use_numpy in modes:
+        start = time.perf_counter()
+        result = price_batch(batch, use_numpy=use_numpy)
+        seconds = time.perf_counter() - start
+        label = "price_batch (NumPy)" if use_numpy else "price_batch (Python)"
+        print(f"{label:<22}: {seconds:8.3f} sn ({args.orders / seconds:>12,.0f} sipariş/sn) "
+              f"| hızlanma x{object_seconds / seconds:.1f}")
+
+        for i, (total, name, shipping, total_cost) in enumerate(expected):
+            assert result.totals[i] == total, f"{i}. sipariş toplamı farklı"
+            assert result.shipping_name(i) == name, f"{i}. sipariş kargo kademesi farklı"
+            assert result.shipping_costs[i] == shipping, f"{i}. sipariş kargo ücreti farklı"
+            assert result.total_costs[i] == total_cost, f"{i}. sipariş toplam maliyeti farklı"
+    print("Tüm sonuçlar nesne tabanlı yol ile birebir aynı.")
+
+
+if __name__ == "__main__":
+    main()
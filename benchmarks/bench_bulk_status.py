@@ -0,0 +1,124 @@
+# benchmarks/bench_bulk_status.py
+"""
+Depodan binlerce siparişin aynı anda "Kargoya Verildi" yapılmasını ölçer:
+
+- "Önce": update_order_status'taki gibi sipariş başına registry.get_order + update_status;
+  her sipariş için ayrı bildirim ve ayrı indeks güncellemesi.
+- "Sonra": CustomerOrderRegistry.transition_orders; geçişler tek geçişte doğrulanıp uygulanır,
+  indeksler ve satış toplamları tek çağrıda güncellenir, her müşteri tek bildirim alır.
+
+Müşteri bildirimleri os.devnull'a yazdırılır; gönderilen bildirim sayısı ayrıca sayılır.
+Siparişlerin --invalid oranı geçişe izin vermeyen bir durumdadır (örn. iptal edilmiş).
+
+Kullanım:
+    python benchmarks/bench_bulk_status.py --orders 100000 --customers 5000 --batch 5000
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from customer_order_registry import CustomerOrderRegistry
+from order import Order, OrderStatus
+from order_decorator import BaseOrder
+from product import PhysicalProduct
+from sales_aggregates import SalesAggregates
+
+
+class CountingCustomer(Customer):
+    """
+    Gönderdiği bildirimleri sayan müşteri.
+    """
+    __slots__ = ()
+    notifications = 0
+
+    def update(self, order):
+        CountingCustomer.notifications += 1
+        super().update(order)
+
+    def update_many(self, orders):
+        if len(orders) == 1:
+            self.update(orders[0])
+            return
+        CountingCustomer.notifications += 1
+        super().update_many(orders)
+
+
+def build(order_count: int, customer_count: int, invalid: float, seed: int):
+    """
+    Kayıt defterini ve satış toplamlarını sıfırlayıp siparişleri kaydeder; sipariş ID'lerini döndürür.
+    """
+    rng = random.Random(seed)
+    registry = CustomerOrderRegistry.get_instance()
+    registry.clear()
+    SalesAggregates.get_instance().clear()
+    products = [PhysicalProduct(i, f"Ürün {i}", "Kırtasiye", 10.0 + i % 50, 10**6) for i in range(1, 501)]
+    customers = [CountingCustomer(f"c-{i}", f"Müşteri {i}", f"m{i}@example.com") for i in range(customer_count)]
+    orders = []
+    for i in range(order_count):
+        order = Order(f"o-{i}", rng.choice(customers), [(rng.choice(products), rng.randint(1, 3))])
+        if rng.random() < invalid:
+            order.status = OrderStatus.CANCELLED
+        registry.add_order(BaseOrder(order))
+        orders.append(order)
+    SalesAggregates.get_instance().record_orders(orders)
+    order_ids = [order.order_id for order in orders]
+    rng.shuffle(order_ids) # Depo listesi müşteriye göre sıralı değildir
+    return registry, order_ids
+
+
+def per_order(registry: CustomerOrderRegistry, order_ids, batch: int) -> int:
+    updated = 0
+    for offset in range(0, len(order_ids), batch):
+        for order_id in order_ids[offset:offset + batch]:
+            order = registry.get_order(order_id)
+            try:
+                order.update_status(OrderStatus.SHIPPED)
+                updated += 1
+            except ValueError:
+                pass
+    return updated
+
+
+def bulk(registry: CustomerOrderRegistry, order_ids, batch: int) -> int:
+    updated = 0
+    for offset in range(0, len(order_ids), batch):
+        updated += len(registry.transition_orders(order_ids[offset:offset + batch], OrderStatus.SHIPPED).updated)
+    return updated
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Toplu sipariş durumu güncelleme: sipariş başına ve toplu API")
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--customers", type=int, default=5_000)
+    parser.add_argument("--batch", type=int, default=5_000, help="Tek seferde güncellenen sipariş sayısı")
+    parser.add_argument("--invalid", type=float, default=0.05, help="Geçişe izin vermeyen sipariş oranı")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{args.orders} sipariş, {args.customers} müşteri, {args.batch} siparişlik gruplar\n")
+    print(f"{'Yöntem':<22} | {'Süre (sn)':>9} | {'Sipariş/sn':>11} | {'Güncellenen':>11} | {'Bildirim':>9}")
+    print("-" * 74)
+    rates = []
+    for name, run in (("sipariş başına", per_order), ("transition_orders", bulk)):
+        registry, order_ids = build(args.orders, args.customers, args.invalid, args.seed)
+        CountingCustomer.notifications = 0
+        with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            updated = run(registry, order_ids, args.batch)
+            elapsed = time.perf_counter() - start
+        assert registry.count_orders_by_status(OrderStatus.SHIPPED) == updated, "Durum indeksi tutmuyor"
+        assert SalesAggregates.get_instance().status_totals(OrderStatus.SHIPPED).orders == updated, "Toplamlar tutmuyor"
+        rates.append(len(order_ids) / elapsed)
+        print(f"{name:<22} | {elapsed:>9.3f} | {rates[-1]:>11,.0f} | {updated:>11} | {CountingCustomer.notifications:>9}")
+    print(f"\nHızlanma: x{rates[1] / rates[0]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# benchmarks/bench_catalog_startup.py
+"""
+Katalog yükleme (soğuk başlangıç) süresini karşılaştırır. Her iki yol da boş envanterle
+başlayan ayrı bir süreçte ölçülür.
+
+- "Önce": add_initial_products_to_inventory'deki gibi her ürün için
+  ProductFactory.create_product + InventoryManager.add_product (bilgi mesajları kapalı).
+- "Sonra": InventoryManager.open_catalog ile mmap'lenen anlık görüntünün açılması.
+
+Anlık görüntü açıldıktan sonra rastgele get_product maliyeti (ilk ve tekrar erişim)
+ve ilk indeks sorgusunun süresi de yazdırılır.
+
+Kullanım:
+    python benchmarks/bench_catalog_startup.py --count 1000000
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog_snapshot import write_catalog_snapshot
+from product_factory import ProductFactory
+from inventorymanager import InventoryManager
+
+CATEGORIES = ["Elektronik", "Kırtasiye", "Kitap", "Ev Eşyası", "Mutfak Aletleri", "Giyim", "Yazılım", "Hizmet"]
+
+
+def product_args(product_id: int):
+    """
+    ID'ye göre belirlenimci (deterministic) sentetik ürün için ProductFactory argümanları.
+    """
+    category = CATEGORIES[product_id % len(CATEGORIES)]
+    price = float(10 + product_id % 5000)
+    kind = product_id % 10
+    if kind < 8:
+        return "physical", product_id, f"Ürün {product_id}", category, price, product_id % 100
+    if kind == 8:
+        return "digital", product_id, f"Dijital Ürün {product_id}", category, price, f"link-{product_id}.zip"
+    return "service", product_id, f"Hizmet {product_id}", category, price, product_id % 365
+
+
+def cold_start(mode: str, count: int, path: str) -> float:
+    """
+    Katalog yüklemesini yeni bir süreçte çalıştırır ve yükleme süresini (saniye) döndürür.
+    """
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", mode,
+                             "--count", str(count), "--path", path],
+                            check=True, capture_output=True, text=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def child(mode: str, count: int, path: str):
+    inventory = InventoryManager.get_instance()
+    start = time.perf_counter()
+    if mode == "add":
+        for product_id in range(1, count + 1):
+            inventory.add_product(ProductFactory.create_product(*product_args(product_id)), verbose=False)
+    else:
+        inventory.open_catalog(path)
+    print(time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Katalog soğuk başlangıç süresi")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Katalogdaki ürün sayısı")
+    parser.add_argument("--lookups", type=int, default=100_000, help="Ölçülecek rastgele get_product sayısı")
+    parser.add_argument("--path", help="Anlık görüntü dosyası (verilmezse geçici dosya)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--child", choices=("add", "open"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(args.child, args.count, args.path)
+        return
+
+    path = args.path or os.path.join(tempfile.mkdtemp(prefix="catalog-bench-"), "catalog.bin")
+    start = time.perf_counter()
+    write_catalog_snapshot(path, (ProductFactory.create_product(*product_args(product_id))
+                                  for product_id in range(1, args.count + 1)))
+    print(f"Anlık görüntü yazma                 : {time.perf_counter() - start:>9.3f} sn "
+          f"({os.path.getsize(path) / 1024 / 1024:.1f} MiB)")
+
+    before = cold_start("add", args.count, path)
+    print(f"Önce  (create_product + add_product): {before:>9.3f} sn")
+    after = cold_start("open", args.count, path)
+    print(f"Sonra (open_catalog, mmap)          : {after * 1000:>9.3f} ms | hızlanma x{before / after:,.0f}")
+
+    inventory = InventoryManager.get_instance()
+    inventory.open_catalog(path)
+
+    rng = random.Random(args.seed)
+    ids = [rng.randint(1, args.count) for _ in range(args.lookups)]
+    for label in ("ilk erişim", "tekrar erişim"):
+        start = time.perf_counter()
+        for product_id in ids:
+            inventory.get_product(product_id)
+        elapsed = time.perf_counter() - start
+        print(f"get_product ({label:<13})        : {elapsed / len(ids) * 1e9:>9.0f} ns/çağrı")
+
+    start = time.perf_counter()
+    matching = inventory.get_products_by_category("Kırtasiye")
+    print(f"İlk indeks sorgusu (kategori)       : {time.perf_counter() - start:>9.3f} sn ({len(matching)} ürün)")
+
+    if not args.path:
+        inventory.stock.close()
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
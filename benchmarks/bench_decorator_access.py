@@ -0,0 +1,111 @@
+# benchmarks/bench_decorator_access.py
+"""
+1-10 katmanlı dekoratör zincirlerinde öznitelik erişimi, get_total_cost ve get_description
+maliyetini ölçer. "Önce" sütunu eski özyinelemeli __getattr__ zincirinin birebir kopyasıyla,
+"Sonra" sütunu order_decorator modülündeki düzleştirilmiş zincirle ölçülür.
+
+Kullanım:
+    python benchmarks/bench_decorator_access.py --repeat 2000
+"""
+import argparse
+import os
+import sys
+import timeit
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from order import Order
+from order_decorator import BaseOrder, FragileDecorator, InsuranceDecorator, GiftWrapDecorator
+from product import PhysicalProduct
+from shippingstrategy import CheapShipping
+
+
+# --- Eski (özyinelemeli) uygulamanın kopyası ---
+
+class LegacyBaseOrder:
+    def __init__(self, order):
+        self.order = order
+
+    def get_description(self):
+        return str(self.order)
+
+    def get_total_cost(self):
+        cost = self.order.total
+        if self.order.shipping_strategy:
+            cost += self.order.get_shipping_cost()
+        return cost
+
+    def __getattr__(self, name):
+        if hasattr(self.order, name):
+            return getattr(self.order, name)
+        raise AttributeError(name)
+
+
+class LegacyDecorator:
+    SURCHARGE = 0
+    DESCRIPTION = ""
+
+    def __init__(self, component):
+        self.component = component
+
+    def get_description(self):
+        return self.component.get_description() + self.DESCRIPTION
+
+    def get_total_cost(self):
+        return self.component.get_total_cost() + self.SURCHARGE
+
+    def __getattr__(self, name):
+        if hasattr(self.component, name):
+            return getattr(self.component, name)
+        raise AttributeError(name)
+
+
+class LegacyFragile(LegacyDecorator):
+    SURCHARGE, DESCRIPTION = 20, " + Kırılabilir Etiketi"
+
+
+class LegacyInsurance(LegacyDecorator):
+    SURCHARGE, DESCRIPTION = 35, " + Sigortalı Gönderim"
+
+
+class LegacyGiftWrap(LegacyDecorator):
+    SURCHARGE, DESCRIPTION = 15, " + Hediye Paketi"
+
+
+def build_chain(order, base_cls, decorator_classes, depth: int):
+    component = base_cls(order)
+    for level in range(depth):
+        component = decorator_classes[level % len(decorator_classes)](component)
+    return component
+
+
+def access(component):
+    # main.py'deki sipariş listeleme döngüsünün eriştiği öznitelikler
+    return (component.order_id, component.status, component.customer.name,
+            component.get_total_cost(), component.get_description())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dekoratör zinciri erişim maliyeti")
+    parser.add_argument("--repeat", type=int, default=2_000, help="Her ölçüm için tekrar sayısı")
+    args = parser.parse_args()
+
+    customer = Customer("c-1", "Test Müşteri", "test@example.com")
+    order = Order("o-1", customer, [(PhysicalProduct(1, "Defter", "Kırtasiye", 25, 100), 3)])
+    order.set_shipping_strategy(CheapShipping())
+
+    print(f"{'Katman':>6} | {'Önce (µs)':>10} | {'Sonra (µs)':>10} | {'Hızlanma':>8}")
+    print("-" * 44)
+    for depth in range(1, 11):
+        legacy = build_chain(order, LegacyBaseOrder, [LegacyFragile, LegacyInsurance, LegacyGiftWrap], depth)
+        flat = build_chain(order, BaseOrder, [FragileDecorator, InsuranceDecorator, GiftWrapDecorator], depth)
+        assert access(legacy) == access(flat)
+        before = timeit.timeit(lambda: access(legacy), number=args.repeat) / args.repeat * 1e6
+        after = timeit.timeit(lambda: access(flat), number=args.repeat) / args.repeat * 1e6
+        print(f"{depth:>6} | {before:>10.2f} | {after:>10.2f} | x{before / after:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
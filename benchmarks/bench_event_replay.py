@@ -0,0 +1,144 @@
+# benchmarks/bench_event_replay.py
+"""
+OrderEventLog'un yazma ve yeniden oynatma hızını ölçer.
+
+1. Farklı group commit boyutlarında olay yazma hızı ve fsync sayısı.
+2. Anlık görüntü olmadan tüm günlüğün yeniden oynatılması (olay/sn).
+3. Anlık görüntü + günlüğün kalan kısmının yeniden oynatılması.
+4. Yeniden kurulan durumdan Customer/Order nesnelerinin oluşturulması.
+
+Kullanım:
+    python benchmarks/bench_event_replay.py --orders 100000 --updates 3
+"""
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from inventorymanager import InventoryManager
+from order import Order, OrderStatus
+from order_decorator import BaseOrder, FragileDecorator
+from order_event_log import OrderEventLog
+from product import PhysicalProduct
+
+STATUS_SEQUENCE = [OrderStatus.PENDING_PAYMENT, OrderStatus.PREPARING, OrderStatus.SHIPPED, OrderStatus.DELIVERED]
+
+
+class QuietCustomer(Customer):
+    """
+    Bildirimleri yazdırmayan müşteri; ölçümü konsol çıktısından ayırır.
+    """
+    __slots__ = ()
+
+    def update(self, order):
+        pass
+
+
+def write_events(directory: str, orders, updates: int, group_commit_size: int) -> OrderEventLog:
+    """
+    Siparişleri ve durum değişikliklerini günlüğe yazar; günlük açık olarak döner.
+    """
+    log = OrderEventLog(directory, group_commit_size=group_commit_size, group_commit_interval=0, snapshot_every=0)
+    log.attach()
+    for order in orders:
+        log.record_order(BaseOrder(order) if int(order.order_id[2:]) % 4 else FragileDecorator(BaseOrder(order)))
+    for step in range(updates):
+        status = STATUS_SEQUENCE[step % len(STATUS_SEQUENCE)]
+        for order in orders:
+            if status is STATUS_SEQUENCE[0]:
+                order.status = OrderStatus.PREPARING # Teslim edilen sipariş ödeme beklemeye dönemez; dizi baştan başlar
+            order.update_status(status)
+    return log
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Olay günlüğü yazma ve yeniden oynatma hızı")
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--updates", type=int, default=3, help="Sipariş başına durum değişikliği")
+    parser.add_argument("--customers", type=int, default=10_000)
+    parser.add_argument("--group-sizes", type=int, nargs="+", default=[1, 64, 1024],
+                        help="Yazma hızı ölçülecek group commit boyutları")
+    parser.add_argument("--group-sample", type=int, default=2000,
+                        help="Group commit karşılaştırmasında kullanılacak sipariş sayısı")
+    parser.add_argument("--tail", type=float, default=0.1, help="Anlık görüntüden sonra günlükte kalan olay oranı")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    inventory = InventoryManager.get_instance()
+    products = [PhysicalProduct(i, f"Ürün {i}", "Kırtasiye", round(rng.uniform(1, 900), 2), 10**9) for i in range(1, 201)]
+    for product in products:
+        inventory.add_product(product, verbose=False)
+    customers = [QuietCustomer(f"c-{i}", f"Müşteri {i}", f"musteri{i}@example.com") for i in range(args.customers)]
+
+    def make_orders(count):
+        return [Order(f"o-{i:09d}", customers[i % len(customers)],
+                      [(rng.choice(products), rng.randint(1, 4)) for _ in range(3)]) for i in range(count)]
+
+    root = tempfile.mkdtemp(prefix="event-log-bench-")
+    try:
+        print(f"{'Group commit':>12} | {'Olay':>9} | {'fsync':>7} | {'Olay/sn':>12}")
+        print("-" * 50)
+        sample = make_orders(min(args.group_sample, args.orders))
+        for size in args.group_sizes:
+            for order in sample:
+                order.status = OrderStatus.PREPARING
+            directory = os.path.join(root, f"group-{size}")
+            start = time.perf_counter()
+            log = write_events(directory, sample, args.updates, size)
+            log.close()
+            elapsed = time.perf_counter() - start
+            print(f"{size:>12} | {log.events_appended:>9} | {log.fsyncs:>7} | {log.events_appended / elapsed:>12,.0f}")
+
+        orders = make_orders(args.orders)
+        directory = os.path.join(root, "replay")
+        tail_orders = int(len(orders) * args.tail)
+        log = write_events(directory, orders, args.updates, 1024)
+        log.close()
+        size_mb = os.path.getsize(log.path) / 1024 / 1024
+        print(f"\nGünlük: {log.events_appended} olay, {size_mb:.1f} MiB, {log.fsyncs} fsync")
+
+        replayed = OrderEventLog(directory, group_commit_interval=0)
+        stats = replayed.replay_stats
+        replayed.close()
+        print(f"Tam yeniden oynatma          : {stats.events:>9} olay, {stats.seconds:7.3f} sn "
+              f"({stats.events_per_second:>12,.0f} olay/sn)")
+
+        # Son tail_orders siparişin son durum değişikliği anlık görüntüden sonra gelsin
+        for order in orders[-tail_orders:]:
+            order.status = (STATUS_SEQUENCE[(args.updates - 2) % len(STATUS_SEQUENCE)]
+                            if (args.updates - 1) % len(STATUS_SEQUENCE) else OrderStatus.PREPARING)
+        snapshot_dir = os.path.join(root, "snapshot")
+        log = OrderEventLog(snapshot_dir, group_commit_size=1024, group_commit_interval=0, snapshot_every=0)
+        log.attach()
+        for order in orders:
+            log.record_order(order)
+        log.snapshot()
+        for order in orders[-tail_orders:]:
+            order.update_status(STATUS_SEQUENCE[(args.updates - 1) % len(STATUS_SEQUENCE)])
+        log.close()
+
+        replayed = OrderEventLog(snapshot_dir, group_commit_interval=0)
+        stats = replayed.replay_stats
+        print(f"Anlık görüntü yükleme        : {stats.snapshot_events:>9} olay, {stats.snapshot_seconds:7.3f} sn")
+        print(f"Kalan günlüğün oynatılması   : {stats.events:>9} olay, {stats.seconds:7.3f} sn "
+              f"({stats.events_per_second:>12,.0f} olay/sn)")
+
+        start = time.perf_counter()
+        new_customers, components = replayed.state.materialize(inventory)
+        elapsed = time.perf_counter() - start
+        replayed.close()
+        print(f"Nesnelerin kurulması         : {len(new_customers)} müşteri, {len(components)} sipariş, {elapsed:7.3f} sn")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+# benchmarks/bench_factories.py
+"""
+Sipariş ve ürün oluşturma hızını karşılaştırır:
+
+- "Önce": if/elif zinciriyle tür seçimi ve sipariş başına str(uuid.uuid4()) (fabrikaların
+  kayıt tablosundan önceki hali, bu dosyada birebir kopyalanmıştır).
+- "Sonra": kayıt tablosu üzerinden create_order / create_product, farklı ID üreteçleriyle;
+  toplu oluşturma için create_orders_many / create_products_many.
+
+Siparişlerin türleri karışıktır (standard, express, subscription, preorder, gift, bulk).
+ID üreteçlerinin çağrı başına maliyeti ayrıca yazdırılır.
+
+Kullanım:
+    python benchmarks/bench_factories.py --orders 100000 --products 200000 --batch 1000
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import timeit
+import uuid
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from order import Order, ExpressOrder, SubscriptionOrder, PreOrder, GiftOrder, BulkOrder
+from order_factory import OrderFactory
+from order_ids import CounterIdGenerator, ULIDGenerator, UUIDGenerator
+from product import PhysicalProduct, DigitalProduct, ServiceProduct
+from product_factory import ProductFactory
+
+ORDER_TYPES = ["standard", "express", "subscription", "preorder", "gift", "bulk"]
+PRODUCT_TYPES = ["physical", "digital", "service"]
+
+
+def legacy_create_order(order_type, customer, product_data, **kwargs):
+    order_id = str(uuid.uuid4())
+    if order_type == "standard":
+        order = Order(order_id, customer, product_data)
+    elif order_type == "express":
+        order = ExpressOrder(order_id, customer, product_data)
+    elif order_type == "subscription":
+        order = SubscriptionOrder(order_id, customer, product_data)
+    elif order_type == "preorder":
+        expected_delivery_date = kwargs.get("expected_delivery_date")
+        if not expected_delivery_date:
+            raise ValueError("Ön sipariş için tahmini teslim tarihi belirtilmelidir.")
+        order = PreOrder(order_id, customer, product_data, expected_delivery_date)
+    elif order_type == "gift":
+        order = GiftOrder(order_id, customer, product_data, kwargs.get("gift_note", ""))
+    elif order_type == "bulk":
+        order = BulkOrder(order_id, customer, product_data)
+    else:
+        raise ValueError(f"Geçersiz sipariş türü: '{order_type}'.")
+    customer.add_order(order)
+    for listener in OrderFactory._listeners:
+        listener.order_created(order)
+    return order
+
+
+def legacy_create_product(product_type, *args, **kwargs):
+    if product_type == "physical":
+        return PhysicalProduct(*args, **kwargs)
+    elif product_type == "digital":
+        return DigitalProduct(*args, **kwargs)
+    elif product_type == "service":
+        return ServiceProduct(*args, **kwargs)
+    else:
+        raise ValueError(f"Geçersiz ürün türü: '{product_type}'.")
+
+
+def timed(run, customers=()) -> float:
+    for customer in customers: # Önceki koşunun siparişleri bellekte birikip GC süresini şişirmesin
+        customer.orders.clear()
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+
+def product_rows(product_type: str, count: int):
+    last = {"physical": 10, "digital": "indir.zip", "service": 30}[product_type]
+    return [(i, f"Ürün {i}", "Kırtasiye", 10.0, last) for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fabrikalar: if/elif + uuid4 ve kayıt tablosu + hızlı ID üreteçleri")
+    parser.add_argument("--orders", type=int, default=100_000)
+    parser.add_argument("--products", type=int, default=200_000)
+    parser.add_argument("--batch", type=int, default=1_000, help="create_orders_many grup boyutu")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    Customer.update = lambda self, order: None
+    products = [PhysicalProduct(i, f"Ürün {i}", "Kırtasiye", round(rng.uniform(5, 500), 2), 10**9) for i in range(500)]
+    customers = [Customer(f"c-{i}", f"Müşteri {i}", f"m{i}@example.com") for i in range(1000)]
+    options = {"expected_delivery_date": "2026-12-01", "gift_note": "İyi günlerde kullan"}
+    specs = [(rng.choice(ORDER_TYPES), rng.choice(customers),
+              [(rng.choice(products), rng.randint(1, 3)) for _ in range(rng.randint(1, 4))], options)
+             for _ in range(args.orders)]
+    batches = [specs[i:i + args.batch] for i in range(0, len(specs), args.batch)]
+
+    def single(create):
+        def run():
+            for order_type, customer, cart, kwargs in specs:
+                create(order_type, customer, cart, **kwargs)
+        return run
+
+    def with_ids(generator, run):
+        def configured():
+            OrderFactory.set_id_generator(generator)
+            run()
+        return configured
+
+    def many():
+        for batch in batches:
+            OrderFactory.create_orders_many(batch)
+
+    order_runs = [
+        ("önce: if/elif + uuid4", single(legacy_create_order)),
+        ("create_order + uuid", with_ids(UUIDGenerator(), single(OrderFactory.create_order))),
+        ("create_order + counter", with_ids(CounterIdGenerator("bench"), single(OrderFactory.create_order))),
+        ("create_order + ulid", with_ids(ULIDGenerator(), single(OrderFactory.create_order))),
+        (f"create_orders_many({args.batch}) + counter", with_ids(CounterIdGenerator("bench"), many)),
+    ]
+    print(f"{args.orders} sipariş (karışık türler), en iyi {args.repeat} tekrar\n")
+    print(f"{'Yöntem':<36} | {'Süre (sn)':>9} | {'Sipariş/sn':>11} | {'Hızlanma':>8}")
+    print("-" * 74)
+    baseline = None
+    for name, run in order_runs:
+        elapsed = min(timed(run, customers) for _ in range(args.repeat))
+        baseline = baseline or elapsed
+        print(f"{name:<36} | {elapsed:>9.3f} | {args.orders / elapsed:>11,.0f} | x{baseline / elapsed:>7.2f}")
+    OrderFactory.set_id_generator(UUIDGenerator())
+
+    rows = {product_type: product_rows(product_type, args.products // len(PRODUCT_TYPES)) for product_type in PRODUCT_TYPES}
+    product_count = sum(len(type_rows) for type_rows in rows.values())
+    product_runs = [
+        ("önce: if/elif", lambda: [legacy_create_product(t, *row) for t, type_rows in rows.items() for row in type_rows]),
+        ("create_product", lambda: [ProductFactory.create_product(t, *row) for t, type_rows in rows.items()
+                                    for row in type_rows]),
+        ("create_products_many", lambda: [ProductFactory.create_products_many(t, type_rows)
+                                          for t, type_rows in rows.items()]),
+    ]
+    print(f"\n{product_count} ürün\n")
+    print(f"{'Yöntem':<36} | {'Süre (sn)':>9} | {'Ürün/sn':>11} | {'Hızlanma':>8}")
+    print("-" * 74)
+    baseline = None
+    for name, run in product_runs:
+        elapsed = min(timed(run) for _ in range(args.repeat))
+        baseline = baseline or elapsed
+        print(f"{name:<36} | {elapsed:>9.3f} | {product_count / elapsed:>11,.0f} | x{baseline / elapsed:>7.2f}")
+
+    print("\nID üreteci başına maliyet:")
+    for generator in (UUIDGenerator(), CounterIdGenerator("bench"), ULIDGenerator()):
+        cost = timeit.timeit(generator, number=200_000) / 200_000 * 1e9
+        print(f"  {generator.NAME:<8} {cost:>7.0f} ns  örnek: {generator()}")
+
+
+if __name__ == "__main__":
+    main()
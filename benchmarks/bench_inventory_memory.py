@@ -0,0 +1,69 @@
+# benchmarks/bench_inventory_memory.py
+"""
+dict-of-objects ürün deposu ile ColumnarProductStore'un bellek kullanımını karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_inventory_memory.py --count 1000000
+"""
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from product import PhysicalProduct, DigitalProduct, ServiceProduct
+from product_store import ColumnarProductStore
+
+CATEGORIES = ["Elektronik", "Kırtasiye", "Kitap", "Ev Eşyası", "Mutfak Aletleri", "Giyim", "Yazılım", "Hizmet"]
+
+
+def make_product(product_id: int):
+    """
+    ID'ye göre belirlenimci (deterministic) bir sentetik ürün oluşturur.
+    """
+    category = CATEGORIES[product_id % len(CATEGORIES)]
+    price = float(10 + product_id % 5000)
+    kind = product_id % 10
+    if kind < 8:
+        return PhysicalProduct(product_id, f"Ürün {product_id}", category, price, product_id % 100)
+    if kind == 8:
+        return DigitalProduct(product_id, f"Dijital Ürün {product_id}", category, price, f"link-{product_id}.zip")
+    return ServiceProduct(product_id, f"Hizmet {product_id}", category, price, product_id % 365)
+
+
+def measure(label: str, store, count: int) -> int:
+    """
+    Depoyu count adet ürünle doldurur ve depoda kalan bellek miktarını (bayt) döndürür.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    for product_id in range(1, count + 1):
+        store[product_id] = make_product(product_id)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} | {count:>9} ürün | {current / 1024 / 1024:>9.1f} MiB | "
+          f"{current / count:>7.1f} B/ürün | tepe {peak / 1024 / 1024:>9.1f} MiB | {elapsed:>6.2f} sn")
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ürün deposu bellek karşılaştırması")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Oluşturulacak ürün sayısı")
+    args = parser.parse_args()
+
+    print(f"{'Depo':<22} | {'Adet':>14} | {'Bellek':>13} | {'Ürün başına':>14} | {'Tepe':>18} | Süre")
+    print("-" * 100)
+    dict_bytes = measure("dict (nesneler)", {}, args.count)
+    columnar_bytes = measure("ColumnarProductStore", ColumnarProductStore(), args.count)
+    print(f"\nSütunlu depo, dict deposunun %{100 * columnar_bytes / dict_bytes:.1f}'i kadar bellek kullanıyor.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/bench_metrics_overhead.py
+"""
+Ölçüm altyapısının (metrics) sipariş akışına eklediği maliyeti ölçer.
+
+Her sipariş için: OrderFactory.create_order, choose_optimal_shipping_strategy, satırların
+InventoryManager.update_stock ile düşülmesi, dekoratörlü maliyet hesabı ve update_status.
+Aynı akış üç kez koşturulur: ölçümler kapalı, açık ve açık + siparişlerin --profile oranı
+cProfile altında. Her yapılandırmanın --repeat tekrarındaki en iyi süresi alınır.
+
+Kapalıyken ölçüm noktası başına maliyet (metrics.enabled okuması) ayrıca timeit ile ölçülür.
+
+Kullanım:
+    python benchmarks/bench_metrics_overhead.py --orders 20000 --repeat 5
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import tempfile
+import time
+import timeit
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import metrics
+from customer import Customer
+from inventorymanager import InventoryManager
+from order import OrderStatus
+from order_decorator import BaseOrder, FragileDecorator, InsuranceDecorator
+from order_factory import OrderFactory
+from product import PhysicalProduct
+from shipping_selector import choose_optimal_shipping_strategy
+
+ORDER_TYPES = ["standard", "express", "subscription", "gift", "bulk"]
+
+
+def run_workflow(inventory: InventoryManager, customers, carts, order_types) -> float:
+    for customer in customers: # Önceki koşunun siparişleri bellekte birikip GC süresini şişirmesin
+        customer.orders.clear()
+    gc.collect()
+    start = time.perf_counter()
+    for customer, cart, order_type in zip(customers, carts, order_types):
+        order = OrderFactory.create_order(order_type, customer, cart, gift_note="Not")
+        order.set_shipping_strategy(choose_optimal_shipping_strategy(order, verbose=False))
+        for product, quantity in cart:
+            inventory.update_stock(product.product_id, quantity, verbose=False)
+        decorated = InsuranceDecorator(FragileDecorator(BaseOrder(order)))
+        decorated.get_total_cost()
+        order.update_status(OrderStatus.SHIPPED)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ölçüm altyapısının sipariş akışına etkisi")
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--profile", type=float, default=0.01, help="Profillenen sipariş oranı")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    inventory = InventoryManager.get_instance()
+    products = [PhysicalProduct(i, f"Ürün {i}", "Kırtasiye", round(rng.uniform(5, 800), 2), 10**9)
+                for i in range(1, 1001)]
+    for product in products:
+        inventory.add_product(product, verbose=False)
+    Customer.update = lambda self, order: None # Bildirim çıktısını ölçüme katmamak için
+    customer_pool = [Customer(f"c-{i}", f"Müşteri {i}", f"m{i}@example.com") for i in range(1000)]
+    customers = [rng.choice(customer_pool) for _ in range(args.orders)]
+    carts = [[(rng.choice(products), rng.randint(1, 3)) for _ in range(rng.randint(1, 4))] for _ in range(args.orders)]
+    order_types = [rng.choice(ORDER_TYPES) for _ in range(args.orders)]
+    profile_path = os.path.join(tempfile.mkdtemp(prefix="metrics-bench-"), "orders.folded")
+
+    def configure(name: str):
+        metrics.disable()
+        metrics.profiler = None
+        if name != "kapalı":
+            metrics.enable()
+        if name.endswith("profil"):
+            metrics.configure_profiling(args.profile, profile_path, seed=args.seed)
+
+    configs = ["kapalı", "açık", f"açık + %{args.profile * 100:g} profil"]
+    best = {name: float("inf") for name in configs}
+    for _ in range(args.repeat):
+        for name in configs: # Yapılandırmalar sırayla dönüşümlü koşturulur; makinedeki dalgalanma eşit dağılır
+            configure(name)
+            best[name] = min(best[name], run_workflow(inventory, customers, carts, order_types))
+
+    baseline = best["kapalı"]
+    print(f"{args.orders} sipariş, en iyi {args.repeat} tekrar\n")
+    print(f"{'Yapılandırma':<22} | {'Süre (sn)':>9} | {'µs/sipariş':>10} | {'Ek maliyet':>10}")
+    print("-" * 60)
+    for name in configs:
+        print(f"{name:<22} | {best[name]:>9.3f} | {best[name] / args.orders * 1e6:>10.2f} | "
+              f"{(best[name] / baseline - 1) * 100:>+9.2f}%")
+
+    metrics.disable()
+    check = timeit.timeit("if metrics.enabled: pass", globals={"metrics": metrics}, number=1_000_000) * 1000
+    print(f"\nKapalıyken ölçüm noktası başına maliyet: {check:.1f} ns")
+    profiled = metrics.profiler.sampled if metrics.profiler else 0
+    stacks = metrics.dump_profile()
+    print(f"Profil: {profiled} sipariş örneklendi, {stacks} yığın -> {profile_path}")
+
+    registry = metrics.MetricsRegistry.get_instance()
+    print("\n" + "\n".join(line for line in registry.to_prometheus().splitlines()
+                            if line.startswith(("order_create_seconds_count", "inventory_stock", "shipping_tier"))))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_notifications.py
+"""
+Yavaş bir gözlemci (örn. e-posta gönderimi) varken Order.update_status çağrılarının
+senkron ve asenkron (NotificationDispatcher) bildirimlerdeki maliyetini karşılaştırır.
+Asenkron modda birleştirme, geri basınç ve teslim gecikmesi metriklerini yazdırır.
+
+Kullanım:
+    python benchmarks/bench_notifications.py --orders 500 --updates 4 --observer-delay-ms 2
+"""
+import argparse
+import os
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from notification_dispatcher import NotificationDispatcher
+from order import Order, OrderStatus
+from order_subject import OrderSubject
+from product import PhysicalProduct
+
+STATUS_SEQUENCE = [OrderStatus.PENDING_PAYMENT, OrderStatus.PREPARING, OrderStatus.SHIPPED, OrderStatus.DELIVERED]
+
+
+class SlowCustomer(Customer):
+    """
+    Bildirim başına sabit süre bekleyen (bloklayan I/O benzeri) müşteri.
+    """
+    def __init__(self, customer_id: str, delay: float):
+        super().__init__(customer_id, f"Müşteri {customer_id}", f"{customer_id}@example.com")
+        self.delay = delay
+        self.received = 0
+
+    def update(self, order):
+        time.sleep(self.delay)
+        self.received += 1
+
+
+def make_orders(order_count: int, delay: float):
+    product = PhysicalProduct(1, "Defter", "Kırtasiye", 25, 10**9)
+    customers = [SlowCustomer(f"c-{i}", delay) for i in range(order_count)]
+    return customers, [Order(f"o-{i}", customer, [(product, 1)]) for i, customer in enumerate(customers)]
+
+
+def run_updates(orders, updates: int) -> float:
+    """
+    Her siparişin durumunu art arda updates kez değiştirir (örn. ödeme -> hazırlık -> kargo)
+    ve geçen süreyi döndürür.
+    """
+    statuses = [STATUS_SEQUENCE[step % len(STATUS_SEQUENCE)] for step in range(updates)]
+    start = time.perf_counter()
+    for order in orders:
+        for status in statuses:
+            if status is STATUS_SEQUENCE[0]:
+                order.status = OrderStatus.PREPARING # Teslim edilen sipariş ödeme beklemeye dönemez; dizi baştan başlar
+            order.update_status(status)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Senkron / asenkron bildirim karşılaştırması")
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--updates", type=int, default=4, help="Sipariş başına durum değişikliği")
+    parser.add_argument("--observer-delay-ms", type=float, default=2.0, help="Gözlemcinin bildirim başına bekleme süresi")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--max-queue", type=int, default=256)
+    parser.add_argument("--window-ms", type=float, default=50.0, help="Birleştirme penceresi")
+    args = parser.parse_args()
+    delay = args.observer_delay_ms / 1000
+    changes = args.orders * args.updates
+
+    customers, orders = make_orders(args.orders, delay)
+    sync_seconds = run_updates(orders, args.updates)
+    print(f"Senkron : {sync_seconds:8.3f} sn update_status içinde "
+          f"({changes / sync_seconds:>10,.0f} değişiklik/sn, {sum(c.received for c in customers)} teslim)")
+
+    customers, orders = make_orders(args.orders, delay)
+    dispatcher = NotificationDispatcher(args.workers, args.max_queue, args.window_ms / 1000).start()
+    OrderSubject.set_dispatcher(dispatcher)
+    try:
+        async_seconds = run_updates(orders, args.updates)
+        start = time.perf_counter()
+        dispatcher.join()
+        drain_seconds = time.perf_counter() - start
+    finally:
+        OrderSubject.set_dispatcher(None)
+        dispatcher.stop()
+    print(f"Asenkron: {async_seconds:8.3f} sn update_status içinde "
+          f"({changes / async_seconds:>10,.0f} değişiklik/sn, {sum(c.received for c in customers)} teslim), "
+          f"kuyruk boşaltma {drain_seconds:.3f} sn")
+    dispatcher.metrics.display(dispatcher.queue_depth)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# benchmarks/bench_order_cost.py
+"""
+Dekoratörlü sipariş maliyetinin tekrar tekrar okunmasını ölçer (konsol özetleri ve listeleri).
+
+- "Önce": önbelleksiz zincir (bu dosyada birebir kopyalanmıştır); her get_total_cost çağrısı
+  kargo stratejisinin calculate metodunu ve her dekoratör için plan.surcharge'ı çağırır.
+- "Sonra": BaseOrder/OrderDecorator maliyet önbelleği; yalnızca satırlar, kargo stratejisi,
+  temel toplam veya fiyatlama planı değiştiğinde yeniden hesaplanır.
+
+Her sipariş --reads kez okunur (ilk okuma önbelleği doldurur). Ayrıca get_cost_breakdown ve
+--mutations rastgele değişiklikten (satır, kargo stratejisi, kural) sonra önbellekten gelen
+maliyetin önbelleksiz hesapla birebir aynı olduğu kontrol edilir. Önbellekler her tekrardan
+önce (ölçüm dışında) boşaltılır.
+
+Kullanım:
+    python benchmarks/bench_order_cost.py --orders 20000 --reads 1,5,20
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from order import Order, ExpressOrder, SubscriptionOrder, BulkOrder
+from order_decorator import BaseOrder, FragileDecorator, InsuranceDecorator, GiftWrapDecorator
+from pricing_rules import PricingRegistry, PricingRule
+from product import PhysicalProduct
+from shippingstrategy import CheapShipping, FastShipping, DroneShipping
+
+ORDER_CLASSES = [Order, ExpressOrder, SubscriptionOrder, BulkOrder]
+STRATEGIES = [CheapShipping(), FastShipping(), DroneShipping()]
+CHAINS = [(), (FragileDecorator,), (FragileDecorator, InsuranceDecorator),
+          (FragileDecorator, InsuranceDecorator, GiftWrapDecorator)]
+_pricing = PricingRegistry.get_instance()
+
+
+def uncached_base_cost(base) -> float:
+    """
+    Önbellek öncesi BaseOrder.get_total_cost.
+    """
+    cost = base.order.total
+    if base.order.shipping_strategy:
+        cost += base.order.get_shipping_cost()
+    return cost
+
+
+def uncached_cost(component) -> float:
+    """
+    Önbellek öncesi OrderDecorator.get_total_cost (dekoratörsüz bileşende BaseOrder.get_total_cost).
+    """
+    if not component._decorators:
+        return uncached_base_cost(component)
+    cost = uncached_base_cost(component._base)
+    plan, order = _pricing.plan, component.order
+    for decorator in component._decorators:
+        cost += plan.surcharge(decorator, order)
+    return cost
+
+
+def clear_caches(components):
+    for component in components:
+        component._cost_cache = component._base._cost_cache = None
+
+
+def best_of(repeat: int, run, setup=None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def build(args, rng):
+    products = [PhysicalProduct(i, f"Ürün {i}", "Kırtasiye", round(rng.uniform(5, 500), 2), 10**9) for i in range(500)]
+    customers = [Customer(f"c-{i}", f"Müşteri {i}", f"m{i}@example.com") for i in range(1000)]
+    components = []
+    for i in range(args.orders):
+        cart = [(rng.choice(products), rng.randint(1, 4)) for _ in range(rng.randint(1, 6))]
+        order = rng.choice(ORDER_CLASSES)(str(i), rng.choice(customers), cart)
+        order.set_shipping_strategy(rng.choice(STRATEGIES))
+        component = BaseOrder(order)
+        for decorator in rng.choice(CHAINS):
+            component = decorator(component)
+        components.append(component)
+    return products, components
+
+
+def check_invalidation(components, products, mutations: int, rng) -> int:
+    """
+    Rastgele değişikliklerden sonra önbellekli ve önbelleksiz maliyetleri karşılaştırır.
+    Uyuşmayan okuma sayısını döndürür.
+    """
+    mismatched = 0
+    for step in range(mutations):
+        component = rng.choice(components)
+        kind = step % 4
+        if kind == 0:
+            component.order.products = [(rng.choice(products), rng.randint(1, 4)) for _ in range(rng.randint(1, 6))]
+        elif kind == 1:
+            component.shipping_strategy = rng.choice(STRATEGIES)
+        elif kind == 2:
+            _pricing.add_rules([PricingRule("bench_fragile", "surcharge", decorator="fragile",
+                                            amount=rng.randint(0, 40), subtotal_over=rng.choice((None, 300)))])
+        else:
+            component.order.total = round(rng.uniform(0, 2000), 2)
+        for other in (component, rng.choice(components)):
+            breakdown = other.get_cost_breakdown()
+            expected = uncached_cost(other)
+            mismatched += other.get_total_cost() != expected or breakdown.total != expected
+            mismatched += abs(breakdown.base + breakdown.adjustment - other.order.total) > 1e-6
+    _pricing.reset()
+    return mismatched
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dekoratörlü sipariş maliyeti: önbelleksiz ve önbellekli okuma")
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument("--reads", default="1,5,20", help="Sipariş başına okuma sayıları")
+    parser.add_argument("--mutations", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    products, components = build(args, rng)
+    print(f"{args.orders} sipariş (0-3 dekoratör), en iyi {args.repeat} tekrar\n")
+    print(f"{'Okuma':>5} | {'Önce µs/okuma':>13} | {'Sonra µs/okuma':>14} | {'Hızlanma':>8}")
+    print("-" * 50)
+    for reads in [int(value) for value in args.reads.split(",")]:
+        def before():
+            for component in components:
+                for _ in range(reads):
+                    uncached_cost(component)
+
+        def after():
+            for component in components:
+                for _ in range(reads):
+                    component.get_total_cost()
+
+        total_reads = args.orders * reads
+        old = best_of(args.repeat, before) / total_reads
+        new = best_of(args.repeat, after, lambda: clear_caches(components)) / total_reads # Her tekrar soğuk başlar
+        print(f"{reads:>5} | {old * 1e6:>13.3f} | {new * 1e6:>14.3f} | x{old / new:>7.1f}")
+
+    breakdown = best_of(args.repeat, lambda: [component.get_cost_breakdown() for component in components])
+    print(f"\nget_cost_breakdown (önbellekten): {breakdown / args.orders * 1e6:.3f} µs/okuma")
+    mismatched = check_invalidation(components, products, args.mutations, rng)
+    if mismatched:
+        raise SystemExit(f"{mismatched} okumada önbellekli maliyet önbelleksiz hesaptan farklı.")
+    print(f"{args.mutations} değişiklik sonrası önbellekli ve önbelleksiz maliyetler birebir aynı.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# benchmarks/bench_order_memory.py
+"""
+Sipariş başına bellek kullanımını tracemalloc ile ölçer.
+
+"Önce" satırı, __slots__ öncesi Order/Customer/OrderSubject uygulamasının birebir kopyasıyla
+(sipariş başına konu nesnesi, gözlemci listesi, satır tuple'ları ve kargo stratejisi örneği)
+ölçülür. "Sonra" satırları güncel sınıflarla, satırlar sipariş başına listede ve ortak
+OrderLineStore'da tutularak ölçülür.
+
+Kullanım:
+    python benchmarks/bench_order_memory.py --orders 200000 --lines 3
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from order import Order, OrderStatus
+from order_line_store import OrderLineStore
+from product import PhysicalProduct
+from shipping_selector import choose_optimal_shipping_strategy, FAST_SHIPPING_THRESHOLD, DRONE_SHIPPING_THRESHOLD
+from shippingstrategy import FastShipping, DroneShipping, CheapShipping
+
+
+# --- Eski uygulamanın kopyası ---
+
+class LegacyOrderSubject:
+    def __init__(self):
+        self.observers = []
+
+    def attach(self, observer):
+        if observer not in self.observers:
+            self.observers.append(observer)
+
+
+class LegacyCustomer:
+    def __init__(self, customer_id, name, email):
+        self.customer_id = customer_id
+        self.name = name
+        self.email = email
+        self.orders = []
+
+    def add_order(self, order):
+        self.orders.append(order)
+
+
+class LegacyOrder:
+    def __init__(self, order_id, customer, products):
+        self.order_id = order_id
+        self.customer = customer
+        self.products = products
+        self.total = self.calculate_total()
+        self.status = OrderStatus.PREPARING
+        self.shipping_strategy = None
+        self._subject = LegacyOrderSubject()
+        self._subject.attach(customer)
+
+    def calculate_total(self):
+        return sum(product.price * qty for product, qty in self.products)
+
+
+def legacy_shipping(order):
+    # Eski seçici her çağrıda yeni bir strateji örneği oluşturuyordu
+    if order.total >= FAST_SHIPPING_THRESHOLD:
+        return FastShipping()
+    if order.total >= DRONE_SHIPPING_THRESHOLD:
+        return DroneShipping()
+    return CheapShipping()
+
+
+def build(order_cls, customer_cls, choose_shipping, carts, customer_count):
+    customers = [customer_cls(f"c-{i}", f"Müşteri {i}", f"musteri{i}@example.com") for i in range(customer_count)]
+    orders = []
+    for i, cart in enumerate(carts):
+        customer = customers[i % customer_count]
+        order = order_cls(f"o-{i:09d}", customer, [(product, quantity) for product, quantity in cart])
+        order.shipping_strategy = choose_shipping(order)
+        customer.add_order(order)
+        orders.append(order)
+    return customers, orders
+
+
+def measure(label: str, carts, customer_count: int, order_cls, customer_cls, choose_shipping, baseline=None) -> int:
+    """
+    Siparişleri oluşturur ve oluşturma sonrasında bellekte kalan bayt miktarını döndürür.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = build(order_cls, customer_cls, choose_shipping, carts, customer_count)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    order_count = len(carts)
+    ratio = f"%{100 * current / baseline:>5.1f}" if baseline else "     -"
+    print(f"{label:<34} | {current / 1024 / 1024:>9.1f} MiB | {current / order_count:>8.1f} B/sipariş | "
+          f"{ratio} | {elapsed:>6.2f} sn")
+    del kept
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sipariş başına bellek kullanımı")
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--lines", type=int, default=3, help="Sipariş başına satır sayısı")
+    parser.add_argument("--customers", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    products = [PhysicalProduct(i, f"Ürün {i}", "Kırtasiye", round(rng.uniform(1, 900), 2), 10**9) for i in range(1, 1001)]
+    carts = [[(rng.choice(products), rng.randint(1, 4)) for _ in range(args.lines)] for _ in range(args.orders)]
+
+    print(f"{'Uygulama':<34} | {'Bellek':>13} | {'Sipariş başına':>17} | {'Oran':>6} | Süre")
+    print("-" * 90)
+    silent = lambda order: choose_optimal_shipping_strategy(order, verbose=False)
+    before = measure("Önce (dict, eager subject)", carts, args.customers, LegacyOrder, LegacyCustomer, legacy_shipping)
+    Order.set_line_store(None)
+    measure("Sonra (__slots__)", carts, args.customers, Order, Customer, silent, before)
+    Order.set_line_store(OrderLineStore())
+    measure("Sonra (__slots__ + OrderLineStore)", carts, args.customers, Order, Customer, silent, before)
+    Order.set_line_store(None)
+
+
+if __name__ == "__main__":
+    main()
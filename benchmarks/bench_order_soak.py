@@ -0,0 +1,202 @@
+# benchmarks/bench_order_soak.py
+"""
+Uzun süreli (soak) sipariş akışında GC duraklamalarını ve bellek kullanımını (RSS) ölçer.
+
+Siparişler --batch büyüklüğünde gruplar halinde OrderFactory.create_orders_many ile
+oluşturulur, CustomerOrderRegistry'ye eklenir ve transition_orders ile yaşam döngüsünü
+tamamlar: çoğu kargoya verilip teslim edilir, bir kısmı iptal edilir, teslim edilenlerin
+bir kısmı iade edilir. Siparişlerin %1'ine ayrıca bir denetim gözlemcisi bağlanır.
+
+İki mod ayrı süreçlerde koşturulur (RSS birbirini etkilemesin):
+    önce   Arşivleme yok: tamamlanan siparişler Customer.orders'ta ve kayıt defterinde kalır
+    sonra  Her --archive-every siparişte CustomerOrderRegistry.archive_orders çağrılır
+
+GC duraklamaları gc.callbacks ile her toplama için ölçülür. RSS /proc/self/statm'den
+(yoksa resource.getrusage'ın tepe değerinden) okunur. --checkpoints kez ara sonuç yazılır.
+
+Varsayılan 10 milyon siparişte "önce" modu onlarca GB bellek ister; küçük makinelerde
+--orders düşürülmelidir.
+
+Kullanım:
+    python benchmarks/bench_order_soak.py --orders 10000000 --archive-every 50000
+    python benchmarks/bench_order_soak.py --orders 500000 --mode sonra
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from customer_order_registry import CustomerOrderRegistry
+from observer import Observer
+from order import OrderStatus
+from order_archive import OrderArchive
+from order_factory import OrderFactory
+from order_ids import CounterIdGenerator
+from order_subject import OrderSubject
+from product import PhysicalProduct
+
+ORDER_TYPES = ["standard", "express", "subscription", "gift", "bulk"]
+MODES = ("önce", "sonra")
+
+
+class AuditObserver(Observer):
+    """
+    Siparişlerin bir kısmına bağlanan, çıktı üretmeyen gözlemci.
+    """
+    def __init__(self):
+        self.received = 0
+
+    def update(self, order):
+        self.received += 1
+
+
+class GCPauses:
+    """
+    gc.callbacks ile her toplamanın süresini nesil bazında toplar.
+    """
+    def __init__(self):
+        self.count = [0, 0, 0]
+        self.total = [0.0, 0.0, 0.0]
+        self.max = [0.0, 0.0, 0.0]
+        self._start = 0.0
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+            return
+        pause = time.perf_counter() - self._start
+        generation = info["generation"]
+        self.count[generation] += 1
+        self.total[generation] += pause
+        self.max[generation] = max(self.max[generation], pause)
+
+
+def rss_mb() -> float:
+    """
+    Sürecin güncel RSS değeri (MB). /proc yoksa tepe değer döner.
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def peak_rss_mb() -> float:
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 # Linux'ta KB
+
+
+def run_soak(mode: str, args) -> dict:
+    rng = random.Random(args.seed)
+    Customer.update = lambda self, order: None # Bildirim çıktısını ölçüme katmamak için
+    Customer.update_many = lambda self, orders: None
+    OrderFactory.set_id_generator(CounterIdGenerator("soak"))
+    registry = CustomerOrderRegistry.get_instance()
+    customers = [Customer(f"c-{i}", f"Müşteri {i}", f"m{i}@example.com") for i in range(args.customers)]
+    for customer in customers:
+        registry.add_customer(customer)
+    products = [PhysicalProduct(i, f"Ürün {i}", "Kırtasiye", round(rng.uniform(5, 500), 2), 10**12) for i in range(500)]
+    carts = [[(rng.choice(products), rng.randint(1, 3)) for _ in range(rng.randint(1, 4))] for _ in range(256)]
+    audit = AuditObserver()
+    pauses = GCPauses()
+    gc.collect()
+    gc.callbacks.append(pauses)
+
+    checkpoint_every = max(args.orders // args.checkpoints, args.batch)
+    next_checkpoint = checkpoint_every
+    next_archive = args.archive_every
+    created = 0
+    start = time.perf_counter()
+    print(f"\n[{mode}] {'Sipariş':>10} | {'Canlı':>9} | {'Arşiv':>9} | {'RSS (MB)':>8} | "
+          f"{'Gen2':>4} | {'Gen2 maks (ms)':>14} | {'GC top. (sn)':>12} | {'Süre (sn)':>9}", flush=True)
+    while created < args.orders:
+        count = min(args.batch, args.orders - created)
+        specs = [(rng.choice(ORDER_TYPES), rng.choice(customers), carts[rng.randrange(len(carts))], {})
+                 for _ in range(count)]
+        orders = OrderFactory.create_orders_many(specs)
+        for order in orders:
+            registry.add_order(order)
+        for order in orders[::100]:
+            order.attach(audit)
+        ids = [order.order_id for order in orders]
+        cancelled = count // 20
+        registry.transition_orders(ids[:cancelled], OrderStatus.CANCELLED)
+        registry.transition_orders(ids[cancelled:], OrderStatus.SHIPPED)
+        registry.transition_orders(ids[cancelled:], OrderStatus.DELIVERED)
+        registry.transition_orders(ids[cancelled:cancelled + count // 50], OrderStatus.RETURNED)
+        del orders, specs, ids, order
+        created += count
+
+        if mode == "sonra" and created >= next_archive:
+            registry.archive_orders()
+            next_archive += args.archive_every
+        if created >= next_checkpoint or created == args.orders:
+            next_checkpoint += checkpoint_every
+            print(f"[{mode}] {created:>10,} | {len(registry.get_orders()):>9,} | {len(OrderArchive.get_instance()):>9,} | "
+                  f"{rss_mb():>8.0f} | {pauses.count[2]:>4} | {pauses.max[2] * 1000:>14.1f} | "
+                  f"{sum(pauses.total):>12.2f} | {time.perf_counter() - start:>9.1f}", flush=True)
+
+    gc.callbacks.remove(pauses)
+    return {
+        "mode": mode,
+        "orders": created,
+        "seconds": time.perf_counter() - start,
+        "rss_mb": rss_mb(),
+        "peak_rss_mb": peak_rss_mb(),
+        "gc_count": pauses.count,
+        "gc_max_ms": [pause * 1000 for pause in pauses.max],
+        "gc_total_s": sum(pauses.total),
+        "subscriptions": OrderSubject.subscription_count(),
+        "audit_notifications": audit.received,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uzun süreli sipariş akışında GC duraklamaları ve RSS")
+    parser.add_argument("--orders", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=1_000, help="create_orders_many grup boyutu")
+    parser.add_argument("--archive-every", type=int, default=50_000, help="Arşivleme aralığı (sipariş)")
+    parser.add_argument("--customers", type=int, default=100_000)
+    parser.add_argument("--checkpoints", type=int, default=10, help="Ara sonuç sayısı")
+    parser.add_argument("--mode", choices=MODES + ("ikisi",), default="ikisi")
+    parser.add_argument("--json", action="store_true", help="Sonucu son satırda JSON olarak yaz (alt süreçler için)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if args.mode != "ikisi":
+        result = run_soak(args.mode, args)
+        if args.json:
+            print(json.dumps(result, ensure_ascii=False))
+        return
+
+    results = {}
+    for mode in MODES:
+        command = [sys.executable, os.path.abspath(__file__), "--mode", mode, "--json"]
+        for name in ("orders", "batch", "archive_every", "customers", "checkpoints", "seed"):
+            command += [f"--{name.replace('_', '-')}", str(getattr(args, name))]
+        output = subprocess.run(command, stdout=subprocess.PIPE, text=True, check=True).stdout.splitlines()
+        print("\n".join(output[:-1]))
+        results[mode] = json.loads(output[-1])
+
+    print(f"\n{args.orders:,} sipariş\n")
+    print(f"{'Mod':<6} | {'Süre (sn)':>9} | {'RSS (MB)':>8} | {'Tepe RSS':>8} | {'Gen2':>4} | "
+          f"{'Gen2 maks (ms)':>14} | {'GC top. (sn)':>12} | {'Abonelik':>8}")
+    print("-" * 92)
+    for mode, result in results.items():
+        print(f"{mode:<6} | {result['seconds']:>9.1f} | {result['rss_mb']:>8.0f} | {result['peak_rss_mb']:>8.0f} | "
+              f"{result['gc_count'][2]:>4} | {result['gc_max_ms'][2]:>14.1f} | {result['gc_total_s']:>12.2f} | "
+              f"{result['subscriptions']:>8,}")
+
+
+if __name__ == "__main__":
+    main()
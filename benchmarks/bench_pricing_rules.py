@@ -0,0 +1,191 @@
+# benchmarks/bench_pricing_rules.py
+"""
+Fiyatlama kurallarının sepet başına değerlendirme maliyetini kural sayısına göre ölçer.
+
+- "Önce": tür ayarlamalarının Order alt sınıflarına gömülü olduğu hal (bu dosyada birebir
+  kopyalanmıştır); kural motoru olmadan sepet başına maliyet.
+- Derlenmiş plan: PricingPlan.order_total (indeksler ve ürün başına saklanan kurallar).
+- Doğrusal tarama: aynı anlamı taşıyan, her satır için bütün kuralları sırayla deneyen
+  yorumlayıcı; yalnızca --naive-carts sepet üzerinde koşturulur ve sonuçları planla
+  birebir karşılaştırılır.
+
+Kural kümeleri varsayılan kurallara ek olarak rastgele üretilir: kategori, ürün ve ürün türü
+koşullu satır kuralları, sipariş türü ve müşteri koşullu sipariş kuralları ve dekoratör
+ücret kuralları. Dekoratörlü maliyet (InsuranceDecorator(FragileDecorator(BaseOrder)))
+de her kural kümesi için ölçülür.
+
+Kullanım:
+    python benchmarks/bench_pricing_rules.py --carts 20000 --sizes 0,10,100,1000,10000
+"""
+import argparse
+import gc
+import os
+import random
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from order import Order, ExpressOrder, SubscriptionOrder, GiftOrder, BulkOrder
+from order_decorator import BaseOrder, FragileDecorator, InsuranceDecorator, DECORATORS
+from pricing_rules import DEFAULT_RULES, PricingPlan, PricingRegistry, PricingRule
+from product import PhysicalProduct, DigitalProduct, ServiceProduct
+from shippingstrategy import CheapShipping
+
+ORDER_CLASSES = [Order, ExpressOrder, SubscriptionOrder, BulkOrder]
+ORDER_TYPES = ["Standard", "Express", "Subscription", "Gift", "Bulk", "PreOrder"]
+PRODUCT_TYPES = ["Physical", "Digital", "Service"]
+
+
+def legacy_total(order) -> float:
+    base_total = sum(product.price * qty for product, qty in order.products)
+    if isinstance(order, ExpressOrder):
+        return base_total * 1.10
+    if isinstance(order, SubscriptionOrder):
+        return base_total * 0.85
+    if isinstance(order, BulkOrder) and base_total > 1000:
+        return base_total * 0.95
+    return base_total
+
+
+def naive_total(ordered_rules, order) -> float:
+    """
+    Kuralları indekssiz, sırayla deneyen yorumlayıcı (PricingPlan.order_total ile aynı anlam).
+    """
+    lines = order.products
+    order_type, customer_id = order.get_type(), order.customer.customer_id
+    subtotal = 0
+    for product, qty in lines:
+        amount = product.price * qty
+        for rule in ordered_rules:
+            if (rule.scope != "line"
+                    or (rule.product_ids and product.product_id not in rule.product_ids)
+                    or (rule.categories and product.category not in rule.categories)
+                    or (rule.product_types and product.get_type() not in rule.product_types)
+                    or (rule.order_types and order_type not in rule.order_types)
+                    or (rule.customer_ids and customer_id not in rule.customer_ids)
+                    or qty < rule.min_quantity):
+                continue
+            amount = amount * rule.multiplier + rule.amount * qty if rule.amount else amount * rule.multiplier
+        if amount < 0:
+            amount = 0.0
+        subtotal += amount
+    total = subtotal
+    units = sum(qty for _, qty in lines)
+    for rule in ordered_rules:
+        if (rule.scope != "order"
+                or (rule.order_types and order_type not in rule.order_types)
+                or (rule.customer_ids and customer_id not in rule.customer_ids)
+                or (rule.subtotal_over is not None and not subtotal > rule.subtotal_over)
+                or units < rule.min_quantity):
+            continue
+        total = total * rule.multiplier + rule.amount if rule.amount else total * rule.multiplier
+    return total if total > 0 else 0.0
+
+
+def random_rules(count: int, rng: random.Random, products, categories, customers):
+    rules = []
+    for i in range(count):
+        kind = rng.random()
+        options = {"priority": rng.choice((50, 100, 150))}
+        if kind < 0.40:
+            scope = "line"
+            options.update(categories=[rng.choice(categories)], percent=-rng.randint(1, 20))
+        elif kind < 0.65:
+            scope = "line"
+            options.update(product_ids=[rng.choice(products).product_id], amount=-rng.randint(1, 5),
+                           min_quantity=rng.choice((0, 2)))
+        elif kind < 0.75:
+            scope = "line"
+            options.update(product_types=[rng.choice(PRODUCT_TYPES)], order_types=[rng.choice(ORDER_TYPES)],
+                           percent=-rng.randint(1, 10))
+        elif kind < 0.90:
+            scope = "order"
+            if rng.random() < 0.5:
+                options.update(customer_ids=[rng.choice(customers).customer_id])
+            else:
+                options.update(order_types=[rng.choice(ORDER_TYPES)], subtotal_over=rng.choice((None, 200, 800)))
+            options.update(percent=-rng.randint(1, 10), min_quantity=rng.choice((0, 0, 5)))
+        else:
+            scope = "surcharge"
+            options.update(decorator=rng.choice(list(DECORATORS)), subtotal_over=rng.choice((None, 300)),
+                           customer_ids=[rng.choice(customers).customer_id] if rng.random() < 0.5 else None,
+                           amount=rng.randint(0, 40))
+        rules.append(PricingRule(f"kural-{i}", scope, **options))
+    return rules
+
+
+def best_of(repeat: int, run) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fiyatlama kuralları: sepet başına maliyet ve kural sayısı")
+    parser.add_argument("--carts", type=int, default=20_000)
+    parser.add_argument("--sizes", default="0,10,100,1000,10000", help="Varsayılanlara eklenecek kural sayıları")
+    parser.add_argument("--naive-carts", type=int, default=300, help="Doğrusal taramanın koşturulacağı sepet sayısı")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    categories = [f"Kategori {i}" for i in range(40)]
+    product_classes = [(PhysicalProduct, 10**9), (DigitalProduct, "indir.zip"), (ServiceProduct, 30)]
+    products = []
+    for i in range(5000):
+        cls, last = rng.choice(product_classes)
+        products.append(cls(i, f"Ürün {i}", rng.choice(categories), round(rng.uniform(5, 500), 2), last))
+    customers = [Customer(f"c-{i}", f"Müşteri {i}", f"m{i}@example.com") for i in range(2000)]
+    orders = []
+    for i in range(args.carts):
+        cart = [(rng.choice(products), rng.randint(1, 4)) for _ in range(rng.randint(1, 6))]
+        if rng.random() < 0.1:
+            order = GiftOrder(str(i), rng.choice(customers), cart, "Not")
+        else:
+            order = rng.choice(ORDER_CLASSES)(str(i), rng.choice(customers), cart)
+        order.set_shipping_strategy(CheapShipping())
+        orders.append(order)
+    decorated = [InsuranceDecorator(FragileDecorator(BaseOrder(order))) for order in orders]
+    sample = orders[:args.naive_carts]
+
+    legacy = best_of(args.repeat, lambda: [legacy_total(order) for order in orders])
+    print(f"{args.carts} sepet (1-6 satır), en iyi {args.repeat} tekrar")
+    print(f"önce (alt sınıflara gömülü tür ayarlamaları): {legacy / args.carts * 1e6:.2f} µs/sepet\n")
+    print(f"{'Kural':>6} | {'Derleme (ms)':>12} | {'Plan µs/sepet':>13} | {'Doğrusal µs/sepet':>17} | "
+          f"{'Hızlanma':>8} | {'Dekoratörlü µs':>14}")
+    print("-" * 86)
+
+    registry = PricingRegistry.get_instance()
+    for size in [int(size) for size in args.sizes.split(",")]:
+        rules = list(DEFAULT_RULES) + random_rules(size, rng, products, categories, customers)
+        start = time.perf_counter()
+        plan = PricingPlan(rules)
+        compile_ms = (time.perf_counter() - start) * 1000
+
+        planned = best_of(args.repeat, lambda: [plan.order_total(order) for order in orders]) / args.carts
+        ordered = plan.rules
+        naive = best_of(1, lambda: [naive_total(ordered, order) for order in sample]) / len(sample)
+        mismatched = sum(plan.order_total(order) != naive_total(ordered, order) for order in sample)
+        if mismatched:
+            raise SystemExit(f"{size} kural: {mismatched} sepette plan ve doğrusal tarama farklı sonuç verdi.")
+
+        registry.set_rules(rules)
+        for order in orders: # Dekoratörlü maliyet güncel kurallarla hesaplanmış temel toplamı kullanır
+            order.total = order.calculate_total()
+        costed = best_of(args.repeat, lambda: [component.get_total_cost() for component in decorated]) / args.carts
+        print(f"{size:>6} | {compile_ms:>12.2f} | {planned * 1e6:>13.2f} | {naive * 1e6:>17.2f} | "
+              f"x{naive / planned:>7.1f} | {costed * 1e6:>14.2f}")
+    registry.reset()
+    print("\nPlan ve doğrusal tarama sonuçları bütün kural kümelerinde birebir aynı.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# benchmarks/bench_product_search.py
+"""
+Ürün adı aramasını karşılaştırır:
+
+- "Önce": tüm ürünler üzerinde doğrusal tarama (her ad kelimelere ayrılıp sorgu
+  kelimeleriyle önek karşılaştırması yapılır, eşleşmeler aynı kurallarla sıralanır).
+- "Sonra": InventoryManager.search_products (ters indeks + sıralı kelime listesinde bisect).
+
+İndeksin kurulma süresi (ilk arama) ayrıca yazdırılır. --catalog verilirse ürünler mmap'lenen
+anlık görüntüden açılır ve indeks ürün nesneleri oluşturulmadan kurulur.
+
+Kullanım:
+    python benchmarks/bench_product_search.py --count 1000000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog_snapshot import write_catalog_snapshot
+from inventorymanager import InventoryManager
+from product import PhysicalProduct
+from product_search import tokenize
+
+PREFIXES = ["Kitap:", "Defter", "Kalem", "Set", "Kurs:", "Yazılım:", "Kablo", "Çanta"]
+WORDS = ["Python", "Programlama", "İleri", "Başlangıç", "Kırmızı", "Mavi", "Işıklı", "Çizgili", "Kareli",
+         "Öğrenci", "Ofis", "Türkçe", "İngilizce", "Matematik", "Fizik", "Kimya", "Tarih", "Coğrafya",
+         "Sanat", "Müzik", "Veri", "Analizi", "Yapay", "Zeka", "Ağ", "Güvenliği", "Web", "Tasarım"]
+QUERIES = ["python", "kitap pyt", "İNGİLİZCE", "ışık", "kırmızı kareli defter", "zeka yap", "coğ", "sanat müzik ofis"]
+
+
+def product_name(rng: random.Random, product_id: int) -> str:
+    words = rng.sample(WORDS, rng.randint(1, 3))
+    return f"{rng.choice(PREFIXES)} {' '.join(words)} {product_id}"
+
+
+def linear_search(products, query: str, limit: int):
+    """
+    İndeks olmadan tüm adları tarayan, search_products ile aynı sıralamayı veren arama.
+    """
+    tokens = list(dict.fromkeys(tokenize(query)))
+    ranked = []
+    for product in products:
+        terms = tokenize(product.name)
+        score = 0
+        for token in tokens:
+            if token in terms:
+                score += 2
+            elif any(term.startswith(token) for term in terms):
+                score += 1
+            else:
+                break
+        else:
+            ranked.append((-score, len(terms), product.product_id, product))
+    ranked.sort(key=lambda row: row[:3])
+    return [row[3] for row in ranked[:limit]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ürün adı araması: doğrusal tarama ve ters indeks")
+    parser.add_argument("--count", type=int, default=1_000_000, help="Katalogdaki ürün sayısı")
+    parser.add_argument("--limit", type=int, default=20, help="Sorgu başına sonuç sınırı")
+    parser.add_argument("--repeat", type=int, default=200, help="İndeksli sorgu tekrar sayısı")
+    parser.add_argument("--catalog", action="store_true", help="Ürünleri mmap'lenen anlık görüntüden aç")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    products = [PhysicalProduct(product_id, product_name(rng, product_id), "Kırtasiye", 10.0, 5)
+                for product_id in range(1, args.count + 1)]
+    inventory = InventoryManager.get_instance()
+    path = None
+    if args.catalog:
+        path = os.path.join(tempfile.mkdtemp(prefix="search-bench-"), "catalog.bin")
+        write_catalog_snapshot(path, products)
+        inventory.open_catalog(path)
+    else:
+        for product in products:
+            inventory.add_product(product, verbose=False)
+
+    start = time.perf_counter()
+    inventory.search_products("python", args.limit)
+    print(f"İndeksin kurulması (ilk arama): {time.perf_counter() - start:7.3f} sn ({args.count} ürün)\n")
+
+    print(f"{'Sorgu':<24} | {'Sonuç':>6} | {'Tarama (ms)':>12} | {'İndeks (µs)':>12} | {'Hızlanma':>9}")
+    print("-" * 76)
+    for query in QUERIES:
+        start = time.perf_counter()
+        expected = linear_search(products, query, args.limit)
+        before = time.perf_counter() - start
+        inventory.search_products(query, args.limit) # Kelimelerin sıralı ürün listeleri ilk sorguda kurulur
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            found = inventory.search_products(query, args.limit)
+        after = (time.perf_counter() - start) / args.repeat
+        assert [product.product_id for product in found] == [product.product_id for product in expected], query
+        print(f"{query:<24} | {len(found):>6} | {before * 1e3:>12.2f} | {after * 1e6:>12.1f} | x{before / after:>8,.0f}")
+
+    if path:
+        inventory.stock.close()
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
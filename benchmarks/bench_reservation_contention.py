@@ -0,0 +1,103 @@
+# benchmarks/bench_reservation_contention.py
+"""
+InventoryManager.reserve_stock / commit_reservation yolunu 1, 8 ve 32 iş parçacığıyla ölçer
+ve sonunda hiçbir ürünün stoğunun eksiye düşmediğini (overselling olmadığını) doğrular.
+
+Kullanım:
+    python benchmarks/bench_reservation_contention.py --products 10000 --carts 20000
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inventorymanager import InventoryManager
+from product import PhysicalProduct
+
+
+def reset_inventory(product_count: int, initial_stock: int) -> InventoryManager:
+    """
+    Singleton'ı sıfırlayıp sentetik fiziksel ürünlerle doldurur.
+    """
+    InventoryManager._instance = None
+    inventory = InventoryManager.get_instance()
+    for product_id in range(1, product_count + 1):
+        inventory.add_product(PhysicalProduct(product_id, f"Ürün {product_id}", "Kırtasiye", 10.0, initial_stock), verbose=False)
+    return inventory
+
+
+def make_carts(cart_count: int, product_count: int, seed: int):
+    """
+    Her biri 1-4 satırdan oluşan rastgele sepetler üretir.
+    """
+    rng = random.Random(seed)
+    return [[(rng.randint(1, product_count), rng.randint(1, 3)) for _ in range(rng.randint(1, 4))]
+            for _ in range(cart_count)]
+
+
+def run(thread_count: int, product_count: int, carts, initial_stock: int):
+    """
+    Sepetleri iş parçacıklarına bölerek reserve + commit çalıştırır.
+    """
+    inventory = reset_inventory(product_count, initial_stock)
+    products = {product_id: inventory.get_product(product_id) for product_id in range(1, product_count + 1)}
+    committed = [0] * thread_count
+    rejected = [0] * thread_count
+    sold = [dict() for _ in range(thread_count)]
+
+    def worker(index: int):
+        for cart in carts[index::thread_count]:
+            lines = [(products[product_id], quantity) for product_id, quantity in cart]
+            try:
+                reservation_id = inventory.reserve_stock(lines)
+            except ValueError:
+                rejected[index] += 1
+                continue
+            inventory.commit_reservation(reservation_id, verbose=False)
+            committed[index] += 1
+            for product_id, quantity in cart:
+                sold[index][product_id] = sold[index].get(product_id, 0) + quantity
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(thread_count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    # Tutarlılık kontrolü: satılan adet + kalan stok = başlangıç stoğu ve stok hiçbir zaman eksi değil
+    for product_id, product in products.items():
+        total_sold = sum(per_thread.get(product_id, 0) for per_thread in sold)
+        assert product.stock >= 0, f"Ürün {product_id} için stok eksiye düştü: {product.stock}"
+        assert product.stock + total_sold == initial_stock, f"Ürün {product_id} için stok tutarsız"
+    assert not inventory._reserved, "Sonuçlandırılmamış rezervasyon kaldı"
+
+    total_committed = sum(committed)
+    print(f"{thread_count:>7} | {len(carts):>8} | {total_committed:>10} | {sum(rejected):>9} | "
+          f"{elapsed:>8.3f} | {len(carts) / elapsed:>12,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stok rezervasyonu eşzamanlılık testi")
+    parser.add_argument("--products", type=int, default=10_000, help="Ürün sayısı")
+    parser.add_argument("--carts", type=int, default=20_000, help="İşlenecek sepet sayısı")
+    parser.add_argument("--stock", type=int, default=10, help="Her ürünün başlangıç stoğu (düşük değer çekişmeyi artırır)")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8, 32], help="Denenecek iş parçacığı sayıları")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    carts = make_carts(args.carts, args.products, args.seed)
+    print(f"{'Thread':>7} | {'Sepet':>8} | {'Onaylanan':>10} | {'Reddedilen':>9} | {'Süre(sn)':>8} | {'Sepet/sn':>12}")
+    print("-" * 70)
+    for thread_count in args.threads:
+        run(thread_count, args.products, carts, args.stock)
+
+
+if __name__ == "__main__":
+    main()
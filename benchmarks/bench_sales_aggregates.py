@@ -0,0 +1,145 @@
+# benchmarks/bench_sales_aggregates.py
+"""
+Satış raporlarının maliyetini karşılaştırır:
+
+- "Önce": rapor her istendiğinde tüm müşterilerin Customer.orders listeleri ve her
+  siparişin Order.products satırları baştan taranır.
+- "Sonra": SalesAggregates sayaçları sipariş oluşturma ve durum değişikliği olaylarıyla
+  artımlı güncellenir; rapor yalnızca sayaçları okur.
+
+Olay başına ek maliyet (create_order ve update_status süresindeki artış) ayrıca yazdırılır.
+Sonunda artımlı toplamların yeniden taramayla aynı sonucu verdiği doğrulanır.
+
+Kullanım:
+    python benchmarks/bench_sales_aggregates.py --orders 200000 --customers 20000
+"""
+import argparse
+import math
+import os
+import random
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from order import OrderStatus
+from order_factory import OrderFactory
+from order_subject import OrderSubject
+from product import PhysicalProduct
+from sales_aggregates import REFUND_STATUSES, SalesAggregates
+
+ORDER_TYPES = ["standard", "express", "subscription", "gift", "bulk"]
+CATEGORIES = ["Kırtasiye", "Kitap", "Elektronik", "Oyuncak", "Ofis"]
+# Siparişlerin yarısı bu yollardan biriyle ilerletilir (her adım bir update_status)
+STATUS_PATHS = [(OrderStatus.SHIPPED,), (OrderStatus.SHIPPED, OrderStatus.DELIVERED), (OrderStatus.CANCELLED,),
+                (OrderStatus.SHIPPED, OrderStatus.DELIVERED, OrderStatus.RETURNED)]
+
+
+def rescan_report(customers):
+    """
+    Sayaç kullanmadan, tüm sipariş geçmişini tarayarak müşteri/kategori/tür/durum bazında net ciroyu hesaplar.
+    """
+    by_customer, by_category, by_type, by_status = {}, {}, {}, {}
+    for customer in customers:
+        for order in customer.orders:
+            lines = order.products
+            base = sum(product.price * quantity for product, quantity in lines)
+            refunded = order.status in REFUND_STATUSES
+            net = 0.0 if refunded else order.total
+            by_customer[customer.customer_id] = by_customer.get(customer.customer_id, 0.0) + net
+            by_type[order.get_type()] = by_type.get(order.get_type(), 0.0) + net
+            by_status[order.status] = by_status.get(order.status, 0) + 1
+            for product, quantity in lines:
+                share = 0.0 if refunded else product.price * quantity * order.total / base
+                by_category[product.category] = by_category.get(product.category, 0.0) + share
+    return by_customer, by_category, by_type, by_status
+
+
+def aggregated_report(aggregates: SalesAggregates):
+    return ({key: totals.net_revenue for key, totals in aggregates.breakdown("customer").items()},
+            {key: totals.net_revenue for key, totals in aggregates.breakdown("category").items()},
+            {key: totals.net_revenue for key, totals in aggregates.breakdown("type").items()},
+            {key: totals.orders for key, totals in aggregates.breakdown("status").items() if totals.orders})
+
+
+def run_events(customers, products, order_count: int, seed: int):
+    """
+    Siparişleri OrderFactory ile oluşturur ve bir kısmının durumunu değiştirir;
+    (oluşturma süresi, güncelleme süresi, güncelleme sayısı) döndürür.
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    orders = [OrderFactory.create_order(rng.choice(ORDER_TYPES), rng.choice(customers),
+                                        [(rng.choice(products), rng.randint(1, 3)) for _ in range(rng.randint(1, 4))],
+                                        gift_note="Not")
+              for _ in range(order_count)]
+    created = time.perf_counter() - start
+    paths = [(order, rng.choice(STATUS_PATHS)) for order in rng.sample(orders, order_count // 2)]
+    start = time.perf_counter()
+    for order, path in paths:
+        for status in path:
+            order.update_status(status)
+    return created, time.perf_counter() - start, sum(len(path) for _, path in paths)
+
+
+def close_enough(left: dict, right: dict) -> bool:
+    return left.keys() == right.keys() and all(math.isclose(left[key], right[key], rel_tol=1e-9, abs_tol=1e-6)
+                                               for key in left)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Satış raporu: yeniden tarama ve artımlı sayaçlar")
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--customers", type=int, default=20_000)
+    parser.add_argument("--products", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    products = [PhysicalProduct(i, f"Ürün {i}", rng.choice(CATEGORIES), round(rng.uniform(1, 500), 2), 10**9)
+                for i in range(1, args.products + 1)]
+    Customer.update = lambda self, order: None # Bildirim çıktısını ölçüme katmamak için
+
+    def make_customers():
+        return [Customer(f"c-{i}", f"Müşteri {i}", f"m{i}@example.com") for i in range(args.customers)]
+
+    plain_customers = make_customers()
+    plain_created, plain_updated, _ = run_events(plain_customers, products, args.orders, args.seed)
+
+    aggregates = SalesAggregates.get_instance()
+    customers = make_customers()
+    created, updated, update_count = run_events(customers, products, args.orders, args.seed)
+    print(f"{args.orders} sipariş oluşturma: {plain_created:.2f} sn -> {created:.2f} sn "
+          f"(+{(created - plain_created) / args.orders * 1e6:.1f} µs/sipariş)")
+    print(f"{update_count} durum güncellemesi: {plain_updated:.2f} sn -> {updated:.2f} sn "
+          f"(+{(updated - plain_updated) / update_count * 1e6:.1f} µs/güncelleme)\n")
+
+    start = time.perf_counter()
+    expected = rescan_report(customers)
+    before = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = aggregated_report(aggregates)
+    after = time.perf_counter() - start
+    assert all(close_enough(left, right) for left, right in zip(expected, actual)), "Sayaçlar yeniden taramayla tutmuyor"
+
+    repeat = 10_000
+    customer_id = customers[0].customer_id
+    start = time.perf_counter()
+    for _ in range(repeat):
+        aggregates.customer_totals(customer_id).net_revenue
+    single = (time.perf_counter() - start) / repeat
+
+    print(f"{'Ölçüm':<34} | {'Süre':>14}")
+    print("-" * 52)
+    print(f"{'Tam rapor, yeniden tarama':<34} | {before * 1e3:>11.1f} ms")
+    print(f"{'Tam rapor, sayaçlardan':<34} | {after * 1e3:>11.1f} ms")
+    print(f"{'Tek müşterinin net cirosu':<34} | {single * 1e6:>11.2f} µs")
+    print(f"\nHızlanma (tam rapor): x{before / after:.1f}")
+    OrderSubject.detach_global(aggregates)
+    OrderFactory.remove_listener(aggregates)
+
+
+if __name__ == "__main__":
+    main()
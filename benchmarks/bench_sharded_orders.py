@@ -0,0 +1,136 @@
+# benchmarks/bench_sharded_orders.py
+"""
+Bölümlenmiş envanterle (ShardedInventory) sipariş alım hızını yerel bir yük üreticisiyle ölçer.
+
+- Tek süreç: aynı iş (rezervasyon, OrderFactory.create_order, kargo seçimi, kesinleştirme)
+  tek InventoryManager üzerinde sırayla yapılır.
+- N işçi: siparişler place_orders ile toplu olarak bölümlere yönlendirilir. Sepetlerin
+  --cross oranı birden fazla bölüme yayılır ve iki aşamalı rezervasyondan geçer.
+
+Her çalıştırmanın sonunda stoğun eksiye düşmediği, bekleyen işlem kalmadığı ve satılan
+adetlerin stok düşüşüne eşit olduğu doğrulanır. Ölçeklenme, makinedeki çekirdek sayısıyla
+sınırlıdır (os.cpu_count() yazdırılır).
+
+Kullanım:
+    python benchmarks/bench_sharded_orders.py --orders 200000 --workers 1 2 4 8 --cross 0.1
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from inventorymanager import InventoryManager
+from order_factory import OrderFactory
+from product import PhysicalProduct
+from sharded_inventory import OrderRequest, ShardedInventory
+from shipping_selector import choose_optimal_shipping_strategy
+
+ORDER_TYPES = ["standard", "express", "subscription", "gift", "bulk"]
+
+
+def make_products(count: int, stock: int, seed: int):
+    rng = random.Random(seed)
+    return [PhysicalProduct(product_id, f"Ürün {product_id}", "Kırtasiye", round(rng.uniform(5, 500), 2), stock)
+            for product_id in range(1, count + 1)]
+
+
+def make_requests(count: int, product_count: int, shard_count: int, cross: float, seed: int):
+    """
+    Sepetlerin (1 - cross) oranı tek bir bölümün ürünlerinden, kalanı tüm katalogdan seçilir.
+    """
+    rng = random.Random(seed)
+    requests = []
+    for i in range(count):
+        line_count = rng.randint(1, 4)
+        if shard_count > 1 and rng.random() < cross:
+            product_ids = [rng.randint(1, product_count) for _ in range(line_count)]
+        else:
+            shard = rng.randrange(shard_count)
+            product_ids = [shard + shard_count * rng.randrange(1, product_count // shard_count) for _ in range(line_count)]
+        order_type = rng.choice(ORDER_TYPES)
+        kwargs = {"gift_note": "İyi ki doğdun"} if order_type == "gift" else None
+        requests.append(OrderRequest(f"c-{i % 10_000}", f"Müşteri {i % 10_000}", f"musteri{i % 10_000}@example.com",
+                                     order_type, [(product_id, rng.randint(1, 3)) for product_id in product_ids], kwargs))
+    return requests
+
+
+def run_single_process(products, requests) -> float:
+    """
+    Aynı istekleri tek süreçte, tek InventoryManager üzerinde işler ve saniyede sipariş sayısını döndürür.
+    """
+    InventoryManager._instance = None
+    inventory = InventoryManager.get_instance()
+    for product in products:
+        inventory.add_product(PhysicalProduct(product.product_id, product.name, product.category, product.price,
+                                              product.stock), verbose=False)
+    start = time.perf_counter()
+    for request in requests:
+        cart = [(inventory.get_product(product_id), quantity) for product_id, quantity in request.lines]
+        try:
+            reservation_id = inventory.reserve_stock(cart)
+        except ValueError:
+            continue
+        customer = Customer(request.customer_id, request.customer_name, request.customer_email)
+        order = OrderFactory.create_order(request.order_type, customer, cart, **request.kwargs)
+        order.set_shipping_strategy(choose_optimal_shipping_strategy(order, verbose=False))
+        inventory.commit_reservation(reservation_id, verbose=False)
+    return len(requests) / (time.perf_counter() - start)
+
+
+def run_sharded(products, requests, shard_count: int, batch_size: int, initial_stock: int):
+    """
+    İstekleri bölümlenmiş envanterle işler; (sipariş/sn, kabul, iki aşamalı sipariş sayısı) döndürür.
+    """
+    with ShardedInventory(shard_count) as inventory:
+        inventory.load_products(products)
+        accepted = cross = sold = 0
+        start = time.perf_counter()
+        for offset in range(0, len(requests), batch_size):
+            batch = requests[offset:offset + batch_size]
+            for request, result in zip(batch, inventory.place_orders(batch)):
+                cross += result.shards > 1
+                if result.ok:
+                    accepted += 1
+                    sold += sum(quantity for _, quantity in request.lines)
+        elapsed = time.perf_counter() - start
+
+        stats = inventory.stats()
+        remaining = sum(inventory.get_available_stock(product.product_id) for product in products)
+        assert all(shard["min_stock"] >= 0 for shard in stats), "Stok eksiye düştü"
+        assert all(shard["prepared"] == 0 for shard in stats), "Bekleyen iki aşamalı işlem kaldı"
+        assert initial_stock * len(products) - remaining == sold, "Satılan adet ile stok düşüşü tutmuyor"
+    return len(requests) / elapsed, accepted, cross
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bölümlenmiş envanterle paralel sipariş alımı")
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--stock", type=int, default=20, help="Ürün başına başlangıç stoğu")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8], help="Denenecek bölüm sayıları")
+    parser.add_argument("--batch", type=int, default=2000, help="place_orders başına istek sayısı")
+    parser.add_argument("--cross", type=float, default=0.1, help="Birden fazla bölüme yayılan sepet oranı")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    products = make_products(args.products, args.stock, args.seed)
+    print(f"Çekirdek sayısı: {os.cpu_count()} | {args.products} ürün, {args.orders} sipariş, "
+          f"çapraz bölüm oranı {args.cross:.0%}\n")
+
+    baseline = run_single_process(products, make_requests(args.orders, args.products, 1, 0, args.seed))
+    print(f"{'Yapı':<14} | {'Sipariş/sn':>11} | {'Hızlanma':>9} | {'Kabul':>8} | {'2 aşamalı':>9}")
+    print("-" * 64)
+    print(f"{'tek süreç':<14} | {baseline:>11,.0f} | {'x1.00':>9} | {'-':>8} | {'-':>9}")
+    for shard_count in args.workers:
+        requests = make_requests(args.orders, args.products, shard_count, args.cross, args.seed)
+        rate, accepted, cross = run_sharded(products, requests, shard_count, args.batch, args.stock)
+        print(f"{f'{shard_count} işçi':<14} | {rate:>11,.0f} | {f'x{rate / baseline:.2f}':>9} | {accepted:>8} | {cross:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# benchmarks/bench_shipping_selection.py
+"""
+Kargo seçiminin çağrı başına maliyetini ölçer.
+
+- "Önce" satırı, eski seçicinin birebir kopyasıyla (if/elif zinciri ve her çağrıda yeni
+  strateji örneği) ölçülür.
+- Farklı kademe sayılarında, kademeleri sırayla deneyen doğrusal arama (if/elif zincirinin
+  genellenmiş hali) ile ShippingTierTable.select'in ikili araması karşılaştırılır.
+- quote_many'nin (saf Python ve NumPy) sipariş başına maliyeti yazdırılır.
+
+Kullanım:
+    python benchmarks/bench_shipping_selection.py --totals 200000 --tiers 3 10 50 200
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shipping_registry
+from customer import Customer
+from order import Order
+from product import PhysicalProduct
+from shipping_registry import ShippingTierTable, FAST_SHIPPING_THRESHOLD, DRONE_SHIPPING_THRESHOLD
+from shipping_selector import choose_optimal_shipping_strategy
+from shippingstrategy import FastShipping, DroneShipping, CheapShipping, ConfiguredShipping
+
+
+def legacy_choose(order):
+    # Eski seçici: if/elif zinciri, her çağrıda yeni strateji örneği
+    if order.total >= FAST_SHIPPING_THRESHOLD:
+        return FastShipping()
+    elif order.total >= DRONE_SHIPPING_THRESHOLD:
+        return DroneShipping()
+    else:
+        return CheapShipping()
+
+
+def linear_select(tiers, total):
+    # Kademeleri en yüksekten başlayarak deneyen if/elif zincirinin genellenmiş hali
+    for min_total, strategy in tiers:
+        if total >= min_total:
+            return strategy
+    return tiers[-1][1]
+
+
+def make_tiers(count: int, max_total: float):
+    step = max_total / count
+    return [(i * step, ConfiguredShipping(f"tier-{i}", f"Kademe {i}", 10 + i, 0.001 * i)) for i in range(count)]
+
+
+def per_call_ns(func, items) -> float:
+    for item in items[:1000]: # Isınma
+        func(item)
+    start = time.perf_counter()
+    for item in items:
+        func(item)
+    return (time.perf_counter() - start) / len(items) * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Kargo seçimi çağrı başına maliyet")
+    parser.add_argument("--totals", type=int, default=200_000, help="Seçim yapılacak sipariş toplamı sayısı")
+    parser.add_argument("--tiers", type=int, nargs="+", default=[3, 10, 50, 200], help="Denenecek kademe sayıları")
+    parser.add_argument("--max-total", type=float, default=2000.0)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    totals = [round(rng.uniform(0, args.max_total), 2) for _ in range(args.totals)]
+    customer = Customer("c-1", "Müşteri", "musteri@example.com")
+    product = PhysicalProduct(1, "Defter", "Kırtasiye", 1, 10**9)
+    orders = [Order(f"o-{i}", customer, [(product, 1)]) for i in range(args.totals)]
+    for order, total in zip(orders, totals):
+        order.total = total
+
+    print("Varsayılan 3 kademe (sipariş nesnesiyle):")
+    before = per_call_ns(lambda order: legacy_choose(order), orders)
+    after = per_call_ns(lambda order: choose_optimal_shipping_strategy(order, False), orders)
+    print(f"  {'Önce (if/elif + yeni örnek)':<34}: {before:>7.1f} ns/çağrı")
+    print(f"  {'Sonra (choose_optimal, bisect)':<34}: {after:>7.1f} ns/çağrı | hızlanma x{before / after:.2f}")
+
+    print(f"\n{'Kademe':>6} | {'Doğrusal':>12} | {'Bisect':>12} | {'quote_many':>12} | {'quote_many NumPy':>16}")
+    print("-" * 72)
+    for count in args.tiers:
+        tiers = make_tiers(count, args.max_total)
+        table = ShippingTierTable(tiers)
+        descending = list(reversed(tiers))
+        for total in totals[:1000]:
+            assert linear_select(descending, total) is table.select(total)
+
+        linear = per_call_ns(lambda total: linear_select(descending, total), totals)
+        bisected = per_call_ns(table.select, totals)
+        start = time.perf_counter()
+        table.quote_many(totals, use_numpy=False)
+        python_many = (time.perf_counter() - start) / len(totals) * 1e9
+        numpy_many = "-"
+        if shipping_registry.load_numpy() is not None:
+            start = time.perf_counter()
+            table.quote_many(totals, use_numpy=True)
+            numpy_many = f"{(time.perf_counter() - start) / len(totals) * 1e9:>8.1f} ns"
+        print(f"{count:>6} | {linear:>9.1f} ns | {bisected:>9.1f} ns | {python_many:>9.1f} ns | {numpy_many:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# benchmarks/bench_startup.py
+"""
+Açılış süresini python -X importtime çıktısından ölçer ve bütçeyle karşılaştırır.
+
+Her hedef ayrı bir yorumlayıcıda çalıştırılır; yorumlayıcının kendi açılışında (site,
+encodings) yüklenen modüller düşülür, kalan üst düzey içe aktarmaların kümülatif süreleri
+toplanır. Ölçümler bayt kodu önbelleği (__pycache__) sıcakken yapılır: ilk koşu ısınma
+koşusudur ve PYTHONDONTWRITEBYTECODE alt süreçler için kaldırılır.
+
+Hedefler:
+    main          Konsol uygulamasının menüyü gösterene kadar yüklediği modüller
+    core          Yalnızca paketin kendisi (adlar ilk erişimde yüklenir)
+    core-worker   Toplu işlem süreçlerinin tipik kullanımı: sipariş, envanter ve kargo
+
+core hedeflerinde konsol modüllerinden (*_console) biri veya main yüklenirse ölçüm başarısız sayılır.
+Bütçeyi aşan hedef olursa çıkış kodu 1'dir. core-worker görüntüleme (table_renderer), NumPy ve
+json modüllerini yüklemez; bunlar ilk kullanıldıkları yerde içe aktarılır.
+
+Kullanım:
+    python benchmarks/bench_startup.py --repeat 7 --budget-main 60 --budget-core-worker 40
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = {
+    "main": "import main",
+    "core": "import core",
+    "core-worker": "import core; core.OrderFactory; core.InventoryManager; core.choose_optimal_shipping_strategy",
+}
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """
+    -X importtime satırlarını (modül, derinlik, kendi süresi µs, kümülatif süre µs) listesine çevirir.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def run_importtime(statement: str, env: Dict[str, str]) -> List[Tuple[str, int, int, int]]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            cwd=ROOT, env=env, capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+
+def measure(statement: str, baseline: set, env: Dict[str, str], repeat: int):
+    """
+    Hedefi repeat kez ölçer; (medyan ms, son koşunun satırları) döndürür.
+    """
+    run_importtime(statement, env) # Isınma: bayt kodu önbelleğini doldurur
+    totals = []
+    for _ in range(repeat):
+        rows = run_importtime(statement, env)
+        totals.append(sum(cumulative for name, depth, _, cumulative in rows if depth == 0 and name not in baseline))
+    return statistics.median(totals) / 1000, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="-X importtime ile açılış süresi ve bütçe kontrolü")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget-main", type=float, default=60.0, help="main için bütçe (ms)")
+    parser.add_argument("--budget-core", type=float, default=2.0, help="core için bütçe (ms)")
+    parser.add_argument("--budget-core-worker", type=float, default=40.0, help="core-worker için bütçe (ms)")
+    parser.add_argument("--top", type=int, default=8, help="main için listelenecek en yavaş modül sayısı")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    baseline = {name for name, depth, _, _ in run_importtime("pass", env) if depth == 0}
+    budgets = {"main": args.budget_main, "core": args.budget_core, "core-worker": args.budget_core_worker}
+
+    print(f"{'Hedef':<12} | {'Medyan (ms)':>11} | {'Bütçe (ms)':>10} | {'Modül':>5} | Sonuç")
+    print("-" * 56)
+    failed = False
+    main_rows = []
+    for name, statement in TARGETS.items():
+        elapsed, rows = measure(statement, baseline, env, args.repeat)
+        loaded = [module for module, _, _, _ in rows]
+        consoles = [module for module in loaded if module.endswith("_console") or module == "main"]
+        ok = elapsed <= budgets[name] and not (name.startswith("core") and consoles)
+        failed |= not ok
+        print(f"{name:<12} | {elapsed:>11.1f} | {budgets[name]:>10.1f} | {len(loaded):>5} | {'tamam' if ok else 'AŞILDI'}")
+        if name.startswith("core") and consoles:
+            print(f"  core konsol modülü yükledi: {', '.join(consoles)}")
+        if name == "main":
+            main_rows = rows
+
+    print(f"\nmain: kendi süresi en yüksek {args.top} modül")
+    for module, _, self_us, cumulative_us in sorted(main_rows, key=lambda row: -row[2])[:args.top]:
+        print(f"  {module:<28} {self_us / 1000:>7.2f} ms (kümülatif {cumulative_us / 1000:.2f} ms)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
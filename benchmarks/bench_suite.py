@@ -0,0 +1,360 @@
+# benchmarks/bench_suite.py
+"""
+Sipariş yaşam döngüsündeki sıcak yolları sentetik veriyle ölçen tekrarlanabilir benchmark seti.
+
+Her ölçek (ürün sayısı; 10^3 - 10^6) için belirlenimci (seed'e bağlı) bir katalog ve müşteri
+kümesi üretilir; her ölçüm repeat kez çalıştırılıp en iyi süre alınır. Sonuçlar JSON olarak
+yazılır. --compare ile iki çalıştırmanın sonuçları karşılaştırılır ve eşik üzerindeki
+yavaşlamalar gerileme (regression) olarak işaretlenir; gerileme varsa çıkış kodu 1 olur.
+
+Ölçülen yollar:
+    product_factory.create_product, inventory.add_product, inventory.update_stock,
+    order_factory.create_order[<tür>] (tüm sipariş türleri), decorator.get_total_cost,
+    shipping.choose_optimal_shipping_strategy, inventory.get_products_by_category,
+    order.update_status (gözlemcilere bildirim dağıtımı)
+
+Kullanım:
+    python benchmarks/bench_suite.py --scales 1000,10000,100000 --output base.json
+    python benchmarks/bench_suite.py --scales 1000,10000,100000 --output new.json
+    python benchmarks/bench_suite.py --compare base.json new.json --threshold 0.15
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Tuple
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from inventorymanager import InventoryManager
+from observer import Observer
+from order import OrderStatus
+from order_decorator import BaseOrder, FragileDecorator, InsuranceDecorator, GiftWrapDecorator
+from order_factory import OrderFactory
+from product import PhysicalProduct
+from product_factory import ProductFactory
+from shipping_selector import choose_optimal_shipping_strategy
+
+CATEGORIES = ["Elektronik", "Kırtasiye", "Kitap", "Ev Eşyası", "Mutfak Aletleri", "Giyim", "Yazılım", "Hizmet"]
+ORDER_TYPES = ["standard", "express", "subscription", "preorder", "gift", "bulk"]
+ORDER_KWARGS = {"preorder": {"expected_delivery_date": "2026-12-31"}, "gift": {"gift_note": "İyi ki doğdun"}}
+# Yeni siparişin (Hazırlanıyor) geçebileceği durumlar
+STATUS_CYCLE = [OrderStatus.SHIPPED, OrderStatus.PENDING_PAYMENT, OrderStatus.SHIPPED, OrderStatus.CANCELLED]
+CATEGORY_QUERIES = 200 # Ölçek başına kategori sorgusu sayısı
+FANOUT_OBSERVERS = 8 # update_status ölçümünde sipariş başına gözlemci sayısı
+
+
+class SilentObserver(Observer):
+    """
+    Bildirim dağıtımının kendisini ölçmek için çıktı üretmeyen gözlemci.
+    """
+    def __init__(self):
+        self.received = 0
+
+    def update(self, order):
+        self.received += 1
+
+
+class SuiteContext:
+    """
+    Bir ölçek için üretilen sentetik veri. Aynı seed ile her çalıştırmada aynı veri üretilir.
+    """
+    def __init__(self, scale: int, seed: int):
+        rng = random.Random(seed * 1_000_003 + scale)
+        self.scale = scale
+        self.order_count = max(100, scale // 10)
+        self.product_specs: List[Tuple[str, tuple]] = []
+        for product_id in range(1, scale + 1):
+            category = CATEGORIES[product_id % len(CATEGORIES)]
+            price = round(rng.uniform(1, 2000), 2)
+            kind = product_id % 10
+            if kind < 8:
+                spec = ("physical", (product_id, f"Ürün {product_id}", category, price, 10**9))
+            elif kind == 8:
+                spec = ("digital", (product_id, f"Dijital Ürün {product_id}", category, price, f"link-{product_id}.zip"))
+            else:
+                spec = ("service", (product_id, f"Hizmet {product_id}", category, price, 1 + product_id % 365))
+            self.product_specs.append(spec)
+        self.products = [ProductFactory.create_product(kind, *args) for kind, args in self.product_specs]
+        self.physical_ids = [p.product_id for p in self.products if isinstance(p, PhysicalProduct)]
+        customer_count = max(10, scale // 100)
+        self.customers = [Customer(f"c-{i}", f"Müşteri {i}", f"musteri{i}@example.com") for i in range(customer_count)]
+        self.carts = [
+            [(rng.choice(self.products), rng.randint(1, 4)) for _ in range(rng.randint(1, 5))]
+            for _ in range(self.order_count)
+        ]
+        self.cart_customers = [rng.choice(self.customers) for _ in range(self.order_count)]
+        self.stock_updates = [rng.choice(self.physical_ids) for _ in range(scale)]
+        self.category_queries = [rng.choice(CATEGORIES) for _ in range(CATEGORY_QUERIES)]
+
+    def fresh_inventory(self) -> InventoryManager:
+        """
+        InventoryManager singleton'ını sıfırlar ve kataloğu yükler.
+        """
+        InventoryManager._instance = None
+        inventory = InventoryManager.get_instance()
+        for product in self.products:
+            inventory.add_product(product, verbose=False)
+        return inventory
+
+    def make_orders(self, order_type: str = "standard"):
+        kwargs = ORDER_KWARGS.get(order_type, {})
+        return [OrderFactory.create_order(order_type, customer, cart, **kwargs)
+                for customer, cart in zip(self.cart_customers, self.carts)]
+
+    def reset_customers(self):
+        """
+        Ölçümler arasında müşterilerin sipariş geçmişlerinde biriken siparişleri temizler.
+        """
+        for customer in self.customers:
+            customer.orders.clear()
+
+
+# --- Ölçümler ---
+# Her ölçüm (işlem sayısı, süre) döndürür; hazırlık adımları süreye dahil edilmez.
+
+def read_passes(ctx: SuiteContext, items: list) -> int:
+    """
+    Salt okunur ucuz ölçümlerde gürültüyü azaltmak için listenin kaç kez dolaşılacağını
+    döndürür; toplam işlem sayısı ölçeğe yaklaşır.
+    """
+    return max(1, ctx.scale // len(items))
+
+
+def bench_create_product(ctx: SuiteContext) -> Tuple[int, float]:
+    specs = ctx.product_specs
+    create = ProductFactory.create_product
+    start = time.perf_counter()
+    for kind, args in specs:
+        create(kind, *args)
+    return len(specs), time.perf_counter() - start
+
+
+def bench_add_product(ctx: SuiteContext) -> Tuple[int, float]:
+    InventoryManager._instance = None
+    inventory = InventoryManager.get_instance()
+    products = ctx.products
+    start = time.perf_counter()
+    for product in products:
+        inventory.add_product(product, verbose=False)
+    return len(products), time.perf_counter() - start
+
+
+def bench_update_stock(ctx: SuiteContext) -> Tuple[int, float]:
+    inventory = ctx.fresh_inventory()
+    update_stock = inventory.update_stock
+    start = time.perf_counter()
+    for product_id in ctx.stock_updates:
+        update_stock(product_id, 1, verbose=False)
+    return len(ctx.stock_updates), time.perf_counter() - start
+
+
+def make_create_order_bench(order_type: str) -> Callable[[SuiteContext], Tuple[int, float]]:
+    def bench(ctx: SuiteContext) -> Tuple[int, float]:
+        ctx.reset_customers()
+        kwargs = ORDER_KWARGS.get(order_type, {})
+        create = OrderFactory.create_order
+        start = time.perf_counter()
+        for customer, cart in zip(ctx.cart_customers, ctx.carts):
+            create(order_type, customer, cart, **kwargs)
+        elapsed = time.perf_counter() - start
+        ctx.reset_customers()
+        return ctx.order_count, elapsed
+    return bench
+
+
+def bench_decorator_total_cost(ctx: SuiteContext) -> Tuple[int, float]:
+    ctx.reset_customers()
+    decorated = []
+    for order in ctx.make_orders():
+        order.set_shipping_strategy(choose_optimal_shipping_strategy(order, verbose=False))
+        decorated.append(GiftWrapDecorator(InsuranceDecorator(FragileDecorator(BaseOrder(order)))))
+    ctx.reset_customers()
+    passes = read_passes(ctx, decorated)
+    start = time.perf_counter()
+    for _ in range(passes):
+        for component in decorated:
+            component.get_total_cost()
+    return passes * len(decorated), time.perf_counter() - start
+
+
+def bench_choose_shipping(ctx: SuiteContext) -> Tuple[int, float]:
+    ctx.reset_customers()
+    orders = ctx.make_orders()
+    ctx.reset_customers()
+    passes = read_passes(ctx, orders)
+    start = time.perf_counter()
+    for _ in range(passes):
+        for order in orders:
+            choose_optimal_shipping_strategy(order, verbose=False)
+    return passes * len(orders), time.perf_counter() - start
+
+
+def bench_category_filter(ctx: SuiteContext) -> Tuple[int, float]:
+    inventory = ctx.fresh_inventory()
+    get_products_by_category = inventory.get_products_by_category
+    get_products_by_category(CATEGORIES[0]) # Tembel kurulan indeksler ölçüme dahil edilmez
+    start = time.perf_counter()
+    for category in ctx.category_queries:
+        get_products_by_category(category)
+    return len(ctx.category_queries), time.perf_counter() - start
+
+
+def bench_update_status(ctx: SuiteContext) -> Tuple[int, float]:
+    ctx.reset_customers()
+    orders = ctx.make_orders()
+    ctx.reset_customers()
+    observers = [SilentObserver() for _ in range(FANOUT_OBSERVERS)] # Abonelikler zayıf referanslıdır; gözlemciler burada tutulur
+    for order in orders:
+        order.detach(order.customer) # Customer.update konsola yazar; dağıtım maliyeti sessiz gözlemcilerle ölçülür
+        for observer in observers:
+            order.attach(observer)
+    start = time.perf_counter()
+    for i, order in enumerate(orders):
+        order.update_status(STATUS_CYCLE[i % len(STATUS_CYCLE)])
+    return len(orders), time.perf_counter() - start
+
+
+BENCHMARKS: List[Tuple[str, Callable[[SuiteContext], Tuple[int, float]]]] = [
+    ("product_factory.create_product", bench_create_product),
+    ("inventory.add_product", bench_add_product),
+    ("inventory.update_stock", bench_update_stock),
+    *[(f"order_factory.create_order[{order_type}]", make_create_order_bench(order_type)) for order_type in ORDER_TYPES],
+    ("decorator.get_total_cost", bench_decorator_total_cost),
+    ("shipping.choose_optimal_shipping_strategy", bench_choose_shipping),
+    ("inventory.get_products_by_category", bench_category_filter),
+    (f"order.update_status[fanout={FANOUT_OBSERVERS}]", bench_update_status),
+]
+
+
+def run_suite(scales: List[int], repeat: int, seed: int, only: List[str]) -> Dict:
+    """
+    Tüm ölçekler için seçili ölçümleri çalıştırır ve JSON'a yazılabilir sonuç döndürür.
+    """
+    results = []
+    for scale in scales:
+        print(f"\nÖlçek {scale:,}: sentetik veri üretiliyor...", file=sys.stderr)
+        ctx = SuiteContext(scale, seed)
+        for name, bench in BENCHMARKS:
+            if only and not any(part in name for part in only):
+                continue
+            best = None
+            ops = 0
+            for _ in range(repeat):
+                gc.collect()
+                ops, seconds = bench(ctx)
+                best = seconds if best is None else min(best, seconds)
+            results.append({
+                "name": name,
+                "scale": scale,
+                "ops": ops,
+                "seconds": best,
+                "ops_per_sec": ops / best if best else None,
+                "ns_per_op": best / ops * 1e9 if ops else None,
+            })
+            print(f"  {name:<45} {ops:>9,} işlem | {best / ops * 1e9:>12,.0f} ns/işlem", file=sys.stderr)
+        InventoryManager._instance = None
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "scales": scales,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(base: Dict, new: Dict, threshold: float) -> Dict:
+    """
+    İki çalıştırmayı (ad, ölçek) çiftine göre karşılaştırır.
+    ns/işlem oranı 1 + threshold'u aşan ölçümler gerileme olarak işaretlenir.
+    """
+    base_results = {(r["name"], r["scale"]): r for r in base["results"]}
+    rows = []
+    for result in new["results"]:
+        old = base_results.get((result["name"], result["scale"]))
+        if old is None or not old["ns_per_op"] or not result["ns_per_op"]:
+            continue
+        ratio = result["ns_per_op"] / old["ns_per_op"]
+        if ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 / (1 + threshold):
+            verdict = "improvement"
+        else:
+            verdict = "unchanged"
+        rows.append({
+            "name": result["name"],
+            "scale": result["scale"],
+            "base_ns_per_op": old["ns_per_op"],
+            "new_ns_per_op": result["ns_per_op"],
+            "ratio": ratio,
+            "verdict": verdict,
+        })
+    return {
+        "threshold": threshold,
+        "regressions": sum(row["verdict"] == "regression" for row in rows),
+        "comparisons": rows,
+    }
+
+
+def print_comparison(report: Dict):
+    print(f"{'Ölçüm':<45} | {'Ölçek':>9} | {'Önce ns':>12} | {'Sonra ns':>12} | {'Oran':>6} | Sonuç")
+    print("-" * 110)
+    labels = {"regression": "GERİLEME", "improvement": "iyileşme", "unchanged": "-"}
+    for row in report["comparisons"]:
+        print(f"{row['name']:<45} | {row['scale']:>9,} | {row['base_ns_per_op']:>12,.0f} | "
+              f"{row['new_ns_per_op']:>12,.0f} | {row['ratio']:>6.2f} | {labels[row['verdict']]}")
+    print(f"\nEşik: %{report['threshold'] * 100:.0f} | Gerileme sayısı: {report['regressions']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sipariş yaşam döngüsü benchmark seti")
+    parser.add_argument("--scales", default="1000,10000,100000",
+                        help="Virgülle ayrılmış ölçekler (ürün sayısı, 1000 - 1000000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Her ölçüm için tekrar sayısı (en iyi süre alınır)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", default="", help="Yalnızca adında bu parçalardan biri geçen ölçümler (virgülle ayrılmış)")
+    parser.add_argument("--output", help="JSON sonuç dosyası (verilmezse standart çıktıya yazılır)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="İki sonuç dosyasını karşılaştır")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Gerileme eşiği (0.15 = %%15 yavaşlama)")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as f:
+            base = json.load(f)
+        with open(args.compare[1], encoding="utf-8") as f:
+            new = json.load(f)
+        report = compare(base, new, args.threshold)
+        print_comparison(report)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+        sys.exit(1 if report["regressions"] else 0)
+
+    scales = [int(part) for part in args.scales.split(",") if part.strip()]
+    if any(not 1_000 <= scale <= 1_000_000 for scale in scales):
+        parser.error("Ölçekler 1000 ile 1000000 arasında olmalıdır.")
+    only = [part.strip() for part in args.only.split(",") if part.strip()]
+    suite = run_suite(scales, args.repeat, args.seed, only)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(suite, f, indent=2, ensure_ascii=False)
+        print(f"\nSonuçlar '{args.output}' dosyasına yazıldı.", file=sys.stderr)
+    else:
+        json.dump(suite, sys.stdout, indent=2, ensure_ascii=False)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# benchmarks/bench_table_rendering.py
+"""
+Envanter tablosunun (get_stock_info) ve sipariş geçmişinin yazdırılma maliyetini ölçer.
+
+- "Önce": her satır her çağrıda isinstance zinciri ve f-string ile yeniden biçimlendirilir,
+  Order.__str__ ürün adlarını her seferinde birleştirir (eski davranışın kopyası).
+- "Sonra": satırlar table_renderer önbelleğinden gelir; yalnızca update_stock/update_status
+  ile sürümü değişen satırlar yeniden biçimlendirilir.
+
+Çıktı os.devnull'a yazdırılır; ölçülen süre biçimlendirme ve yazdırmayı kapsar. Her
+listelemeden önce ürünlerin --changed oranının stoğu güncellenir.
+
+Kullanım:
+    python benchmarks/bench_table_rendering.py --products 100000 --orders 20000
+"""
+import argparse
+import contextlib
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from inventorymanager import InventoryManager
+from order import Order, OrderStatus
+from product import PhysicalProduct, DigitalProduct, ServiceProduct, next_version
+from product_factory import ProductFactory
+
+STATUSES = [OrderStatus.SHIPPED, OrderStatus.DELIVERED, OrderStatus.RETURNED]
+
+
+def legacy_stock_info(inventory: InventoryManager):
+    """
+    get_stock_info'nun önbelleksiz eski hali.
+    """
+    print("\n--- Stok Bilgileri ---")
+    print(f"{'ID':<4} | {'Ürün Adı':<25} | {'Tür':<10} | {'Kategori':<15} | {'Fiyat':<8} | {'Stok/Detay':<15}")
+    print("-" * 90)
+    for product_id, product in inventory.stock.items():
+        if isinstance(product, PhysicalProduct):
+            stock_info = str(product.stock)
+        elif isinstance(product, DigitalProduct):
+            stock_info = f"Link: {product.download_link[:10]}..."
+        elif isinstance(product, ServiceProduct):
+            stock_info = f"Süre: {product.duration} gün"
+        else:
+            stock_info = "N/A"
+        print(
+            f"{product.product_id:<4} | {product.name:<25} | {product.get_type():<10} | "
+            f"{product.category:<15} | {product.price:<8.2f} | {stock_info:<15}"
+        )
+
+
+def legacy_order_str(order: Order) -> str:
+    product_names = ", ".join([f"{p.name} (x{q})" for p, q in order.products])
+    return (f"Sipariş ID: {order.order_id} | Müşteri: {order.customer.name} | "
+            f"Ürünler: [{product_names}] | Toplam: {order.total:.2f}₺ | Durum: {order.status.value}")
+
+
+def timed(func, *args) -> float:
+    """
+    Fonksiyonu çıktısı os.devnull'a yönlendirilmiş olarak çalıştırır ve süresini döndürür.
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        func(*args)
+        return time.perf_counter() - start
+
+
+def peak_memory(func, *args) -> int:
+    """
+    Fonksiyonun çalışırken ayırdığı en yüksek bellek miktarı (bayt); süre ölçümünden ayrı çalıştırılır.
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull, contextlib.redirect_stdout(devnull):
+        tracemalloc.start()
+        func(*args)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tablo çıktısı: önbelleksiz ve önbellekli satırlar")
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--orders", type=int, default=20_000)
+    parser.add_argument("--changed", type=float, default=0.01, help="Listelemeler arasında değişen ürün/sipariş oranı")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    inventory = InventoryManager.get_instance()
+    kinds = ["physical"] * 8 + ["digital", "service"]
+    for product_id in range(1, args.products + 1):
+        kind = rng.choice(kinds)
+        extra = {"physical": 10**6, "digital": f"https://cdn.example.com/{product_id}.zip", "service": 30}[kind]
+        inventory.add_product(ProductFactory.create_product(kind, product_id, f"Ürün {product_id}", "Kırtasiye",
+                                                            round(rng.uniform(1, 900), 2), extra), verbose=False)
+    physical_ids = [product.product_id for product in inventory.iter_products() if isinstance(product, PhysicalProduct)]
+    customer = Customer("c-1", "Müşteri", "musteri@example.com")
+    orders = [Order(f"o-{i}", customer, [(inventory.get_product(rng.randint(1, args.products)), rng.randint(1, 3))
+                                         for _ in range(4)]) for i in range(args.orders)]
+
+    def change_some():
+        for product_id in rng.sample(physical_ids, int(len(physical_ids) * args.changed)):
+            inventory.update_stock(product_id, 1, verbose=False)
+        for order in rng.sample(orders, int(len(orders) * args.changed)):
+            order.status = rng.choice(STATUSES) # Bildirim maliyetini ölçüme katmamak için doğrudan atanır
+            order.version = next_version()
+
+    print(f"{'Ölçüm':<32} | {'Tur':>3} | {'Önce (ms)':>10} | {'Sonra (ms)':>10} | {'Hızlanma':>8}")
+    print("-" * 76)
+    for round_number in range(1, args.rounds + 1):
+        change_some()
+        before = timed(legacy_stock_info, inventory)
+        after = timed(inventory.get_stock_info)
+        print(f"{'get_stock_info':<32} | {round_number:>3} | {before * 1e3:>10.1f} | {after * 1e3:>10.1f} | x{before / after:>7.2f}")
+        before = timed(lambda: [print(legacy_order_str(order)) for order in orders])
+        after = timed(lambda: [print(order) for order in orders])
+        print(f"{'Order.__str__ (sipariş geçmişi)':<32} | {round_number:>3} | {before * 1e3:>10.1f} | {after * 1e3:>10.1f} | "
+              f"x{before / after:>7.2f}")
+
+    change_some()
+    print(f"\nget_stock_info tepe bellek (önbellek dolu, %{args.changed * 100:g} değişmiş): "
+          f"{peak_memory(inventory.get_stock_info) / 1024:,.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
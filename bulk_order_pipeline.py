@@ -0,0 +1,371 @@
+# bulk_order_pipeline.py
+"""
+JSONL veya CSV dosyalarından toplu sipariş alımı.
+
+Etkileşimli konsolu (create_order_interactive) kullanmadan siparişleri parçalar (chunk)
+halinde işler: satırları ayrıştırır, ürünleri InventoryManager üzerinden çözüp stok
+rezerve eder, siparişi OrderFactory ile oluşturur, kargo stratejisini seçer ve
+dekoratörleri uygular. Geçersiz satırlar çalışmayı durdurmadan ret dosyasına yazılır.
+
+JSONL satır örneği:
+    {"customer_id": "c-1", "order_type": "gift", "items": [{"product_id": 1, "quantity": 2}],
+     "decorators": ["fragile", "gift_wrap"], "gift_note": "İyi ki doğdun"}
+
+CSV sütunları:
+    customer_id,order_type,items,decorators,expected_delivery_date,gift_note
+    c-1,express,1:2;5:1,fragile;insurance,,
+
+Kullanım:
+    python bulk_order_pipeline.py orders.jsonl --rejects rejects.jsonl --chunk-size 5000
+"""
+import argparse
+import csv
+import itertools
+import json
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from customer import Customer
+from customer_order_registry import CustomerOrderRegistry
+from inventorymanager import InventoryManager
+from order_decorator import BaseOrder, DECORATORS, OrderComponent
+from order import Order
+from order_factory import OrderFactory
+from order_line_store import OrderLineStore
+from shipping_registry import ShippingRegistry
+from shipping_selector import choose_optimal_shipping_strategy
+
+STAGES = ("parse", "resolve", "create", "shipping", "decorate")
+# Kayıtta metin (veya boş) olması gereken alanlar
+TEXT_FIELDS = ("customer_id", "customer_name", "customer_email", "order_type", "expected_delivery_date", "gift_note")
+
+
+class RejectedLine(Exception):
+    """
+    Bir satırın işlenemediğini ve ret dosyasına yazılması gerektiğini belirtir.
+    """
+    pass
+
+
+class StageStats:
+    """
+    Bir aşamanın işlediği kayıt sayısını ve harcadığı süreyi tutar.
+    """
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.seconds = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Saniyedeki kayıt sayısı."""
+        return self.count / self.seconds if self.seconds else 0.0
+
+
+class IngestReport:
+    """
+    Toplu alım çalışmasının özetini (aşama bazında verim, kabul/ret sayıları) tutar.
+    """
+    def __init__(self):
+        self.stages: Dict[str, StageStats] = {name: StageStats(name) for name in STAGES}
+        self.accepted = 0
+        self.rejected = 0
+        self.reject_reasons: Dict[str, int] = {}
+        self.elapsed = 0.0
+
+    def add_reject(self, reason: str):
+        self.rejected += 1
+        # Ret nedenleri, ayrıntı kısmı (":" sonrası) atılarak gruplanır
+        key = reason.split(":", 1)[0]
+        self.reject_reasons[key] = self.reject_reasons.get(key, 0) + 1
+
+    def display(self):
+        """
+        Raporu tablo halinde yazdırır.
+        """
+        print("\n--- Toplu Sipariş Alımı Raporu ---")
+        print(f"{'Aşama':<10} | {'Kayıt':>10} | {'Süre (sn)':>10} | {'Kayıt/sn':>12}")
+        print("-" * 52)
+        for stats in self.stages.values():
+            print(f"{stats.name:<10} | {stats.count:>10} | {stats.seconds:>10.3f} | {stats.rate:>12,.0f}")
+        print("-" * 52)
+        total = self.accepted + self.rejected
+        per_minute = self.accepted / self.elapsed * 60 if self.elapsed else 0.0
+        print(f"Toplam satır: {total} | Kabul: {self.accepted} | Ret: {self.rejected}")
+        print(f"Toplam süre: {self.elapsed:.3f} sn | Verim: {per_minute:,.0f} sipariş/dk")
+        for reason, count in sorted(self.reject_reasons.items(), key=lambda item: -item[1]):
+            print(f"  Ret nedeni '{reason}': {count}")
+
+
+class BulkOrderPipeline:
+    """
+    Sipariş kayıtlarını parçalar halinde işleyen toplu alım hattı.
+    """
+    def __init__(self, customers: Optional[Dict[str, Customer]] = None, chunk_size: int = 5000,
+                 create_missing_customers: bool = False):
+        """
+        Args:
+            customers: {customer_id: Customer} sözlüğü. Verilmezse müşteriler CustomerOrderRegistry'de
+                aranır ve yeni müşteriler customer_console.register_customer ile kaydedilir.
+            chunk_size: Her seferde işlenecek satır sayısı.
+            create_missing_customers: True ise bilinmeyen müşteri, kayıttaki customer_name ve
+                customer_email alanlarından oluşturulur; False ise satır reddedilir.
+        """
+        if customers is None:
+            from customer_console import register_customer
+            self._find_customer = CustomerOrderRegistry.get_instance().get_customer
+            self._register_customer = register_customer
+        else:
+            self._find_customer = customers.get
+            self._register_customer = lambda customer: customers.__setitem__(customer.customer_id, customer)
+        self.chunk_size = chunk_size
+        self.create_missing_customers = create_missing_customers
+        self.inventory = InventoryManager.get_instance()
+        self.report = IngestReport()
+
+    # --- Aşamalar ---
+
+    def _parse(self, line_no: int, raw: Any) -> Dict[str, Any]:
+        """
+        Ham JSON satırını veya CSV satırını (dict) normalize edilmiş kayda çevirir.
+        """
+        if isinstance(raw, str):
+            try:
+                record = json.loads(raw)
+            except json.JSONDecodeError as e:
+                raise RejectedLine(f"invalid_json: {e}")
+            if not isinstance(record, dict):
+                raise RejectedLine("invalid_json: satır bir JSON nesnesi değil")
+            items = record.get("items") or []
+            if not isinstance(items, list):
+                raise RejectedLine("invalid_items: items bir liste olmalıdır")
+            try:
+                lines = [(int(item["product_id"]), int(item["quantity"])) for item in items]
+            except (KeyError, TypeError, ValueError):
+                raise RejectedLine("invalid_items: items alanı okunamadı")
+            decorators = record.get("decorators") or []
+            if not isinstance(decorators, list) or not all(isinstance(name, str) for name in decorators):
+                raise RejectedLine("invalid_decorators: decorators metinlerden oluşan bir liste olmalıdır")
+        else:
+            record = raw
+            try:
+                lines = [tuple(int(part) for part in item.split(":"))
+                         for item in (record.get("items") or "").split(";") if item.strip()]
+            except ValueError:
+                raise RejectedLine("invalid_items: items alanı okunamadı")
+            if any(len(line) != 2 for line in lines):
+                raise RejectedLine("invalid_items: items 'urun_id:adet' biçiminde olmalıdır")
+            decorators = [name.strip() for name in (record.get("decorators") or "").split(";") if name.strip()]
+
+        for key in TEXT_FIELDS:
+            value = record.get(key)
+            if value is not None and not isinstance(value, str):
+                raise RejectedLine(f"invalid_field: {key} metin olmalıdır")
+        if not lines:
+            raise RejectedLine("empty_cart: siparişte ürün yok")
+        if any(quantity <= 0 for _, quantity in lines):
+            raise RejectedLine("invalid_quantity: adet 0'dan büyük olmalıdır")
+        unknown = [name for name in decorators if name not in DECORATORS]
+        if unknown:
+            raise RejectedLine(f"unknown_decorator: {', '.join(unknown)}")
+
+        kwargs = {}
+        for key in ("expected_delivery_date", "gift_note"):
+            if record.get(key):
+                kwargs[key] = record[key]
+        return {
+            "line_no": line_no,
+            "raw": raw,
+            "customer_id": record.get("customer_id"),
+            "customer_name": record.get("customer_name"),
+            "customer_email": record.get("customer_email"),
+            "order_type": (record.get("order_type") or "standard").strip().lower(),
+            "lines": lines,
+            "decorators": decorators,
+            "kwargs": kwargs,
+        }
+
+    def _resolve(self, record: Dict[str, Any]):
+        """
+        Müşteriyi ve ürünleri çözer, sepet için stok rezerve eder.
+        """
+        customer = self._find_customer(record["customer_id"])
+        if customer is None:
+            if not (self.create_missing_customers and record["customer_id"]
+                    and record["customer_name"] and record["customer_email"]):
+                raise RejectedLine(f"unknown_customer: {record['customer_id']}")
+            customer = Customer(record["customer_id"], record["customer_name"], record["customer_email"])
+            try:
+                self._register_customer(customer)
+            except ValueError as e:
+                raise RejectedLine(f"duplicate_customer: {e}")
+
+        cart = []
+        for product_id, quantity in record["lines"]:
+            product = self.inventory.get_product(product_id)
+            if product is None:
+                raise RejectedLine(f"unknown_product: {product_id}")
+            cart.append((product, quantity))
+        try:
+            record["reservation_id"] = self.inventory.reserve_stock(cart)
+        except ValueError as e:
+            raise RejectedLine(f"insufficient_stock: {e}")
+        record["customer"] = customer
+        record["cart"] = cart
+
+    def _create(self, record: Dict[str, Any]):
+        """
+        Siparişi OrderFactory ile oluşturur ve stok rezervasyonunu kesinleştirir.
+        """
+        try:
+            order = OrderFactory.create_order(record["order_type"], record["customer"], record["cart"], **record["kwargs"])
+        except ValueError as e:
+            self.inventory.release_reservation(record["reservation_id"])
+            raise RejectedLine(f"invalid_order: {e}")
+        try:
+            self.inventory.commit_reservation(record["reservation_id"], verbose=False)
+        except ValueError as e: # Stok rezervasyondan sonra dışarıdan azaltıldıysa; rezervasyon açık kalır
+            self.inventory.release_reservation(record["reservation_id"])
+            record["customer"].orders.remove(order)
+            raise RejectedLine(f"insufficient_stock: {e}")
+        record["order"] = order
+
+    @staticmethod
+    def _ship(record: Dict[str, Any]):
+        order = record["order"]
+        order.set_shipping_strategy(choose_optimal_shipping_strategy(order, verbose=False))
+
+    @staticmethod
+    def _decorate(record: Dict[str, Any]) -> OrderComponent:
+        decorated: OrderComponent = BaseOrder(record["order"])
+        for name in record["decorators"]:
+            decorated = DECORATORS[name](decorated)
+        return decorated
+
+    # --- Çalıştırma ---
+
+    def _run_stage(self, name: str, records: List[Dict[str, Any]], func, rejects: List) -> List[Dict[str, Any]]:
+        """
+        Bir aşamayı parçadaki tüm kayıtlara uygular; reddedilen kayıtları ayırır.
+        """
+        stats = self.report.stages[name]
+        passed = []
+        start = time.perf_counter()
+        for record in records:
+            try:
+                func(record)
+                passed.append(record)
+            except RejectedLine as e:
+                rejects.append((record["line_no"], record["raw"], str(e)))
+        stats.seconds += time.perf_counter() - start
+        stats.count += len(records)
+        return passed
+
+    def process_chunk(self, raw_lines: List[Tuple[int, Any]], rejects: List) -> List[OrderComponent]:
+        """
+        Bir parça ham satırı tüm aşamalardan geçirir ve dekore edilmiş siparişleri döndürür.
+        """
+        stats = self.report.stages["parse"]
+        records = []
+        start = time.perf_counter()
+        for line_no, raw in raw_lines:
+            try:
+                records.append(self._parse(line_no, raw))
+            except RejectedLine as e:
+                rejects.append((line_no, raw, str(e)))
+        stats.seconds += time.perf_counter() - start
+        stats.count += len(raw_lines)
+
+        records = self._run_stage("resolve", records, self._resolve, rejects)
+        records = self._run_stage("create", records, self._create, rejects)
+        records = self._run_stage("shipping", records, self._ship, rejects)
+
+        stats = self.report.stages["decorate"]
+        start = time.perf_counter()
+        decorated = [self._decorate(record) for record in records]
+        stats.seconds += time.perf_counter() - start
+        stats.count += len(records)
+        return decorated
+
+    def run(self, source: Iterable[Tuple[int, Any]], reject_file: Optional[TextIO] = None,
+            sink: Optional[List[OrderComponent]] = None) -> IngestReport:
+        """
+        (satır_no, ham_kayıt) akışını parçalar halinde işler.
+
+        Args:
+            source: read_jsonl / read_csv ile üretilen satır akışı.
+            reject_file: Reddedilen satırların JSONL olarak yazılacağı dosya (isteğe bağlı).
+            sink: Oluşturulan siparişlerin ekleneceği liste (örn. main.orders).
+        """
+        start = time.perf_counter()
+        source = iter(source)
+        while True:
+            chunk = list(itertools.islice(source, self.chunk_size))
+            if not chunk:
+                break
+            rejects: List[Tuple[int, Any, str]] = []
+            orders = self.process_chunk(chunk, rejects)
+            self.report.accepted += len(orders)
+            if sink is not None:
+                sink.extend(orders)
+            for line_no, raw, reason in rejects:
+                self.report.add_reject(reason)
+                if reject_file is not None:
+                    reject_file.write(json.dumps({"line": line_no, "reason": reason, "record": raw}, ensure_ascii=False) + "\n")
+        self.report.elapsed = time.perf_counter() - start
+        return self.report
+
+
+def read_jsonl(stream: TextIO) -> Iterator[Tuple[int, str]]:
+    """
+    JSONL akışından boş olmayan satırları (satır_no, metin) olarak üretir.
+    """
+    for line_no, line in enumerate(stream, start=1):
+        if line.strip():
+            yield line_no, line.rstrip("\r\n")
+
+
+def read_csv(stream: TextIO) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    CSV akışından satırları (satır_no, sözlük) olarak üretir. İlk satır başlıktır.
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSONL/CSV dosyasından toplu sipariş alımı")
+    parser.add_argument("input", help="Sipariş dosyası (.jsonl veya .csv)")
+    parser.add_argument("--rejects", default="rejects.jsonl", help="Reddedilen satırların yazılacağı dosya")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Parça başına satır sayısı")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="Dosya biçimi (varsayılan: uzantıdan)")
+    parser.add_argument("--seed-catalog", action="store_true", help="Başlangıç ürünlerini envantere ekle")
+    parser.add_argument("--create-customers", action="store_true",
+                        help="Bilinmeyen müşterileri customer_name/customer_email alanlarından oluştur")
+    parser.add_argument("--compact-orders", action="store_true",
+                        help="Sipariş satırlarını ortak, dizi tabanlı depoda tut")
+    parser.add_argument("--shipping-config", help="Kargo firmalarını ve kademelerini tanımlayan JSON dosyası")
+    args = parser.parse_args()
+
+    if args.compact_orders:
+        Order.set_line_store(OrderLineStore())
+
+    if args.shipping_config:
+        ShippingRegistry.get_instance().load_config(args.shipping_config)
+
+    if args.seed_catalog:
+        from main import add_initial_products_to_inventory
+        add_initial_products_to_inventory(InventoryManager.get_instance())
+
+    file_format = args.format or ("csv" if args.input.lower().endswith(".csv") else "jsonl")
+    pipeline = BulkOrderPipeline(chunk_size=args.chunk_size, create_missing_customers=args.create_customers)
+    with open(args.input, encoding="utf-8", newline="") as stream, \
+            open(args.rejects, "w", encoding="utf-8") as reject_file:
+        source = read_csv(stream) if file_format == "csv" else read_jsonl(stream)
+        report = pipeline.run(source, reject_file=reject_file)
+    report.display()
+
+
+if __name__ == "__main__":
+    main()
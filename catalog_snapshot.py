@@ -0,0 +1,269 @@
+# catalog_snapshot.py
+"""
+Ürün kataloğunun mmap ile açılan ikili anlık görüntüsü.
+
+Dosya düzeni (tüm sayılar little-endian, bölgeler 8 bayta hizalı):
+    Başlık        MAGIC, sürüm, ürün sayısı, string sayısı ve bölgelerin konumları
+    ID indeksi    Artan sıralı ürün ID'leri (int64); i. ID'nin kaydı kayıt bölgesinin i. satırıdır
+    Kayıtlar      Sabit genişlikte satırlar: ID, fiyat, stok, ek alan, isim, kategori, tür
+    String havuzu String başlangıç konumları (uint32, sayı + 1 adet) ve UTF-8 bayt bloğu
+
+Kategoriler gibi tekrar eden metinler havuzda bir kez tutulur. Dijital ürünlerin linki
+havuzdaki string numarası, hizmet ürünlerinin süresi doğrudan ek alanda saklanır.
+
+Açılışta yalnızca başlık okunur; ürünler get_product ile istendiklerinde ikili arama ile
+bulunup nesneye dönüştürülür. Böylece milyonlarca ürünlük katalog milisaniyeler içinde açılır.
+
+Kullanım:
+    write_catalog_snapshot("catalog.bin", inventory.get_all_products())
+    inventory.open_catalog("catalog.bin")
+"""
+import mmap
+import os
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from product import Product, PhysicalProduct, DigitalProduct, ServiceProduct
+
+MAGIC = b"CATSNAP1"
+VERSION = 1
+# MAGIC, sürüm, ürün sayısı, string sayısı, ID indeksi, kayıtlar, string konumları, metin bloğu konumları
+HEADER = struct.Struct("<8sIIQQQQQ")
+# product_id, fiyat, stok, ek alan (link string'i / süre), isim string'i, kategori string'i, tür
+RECORD = struct.Struct("<qdqqIIB7x")
+
+# Ürün türlerinin kayıtlarda tutulan kodları
+_PHYSICAL = 0
+_DIGITAL = 1
+_SERVICE = 2
+_TYPE_NAMES = {_PHYSICAL: "Physical", _DIGITAL: "Digital", _SERVICE: "Service"}
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def write_catalog_snapshot(path: str, products: Iterable[Product]) -> int:
+    """
+    Ürünleri anlık görüntü dosyasına yazar ve yazılan ürün sayısını döndürür.
+    Dosya önce geçici adla yazılır, ardından tek adımda yerine taşınır.
+
+    Raises:
+        ValueError: Desteklenmeyen ürün türü veya aynı ID'ye sahip iki ürün verildiğinde.
+    """
+    strings: Dict[str, int] = {}
+    text = bytearray()
+    text_offsets = array("I", [0])
+
+    def intern(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+            text.extend(value.encode("utf-8"))
+            text_offsets.append(len(text))
+        return index
+
+    rows: List[Tuple] = []
+    for product in products:
+        if isinstance(product, PhysicalProduct):
+            kind, extra = _PHYSICAL, 0
+        elif isinstance(product, DigitalProduct):
+            kind, extra = _DIGITAL, intern(product.download_link)
+        elif isinstance(product, ServiceProduct):
+            kind, extra = _SERVICE, product.duration
+        else:
+            raise ValueError(f"Katalog anlık görüntüsü bu ürün türünü desteklemiyor: '{type(product).__name__}'.")
+        rows.append((product.product_id, product.price, product.stock, extra,
+                     intern(product.name), intern(product.category), kind))
+    rows.sort()
+    ids = array("q", (row[0] for row in rows))
+    if any(ids[i] == ids[i + 1] for i in range(len(ids) - 1)):
+        raise ValueError("Katalogda aynı ID'ye sahip birden fazla ürün var.")
+
+    ids_offset = _align(HEADER.size)
+    records_offset = _align(ids_offset + ids.itemsize * len(ids))
+    string_offsets_offset = _align(records_offset + RECORD.size * len(rows))
+    text_offset = _align(string_offsets_offset + text_offsets.itemsize * len(text_offsets))
+
+    records = bytearray(RECORD.size * len(rows))
+    pack_into = RECORD.pack_into
+    for row_number, row in enumerate(rows):
+        pack_into(records, row_number * RECORD.size, *row)
+
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(rows), len(strings), ids_offset, records_offset,
+                            string_offsets_offset, text_offset))
+        for offset, block in ((ids_offset, ids), (records_offset, records),
+                              (string_offsets_offset, text_offsets), (text_offset, text)):
+            f.write(b"\0" * (offset - f.tell()))
+            f.write(block)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    return len(rows)
+
+
+class CatalogSnapshotStore(MutableMapping):
+    """
+    InventoryManager için mmap tabanlı, salt okunur anlık görüntü üzerinde çalışan ürün deposu.
+
+    Ürün nesneleri ilk erişildiklerinde kayıttan oluşturulup önbelleğe alınır; aynı ID için
+    her zaman aynı nesne döner, böylece stok değişiklikleri bellekte korunur. Eklenen, silinen
+    ve değiştirilen ürünler dosyaya yazılmaz; kalıcı hale getirmek için
+    write_catalog_snapshot ile yeni bir anlık görüntü alınmalıdır.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < HEADER.size:
+            self._mm.close()
+            raise ValueError(f"'{path}' bir katalog anlık görüntüsü değil.")
+        (magic, version, self._count, string_count, ids_offset, self._records_offset,
+         string_offsets_offset, self._text_offset) = HEADER.unpack_from(self._mm)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(f"'{path}' bir katalog anlık görüntüsü değil veya sürümü desteklenmiyor.")
+
+        view = memoryview(self._mm)
+        self._ids = view[ids_offset:ids_offset + 8 * self._count].cast("q")
+        self._string_offsets = view[string_offsets_offset:string_offsets_offset + 4 * (string_count + 1)].cast("I")
+        self._products: Dict[int, Product] = {} # Oluşturulmuş veya sonradan eklenmiş ürünler
+        self._added: Dict[int, None] = {} # Anlık görüntüde olmayan, sonradan eklenen ürün ID'leri
+        self._deleted: Dict[int, None] = {} # Anlık görüntüden silinen ürün ID'leri
+        self._categories: Dict[int, str] = {} # Çözülmüş kategori string'leri; az sayıda farklı değer vardır
+        self._lock = threading.Lock()
+
+    def close(self):
+        """
+        Dosya eşlemesini kapatır. Önbellekteki ürün nesneleri kullanılmaya devam edilebilir.
+        """
+        self._ids.release()
+        self._string_offsets.release()
+        self._mm.close()
+
+    def _string(self, index: int) -> str:
+        offsets = self._string_offsets
+        start = self._text_offset + offsets[index]
+        return self._mm[start:self._text_offset + offsets[index + 1]].decode("utf-8")
+
+    def _category(self, index: int) -> str:
+        category = self._categories.get(index)
+        if category is None:
+            category = self._categories[index] = self._string(index)
+        return category
+
+    def _find_row(self, product_id: int) -> int:
+        """
+        Ürün ID'sinin anlık görüntüdeki satır numarasını döndürür, yoksa -1.
+        """
+        row = bisect_left(self._ids, product_id)
+        if row < self._count and self._ids[row] == product_id:
+            return row
+        return -1
+
+    def _read_product(self, row: int) -> Product:
+        product_id, price, stock, extra, name, category, kind = \
+            RECORD.unpack_from(self._mm, self._records_offset + row * RECORD.size)
+        if kind == _PHYSICAL:
+            return PhysicalProduct(product_id, self._string(name), self._category(category), price, stock)
+        if kind == _DIGITAL:
+            return DigitalProduct(product_id, self._string(name), self._category(category), price, self._string(extra))
+        return ServiceProduct(product_id, self._string(name), self._category(category), price, extra)
+
+    def index_rows(self) -> Iterator[Tuple[int, str, str, float, bool]]:
+        """
+        İkincil indeksler için (product_id, kategori, tür, fiyat, stok_tükendi_mi) satırlarını
+        ürün nesneleri oluşturmadan döndürür. Oluşturulmuş ürünler için güncel değerleri kullanılır.
+        """
+        products, deleted, categories = self._products, self._deleted, self._categories
+        start = self._records_offset
+        records = memoryview(self._mm)[start:start + RECORD.size * self._count]
+        try:
+            for product_id, price, stock, _, _, category, kind in RECORD.iter_unpack(records):
+                if product_id in products or product_id in deleted:
+                    continue
+                category_name = categories.get(category)
+                if category_name is None:
+                    category_name = self._category(category)
+                yield product_id, category_name, _TYPE_NAMES[kind], price, kind == _PHYSICAL and stock <= 0
+        finally:
+            records.release()
+        for product in list(products.values()):
+            yield (product.product_id, product.category, product.get_type(), product.price,
+                   isinstance(product, PhysicalProduct) and product.stock <= 0)
+
+    def name_rows(self) -> Iterator[Tuple[int, str]]:
+        """
+        Arama indeksi için (product_id, ad) satırlarını ürün nesneleri oluşturmadan döndürür.
+        """
+        products, deleted, string = self._products, self._deleted, self._string
+        start = self._records_offset
+        records = memoryview(self._mm)[start:start + RECORD.size * self._count]
+        try:
+            for product_id, _, _, _, name, _, _ in RECORD.iter_unpack(records):
+                if product_id not in products and product_id not in deleted:
+                    yield product_id, string(name)
+        finally:
+            records.release()
+        for product in list(products.values()):
+            yield product.product_id, product.name
+
+    def __getitem__(self, product_id: int) -> Product:
+        product = self._products.get(product_id)
+        if product is not None:
+            return product
+        with self._lock:
+            product = self._products.get(product_id)
+            if product is None:
+                row = -1 if product_id in self._deleted else self._find_row(product_id)
+                if row < 0:
+                    raise KeyError(product_id)
+                product = self._products[product_id] = self._read_product(row)
+        return product
+
+    def __setitem__(self, product_id: int, product: Product):
+        with self._lock:
+            self._products[product_id] = product
+            self._deleted.pop(product_id, None)
+            if self._find_row(product_id) < 0:
+                self._added[product_id] = None
+
+    def __delitem__(self, product_id: int):
+        with self._lock:
+            if product_id in self._added:
+                del self._added[product_id]
+            elif product_id in self._deleted or self._find_row(product_id) < 0:
+                raise KeyError(product_id)
+            else:
+                self._deleted[product_id] = None
+            self._products.pop(product_id, None)
+
+    def __contains__(self, product_id) -> bool:
+        if product_id in self._products:
+            return True
+        return product_id not in self._deleted and self._find_row(product_id) >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        deleted = self._deleted
+        for product_id in self._ids:
+            if product_id not in deleted:
+                yield product_id
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        return self._count - len(self._deleted) + len(self._added)
+
+    def values(self) -> List[Product]:
+        """
+        Tüm ürünleri döndürür; henüz oluşturulmamış olanlar bu sırada oluşturulur.
+        """
+        return [self[product_id] for product_id in self]
+
+    def items(self) -> List[Tuple[int, Product]]:
+        return [(product_id, self[product_id]) for product_id in self]
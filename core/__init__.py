@@ -0,0 +1,79 @@
+# core/__init__.py
+"""
+Konsol içermeyen alan çekirdeği: ürünler, envanter, müşteriler, siparişler, sipariş
+dekoratörleri, fiyatlama kuralları ve kargo.
+
+Toplu işlem süreçleri ve komut satırı araçları için tek içe aktarma noktasıdır. Paket konsol
+modüllerini (*_console) ve main'i içe aktarmaz, içe aktarılırken ekrana bir şey yazmaz.
+Adlar ilk erişildiklerinde tanımlandıkları modülden yüklenir (PEP 562); böylece "import core"
+yalnızca gerçekten kullanılan modüllerin yükleme maliyetini öder.
+
+Modüller proje kök dizininde kalır: olay günlüğü ve SQLite deposu sipariş sınıflarını modül
+adlarıyla (örn. order.GiftOrder) saklar ve mevcut betikler onları doğrudan içe aktarır.
+
+Kullanım:
+    import core
+    product = core.ProductFactory.create_product("physical", 1, "Defter", "Kırtasiye", 25, 50)
+    from core import OrderFactory, choose_optimal_shipping_strategy
+"""
+import importlib
+
+# {ad: tanımlandığı modül}
+_EXPORTS = {
+    "Product": "product",
+    "PhysicalProduct": "product",
+    "DigitalProduct": "product",
+    "ServiceProduct": "product",
+    "ProductFactory": "product_factory",
+    "InventoryManager": "inventorymanager",
+    "Customer": "customer",
+    "Observer": "observer",
+    "OrderStatus": "order",
+    "ALLOWED_TRANSITIONS": "order",
+    "Order": "order",
+    "ExpressOrder": "order",
+    "SubscriptionOrder": "order",
+    "PreOrder": "order",
+    "GiftOrder": "order",
+    "BulkOrder": "order",
+    "OrderFactory": "order_factory",
+    "OrderSubject": "order_subject",
+    "CustomerOrderRegistry": "customer_order_registry",
+    "OrderArchive": "order_archive",
+    "ArchivedOrder": "order_archive",
+    "ARCHIVABLE_STATUSES": "order_archive",
+    "OrderComponent": "order_decorator",
+    "CostBreakdown": "order_decorator",
+    "BaseOrder": "order_decorator",
+    "OrderDecorator": "order_decorator",
+    "FragileDecorator": "order_decorator",
+    "InsuranceDecorator": "order_decorator",
+    "GiftWrapDecorator": "order_decorator",
+    "DECORATORS": "order_decorator",
+    "PricingRule": "pricing_rules",
+    "PricingPlan": "pricing_rules",
+    "PricingRegistry": "pricing_rules",
+    "ShippingStrategy": "shippingstrategy",
+    "FastShipping": "shippingstrategy",
+    "CheapShipping": "shippingstrategy",
+    "DroneShipping": "shippingstrategy",
+    "ConfiguredShipping": "shippingstrategy",
+    "ShippingRegistry": "shipping_registry",
+    "ShippingTierTable": "shipping_registry",
+    "choose_optimal_shipping_strategy": "shipping_selector",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"'core' paketinde '{name}' adı yok.")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value # Sonraki erişimler modül sözlüğünden doğrudan okunur
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_EXPORTS])
@@ -1,57 +1,93 @@
-# customer.py
-from observer import Observer
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from order import Order # Döngüsel bağımlılığı önlemek için
-
-class Customer(Observer):
-    """
-    Müşteri bilgilerini ve sipariş geçmişini tutan sınıf.
-    Observer arayüzünü uygulayarak sipariş durumu değişikliklerinden haberdar olur.
-    """
-    def __init__(self, customer_id: str, name: str, email: str):
-        self.customer_id = customer_id
-        self.name = name
-        self.email = email
-        self.orders = [] # Müşterinin verdiği siparişlerin listesi
-
-    def add_order(self, order: 'Order'):
-        """
-        Müşterinin sipariş geçmişine yeni bir sipariş ekler.
-        """
-        self.orders.append(order)
-
-    def display_profile(self):
-        """
-        Müşterinin profil bilgilerini görüntüler.
-        """
-        print("\n--- Müşteri Profili ---")
-        print(f"ID: {self.customer_id}")
-        print(f"Ad: {self.name}")
-        print(f"E-posta: {self.email}")
-        print(f"Sipariş sayısı: {len(self.orders)}")
-
-    def display_order_history(self):
-        """
-        Müşterinin geçmiş siparişlerini görüntüler.
-        """
-        if not self.orders:
-            print("\nHenüz hiç siparişiniz yok.")
-            return
-        print("\n--- Sipariş Geçmişi ---")
-        for order in self.orders:
-            # order'ın __str__ metodunu kullanarak özet görüntüleme
-            print(f"- {order}")
-
-    def update(self, order: 'Order'):  # Observer arayüzü uygulaması
-        """
-        Sipariş durumu güncellendiğinde çağrılır ve müşteriye bildirim gönderir.
-        """
-        print(f"\n[BİLDİRİM] Sayın {self.name}, siparişiniz (ID: {order.order_id}) güncellendi. Yeni durum: {order.status.value}")
-
-    def __str__(self):
-        """
-        Müşteri nesnesinin okunabilir string temsilini döndürür.
-        """
+# customer.py
+from observer import Observer
+from typing import Iterable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from order import Order, OrderStatus # Döngüsel bağımlılığı önlemek için
+
+class Customer(Observer):
+    """
+    Müşteri bilgilerini ve sipariş geçmişini tutan sınıf.
+    Observer arayüzünü uygulayarak sipariş durumu değişikliklerinden haberdar olur.
+    """
+    __slots__ = ("customer_id", "name", "email", "orders", "__weakref__")
+
+    def __init__(self, customer_id: str, name: str, email: str):
+        self.customer_id = customer_id
+        self.name = name
+        self.email = email
+        self.orders = [] # Müşterinin verdiği siparişlerin listesi
+
+    def add_order(self, order: 'Order'):
+        """
+        Müşterinin sipariş geçmişine yeni bir sipariş ekler.
+        """
+        self.orders.append(order)
+
+    def archive_orders(self, statuses: Optional[Iterable['OrderStatus']] = None) -> List['Order']:
+        """
+        Verilen durumlardaki (varsayılan: teslim edilmiş, iptal edilmiş, iade edilmiş) siparişleri
+        sipariş listesinden çıkarıp OrderArchive'e yazar; çıkarılan siparişleri döndürür.
+        Kayıt defterindeki siparişler için CustomerOrderRegistry.archive_orders kullanılmalıdır.
+        """
+        from order_archive import ARCHIVABLE_STATUSES, OrderArchive, check_archivable # order -> customer döngüsünü önlemek için
+        statuses = ARCHIVABLE_STATUSES if statuses is None else check_archivable(statuses)
+        kept, archived = [], []
+        for order in self.orders:
+            (archived if order.status in statuses else kept).append(order)
+        if archived:
+            OrderArchive.get_instance().archive(archived)
+            self.orders = kept
+        return archived
+
+    def display_profile(self):
+        """
+        Müşterinin profil bilgilerini görüntüler.
+        """
+        print("\n--- Müşteri Profili ---")
+        print(f"ID: {self.customer_id}")
+        print(f"Ad: {self.name}")
+        print(f"E-posta: {self.email}")
+        print(f"Sipariş sayısı: {len(self.orders)}")
+        from order_archive import OrderArchive
+        archived = OrderArchive.get_instance().count_by_customer(self.customer_id)
+        if archived:
+            print(f"Arşivlenmiş sipariş sayısı: {archived}")
+
+    def display_order_history(self):
+        """
+        Müşterinin geçmiş siparişlerini görüntüler.
+        """
+        from order_archive import OrderArchive
+        archived = OrderArchive.get_instance().customer_history(self.customer_id)
+        if not self.orders and not archived:
+            print("\nHenüz hiç siparişiniz yok.")
+            return
+        print("\n--- Sipariş Geçmişi ---")
+        for order in archived:
+            print(f"- {order}")
+        for order in self.orders:
+            # order'ın __str__ metodunu kullanarak özet görüntüleme
+            print(f"- {order}")
+
+    def update(self, order: 'Order'):  # Observer arayüzü uygulaması
+        """
+        Sipariş durumu güncellendiğinde çağrılır ve müşteriye bildirim gönderir.
+        """
+        print(f"\n[BİLDİRİM] Sayın {self.name}, siparişiniz (ID: {order.order_id}) güncellendi. Yeni durum: {order.status.value}")
+
+    def update_many(self, orders: List['Order']):
+        """
+        Toplu durum güncellemesinde müşterinin tüm siparişleri için tek bir bildirim gönderir.
+        """
+        if len(orders) == 1:
+            self.update(orders[0])
+            return
+        details = ", ".join(f"{order.order_id} ({order.status.value})" for order in orders)
+        print(f"\n[BİLDİRİM] Sayın {self.name}, {len(orders)} siparişiniz güncellendi: {details}")
+
+    def __str__(self):
+        """
+        Müşteri nesnesinin okunabilir string temsilini döndürür.
+        """
         return f"Müşteri: {self.name} (ID: {self.customer_id}, Email: {self.email})"
\ No newline at end of file
@@ -0,0 +1,229 @@
+# customer_order_registry.py
+import threading
+from typing import Dict, Iterable, List, TYPE_CHECKING
+from observer import Observer
+from order import Order, OrderStatus
+from order_archive import ARCHIVABLE_STATUSES, check_archivable
+from order_subject import OrderSubject
+
+if TYPE_CHECKING:
+    from customer import Customer
+    from order_decorator import OrderComponent
+
+
+class BulkTransitionResult:
+    """
+    CustomerOrderRegistry.transition_orders sonucu: durumu değişen siparişler ve reddedilenler.
+    """
+    def __init__(self, new_status: OrderStatus):
+        self.new_status = new_status
+        self.updated: List['OrderComponent'] = []
+        self.rejected: Dict[str, str] = {} # {order_id: neden}
+
+    def display(self):
+        print(f"\n{len(self.updated)} sipariş '{self.new_status.value}' durumuna geçirildi, "
+              f"{len(self.rejected)} sipariş reddedildi.")
+        for order_id, reason in list(self.rejected.items())[:20]:
+            print(f"  - {order_id}: {reason}")
+        if len(self.rejected) > 20:
+            print(f"  ... ve {len(self.rejected) - 20} sipariş daha.")
+
+
+class CustomerOrderRegistry(Observer):
+    """
+    Müşterileri ve siparişleri hash indeksleriyle tutan kayıt defteri. Singleton deseni uygular.
+    Müşteriler ID ve e-posta ile, siparişler ID, durum ve müşteri ile sabit zamanda bulunur.
+
+    Kayıt defteri tüm siparişlerin global gözlemcisidir; böylece Order.update_status
+    çağrıldığında durum indeksi kendiliğinden güncellenir. Kayıtlı olmayan siparişlerin
+    bildirimleri yok sayılır.
+    """
+    ASYNC_DELIVERY = False # Durum indeksi, durum değişikliğiyle aynı anda güncellenmelidir
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """
+        Singleton deseni için __new__ metodu override edildi.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance.clear()
+                    OrderSubject.attach_global(instance)
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def get_instance() -> "CustomerOrderRegistry":
+        """
+        CustomerOrderRegistry'nin tek örneğini döndürür (Singleton deseni).
+        """
+        return CustomerOrderRegistry()
+
+    def clear(self):
+        """
+        Tüm kayıtları ve indeksleri boşaltır.
+        """
+        self._customers: Dict[str, 'Customer'] = {} # {customer_id: Customer}
+        self._customers_by_email: Dict[str, 'Customer'] = {} # {casefold e-posta: Customer}
+        self._orders: Dict[str, 'OrderComponent'] = {} # {order_id: sipariş bileşeni}
+        self._order_status: Dict[str, OrderStatus] = {} # {order_id: indekslendiği durum}
+        self._orders_by_status: Dict[OrderStatus, Dict[str, None]] = {status: {} for status in OrderStatus}
+        self._orders_by_customer: Dict[str, Dict[str, None]] = {} # {customer_id: {order_id: None}}
+
+    @staticmethod
+    def _normalize_email(email: str) -> str:
+        return email.strip().casefold()
+
+    # --- Müşteriler ---
+
+    def add_customer(self, customer: 'Customer'):
+        """
+        Müşteriyi kaydeder. Aynı ID veya e-posta ile kayıtlı başka bir müşteri varsa ValueError fırlatır.
+        """
+        if customer.customer_id in self._customers:
+            raise ValueError(f"ID {customer.customer_id} ile kayıtlı bir müşteri zaten var.")
+        email_key = self._normalize_email(customer.email)
+        if email_key in self._customers_by_email:
+            raise ValueError(f"'{customer.email}' e-posta adresiyle kayıtlı bir müşteri zaten var.")
+        self._customers[customer.customer_id] = customer
+        self._customers_by_email[email_key] = customer
+
+    def get_customer(self, customer_id: str) -> 'Customer | None':
+        """
+        Müşteri ID'sine göre müşteriyi döndürür. Bulamazsa None döner.
+        """
+        return self._customers.get(customer_id)
+
+    def get_customer_by_email(self, email: str) -> 'Customer | None':
+        """
+        E-posta adresine göre (büyük/küçük harf duyarsız) müşteriyi döndürür. Bulamazsa None döner.
+        """
+        return self._customers_by_email.get(self._normalize_email(email))
+
+    def find_customer(self, key: str) -> 'Customer | None':
+        """
+        Verilen değeri önce müşteri ID'si, sonra e-posta adresi olarak arar.
+        """
+        return self.get_customer(key) or self.get_customer_by_email(key)
+
+    def get_customers(self) -> List['Customer']:
+        """
+        Kayıtlı tüm müşterileri kayıt sırasıyla döndürür.
+        """
+        return list(self._customers.values())
+
+    # --- Siparişler ---
+
+    def add_order(self, order: 'OrderComponent'):
+        """
+        Siparişi (dekore edilmiş haliyle) kaydeder; durum değişiklikleri bundan sonra indekslenir.
+        Aynı ID ile kayıtlı bir sipariş varsa ValueError fırlatır.
+        """
+        order_id = order.order_id
+        if order_id in self._orders:
+            raise ValueError(f"ID {order_id} ile kayıtlı bir sipariş zaten var.")
+        self._orders[order_id] = order
+        self._order_status[order_id] = order.status
+        self._orders_by_status[order.status][order_id] = None
+        self._orders_by_customer.setdefault(order.customer.customer_id, {})[order_id] = None
+
+    def get_order(self, order_id: str) -> 'OrderComponent | None':
+        """
+        Sipariş ID'sine göre siparişi döndürür. Bulamazsa None döner.
+        """
+        return self._orders.get(order_id)
+
+    def get_orders_by_status(self, status: OrderStatus) -> List['OrderComponent']:
+        """
+        Belirtilen durumdaki siparişleri kayıt sırasıyla döndürür.
+        """
+        return [self._orders[order_id] for order_id in self._orders_by_status[status]]
+
+    def get_orders_by_customer(self, customer_id: str) -> List['OrderComponent']:
+        """
+        Müşterinin kayıtlı siparişlerini döndürür.
+        """
+        return [self._orders[order_id] for order_id in self._orders_by_customer.get(customer_id, ())]
+
+    def count_orders_by_status(self, status: OrderStatus) -> int:
+        """
+        Belirtilen durumdaki sipariş sayısını döndürür.
+        """
+        return len(self._orders_by_status[status])
+
+    def get_orders(self) -> List['OrderComponent']:
+        """
+        Kayıtlı tüm siparişleri kayıt sırasıyla döndürür.
+        """
+        return list(self._orders.values())
+
+    def archive_orders(self, statuses: Iterable[OrderStatus] = ARCHIVABLE_STATUSES) -> List[str]:
+        """
+        Verilen durumlardaki siparişleri müşterilerinin sipariş listesinden ve kayıt defterinden
+        çıkarıp OrderArchive'e taşır (bkz. Customer.archive_orders); taşınan sipariş ID'lerini döndürür.
+        Sipariş nesnelerine başka yerde (örn. konsolun sipariş listesi) referans kalmamalıdır.
+        """
+        statuses = check_archivable(statuses)
+        customers: Dict['Customer', None] = {}
+        for status in statuses:
+            for order_id in self._orders_by_status[status]:
+                customers[self._orders[order_id].customer] = None
+        archived_ids = []
+        for customer in customers:
+            customer_orders = self._orders_by_customer.get(customer.customer_id, {})
+            for order in customer.archive_orders(statuses):
+                order_id = order.order_id
+                if self._orders.pop(order_id, None) is None: # Kayıt defterine eklenmemiş sipariş
+                    continue
+                del self._orders_by_status[self._order_status.pop(order_id)][order_id]
+                customer_orders.pop(order_id, None)
+                archived_ids.append(order_id)
+            if not customer_orders:
+                self._orders_by_customer.pop(customer.customer_id, None)
+        return archived_ids
+
+    def update(self, order: 'Order'):  # Observer arayüzü uygulaması
+        """
+        Sipariş durumu değiştiğinde çağrılır; siparişi durum indeksinde yeni durumuna taşır.
+        """
+        self.update_many((order,))
+
+    def update_many(self, orders: Iterable['Order']):
+        """
+        Toplu durum değişikliğinde siparişleri durum indeksinde tek geçişte taşır.
+        """
+        order_status = self._order_status
+        by_status = self._orders_by_status
+        for order in orders:
+            order_id = order.order_id
+            old_status = order_status.get(order_id)
+            new_status = order.status
+            if old_status is None or old_status is new_status:
+                continue
+            del by_status[old_status][order_id]
+            by_status[new_status][order_id] = None
+            order_status[order_id] = new_status
+
+    def transition_orders(self, order_ids: Iterable[str], new_status: OrderStatus) -> BulkTransitionResult:
+        """
+        Kayıtlı siparişleri ID'leriyle tek çağrıda new_status durumuna geçirir (örn. depodan
+        binlerce siparişin "Kargoya Verildi" yapılması). Geçişi izinli olmayan veya bulunamayan
+        siparişler değiştirilmez ve sonuçta nedenleriyle raporlanır. Her müşteri, değişen
+        siparişleri için tek bir bildirim alır.
+        """
+        orders = self._orders
+        result = BulkTransitionResult(new_status)
+        base_orders = []
+        for order_id in dict.fromkeys(order_ids): # Tekrarlanan ID'ler bir kez işlenir
+            component = orders.get(order_id)
+            if component is None:
+                result.rejected[order_id] = "Sipariş bulunamadı."
+            else:
+                base_orders.append(getattr(component, "order", component))
+        changed, rejected = Order.bulk_update_status(base_orders, new_status)
+        result.rejected.update(rejected)
+        result.updated = [orders[order.order_id] for order in changed]
+        return result
@@ -1,96 +1,529 @@
-# inventorymanager.py
-from product import Product, PhysicalProduct, DigitalProduct, ServiceProduct
-from typing import List, Dict
-
-class InventoryManager:
-    """
-    Envanter yöneticisi sınıfı. Singleton deseni uygular.
-    Mağazadaki tüm ürünlerin stok bilgilerini yönetir.
-    """
-    _instance = None # Singleton örneğini tutar
-
-    def __new__(cls):
-        """
-        Singleton desenini uygulamak için __new__ metodu override edildi.
-        """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.stock: Dict[int, Product] = {} # Ürün stoklarını tutacak dictionary: {product_id: Product_object}
-        return cls._instance
-
-    @staticmethod
-    def get_instance():
-        """
-        InventoryManager'ın tek örneğini döndürür (Singleton deseni).
-        """
-        if InventoryManager._instance is None:
-            InventoryManager._instance = InventoryManager() # __new__ metodu çağrılır
-        return InventoryManager._instance
-
-    def add_product(self, product: Product):
-        """
-        Envantere bir ürün ekler.
-        """
-        if product.product_id in self.stock:
-            print(f"Uyarı: '{product.name}' (ID: {product.product_id}) zaten envanterde. Stok güncelleniyor.")
-        self.stock[product.product_id] = product
-        print(f"'{product.name}' (ID: {product.product_id}) envantere eklendi/güncellendi.")
-
-    def update_stock(self, product_id: int, quantity: int) -> bool:
-        """
-        Belirtilen ürünün stoğunu günceller.
-        Sadece fiziksel ürünler için stok azaltımı yapar.
-        """
-        product = self.stock.get(product_id)
-        if product:
-            try:
-                # Ürünün kendi update_stock metodunu çağırır.
-                # PhysicalProduct stok düşürür, diğerleri bilgilendirme yapar.
-                product.update_stock(quantity)
-                return True
-            except ValueError as e:
-                print(f"Stok güncelleme hatası: {e}")
-                return False
-        else:
-            print(f"Hata: ID {product_id} ile ürün bulunamadı.")
-            return False
-
-    def get_product(self, product_id: int) -> Product | None:
-        """
-        Ürün ID'sine göre ürün nesnesini döndürür. Bulamazsa None döner.
-        """
-        return self.stock.get(product_id)
-
-    def get_all_products(self) -> List[Product]:
-        """
-        Envanterdeki tüm ürünlerin listesini döndürür.
-        """
-        return list(self.stock.values())
-
-    def get_stock_info(self):
-        """
-        Tüm ürünlerin stok bilgilerini tablo halinde listeler.
-        """
-        print("\n--- Stok Bilgileri ---")
-        # Sütun genişlikleri düzenlendi
-        print(f"{'ID':<4} | {'Ürün Adı':<25} | {'Tür':<10} | {'Kategori':<15} | {'Fiyat':<8} | {'Stok/Detay':<15}")
-        print("-" * 90) # Çizgi uzunluğu ayarlandı
-        if not self.stock:
-            print("Envanterde henüz ürün bulunmamaktadır.")
-            return
-
-        for product_id, product in self.stock.items():
-            stock_info = ""
-            if isinstance(product, PhysicalProduct):
-                stock_info = str(product.stock)
-            elif isinstance(product, DigitalProduct):
-                stock_info = f"Link: {product.download_link[:10]}..." # Link kısaltıldı
-            elif isinstance(product, ServiceProduct):
-                stock_info = f"Süre: {product.duration} gün"
-            else:
-                stock_info = "N/A"
-
-            print(
-                f"{product.product_id:<4} | {product.name:<25} | {product.get_type():<10} | "
-                f"{product.category:<15} | {product.price:<8.2f} | {stock_info:<15}"
-            )
\ No newline at end of file
+# inventorymanager.py
+import itertools
+import threading
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import MutableMapping
+from product import Product, PhysicalProduct, DigitalProduct, ServiceProduct
+from typing import List, Dict, Iterator, Tuple, TYPE_CHECKING
+import metrics
+
+if TYPE_CHECKING:
+    from product_search import ProductSearchIndex
+
+_STOCK_UPDATES = metrics.MetricsRegistry.get_instance().counter(
+    "inventory_stock_updates_total", "InventoryManager.update_stock çağrıları (sonuca göre)", ("result",))
+_STOCK_OK, _STOCK_OUT, _STOCK_NOT_FOUND = (_STOCK_UPDATES.labels(result) for result in ("ok", "stock_out", "not_found"))
+
+class InventoryManager:
+    """
+    Envanter yöneticisi sınıfı. Singleton deseni uygular.
+    Mağazadaki tüm ürünlerin stok bilgilerini yönetir.
+    Kategori, tür ve fiyat için ikincil indeksleri artımlı olarak günceller.
+    Ürün adları için bir ters indeks (bkz. product_search) ilk aramada kurulur.
+    Ürünlerin tutulduğu depo değiştirilebilir (varsayılan: dict, alternatif: ColumnarProductStore,
+    SQLiteProductStore, CatalogSnapshotStore).
+    Stok işlemleri ürün ID'sine göre bölümlenmiş (lock striping) kilitlerle korunur.
+    """
+    _instance = None # Singleton örneğini tutar
+    _instance_lock = threading.Lock() # Singleton'ın iş parçacıkları arasında tek kez oluşturulması için
+    LOCK_STRIPES = 256 # Stok kilidi sayısı; farklı kilitlere düşen ürünler birbirini beklemez
+
+    def __new__(cls):
+        """
+        Singleton desenini uygulamak için __new__ metodu override edildi.
+        Çift kontrollü kilitleme ile eşzamanlı çağrılarda tek örnek oluşturulur.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance.stock: Dict[int, Product] = {} # Ürün stoklarını tutacak dictionary: {product_id: Product_object}
+                    instance._reset_indexes()
+                    instance._search_index: "ProductSearchIndex | None" = None # İlk aramada kurulur
+                    instance._stock_locks = [threading.Lock() for _ in range(cls.LOCK_STRIPES)]
+                    instance._reserved: Dict[int, int] = {} # {product_id: rezerve edilmiş adet}
+                    instance._reservations: Dict[int, List[Tuple[int, int]]] = {} # {rezervasyon_id: [(product_id, adet)]}
+                    instance._reservation_ids = itertools.count(1)
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def get_instance():
+        """
+        InventoryManager'ın tek örneğini döndürür (Singleton deseni).
+        """
+        if InventoryManager._instance is None:
+            InventoryManager._instance = InventoryManager() # __new__ metodu çağrılır
+        return InventoryManager._instance
+
+    def set_storage_backend(self, store: MutableMapping):
+        """
+        Ürünlerin tutulduğu depoyu değiştirir (örn. ColumnarProductStore).
+        Mevcut ürünler yeni depoya taşınır. İkincil indeksler, depodaki tüm ürünleri
+        hemen belleğe yüklememek için ilk indeks sorgusunda yeniden kurulur.
+        Depo, {product_id: Product} şeklinde bir MutableMapping olmalıdır.
+
+        Depo isteğe bağlı olarak şu metotları sunabilir:
+            index_rows(): (product_id, kategori, tür, fiyat, stok_tükendi_mi) satırları;
+                indeksler ürün nesneleri oluşturulmadan bu satırlardan kurulur.
+            name_rows(): (product_id, ad) satırları; arama indeksi bu satırlardan kurulur.
+            mark_dirty(product_id): ürün nesnesi yerinde değiştiğinde (örn. stok) çağrılır.
+        """
+        for product_id, product in self.stock.items():
+            store[product_id] = product
+        self.stock = store
+        self._reset_indexes()
+        self._indexes_ready = False
+        self._search_index = None
+
+    def open_catalog(self, path: str):
+        """
+        Ürün kataloğunu mmap ile açılan anlık görüntü dosyasından yükler (bkz. catalog_snapshot).
+        Mevcut ürünler atılır; ürünler get_product ile istendiklerinde dosyadan okunur ve
+        ikincil indeksler ilk indeks sorgusunda kurulur.
+        """
+        from catalog_snapshot import CatalogSnapshotStore # mmap/struct yalnızca katalog kullanılırken yüklenir
+        self.stock = CatalogSnapshotStore(path)
+        self._reset_indexes()
+        self._indexes_ready = False
+        self._search_index = None
+
+    def save_catalog(self, path: str) -> int:
+        """
+        Envanterdeki tüm ürünleri, open_catalog ile açılabilecek bir anlık görüntü dosyasına
+        yazar ve yazılan ürün sayısını döndürür.
+        """
+        from catalog_snapshot import write_catalog_snapshot
+        return write_catalog_snapshot(path, self.stock.values())
+
+    # --- İkincil indeksler ---
+
+    def _reset_indexes(self):
+        """
+        İkincil indeksleri boş olarak oluşturur.
+        Küme yerine dict kullanılır; böylece sonuçlar ekleme sırasını korur.
+        """
+        self._category_index: Dict[str, Dict[int, None]] = {} # {casefold kategori: {product_id: None}}
+        self._category_names: Dict[str, int] = {} # {orijinal kategori adı: ürün sayısı}
+        self._type_index: Dict[str, Dict[int, None]] = {} # {casefold tür: {product_id: None}}
+        self._prices: Dict[int, float] = {} # {product_id: fiyat}
+        self._price_index: List[Tuple[float, int]] | None = None # (fiyat, product_id) sıralı liste, ilk sorguda kurulur
+        self._out_of_stock: Dict[int, None] = {} # Stoğu tükenen fiziksel ürünler
+        self._indexes_ready = True # False ise indeksler ilk sorguda depodan kurulur
+
+    def _ensure_indexes(self):
+        """
+        İkincil indeksler henüz kurulmadıysa depodaki ürünlerden kurar.
+        """
+        if self._indexes_ready:
+            return
+        self._reset_indexes()
+        index_rows = getattr(self.stock, "index_rows", None)
+        if index_rows is not None:
+            self._index_rows(index_rows())
+        else:
+            for product in self.stock.values():
+                self._index_product(product)
+        self._indexes_ready = True
+
+    def _mark_dirty(self, product: Product):
+        """
+        Ürün nesnesi yerinde değiştiğinde, destekliyorsa depoya bildirir (örn. kalıcı depolar).
+        """
+        mark_dirty = getattr(self.stock, "mark_dirty", None)
+        if mark_dirty is not None:
+            mark_dirty(product.product_id)
+
+    @staticmethod
+    def _normalize(key: str) -> str:
+        """
+        İndeks anahtarlarını büyük/küçük harf duyarsız hale getirir.
+        """
+        return key.casefold()
+
+    def _get_search_index(self) -> "ProductSearchIndex":
+        """
+        Ürün adı arama indeksini döndürür; henüz kurulmadıysa depodaki ürünlerden kurar.
+        """
+        if self._search_index is None:
+            from product_search import ProductSearchIndex # Arama yapılmayan süreçler modülü yüklemesin
+            search_index = ProductSearchIndex()
+            name_rows = getattr(self.stock, "name_rows", None)
+            if name_rows is not None:
+                search_index.build(name_rows())
+            else:
+                search_index.build((product.product_id, product.name) for product in self.stock.values())
+            self._search_index = search_index
+        return self._search_index
+
+    def _index_product(self, product: Product):
+        """
+        Ürünü tüm ikincil indekslere ekler.
+        """
+        out_of_stock = isinstance(product, PhysicalProduct) and product.stock <= 0
+        self._index_fields(product.product_id, product.category, product.get_type(), product.price, out_of_stock)
+
+    def _index_fields(self, product_id: int, category: str, product_type: str, price: float, out_of_stock: bool):
+        """
+        Ürünü, nesnesine ihtiyaç duymadan indekslenen alanlarıyla tüm ikincil indekslere ekler.
+        """
+        self._category_index.setdefault(self._normalize(category), {})[product_id] = None
+        self._category_names[category] = self._category_names.get(category, 0) + 1
+        self._type_index.setdefault(self._normalize(product_type), {})[product_id] = None
+        self._prices[product_id] = price
+        if self._price_index is not None:
+            insort(self._price_index, (price, product_id))
+        if out_of_stock:
+            self._out_of_stock[product_id] = None
+
+    def _index_rows(self, rows):
+        """
+        İndeksleri (product_id, kategori, tür, fiyat, stok_tükendi_mi) satırlarından toplu kurar.
+        _index_fields ile aynı sonucu verir; ancak farklı kategori ve tür sayısı az olduğundan
+        normalize edilmiş kovalar satır başına değil, her farklı değer için bir kez bulunur.
+        """
+        category_buckets: Dict[str, Dict[int, None]] = {} # {orijinal kategori adı: indeks kovası}
+        type_buckets: Dict[str, Dict[int, None]] = {}
+        category_counts: Dict[str, int] = {}
+        prices, out_of_stock = self._prices, self._out_of_stock
+        for product_id, category, product_type, price, is_out_of_stock in rows:
+            bucket = category_buckets.get(category)
+            if bucket is None:
+                bucket = category_buckets[category] = self._category_index.setdefault(self._normalize(category), {})
+                category_counts[category] = 0
+            bucket[product_id] = None
+            category_counts[category] += 1
+            bucket = type_buckets.get(product_type)
+            if bucket is None:
+                bucket = type_buckets[product_type] = self._type_index.setdefault(self._normalize(product_type), {})
+            bucket[product_id] = None
+            prices[product_id] = price
+            if is_out_of_stock:
+                out_of_stock[product_id] = None
+        for category, count in category_counts.items():
+            self._category_names[category] = self._category_names.get(category, 0) + count
+        self._price_index = None
+
+    def _unindex_product(self, product: Product):
+        """
+        Ürünü tüm ikincil indekslerden çıkarır.
+        """
+        product_id = product.product_id
+        category_key = self._normalize(product.category)
+        bucket = self._category_index.get(category_key)
+        if bucket is not None:
+            bucket.pop(product_id, None)
+            if not bucket:
+                del self._category_index[category_key]
+        remaining = self._category_names.get(product.category, 0) - 1
+        if remaining > 0:
+            self._category_names[product.category] = remaining
+        else:
+            self._category_names.pop(product.category, None)
+        type_key = self._normalize(product.get_type())
+        bucket = self._type_index.get(type_key)
+        if bucket is not None:
+            bucket.pop(product_id, None)
+            if not bucket:
+                del self._type_index[type_key]
+        old_price = self._prices.pop(product_id, None)
+        if self._price_index is not None and old_price is not None:
+            position = bisect_left(self._price_index, (old_price, product_id))
+            if position < len(self._price_index) and self._price_index[position] == (old_price, product_id):
+                del self._price_index[position]
+        self._out_of_stock.pop(product_id, None)
+
+    def _update_stock_index(self, product: Product):
+        """
+        Fiziksel ürünün stok durumuna göre tükenen ürünler indeksini günceller.
+        """
+        if not self._indexes_ready:
+            return
+        if isinstance(product, PhysicalProduct) and product.stock <= 0:
+            self._out_of_stock[product.product_id] = None
+        else:
+            self._out_of_stock.pop(product.product_id, None)
+
+    def _get_price_index(self) -> List[Tuple[float, int]]:
+        """
+        Fiyat indeksini döndürür. Toplu yüklemelerde her eklemede sıralama yapmamak için
+        indeks ilk fiyat sorgusunda bir kez sıralanır, sonrasında artımlı güncellenir.
+        """
+        if self._price_index is None:
+            self._price_index = sorted((price, product_id) for product_id, price in self._prices.items())
+        return self._price_index
+
+    def _products_for_ids(self, product_ids) -> List[Product]:
+        """
+        İndeksten gelen ürün ID'lerini ürün nesnelerine çevirir.
+        """
+        return [self.stock[product_id] for product_id in product_ids]
+
+    # --- Envanter işlemleri ---
+
+    def add_product(self, product: Product, verbose: bool = True):
+        """
+        Envantere bir ürün ekler.
+        Toplu yüklemelerde verbose=False ile bilgi mesajları kapatılabilir.
+        """
+        existing = self.stock.get(product.product_id)
+        if existing is not None:
+            if verbose:
+                print(f"Uyarı: '{product.name}' (ID: {product.product_id}) zaten envanterde. Stok güncelleniyor.")
+            if self._indexes_ready:
+                self._unindex_product(existing)
+            if self._search_index is not None:
+                self._search_index.remove(existing.product_id, existing.name)
+        self.stock[product.product_id] = product
+        if self._indexes_ready:
+            self._index_product(product)
+        if self._search_index is not None:
+            self._search_index.add(product.product_id, product.name)
+        if verbose:
+            print(f"'{product.name}' (ID: {product.product_id}) envantere eklendi/güncellendi.")
+
+    def update_stock(self, product_id: int, quantity: int, verbose: bool = True) -> bool:
+        """
+        Belirtilen ürünün stoğunu günceller.
+        Sadece fiziksel ürünler için stok azaltımı yapar.
+        Rezerve edilmiş adetler başka siparişlere ayrıldığı için kullanılamaz.
+        """
+        product = self.stock.get(product_id)
+        if product:
+            with self._lock_for(product_id):
+                try:
+                    available = self._available(product)
+                    if quantity > available:
+                        raise ValueError(f"Yeterli stok yok! '{product.name}' için kullanılabilir stok: {available} adet. İstenen: {quantity} adet.")
+                    # Ürünün kendi update_stock metodunu çağırır.
+                    # PhysicalProduct stok düşürür, diğerleri bilgilendirme yapar.
+                    product.update_stock(quantity, verbose)
+                    self._update_stock_index(product)
+                    self._mark_dirty(product)
+                    if metrics.enabled:
+                        _STOCK_OK.inc()
+                    return True
+                except ValueError as e:
+                    if metrics.enabled:
+                        _STOCK_OUT.inc()
+                    if verbose:
+                        print(f"Stok güncelleme hatası: {e}")
+                    return False
+        else:
+            if metrics.enabled:
+                _STOCK_NOT_FOUND.inc()
+            if verbose:
+                print(f"Hata: ID {product_id} ile ürün bulunamadı.")
+            return False
+
+    # --- Stok rezervasyonu ---
+
+    def _lock_for(self, product_id: int) -> threading.Lock:
+        """
+        Ürünün stok kilidini (lock stripe) döndürür.
+        """
+        return self._stock_locks[hash(product_id) % self.LOCK_STRIPES]
+
+    def _available(self, product: Product) -> int | float:
+        """
+        Fiziksel ürünün rezerve edilmemiş stoğunu döndürür.
+        Stok takibi yapılmayan ürünler için sınırsız kabul edilir (float("inf")).
+        """
+        if not isinstance(product, PhysicalProduct):
+            return float("inf")
+        return product.stock - self._reserved.get(product.product_id, 0)
+
+    def _acquire_locks(self, product_ids) -> List[threading.Lock]:
+        """
+        Verilen ürünlerin kilitlerini kilitlenmeyi (deadlock) önlemek için sabit sırada alır.
+        """
+        stripes = sorted({hash(product_id) % self.LOCK_STRIPES for product_id in product_ids})
+        locks = [self._stock_locks[stripe] for stripe in stripes]
+        for lock in locks:
+            lock.acquire()
+        return locks
+
+    @staticmethod
+    def _release_locks(locks: List[threading.Lock]):
+        for lock in reversed(locks):
+            lock.release()
+
+    def get_available_stock(self, product_id: int) -> int | float | None:
+        """
+        Ürünün rezervasyonlar düşüldükten sonra kalan stoğunu döndürür. Ürün yoksa None;
+        stok takibi yapılmayan ürünler için float("inf").
+        """
+        product = self.stock.get(product_id)
+        if product is None:
+            return None
+        return self._available(product)
+
+    def reserve_stock(self, cart: List[Tuple[Product, int]]) -> int:
+        """
+        Sepetteki tüm satırlar için stoğu tek seferde (ya hep ya hiç) rezerve eder.
+        Başarılı olursa rezervasyon ID'sini döndürür; herhangi bir satır için ürün
+        bulunamaz veya stok yetersizse hiçbir şey rezerve edilmeden ValueError fırlatılır.
+        """
+        quantities: Dict[int, int] = {}
+        for product, quantity in cart:
+            if quantity <= 0:
+                raise ValueError("Adet 0'dan büyük olmalıdır.")
+            quantities[product.product_id] = quantities.get(product.product_id, 0) + quantity
+
+        locks = self._acquire_locks(quantities)
+        try:
+            for product_id, quantity in quantities.items():
+                product = self.stock.get(product_id)
+                if product is None:
+                    raise ValueError(f"ID {product_id} ile ürün bulunamadı.")
+                available = self._available(product)
+                if quantity > available:
+                    raise ValueError(f"Yeterli stok yok! '{product.name}' için kullanılabilir stok: {available} adet. İstenen: {quantity} adet.")
+            for product_id, quantity in quantities.items():
+                self._reserved[product_id] = self._reserved.get(product_id, 0) + quantity
+        finally:
+            self._release_locks(locks)
+
+        reservation_id = next(self._reservation_ids)
+        self._reservations[reservation_id] = list(quantities.items())
+        return reservation_id
+
+    def _pop_reservation(self, reservation_id: int) -> List[Tuple[int, int]]:
+        lines = self._reservations.pop(reservation_id, None)
+        if lines is None:
+            raise ValueError(f"Geçersiz veya zaten sonuçlandırılmış rezervasyon: {reservation_id}")
+        return lines
+
+    def commit_reservation(self, reservation_id: int, verbose: bool = True):
+        """
+        Rezervasyonu kesinleştirir: rezerve edilen adetler stoktan düşülür.
+        Ya hep ya hiç çalışır: bir satır düşülemiyorsa (ürün silinmiş veya stok dışarıdan
+        azaltılmışsa) hiçbir stok değişmeden ValueError fırlatılır ve rezervasyon açık kalır;
+        çağıran release_reservation ile bırakabilir.
+        """
+        lines = self._reservations.get(reservation_id)
+        if lines is None:
+            raise ValueError(f"Geçersiz veya zaten sonuçlandırılmış rezervasyon: {reservation_id}")
+        locks = self._acquire_locks(product_id for product_id, _ in lines)
+        try:
+            products = []
+            for product_id, quantity in lines:
+                product = self.stock.get(product_id)
+                if product is None:
+                    raise ValueError(f"ID {product_id} ile ürün bulunamadı.")
+                if isinstance(product, PhysicalProduct) and quantity > product.stock:
+                    raise ValueError(f"Yeterli stok yok! '{product.name}' için mevcut stok: {product.stock} adet. İstenen: {quantity} adet.")
+                products.append((product, quantity))
+            self._pop_reservation(reservation_id) # Aynı rezervasyonu eşzamanlı sonuçlandıran çağrıya karşı
+            for product, quantity in products:
+                self._unreserve(product.product_id, quantity)
+                product.update_stock(quantity, verbose)
+                self._update_stock_index(product)
+                self._mark_dirty(product)
+        finally:
+            self._release_locks(locks)
+
+    def release_reservation(self, reservation_id: int):
+        """
+        Rezervasyonu iptal eder; rezerve edilen adetler tekrar kullanılabilir olur.
+        """
+        lines = self._pop_reservation(reservation_id)
+        locks = self._acquire_locks(product_id for product_id, _ in lines)
+        try:
+            for product_id, quantity in lines:
+                self._unreserve(product_id, quantity)
+        finally:
+            self._release_locks(locks)
+
+    def _unreserve(self, product_id: int, quantity: int):
+        remaining = self._reserved.get(product_id, 0) - quantity
+        if remaining > 0:
+            self._reserved[product_id] = remaining
+        else:
+            self._reserved.pop(product_id, None)
+
+    def get_product(self, product_id: int) -> Product | None:
+        """
+        Ürün ID'sine göre ürün nesnesini döndürür. Bulamazsa None döner.
+        """
+        return self.stock.get(product_id)
+
+    def iter_products(self) -> Iterator[Product]:
+        """
+        Envanterdeki ürünleri tüm listeyi oluşturmadan sırayla döndürür.
+        """
+        stock = self.stock
+        if isinstance(stock, dict):
+            return iter(stock.values())
+        return (stock[product_id] for product_id in stock)
+
+    def get_all_products(self) -> List[Product]:
+        """
+        Envanterdeki tüm ürünlerin listesini döndürür.
+        """
+        return list(self.stock.values())
+
+    # --- İndeks destekli sorgular ---
+
+    def get_products_by_category(self, category: str) -> List[Product]:
+        """
+        Kategoriye göre (büyük/küçük harf duyarsız) ürünleri indeksten döndürür.
+        """
+        self._ensure_indexes()
+        return self._products_for_ids(self._category_index.get(self._normalize(category), ()))
+
+    def get_products_by_type(self, product_type: str) -> List[Product]:
+        """
+        Ürün türüne göre (Physical, Digital, Service) ürünleri indeksten döndürür.
+        """
+        self._ensure_indexes()
+        return self._products_for_ids(self._type_index.get(self._normalize(product_type), ()))
+
+    def get_products_in_price_range(self, min_price: float, max_price: float) -> List[Product]:
+        """
+        Fiyatı [min_price, max_price] aralığındaki ürünleri fiyata göre artan sırada döndürür.
+        """
+        if min_price > max_price:
+            return []
+        self._ensure_indexes()
+        price_index = self._get_price_index()
+        start = bisect_left(price_index, (min_price, float("-inf")))
+        end = bisect_right(price_index, (max_price, float("inf")))
+        return self._products_for_ids(product_id for _, product_id in price_index[start:end])
+
+    def search_products(self, query: str, limit: int | None = 20, prefix: bool = True) -> List[Product]:
+        """
+        Adında sorgudaki tüm kelimeleri (prefix=True ise kelime öneklerini) içeren ürünleri
+        en iyi eşleşmeden başlayarak döndürür. Karşılaştırma Türkçe büyük/küçük harf
+        kurallarıyla yapılır (örn. "KİTAP" ve "kitap" aynı kelimedir).
+        """
+        search_index = self._get_search_index()
+        return self._products_for_ids(product_id for product_id, _ in search_index.search(query, limit, prefix))
+
+    def get_categories(self) -> List[str]:
+        """
+        Envanterdeki mevcut kategori adlarını sıralı olarak döndürür.
+        """
+        self._ensure_indexes()
+        return sorted(self._category_names)
+
+    def get_out_of_stock_products(self) -> List[Product]:
+        """
+        Stoğu tükenmiş fiziksel ürünleri döndürür.
+        """
+        self._ensure_indexes()
+        return self._products_for_ids(self._out_of_stock)
+
+    def get_stock_info(self, page_size: int | None = None):
+        """
+        Tüm ürünlerin stok bilgilerini tablo halinde listeler.
+        Satırlar depodan sırayla okunup önbellekten yazdırılır (bkz. table_renderer);
+        page_size verilirse her sayfadan sonra devam edilip edilmeyeceği sorulur.
+        """
+        from table_renderer import print_paginated, product_rows, product_table_header # Yalnızca görüntülemede
+        print("\n--- Stok Bilgileri ---")
+        if not self.stock:
+            print("\n".join(product_table_header()))
+            print("Envanterde henüz ürün bulunmamaktadır.")
+            return
+        print_paginated(product_table_header(), product_rows(self.iter_products()), page_size)
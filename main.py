@@ -1,162 +1,496 @@
-# main.py
-import sys
-import os
-
-# Modül yollarını doğru ayarlamak için (eğer doğrudan çalıştırılıyorsa)
-# Bu, projeyi farklı dizin yapılarında çalıştırırken yardımcı olabilir.
-script_dir = os.path.dirname(__file__)
-sys.path.insert(0, script_dir)
-
-from customer import Customer
-from inventorymanager import InventoryManager
-from product_console import run_product_menu
-from customer_console import create_customer, customer_list, show_customer_profile
-from order_console import create_order_interactive, update_order_status
-from order_factory import OrderFactory
-from product_factory import ProductFactory
-from product_manager import ProductManager
-from order_decorator import BaseOrder, OrderComponent
-from order import OrderStatus  # OrderStatus enum'ını import et
-
-# Bu liste BaseOrder veya OrderDecorator türünde objeler tutacak.
-orders: list[OrderComponent] = []
-
-
-def add_initial_products_to_inventory(inventory_manager: InventoryManager):
-    """
-    ProductFactory kullanarak InventoryManager'a bir dizi ilk ürün ekler.
-    Bu, ürünlerin siparişler için kullanılabilir olmasını sağlar.
-    """
-    print("\nEnvantere başlangıç ürünleri ekleniyor...")
-    # Physical Products
-    inventory_manager.add_product(ProductFactory.create_product("physical", 1, "Klavye", "Elektronik", 500, 10))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 2, "Mouse", "Elektronik", 250, 5))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 3, "Defter", "Kırtasiye", 25, 50))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 4, "Kalem", "Kırtasiye", 10, 100))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 5, "Kitap: Python Programlama", "Kitap", 120, 20))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 6, "Akıllı Telefon", "Elektronik", 8000, 3))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 7, "Kulaklık", "Elektronik", 400, 15))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 8, "Masa Lambası", "Ev Eşyası", 150, 8))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 9, "Kahve Makinesi", "Mutfak Aletleri", 1200, 4))
-    inventory_manager.add_product(ProductFactory.create_product("physical", 10, "Spor Ayakkabı", "Giyim", 750, 12))
-
-    # Digital Products
-    inventory_manager.add_product(ProductFactory.create_product("digital", 11, "E-Kitap: Yapay Zeka Temelleri", "E-Kitap", 75, "link-ai-book.pdf"))
-    inventory_manager.add_product(ProductFactory.create_product("digital", 12, "Yazılım Lisansı: Pro Analiz", "Yazılım", 1500, "link-pro-analysis.zip"))
-    inventory_manager.add_product(ProductFactory.create_product("digital", 13, "Müzik Albümü: Chill Mix", "Müzik", 30, "link-chill-mix.mp3"))
-    inventory_manager.add_product(ProductFactory.create_product("digital", 14, "Online Kurs: Web Geliştirme", "Eğitim", 400, "link-web-dev-course.html"))
-
-    # Service Products
-    inventory_manager.add_product(ProductFactory.create_product("service", 15, "Premium Destek Paketi (1 Yıl)", "Hizmet", 1000, 365))
-    inventory_manager.add_product(ProductFactory.create_product("service", 16, "Danışmanlık Hizmeti (Saatlik)", "Hizmet", 250, 1)) # Duration in hours or days? Let's assume days for consistency.
-    inventory_manager.add_product(ProductFactory.create_product("service", 17, "Yazılım Kurulum Hizmeti", "Hizmet", 180, 1))
-    inventory_manager.add_product(ProductFactory.create_product("service", 18, "Web Sitesi Bakım Hizmeti (Aylık)", "Hizmet", 300, 30))
-
-    print("Başlangıç ürünleri envantere eklendi.")
-
-def main_menu():
-    """
-    Ana menüyü gösterir ve kullanıcı seçimlerini işler.
-    """
-    inventory_manager = InventoryManager.get_instance()
-    # add_initial_products_to_inventory(inventory_manager) # Her çalıştığında ürün eklemesin diye yorum satırı yaptım.
-
-    while True:
-        print("\n--- E-TİCARET PLATFORMU ---")
-        print("1. Yeni Müşteri Oluştur")
-        print("2. Müşteri Profili Görüntüle")
-        print("3. Yeni Sipariş Oluştur")
-        print("4. Sipariş Durumu Güncelle")
-        print("5. Tüm Siparişleri Görüntüle")
-        print("6. Ürün Yönetimi")
-        print("0. Çıkış")
-
-        choice = input("Seçiminiz: ").strip()
-
-        if choice == "1":
-            create_customer()
-        elif choice == "2":
-            if not customer_list:
-                print("Henüz kayıtlı müşteri yok.")
-                continue
-            for i, cust in enumerate(customer_list):
-                print(f"{i + 1}. {cust.name} (ID: {cust.customer_id})")
-            try:
-                cust_index = int(input("Profilini görüntülemek istediğiniz müşterinin numarasını girin: ")) - 1
-                if 0 <= cust_index < len(customer_list):
-                    show_customer_profile(customer_list[cust_index])
-                else:
-                    print("Geçersiz müşteri numarası.")
-            except ValueError:
-                print("Lütfen geçerli bir sayı girin.")
-        elif choice == "3":
-            if not customer_list:
-                print("Sipariş oluşturmak için önce bir müşteri oluşturmalısınız.")
-                continue
-            if not inventory_manager.get_all_products():
-                print("Sipariş oluşturmak için envanterde ürün bulunmalıdır.")
-                continue
-
-            print("\n--- Sipariş Oluşturulacak Müşteriyi Seçin ---")
-            for i, cust in enumerate(customer_list):
-                print(f"{i + 1}. {cust.name} (ID: {cust.customer_id})")
-            try:
-                cust_index = int(input("Sipariş oluşturmak istediğiniz müşterinin numarasını girin: ")) - 1
-                if 0 <= cust_index < len(customer_list):
-                    selected_customer = customer_list[cust_index]
-                    # create_order_interactive artık InventoryManager'ı kendisi alıyor
-                    new_order = create_order_interactive(selected_customer)
-                    if new_order:
-                        orders.append(new_order)
-                        print(f"Sipariş {new_order.order_id} başarıyla eklendi.")
-                else:
-                    print("Geçersiz müşteri numarası.")
-            except ValueError:
-                print("Lütfen geçerli bir sayı girin.")
-        elif choice == "4":
-            if not orders:
-                print("Güncellenecek sipariş bulunmamaktadır.")
-                continue
-            print("\n--- Güncellenecek Siparişi Seçin ---")
-            for i, order_obj in enumerate(orders):
-                # __getattr__ sayesinde doğrudan erişim
-                print(f"{i + 1}. Sipariş ID: {order_obj.order_id}, Müşteri: {order_obj.customer.name}, Durum: {order_obj.status.value}")
-
-            try:
-                order_index = int(input("Durumunu güncellemek istediğiniz siparişin numarasını girin: ")) - 1
-                if 0 <= order_index < len(orders):
-                    update_order_status(orders[order_index])  # orders[order_index] zaten BaseOrder/Decorator
-                else:
-                    print("Geçersiz sipariş numarası.")
-            except ValueError:
-                print("Lütfen geçerli bir sayı girin.")
-
-        elif choice == "5":
-            if not orders:
-                print("Görüntülenecek sipariş bulunmamaktadır.")
-                continue
-            print("\n--- Tüm Siparişler ---")
-            for i, order_obj in enumerate(orders):
-                # __getattr__ sayesinde doğrudan erişim ve metod çağrıları
-                print(f"Sipariş ID: {order_obj.order_id}")
-                print(f"  Açıklama: {order_obj.get_description()}")
-                print(f"  Toplam Maliyet: {order_obj.get_total_cost():.2f}₺")
-                print(f"  Müşteri: {order_obj.customer.name}")
-                print(f"  Durum: {order_obj.status.value}")  # Enum'dan value alınmalı
-                print("-" * 30)
-
-        elif choice == "6":
-            run_product_menu()
-
-        elif choice == "0":
-            print("E-Ticaret Platformundan çıkılıyor. Hoşça kalın!")
-            break
-        else:
-            print("Geçersiz seçim. Lütfen tekrar deneyin.")
-
-
-if __name__ == "__main__":
-    # Uygulama başlatılırken InventoryManager'a başlangıç ürünleri eklenir
-    initial_inventory_manager = InventoryManager.get_instance()
-    add_initial_products_to_inventory(initial_inventory_manager)
-    main_menu()
\ No newline at end of file
+# main.py
+"""
+E-ticaret platformunun konsol uygulaması.
+
+Açılışta yalnızca menüyü göstermek için gereken modüller yüklenir. Konsol ekranları
+(ürün, sipariş), toplu yükleme, SQLite deposu, olay günlüğü ve bildirim dağıtıcısı
+ilgili menü seçeneği veya komut satırı seçeneği kullanıldığında içe aktarılır.
+Konsol içermeyen alan modellerine core paketi üzerinden erişilebilir.
+"""
+import argparse
+import os
+import time
+from typing import TYPE_CHECKING
+
+from inventorymanager import InventoryManager
+from customer_console import create_customer, customer_list, register_customer, show_customer_profile
+from customer_order_registry import CustomerOrderRegistry
+from product_factory import ProductFactory
+from order import OrderStatus  # OrderStatus enum'ını import et
+from sales_aggregates import SalesAggregates
+import metrics
+
+if TYPE_CHECKING:
+    from order_decorator import OrderComponent
+    from sqlite_repository import SQLiteRepository
+    from order_event_log import OrderEventLog
+
+# Bu liste BaseOrder veya OrderDecorator türünde objeler tutacak.
+# ID, durum ve müşteriye göre aramalar için siparişler ayrıca CustomerOrderRegistry'ye kaydedilir.
+orders: "list[OrderComponent]" = []
+
+
+def register_orders(new_orders):
+    """
+    Siparişleri kayıt defterine ve orders listesine ekler.
+    OrderFactory dışında oluşturulan (yüklenen) siparişler satış toplamlarına da eklenir.
+    """
+    registry = CustomerOrderRegistry.get_instance()
+    for order_obj in new_orders:
+        registry.add_order(order_obj)
+        orders.append(order_obj)
+    SalesAggregates.get_instance().record_orders(new_orders)
+
+
+def select_item(items: list, prompt: str, lookup):
+    """
+    Kullanıcının girdiği değeri önce lookup ile (ID veya e-posta) arar, bulamazsa
+    listedeki sıra numarası olarak yorumlar. Geçersiz numarada None döner;
+    değer sayı da değilse ValueError fırlatılır.
+    """
+    selection = input(prompt).strip()
+    found = lookup(selection)
+    if found is not None:
+        return found
+    index = int(selection) - 1
+    if 0 <= index < len(items):
+        return items[index]
+    return None
+
+
+def print_order_summary(order_obj: "OrderComponent"):
+    """
+    Siparişin açıklamasını, maliyetini (kalemleriyle), müşterisini ve durumunu yazdırır.
+    Maliyet kalemleri siparişin maliyet önbelleğinden gelir.
+    """
+    # __getattr__ sayesinde doğrudan erişim ve metod çağrıları
+    breakdown = order_obj.get_cost_breakdown()
+    print(f"Sipariş ID: {order_obj.order_id}")
+    print(f"  Açıklama: {order_obj.get_description()}")
+    print(f"  Toplam Maliyet: {breakdown.total:.2f}₺")
+    print(f"    Ürünler: {breakdown.base:.2f}₺ | Tür ayarlaması/promosyon: {breakdown.adjustment:+.2f}₺ | "
+          f"Kargo: {breakdown.shipping:.2f}₺")
+    for name, fee in breakdown.surcharges:
+        print(f"    Ek hizmet ({name}): {fee:.2f}₺")
+    print(f"  Müşteri: {order_obj.customer.name}")
+    print(f"  Durum: {order_obj.status.value}")  # Enum'dan value alınmalı
+    print("-" * 30)
+
+
+def search_menu(registry: CustomerOrderRegistry):
+    """
+    Müşteri ve siparişleri kayıt defterindeki indekslerden arar.
+    """
+    print("\n--- Müşteri / Sipariş Ara ---")
+    print("1. Müşteri Ara (ID veya E-posta)")
+    print("2. Sipariş Ara (ID)")
+    print("3. Duruma Göre Siparişleri Listele")
+    choice = input("Seçiminiz: ").strip()
+
+    if choice == "1":
+        customer = registry.find_customer(input("Müşteri ID'si veya e-posta: ").strip())
+        if customer:
+            show_customer_profile(customer)
+        else:
+            print("Müşteri bulunamadı.")
+    elif choice == "2":
+        order_id = input("Sipariş ID'si: ").strip()
+        order_obj = registry.get_order(order_id)
+        if order_obj:
+            print_order_summary(order_obj)
+            return
+        from order_archive import OrderArchive
+        archived = OrderArchive.get_instance().get(order_id)
+        print(archived if archived else "Sipariş bulunamadı.")
+    elif choice == "3":
+        statuses = list(OrderStatus)
+        for i, status_enum in enumerate(statuses):
+            print(f"{i + 1}. {status_enum.value} ({registry.count_orders_by_status(status_enum)} sipariş)")
+        try:
+            status_index = int(input("Durum numarası: ").strip()) - 1
+        except ValueError:
+            print("Lütfen geçerli bir sayı girin.")
+            return
+        if not 0 <= status_index < len(statuses):
+            print("Geçersiz durum numarası.")
+            return
+        matching = registry.get_orders_by_status(statuses[status_index])
+        if not matching:
+            print("Bu durumda sipariş bulunmamaktadır.")
+        for order_obj in matching:
+            print_order_summary(order_obj)
+    else:
+        print("Geçersiz seçim.")
+
+
+def add_initial_products_to_inventory(inventory_manager: InventoryManager):
+    """
+    ProductFactory kullanarak InventoryManager'a bir dizi ilk ürün ekler.
+    Bu, ürünlerin siparişler için kullanılabilir olmasını sağlar.
+    """
+    print("\nEnvantere başlangıç ürünleri ekleniyor...")
+    # Physical Products
+    inventory_manager.add_product(ProductFactory.create_product("physical", 1, "Klavye", "Elektronik", 500, 10))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 2, "Mouse", "Elektronik", 250, 5))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 3, "Defter", "Kırtasiye", 25, 50))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 4, "Kalem", "Kırtasiye", 10, 100))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 5, "Kitap: Python Programlama", "Kitap", 120, 20))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 6, "Akıllı Telefon", "Elektronik", 8000, 3))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 7, "Kulaklık", "Elektronik", 400, 15))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 8, "Masa Lambası", "Ev Eşyası", 150, 8))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 9, "Kahve Makinesi", "Mutfak Aletleri", 1200, 4))
+    inventory_manager.add_product(ProductFactory.create_product("physical", 10, "Spor Ayakkabı", "Giyim", 750, 12))
+
+    # Digital Products
+    inventory_manager.add_product(ProductFactory.create_product("digital", 11, "E-Kitap: Yapay Zeka Temelleri", "E-Kitap", 75, "link-ai-book.pdf"))
+    inventory_manager.add_product(ProductFactory.create_product("digital", 12, "Yazılım Lisansı: Pro Analiz", "Yazılım", 1500, "link-pro-analysis.zip"))
+    inventory_manager.add_product(ProductFactory.create_product("digital", 13, "Müzik Albümü: Chill Mix", "Müzik", 30, "link-chill-mix.mp3"))
+    inventory_manager.add_product(ProductFactory.create_product("digital", 14, "Online Kurs: Web Geliştirme", "Eğitim", 400, "link-web-dev-course.html"))
+
+    # Service Products
+    inventory_manager.add_product(ProductFactory.create_product("service", 15, "Premium Destek Paketi (1 Yıl)", "Hizmet", 1000, 365))
+    inventory_manager.add_product(ProductFactory.create_product("service", 16, "Danışmanlık Hizmeti (Saatlik)", "Hizmet", 250, 1)) # Duration in hours or days? Let's assume days for consistency.
+    inventory_manager.add_product(ProductFactory.create_product("service", 17, "Yazılım Kurulum Hizmeti", "Hizmet", 180, 1))
+    inventory_manager.add_product(ProductFactory.create_product("service", 18, "Web Sitesi Bakım Hizmeti (Aylık)", "Hizmet", 300, 30))
+
+    print("Başlangıç ürünleri envantere eklendi.")
+
+def load_catalog(inventory_manager: InventoryManager, catalog_path: str):
+    """
+    Katalog anlık görüntüsü varsa envanteri mmap ile ondan açar; yoksa başlangıç ürünlerini
+    ekleyip sonraki açılışlar için anlık görüntüyü oluşturur.
+    """
+    if os.path.exists(catalog_path):
+        start = time.perf_counter()
+        try:
+            inventory_manager.open_catalog(catalog_path)
+        except (OSError, ValueError) as e:
+            print(f"Katalog açılamadı, başlangıç ürünleri kullanılıyor: {e}")
+            add_initial_products_to_inventory(inventory_manager)
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        print(f"Katalog '{catalog_path}' açıldı: {len(inventory_manager.stock)} ürün ({elapsed_ms:.1f} ms).")
+    else:
+        add_initial_products_to_inventory(inventory_manager)
+        count = inventory_manager.save_catalog(catalog_path)
+        print(f"Katalog anlık görüntüsü oluşturuldu: {catalog_path} ({count} ürün).")
+
+
+def load_from_repository(repository: "SQLiteRepository", inventory_manager: InventoryManager):
+    """
+    Envanteri SQLite deposuna bağlar, kayıtlı müşterileri ve siparişleri yükler.
+    Veritabanında ürün yoksa başlangıç ürünleri eklenip kaydedilir.
+    """
+    inventory_manager.set_storage_backend(repository.product_store())
+    if not repository.has_products():
+        add_initial_products_to_inventory(inventory_manager)
+        repository.flush()
+    for customer in repository.load_customers():
+        register_customer(customer)
+    register_orders(repository.load_orders(customer_list, inventory_manager))
+    print(f"Veritabanından {len(customer_list)} müşteri ve {len(orders)} sipariş yüklendi.")
+
+
+def load_from_event_log(event_log: "OrderEventLog", inventory_manager: InventoryManager):
+    """
+    Olay günlüğünden yeniden kurulan müşterileri ve siparişleri kaydeder ve
+    sonraki durum değişikliklerinin günlüğe yazılması için günlüğü bağlar.
+    """
+    event_log.replay_stats.display()
+    new_customers, restored_orders = event_log.state.materialize(inventory_manager, customer_list)
+    for customer in new_customers:
+        register_customer(customer)
+    register_orders(restored_orders)
+    event_log.attach()
+    print(f"Olay günlüğünden {len(new_customers)} müşteri ve {len(restored_orders)} sipariş yüklendi.")
+
+
+def archive_orders(registry: CustomerOrderRegistry):
+    """
+    İptal edilmiş ve iade edilmiş siparişleri arşive taşır ve orders listesinden çıkarır.
+    Teslim edilmiş siparişler hâlâ iade edilebileceği için arşivlenmez.
+    Veritabanındaki veya olay günlüğündeki kayıtlar değişmez.
+    """
+    from order_archive import CLOSED_STATUSES, OrderArchive
+    archived_ids = registry.archive_orders(CLOSED_STATUSES)
+    if archived_ids:
+        archived = set(archived_ids)
+        orders[:] = [order_obj for order_obj in orders if order_obj.order_id not in archived]
+        SalesAggregates.get_instance().forget_orders(archived_ids)
+    print(f"{len(archived_ids)} sipariş arşivlendi. Arşivdeki toplam sipariş: {len(OrderArchive.get_instance())}")
+
+
+def main_menu(repository: "SQLiteRepository | None" = None, event_log: "OrderEventLog | None" = None):
+    """
+    Ana menüyü gösterir ve kullanıcı seçimlerini işler.
+    repository verilirse müşteri, sipariş ve stok değişiklikleri veritabanına kaydedilir.
+    event_log verilirse müşteri ve sipariş olayları günlüğe yazılır.
+    """
+    inventory_manager = InventoryManager.get_instance()
+    registry = CustomerOrderRegistry.get_instance()
+    aggregates = SalesAggregates.get_instance()
+    # add_initial_products_to_inventory(inventory_manager) # Her çalıştığında ürün eklemesin diye yorum satırı yaptım.
+
+    while True:
+        if repository is not None:
+            repository.flush() # Önceki işlemden kalan stok değişikliklerini yazar
+        if event_log is not None:
+            event_log.flush() # Önceki işlemin olaylarını kalıcı hale getirir
+        print("\n--- E-TİCARET PLATFORMU ---")
+        print("1. Yeni Müşteri Oluştur")
+        print("2. Müşteri Profili Görüntüle")
+        print("3. Yeni Sipariş Oluştur")
+        print("4. Sipariş Durumu Güncelle")
+        print("5. Tüm Siparişleri Görüntüle")
+        print("6. Ürün Yönetimi")
+        print("7. Dosyadan Toplu Sipariş Yükle (JSONL/CSV)")
+        print("8. Müşteri / Sipariş Ara")
+        print("9. Satış Özeti")
+        print("10. Toplu Sipariş Durumu Güncelle")
+        print("11. Tamamlanan Siparişleri Arşivle")
+        print("0. Çıkış")
+
+        choice = input("Seçiminiz: ").strip()
+
+        if choice == "1":
+            new_customer = create_customer()
+            if new_customer and repository is not None:
+                repository.save_customers([new_customer])
+            if new_customer and event_log is not None:
+                event_log.record_customer(new_customer)
+        elif choice == "2":
+            if not customer_list:
+                print("Henüz kayıtlı müşteri yok.")
+                continue
+            for i, cust in enumerate(customer_list):
+                print(f"{i + 1}. {cust.name} (ID: {cust.customer_id})")
+            try:
+                customer = select_item(customer_list, "Profilini görüntülemek istediğiniz müşterinin numarasını, ID'sini veya e-postasını girin: ",
+                                       registry.find_customer)
+                if customer:
+                    show_customer_profile(customer)
+                else:
+                    print("Geçersiz müşteri numarası.")
+            except ValueError:
+                print("Lütfen geçerli bir sayı, ID veya e-posta girin.")
+        elif choice == "3":
+            if not customer_list:
+                print("Sipariş oluşturmak için önce bir müşteri oluşturmalısınız.")
+                continue
+            if len(inventory_manager.stock) == 0: # Ürünler okunmaz; SQLite deposunda COUNT(*)
+                print("Sipariş oluşturmak için envanterde ürün bulunmalıdır.")
+                continue
+
+            print("\n--- Sipariş Oluşturulacak Müşteriyi Seçin ---")
+            for i, cust in enumerate(customer_list):
+                print(f"{i + 1}. {cust.name} (ID: {cust.customer_id})")
+            try:
+                selected_customer = select_item(customer_list, "Sipariş oluşturmak istediğiniz müşterinin numarasını, ID'sini veya e-postasını girin: ",
+                                                registry.find_customer)
+                if selected_customer:
+                    from order_console import create_order_interactive
+                    # create_order_interactive artık InventoryManager'ı kendisi alıyor
+                    new_order = create_order_interactive(selected_customer)
+                    if new_order:
+                        register_orders([new_order])
+                        if repository is not None:
+                            repository.save_orders([new_order])
+                        if event_log is not None:
+                            event_log.record_order(new_order)
+                        print(f"Sipariş {new_order.order_id} başarıyla eklendi.")
+                else:
+                    print("Geçersiz müşteri numarası.")
+            except ValueError:
+                print("Lütfen geçerli bir sayı, ID veya e-posta girin.")
+        elif choice == "4":
+            if not orders:
+                print("Güncellenecek sipariş bulunmamaktadır.")
+                continue
+            print("\n--- Güncellenecek Siparişi Seçin ---")
+            for i, order_obj in enumerate(orders):
+                # __getattr__ sayesinde doğrudan erişim
+                print(f"{i + 1}. Sipariş ID: {order_obj.order_id}, Müşteri: {order_obj.customer.name}, Durum: {order_obj.status.value}")
+
+            try:
+                order_obj = select_item(orders, "Durumunu güncellemek istediğiniz siparişin numarasını veya ID'sini girin: ",
+                                        registry.get_order)
+                if order_obj:
+                    from order_console import update_order_status
+                    # order_obj zaten BaseOrder/Decorator
+                    if update_order_status(order_obj) and repository is not None:
+                        repository.update_order_status(order_obj)
+                else:
+                    print("Geçersiz sipariş numarası.")
+            except ValueError:
+                print("Lütfen geçerli bir sayı veya sipariş ID'si girin.")
+
+        elif choice == "5":
+            if not orders:
+                print("Görüntülenecek sipariş bulunmamaktadır.")
+                continue
+            print("\n--- Tüm Siparişler ---")
+            for order_obj in orders:
+                print_order_summary(order_obj)
+
+        elif choice == "6":
+            from product_console import run_product_menu
+            run_product_menu()
+
+        elif choice == "7":
+            from bulk_order_pipeline import BulkOrderPipeline, read_csv, read_jsonl
+            input_path = input("Sipariş dosyasının yolu (.jsonl veya .csv): ").strip()
+            reject_path = input("Reddedilen satırlar için dosya yolu [rejects.jsonl]: ").strip() or "rejects.jsonl"
+            try:
+                with open(input_path, encoding="utf-8", newline="") as stream, \
+                        open(reject_path, "w", encoding="utf-8") as reject_file:
+                    source = read_csv(stream) if input_path.lower().endswith(".csv") else read_jsonl(stream)
+                    first_new_customer = len(customer_list)
+                    new_orders = []
+                    report = BulkOrderPipeline().run(source, reject_file=reject_file, sink=new_orders)
+                register_orders(new_orders)
+                if repository is not None:
+                    repository.save_customers(customer_list[first_new_customer:])
+                    repository.save_orders(new_orders)
+                if event_log is not None:
+                    for customer in customer_list[first_new_customer:]:
+                        event_log.record_customer(customer)
+                    event_log.record_orders(new_orders)
+                report.display()
+            except OSError as e:
+                print(f"Dosya açılamadı: {e}")
+
+        elif choice == "8":
+            search_menu(registry)
+
+        elif choice == "9":
+            aggregates.display()
+
+        elif choice == "10":
+            from order_console import bulk_update_order_status
+            updated_orders = bulk_update_order_status(registry)
+            if updated_orders and repository is not None:
+                repository.update_order_statuses(updated_orders)
+
+        elif choice == "11":
+            archive_orders(registry)
+
+        elif choice == "0":
+            if repository is not None:
+                repository.close()
+            if event_log is not None:
+                event_log.close()
+            print("E-Ticaret Platformundan çıkılıyor. Hoşça kalın!")
+            break
+        else:
+            print("Geçersiz seçim. Lütfen tekrar deneyin.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="E-Ticaret Platformu")
+    storage = parser.add_mutually_exclusive_group()
+    storage.add_argument("--db", help="Verilerin saklanacağı SQLite veritabanı dosyası (verilmezse veriler bellekte tutulur)")
+    storage.add_argument("--event-log",
+                         help="Müşteri ve sipariş olaylarının yazılacağı dizin; açılışta siparişler bu günlükten geri kurulur")
+    parser.add_argument("--async-notifications", action="store_true",
+                        help="Sipariş durum bildirimlerini arka planda, birleştirerek gönder")
+    parser.add_argument("--compact-orders", action="store_true",
+                        help="Sipariş satırlarını ortak, dizi tabanlı depoda tut (çok sayıda siparişte bellek tasarrufu)")
+    parser.add_argument("--shipping-config",
+                        help="Kargo firmalarını ve kademelerini tanımlayan JSON dosyası (verilmezse varsayılanlar kullanılır)")
+    parser.add_argument("--pricing-rules",
+                        help="Promosyon ve fiyatlama kurallarını tanımlayan JSON dosyası (varsayılan kurallara eklenir)")
+    parser.add_argument("--catalog",
+                        help="Ürünlerin mmap ile açılacağı katalog anlık görüntüsü (yoksa başlangıç ürünleriyle oluşturulur; "
+                             "ürün değişiklikleri dosyaya yazılmaz)")
+    parser.add_argument("--order-ids", choices=["uuid", "counter", "ulid"], default="uuid",
+                        help="Sipariş ID üreteci: uuid (varsayılan), counter (düğüm öneki + sayaç, en hızlısı) "
+                             "veya ulid (zamana göre sıralı)")
+    parser.add_argument("--node-id",
+                        help="counter üreteci için düğüm adı; dağıtımdaki her makinede farklı olmalıdır "
+                             "(verilmezse makine adı)")
+    parser.add_argument("--metrics",
+                        help="Ölçümleri aç ve çıkışta bu dosyaya yaz (.json uzantısıyla JSON, aksi halde Prometheus metin biçimi)")
+    parser.add_argument("--profile-orders", type=float, metavar="ORAN",
+                        help="Siparişlerin bu oranını (0-1) cProfile ile profille")
+    parser.add_argument("--profile-output", default="order-profile.folded",
+                        help="Profilin yazılacağı collapsed stack dosyası (yanına .pstats da yazılır)")
+    args = parser.parse_args()
+    if args.catalog and args.db:
+        parser.error("--catalog ve --db birlikte kullanılamaz; --db ürünleri veritabanında tutar.")
+
+    if args.shipping_config:
+        from shipping_registry import ShippingRegistry
+        try:
+            ShippingRegistry.get_instance().load_config(args.shipping_config)
+        except (OSError, ValueError) as e:
+            print(f"Kargo yapılandırması yüklenemedi, varsayılan kademeler kullanılıyor: {e}")
+
+    if args.pricing_rules:
+        from pricing_rules import PricingRegistry
+        try:
+            PricingRegistry.get_instance().load_config(args.pricing_rules)
+        except (OSError, ValueError) as e:
+            print(f"Fiyatlama kuralları yüklenemedi, varsayılan kurallar kullanılıyor: {e}")
+
+    if args.order_ids != "uuid" or args.node_id:
+        from order_factory import OrderFactory
+        from order_ids import make_id_generator
+        try:
+            OrderFactory.set_id_generator(make_id_generator(args.order_ids, args.node_id))
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.compact_orders:
+        from order import Order
+        from order_line_store import OrderLineStore
+        Order.set_line_store(OrderLineStore())
+
+    if args.metrics:
+        metrics.enable()
+    if args.profile_orders:
+        try:
+            metrics.configure_profiling(args.profile_orders, args.profile_output)
+        except ValueError as e:
+            parser.error(str(e))
+
+    dispatcher = None
+    if args.async_notifications:
+        from notification_dispatcher import NotificationDispatcher
+        from order_subject import OrderSubject
+        dispatcher = NotificationDispatcher().start()
+        OrderSubject.set_dispatcher(dispatcher)
+
+    initial_inventory_manager = InventoryManager.get_instance()
+    if args.db:
+        from sqlite_repository import SQLiteRepository
+        repository = SQLiteRepository(args.db)
+        load_from_repository(repository, initial_inventory_manager)
+        main_menu(repository)
+    elif args.event_log:
+        if args.catalog:
+            load_catalog(initial_inventory_manager, args.catalog)
+        else:
+            add_initial_products_to_inventory(initial_inventory_manager)
+        from order_event_log import OrderEventLog
+        event_log = OrderEventLog(args.event_log)
+        load_from_event_log(event_log, initial_inventory_manager)
+        main_menu(event_log=event_log)
+    else:
+        # Uygulama başlatılırken InventoryManager'a başlangıç ürünleri eklenir
+        if args.catalog:
+            load_catalog(initial_inventory_manager, args.catalog)
+        else:
+            add_initial_products_to_inventory(initial_inventory_manager)
+        main_menu()
+
+    if dispatcher is not None:
+        OrderSubject.set_dispatcher(None)
+        dispatcher.stop()
+        dispatcher.metrics.display()
+
+    if args.metrics:
+        metrics.MetricsRegistry.get_instance().write(args.metrics)
+        print(f"Ölçümler '{args.metrics}' dosyasına yazıldı.")
+    if args.profile_orders:
+        stack_count = metrics.dump_profile()
+        print(f"{metrics.profiler.sampled} siparişin profili '{args.profile_output}' dosyasına yazıldı ({stack_count} yığın).")
\ No newline at end of file
@@ -0,0 +1,465 @@
+# metrics.py
+"""
+İsteğe bağlı (opt-in) ölçüm altyapısı: sayaçlar, histogramlar ve zamanlayıcılar.
+
+Ölçümler varsayılan olarak kapalıdır. Ölçüm noktaları (hook) yalnızca modül düzeyindeki
+enabled bayrağını okur; kapalıyken maliyet tek bir öznitelik okumasıdır. enable() ile
+açıldığında değerler MetricsRegistry'de birikir ve Prometheus metin biçiminde veya JSON
+olarak dosyaya yazılabilir.
+
+Ölçüm noktaları:
+    inventory_stock_updates_total{result}       InventoryManager.update_stock (ok, stock_out, not_found)
+    order_create_seconds{order_type}            OrderFactory.create_order süresi
+    order_create_errors_total{order_type}       Hata fırlatan create_order çağrıları
+    order_create_many_seconds                   OrderFactory.create_orders_many çağrısının toplam süresi
+    order_notify_seconds                        OrderSubject bildirim dağıtımı (fan-out) süresi
+    order_cost_computations_total{decorators}   Dekoratörlü maliyet hesabı (önbellek ıskası; zincirdeki dekoratör sayısı)
+    order_cost_cache_hits_total{decorators}     Önbellekten okunan dekoratörlü maliyet (get_total_cost, get_cost_breakdown)
+    shipping_tier_selections_total{tier,carrier} choose_optimal_shipping_strategy kademe dağılımı
+
+Örneklemeli profil: configure_profiling(fraction, path) ile siparişlerin fraction oranı
+(OrderFactory.create_order) cProfile altında çalıştırılır. dump_profile() birikmiş profili
+path dosyasına flame graph araçlarının (flamegraph.pl, speedscope) okuduğu "collapsed stack"
+biçiminde, path + ".pstats" dosyasına da pstats biçiminde yazar.
+
+Kullanım:
+    metrics.enable()
+    ...
+    MetricsRegistry.get_instance().write("metrics.prom") # .json uzantısıyla JSON
+"""
+import itertools
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from threading import get_ident
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+enabled = False # Ölçüm noktaları yalnızca bu bayrak True iken ölçüm yapar
+profiler: Optional["SamplingProfiler"] = None # configure_profiling ile ayarlanır
+
+# Zamanlayıcıların varsayılan kova sınırları (saniye)
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025,
+                   0.1, 0.25, 1.0)
+
+
+def enable():
+    global enabled
+    enabled = True
+
+
+def disable():
+    global enabled
+    enabled = False
+
+
+class _CounterValue:
+    """
+    Tek bir etiket kombinasyonunun sayacı. _HistogramValue gibi her iş parçacığı kendi
+    parçasına yazar; bir parçaya tek iş parçacığı yazdığından inc ve add kilit almaz.
+    Okumalar parçaları toplar.
+    """
+    __slots__ = ("_shards", "_lock")
+
+    def __init__(self):
+        self._shards: Dict[int, List[float]] = {} # İş parçacığı kimliği -> [değer]
+        self._lock = threading.Lock() # Yalnızca yeni parça eklenirken ve okurken
+
+    def _new_shard(self) -> List[float]:
+        with self._lock:
+            return self._shards.setdefault(get_ident(), [0])
+
+    def inc(self):
+        """
+        Sayacı 1 artırır.
+        """
+        (self._shards.get(get_ident()) or self._new_shard())[0] += 1
+
+    def add(self, amount: float):
+        """
+        Sayaca 1'den farklı bir miktar ekler.
+        """
+        if amount < 0:
+            raise ValueError("Sayaç azaltılamaz.")
+        (self._shards.get(get_ident()) or self._new_shard())[0] += amount
+
+    @property
+    def value(self) -> float:
+        with self._lock:
+            return float(sum(shard[0] for shard in self._shards.values()))
+
+    def reset(self):
+        with self._lock:
+            self._shards = {}
+
+
+class _HistogramValue:
+    """
+    Tek bir etiket kombinasyonunun kovalı histogramı. Her iş parçacığı kendi parçasına
+    (kova sayıları + toplam) yazar; bir parçaya tek iş parçacığı yazdığından observe kilit
+    almaz. Okumalar parçaları toplar.
+    """
+    __slots__ = ("bounds", "_shards", "_lock")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self._shards: Dict[int, List[float]] = {} # İş parçacığı kimliği -> [kova sayıları..., +Inf, toplam]
+        self._lock = threading.Lock() # Yalnızca yeni parça eklenirken
+
+    def _new_shard(self) -> List[float]:
+        shard = [0] * (len(self.bounds) + 1) + [0.0] # Son kova: en büyük sınırın üstü (+Inf)
+        with self._lock:
+            return self._shards.setdefault(get_ident(), shard)
+
+    def observe(self, value: float):
+        shard = self._shards.get(get_ident()) or self._new_shard()
+        shard[bisect_left(self.bounds, value)] += 1
+        shard[-1] += value
+
+    @property
+    def counts(self) -> List[int]:
+        with self._lock:
+            shards = list(self._shards.values())
+        return [sum(column) for column in zip(*shards)][:-1] if shards else [0] * (len(self.bounds) + 1)
+
+    @property
+    def sum(self) -> float:
+        with self._lock:
+            return sum(shard[-1] for shard in self._shards.values())
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def time(self) -> "_Timing":
+        """
+        with bloğunun süresini (saniye) histograma ekleyen bağlam yöneticisi.
+        """
+        return _Timing(self)
+
+    def reset(self):
+        with self._lock:
+            self._shards = {}
+
+
+class _Timing:
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: _HistogramValue):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class Metric(ABC):
+    """
+    Etiketli ölçüm ailesi. labels(...) her etiket kombinasyonu için bir kez değer nesnesi oluşturur;
+    sık çağrılan noktalar bu nesneyi önceden alıp saklayabilir.
+    """
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_value(self):
+        """
+        Yeni bir etiket kombinasyonu için değer nesnesi oluşturur.
+        """
+        pass
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"'{self.name}' için {len(self.labelnames)} etiket değeri bekleniyordu: "
+                                 f"{', '.join(self.labelnames) or '-'}.")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_value())
+        return child
+
+    def children(self) -> List[Tuple[Tuple, Any]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def reset(self):
+        """
+        Değerleri sıfırlar; önceden alınmış değer nesneleri geçerli kalır.
+        """
+        for _, child in self.children():
+            child.reset()
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def _new_value(self) -> _CounterValue:
+        return _CounterValue()
+
+    def inc(self):
+        self.labels().inc()
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(name, help, labelnames)
+        if list(buckets) != sorted(set(buckets)):
+            raise ValueError("Histogram kova sınırları artan sırada ve benzersiz olmalıdır.")
+        self.buckets = tuple(float(bound) for bound in buckets)
+
+    def _new_value(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+
+def _escape_label(value) -> str:
+    """
+    Prometheus biçiminde etiket değerlerindeki \\, " ve satır sonunu kaçışlar.
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    return repr(int(value)) if float(value).is_integer() else repr(value)
+
+
+class MetricsRegistry:
+    """
+    Tüm ölçüm ailelerini ada göre tutan kayıt defteri. Singleton deseni uygular.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """
+        Singleton deseni için __new__ metodu override edildi.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._metrics: Dict[str, Metric] = {}
+                    instance._lock = threading.Lock()
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def get_instance() -> "MetricsRegistry":
+        """
+        MetricsRegistry'nin tek örneğini döndürür (Singleton deseni).
+        """
+        return MetricsRegistry()
+
+    def _register(self, cls, name: str, help: str, labelnames: Sequence[str], **kwargs) -> Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"'{name}' adlı ölçüm farklı bir tür veya etiketlerle zaten kayıtlı.")
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter, name, help, labelnames)
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help, labelnames, buckets=buckets)
+
+    def timer(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Histogram:
+        """
+        Süre ölçümleri (saniye) için gecikme kovalarıyla bir histogram.
+        """
+        return self.histogram(name, help, labelnames, LATENCY_BUCKETS)
+
+    def get(self, name: str) -> Optional[Metric]:
+        return self._metrics.get(name)
+
+    def reset(self):
+        """
+        Tüm değerleri sıfırlar.
+        """
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+    # --- Dışa aktarma ---
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Tüm ölçümleri JSON'a dönüştürülebilir bir sözlük olarak döndürür.
+        """
+        result = {}
+        for name, metric in sorted(self._metrics.items()):
+            samples = []
+            for values, child in metric.children():
+                labels = dict(zip(metric.labelnames, map(str, values)))
+                if isinstance(metric, Counter):
+                    samples.append({"labels": labels, "value": child.value})
+                else:
+                    samples.append({"labels": labels, "count": child.count, "sum": child.sum,
+                                    "buckets": dict(zip([*map(str, metric.buckets), "+Inf"],
+                                                        itertools.accumulate(child.counts)))})
+            result[name] = {"type": metric.kind, "help": metric.help, "samples": samples}
+        return result
+
+    def to_json(self) -> str:
+        import json # Dışa aktarma nadirdir; ölçüm kullanan modüllerin açılışını yavaşlatmasın
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Ölçümleri Prometheus metin biçiminde (text exposition format 0.0.4) döndürür.
+        """
+        lines = []
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for values, child in metric.children():
+                if isinstance(metric, Counter):
+                    lines.append(f"{name}{_format_labels(metric.labelnames, values)} {_format_number(child.value)}")
+                    continue
+                cumulative = 0
+                for bound, count in zip([*metric.buckets, float("inf")], child.counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    bucket_labels = _format_labels(metric.labelnames, values, f'le="{le}"')
+                    lines.append(f"{name}_bucket{bucket_labels} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(metric.labelnames, values)} {repr(child.sum)}")
+                lines.append(f"{name}_count{_format_labels(metric.labelnames, values)} {child.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """
+        Ölçümleri dosyaya yazar: .json uzantısında JSON, aksi halde Prometheus metin biçimi.
+        Dosya önce geçici bir dosyaya yazılıp yerine taşınır; okuyucular yarım dosya görmez
+        (örn. node_exporter textfile toplayıcısı).
+        """
+        text = self.to_json() if path.endswith(".json") else self.to_prometheus()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+
+
+class SamplingProfiler:
+    """
+    Çağrıların belirli bir oranını tek bir cProfile.Profile altında çalıştırır.
+    Aynı anda yalnızca bir çağrı profillenir; profil meşgulken gelen çağrılar örneklenmez.
+    """
+    def __init__(self, fraction: float, path: str, seed: Optional[int] = None):
+        if not 0 < fraction <= 1:
+            raise ValueError("Profil örnekleme oranı 0 ile 1 arasında olmalıdır.")
+        self.fraction = fraction
+        self.path = path
+        import cProfile # Profil yalnızca istendiğinde yüklenir
+        import random
+        self.sampled = 0
+        self._random = random.Random(seed).random
+        self._profile = cProfile.Profile()
+        self._busy = threading.Lock()
+
+    def runcall(self, func, *args, **kwargs):
+        """
+        Örneklenirse func'ı profil altında, aksi halde doğrudan çalıştırır.
+        """
+        if self._random() >= self.fraction or not self._busy.acquire(blocking=False):
+            return func(*args, **kwargs)
+        try:
+            self.sampled += 1
+            return self._profile.runcall(func, *args, **kwargs)
+        finally:
+            self._busy.release()
+
+    def dump(self) -> int:
+        """
+        Birikmiş profili collapsed stack ve pstats biçiminde yazar; yazılan yığın satırı sayısını döndürür.
+        """
+        with self._busy:
+            self._profile.create_stats()
+            stats = dict(self._profile.stats)
+            self._profile.dump_stats(f"{self.path}.pstats")
+        stacks = collapsed_stacks(stats)
+        with open(self.path, "w", encoding="utf-8") as f:
+            for stack, microseconds in sorted(stacks.items()):
+                f.write(f"{stack} {microseconds}\n")
+        return len(stacks)
+
+
+def _frame_name(func: Tuple[str, int, str]) -> str:
+    filename, lineno, name = func
+    if filename == "~": # Yerleşik fonksiyonlar
+        return name.replace(";", ",")
+    return f"{name} ({os.path.basename(filename)}:{lineno})".replace(";", ",")
+
+
+def collapsed_stacks(stats: Dict) -> Dict[str, int]:
+    """
+    cProfile istatistiklerini {"kök;...;fonksiyon": mikrosaniye} biçimindeki yığınlara dönüştürür.
+
+    cProfile tam yığınları değil, çağıran-çağrılan çiftlerini tutar. Yığınlar kök fonksiyonlardan
+    başlanarak yeniden kurulur; birden fazla yerden çağrılan bir fonksiyonun süresi, o kenardan
+    gelen kümülatif süre oranında yollara dağıtılır (flameprof ile aynı yaklaşım).
+    """
+    children: Dict[Tuple, List[Tuple[Tuple, float]]] = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, edge_cumulative) in callers.items():
+            children.setdefault(caller, []).append((func, edge_cumulative))
+    roots = [func for func, (_, _, _, _, callers) in stats.items()
+             if not callers and "_lsprof.Profiler" not in func[2]]
+    stacks: Dict[str, int] = {}
+
+    def walk(func, path: List[str], visiting: set, share: float):
+        own = stats[func][2] * share
+        stack = ";".join(path)
+        if own >= 1e-6:
+            stacks[stack] = stacks.get(stack, 0) + int(round(own * 1e6))
+        cumulative = stats[func][3]
+        for child, edge_cumulative in children.get(func, ()):
+            if child in visiting or not cumulative:
+                continue # Özyinelemeli çağrılar yığına tekrar eklenmez
+            visiting.add(child)
+            path.append(_frame_name(child))
+            walk(child, path, visiting, share * edge_cumulative / stats[child][3] if stats[child][3] else 0.0)
+            path.pop()
+            visiting.discard(child)
+
+    for root in roots:
+        walk(root, [_frame_name(root)], {root}, 1.0)
+    return stacks
+
+
+def configure_profiling(fraction: float, path: str, seed: Optional[int] = None) -> SamplingProfiler:
+    """
+    Siparişlerin fraction oranını profillemeye başlar.
+    """
+    global profiler
+    profiler = SamplingProfiler(fraction, path, seed)
+    return profiler
+
+
+def dump_profile() -> int:
+    """
+    Örneklemeli profil açıksa profili dosyaya yazar; yazılan yığın satırı sayısını döndürür.
+    """
+    return profiler.dump() if profiler is not None else 0
@@ -0,0 +1,379 @@
+# notification_dispatcher.py
+"""
+Sipariş durum bildirimlerini arka planda dağıtan asenkron bildirim kanalı.
+
+OrderSubject.set_dispatcher ile etkinleştirildiğinde, ASYNC_DELIVERY özniteliği True olan
+gözlemcilerin (örn. Customer) update çağrıları Order.update_status içinde değil, bir iş
+parçacığı havuzunda yapılır. Böylece yavaş bir gözlemci (e-posta/SMS) durum
+değişikliklerini bekletmez.
+
+- Kuyruk sınırlıdır (max_queue); kuyruk doluysa submit bekler ve bu bekleme
+  geri basınç (backpressure) metriği olarak kaydedilir.
+- Aynı sipariş için coalesce_window süresi içinde gelen güncellemeler birleştirilir;
+  gözlemciler siparişin son durumunu bir kez alır.
+- Toplu durum değişiklikleri (submit_many) gözlemci başına tek bir kuyruk öğesidir ve
+  update_many ile tek seferde teslim edilir; birleştirilmez.
+- Her bildirimin ilk durum değişikliğinden teslimine kadar geçen süre histogramda tutulur.
+- Kanal başlatılmamışsa veya durdurulduysa submit bildirimi çağıran iş parçacığında
+  hemen teslim eder; kuyrukta işçisiz bekleyen bildirim kalmaz.
+
+Kullanım:
+    dispatcher = NotificationDispatcher(workers=4, max_queue=10000, coalesce_window=0.05).start()
+    OrderSubject.set_dispatcher(dispatcher)
+    ...
+    OrderSubject.set_dispatcher(None)
+    dispatcher.stop()
+    dispatcher.metrics.display()
+"""
+import itertools
+import queue
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Hashable, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from observer import Observer
+    from order import Order
+
+
+class LatencyHistogram:
+    """
+    Teslim gecikmeleri için sabit kovalı (bucket) histogram. Sınırlar milisaniye cinsindendir.
+    """
+    BOUNDS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(self.BOUNDS_MS) + 1) # Son kova: en büyük sınırın üstü
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float):
+        milliseconds = seconds * 1000
+        self.counts[bisect_left(self.BOUNDS_MS, milliseconds)] += 1
+        self.count += 1
+        self.total_ms += milliseconds
+        if milliseconds > self.max_ms:
+            self.max_ms = milliseconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Yüzdelik değeri (ms) değerin düştüğü kova içinde doğrusal ara değerlemeyle tahmin eder.
+        Kovanın üst sınırı gözlenen en büyük değerle sınırlanır; sonuç max_ms'i aşmaz.
+        """
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.BOUNDS_MS + (self.max_ms,), self.counts):
+            upper = min(float(bound), self.max_ms)
+            if count and seen + count >= rank:
+                lower = min(lower, upper)
+                return round(lower + (upper - lower) * (rank - seen) / count, 3)
+            seen += count
+            lower = float(bound)
+        return round(self.max_ms, 3)
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+
+class DispatcherMetrics:
+    """
+    Bildirim kanalının sayaçları, geri basınç ölçümleri ve gecikme histogramı.
+    """
+    def __init__(self):
+        self.submitted = 0 # Kuyruğa gönderilen durum değişikliği sayısı
+        self.coalesced = 0 # Bekleyen bir bildirimle birleştirilenler
+        self.enqueued = 0 # Kuyruğa yeni giren bildirimler
+        self.delivered = 0 # Gözlemciye yapılan başarılı update çağrıları
+        self.failed = 0 # Hata fırlatan update çağrıları
+        self.blocked_submissions = 0 # Kuyruk dolu olduğu için bekleyen submit çağrıları
+        self.blocked_seconds = 0.0 # Bu çağrıların toplam bekleme süresi
+        self.max_queue_depth = 0
+        self.latency = LatencyHistogram()
+
+    def snapshot(self, queue_depth: int = 0) -> Dict[str, float]:
+        """
+        Metriklerin o anki değerlerini sözlük olarak döndürür.
+        """
+        return {
+            "submitted": self.submitted,
+            "coalesced": self.coalesced,
+            "enqueued": self.enqueued,
+            "delivered": self.delivered,
+            "failed": self.failed,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "blocked_submissions": self.blocked_submissions,
+            "blocked_seconds": round(self.blocked_seconds, 6),
+            "latency_mean_ms": round(self.latency.mean_ms, 3),
+            "latency_p50_ms": self.latency.percentile(0.50),
+            "latency_p95_ms": self.latency.percentile(0.95),
+            "latency_p99_ms": self.latency.percentile(0.99),
+            "latency_max_ms": round(self.latency.max_ms, 3),
+        }
+
+    def display(self, queue_depth: int = 0):
+        """
+        Metrikleri ve gecikme histogramını tablo halinde yazdırır.
+        """
+        print("\n--- Bildirim Kanalı Metrikleri ---")
+        for key, value in self.snapshot(queue_depth).items():
+            print(f"{key:<20}: {value}")
+        print(f"\n{'Gecikme (ms)':>14} | {'Adet':>8}")
+        print("-" * 26)
+        lower = 0
+        for bound, count in zip(self.latency.BOUNDS_MS + (float("inf"),), self.latency.counts):
+            if count:
+                label = f"{lower}-{bound}" if bound != float("inf") else f">{lower}"
+                print(f"{label:>14} | {count:>8}")
+            lower = bound
+
+
+class _PendingNotification:
+    """
+    Henüz teslim edilmemiş bildirim. orders None değilse toplu bildirimdir: tek gözlemcinin
+    update_many metoduna siparişlerin tamamı bir kez verilir.
+    """
+    __slots__ = ("order", "orders", "observers", "first_submitted", "due")
+
+    def __init__(self, order: 'Order', observers: List['Observer'], now: float, window: float,
+                 orders: Optional[List['Order']] = None):
+        self.order = order
+        self.orders = orders
+        self.observers: Dict['Observer', None] = dict.fromkeys(observers)
+        self.first_submitted = now
+        self.due = now + window
+
+
+class NotificationDispatcher:
+    """
+    Sınırlı kuyruk ve iş parçacığı havuzu ile sipariş bildirimlerini dağıtır.
+    """
+    def __init__(self, workers: int = 4, max_queue: int = 10000, coalesce_window: float = 0.05):
+        """
+        Args:
+            workers: Bildirimleri teslim eden iş parçacığı sayısı.
+            max_queue: Kuyrukta aynı anda bekleyebilecek en fazla sipariş sayısı.
+            coalesce_window: Aynı siparişin güncellemelerinin birleştirileceği süre (saniye).
+        """
+        if workers <= 0 or max_queue <= 0:
+            raise ValueError("workers ve max_queue 0'dan büyük olmalıdır.")
+        if coalesce_window < 0:
+            raise ValueError("coalesce_window negatif olamaz.")
+        self.workers = workers
+        self.coalesce_window = coalesce_window
+        self.metrics = DispatcherMetrics()
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max_queue)
+        self._pending: Dict[Hashable, _PendingNotification] = {} # {order_id veya toplu anahtar: bekleyen bildirim}
+        self._group_keys = itertools.count() # Toplu bildirimlerin kuyruk anahtarları
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._running = False # submit yalnızca işçiler çalışırken kuyruğa ekler
+
+    def start(self) -> "NotificationDispatcher":
+        """
+        İş parçacıklarını başlatır.
+        """
+        if self._threads:
+            return self
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"notification-worker-{i + 1}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        with self._lock:
+            self._running = True
+        return self
+
+    def stop(self, timeout: Optional[float] = None):
+        """
+        Kuyruktaki bildirimlerin teslim edilmesini bekler ve iş parçacıklarını durdurur.
+        Bundan sonraki submit çağrıları bildirimleri hemen teslim eder.
+        """
+        with self._lock:
+            self._running = False
+        for _ in self._threads:
+            self._queue.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._drain()
+
+    def _drain(self):
+        """
+        İşçiler durduktan sonra kuyrukta kalan bildirimleri çağıran iş parçacığında teslim eder.
+        """
+        while True:
+            try:
+                order_id = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                if order_id is None:
+                    continue
+                with self._lock:
+                    pending = self._pending.pop(order_id, None)
+                if pending is not None:
+                    self._notify_pending(order_id, pending)
+            finally:
+                self._queue.task_done()
+
+    def __enter__(self) -> "NotificationDispatcher":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, order: 'Order', observers: List['Observer']):
+        """
+        Siparişin durum değişikliğini gözlemcilere teslim edilmek üzere kuyruğa ekler.
+        Sipariş için bekleyen bir bildirim varsa onunla birleştirilir. Kanal çalışmıyorsa
+        (start çağrılmadı veya stop çağrıldı) bildirim hemen teslim edilir.
+        """
+        now = time.perf_counter()
+        with self._lock:
+            self.metrics.submitted += 1
+            running = self._running
+            if running:
+                pending = self._pending.get(order.order_id)
+                if pending is not None:
+                    pending.order = order
+                    for observer in observers:
+                        pending.observers[observer] = None
+                    self.metrics.coalesced += 1
+                    return
+                self._pending[order.order_id] = _PendingNotification(order, observers, now, self.coalesce_window)
+        if not running:
+            self._notify(order.order_id, order, observers, now)
+            return
+        self._enqueue(order.order_id)
+
+    def submit_many(self, orders: List['Order'], observer: 'Observer'):
+        """
+        Toplu durum değişikliğinde gözlemciyi ilgilendiren siparişleri tek bildirim olarak
+        kuyruğa ekler; gözlemcinin update_many metodu siparişlerin tamamıyla bir kez çağrılır.
+        Kanal çalışmıyorsa bildirim hemen teslim edilir.
+        """
+        if not orders:
+            return
+        now = time.perf_counter()
+        with self._lock:
+            self.metrics.submitted += 1
+            running = self._running
+            if running:
+                key = ("many", next(self._group_keys))
+                self._pending[key] = _PendingNotification(orders[-1], [observer], now, 0, list(orders))
+        if not running:
+            self._notify_many(orders, observer, now)
+            return
+        self._enqueue(key)
+
+    def _enqueue(self, key: Hashable):
+        """
+        Bekleyen bildirimin anahtarını kuyruğa ekler; kuyruk doluysa yer açılmasını bekler.
+        """
+        try:
+            self._queue.put_nowait(key)
+        except queue.Full:
+            blocked_at = time.perf_counter()
+            while True:
+                try:
+                    self._queue.put(key, timeout=0.1)
+                    break
+                except queue.Full:
+                    if not self._running: # Kanal beklerken durduruldu; kuyruğu boşaltacak işçi yok
+                        with self._lock:
+                            pending = self._pending.pop(key, None)
+                        if pending is not None:
+                            self._notify_pending(key, pending)
+                        return
+            with self._lock:
+                self.metrics.blocked_submissions += 1
+                self.metrics.blocked_seconds += time.perf_counter() - blocked_at
+        if not self._running: # stop ile yarıştı: işçiler durduysa kuyrukta kalanlar burada teslim edilir
+            self._drain()
+            return
+        with self._lock:
+            self.metrics.enqueued += 1
+            depth = self._queue.qsize()
+            if depth > self.metrics.max_queue_depth:
+                self.metrics.max_queue_depth = depth
+
+    def _worker(self):
+        while True:
+            order_id = self._queue.get()
+            try:
+                if order_id is None:
+                    return
+                self._deliver(order_id)
+            finally:
+                self._queue.task_done()
+
+    def _deliver(self, order_id: Hashable):
+        """
+        Birleştirme penceresi dolunca bildirimi gözlemcilere teslim eder.
+        Kuyruk FIFO olduğu ve pencere sabit olduğu için arkadaki bildirimler de henüz hazır değildir.
+        """
+        with self._lock:
+            pending = self._pending[order_id]
+        delay = pending.due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        with self._lock:
+            pending = self._pending.pop(order_id)
+        self._notify_pending(order_id, pending)
+
+    def _notify_pending(self, key: Hashable, pending: _PendingNotification):
+        if pending.orders is None:
+            self._notify(key, pending.order, pending.observers, pending.first_submitted)
+        else:
+            self._notify_many(pending.orders, next(iter(pending.observers)), pending.first_submitted)
+
+    def _notify(self, order_id: str, order: 'Order', observers, first_submitted: float):
+        """
+        Gözlemcilerin update metotlarını çağırır ve teslim metriklerini günceller.
+        """
+        delivered = failed = 0
+        for observer in observers:
+            try:
+                observer.update(order)
+                delivered += 1
+            except Exception as e:
+                failed += 1
+                print(f"Bildirim hatası (Sipariş {order_id}): {e}")
+        latency = time.perf_counter() - first_submitted
+        with self._lock:
+            self.metrics.delivered += delivered
+            self.metrics.failed += failed
+            self.metrics.latency.observe(latency)
+
+    def _notify_many(self, orders: List['Order'], observer: 'Observer', first_submitted: float):
+        """
+        Gözlemcinin update_many metodunu toplu bildirimin siparişleriyle çağırır.
+        """
+        delivered = failed = 0
+        try:
+            observer.update_many(orders)
+            delivered = 1
+        except Exception as e:
+            failed = 1
+            print(f"Bildirim hatası ({len(orders)} sipariş): {e}")
+        latency = time.perf_counter() - first_submitted
+        with self._lock:
+            self.metrics.delivered += delivered
+            self.metrics.failed += failed
+            self.metrics.latency.observe(latency)
+
+    def join(self):
+        """
+        Kuyruktaki tüm bildirimler teslim edilene kadar bekler.
+        """
+        self._queue.join()
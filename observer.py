@@ -1,18 +1,33 @@
-# observer.py
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from order import Order # Döngüsel bağımlılığı önlemek için
-
-class Observer(ABC):
-    """
-    Observer arayüzü, konu nesnesindeki değişiklikleri almak isteyen sınıflar tarafından uygulanır.
-    """
-    @abstractmethod
-    def update(self, order: 'Order'):
-        """
-        Gözlemcinin güncellemeleri alması için çağrılan soyut metot.
-        Parametre olarak güncellenen sipariş nesnesini alır.
-        """
-        pass
\ No newline at end of file
+# observer.py
+from abc import ABC, abstractmethod
+from typing import List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from order import Order # Döngüsel bağımlılığı önlemek için
+
+class Observer(ABC):
+    """
+    Observer arayüzü, konu nesnesindeki değişiklikleri almak isteyen sınıflar tarafından uygulanır.
+    """
+    __slots__ = ()
+
+    # OrderSubject'e bir NotificationDispatcher atanmışsa bildirimler arka planda teslim edilir.
+    # Bildirimi durum değişikliğiyle aynı anda alması gereken gözlemciler (örn. indeksler) False yapmalıdır.
+    ASYNC_DELIVERY: bool = True
+
+    @abstractmethod
+    def update(self, order: 'Order'):
+        """
+        Gözlemcinin güncellemeleri alması için çağrılan soyut metot.
+        Parametre olarak güncellenen sipariş nesnesini alır.
+        """
+        pass
+
+    def update_many(self, orders: List['Order']):
+        """
+        Toplu durum değişikliğinde gözlemciyi ilgilendiren siparişlerle bir kez çağrılır.
+        Varsayılan olarak her sipariş için update çağrılır; gruplu bildirim veya tek
+        geçişte indeksleme yapmak isteyen gözlemciler override eder.
+        """
+        for order in orders:
+            self.update(order)
\ No newline at end of file
@@ -1,145 +1,318 @@
-# order.py
-from order_subject import OrderSubject
-from typing import List, Tuple
-from product import Product # For type hinting
-from enum import Enum # Sipariş durumları için Enum
-from customer import Customer # Type hinting için
-
-class OrderStatus(Enum):
-    """
-    Siparişin mevcut durumlarını temsil eden Enum.
-    """
-    PREPARING = "Hazırlanıyor"
-    SHIPPED = "Kargoya Verildi"
-    DELIVERED = "Teslim Edildi"
-    CANCELLED = "İptal Edildi"
-    RETURNED = "İade Edildi"
-    PENDING_PAYMENT = "Ödeme Bekleniyor"
-
-    def __str__(self):
-        return self.value
-
-class Order:
-    """
-    Sipariş bilgilerini, ürün listesini ve durumunu tutan temel sınıf.
-    Observer deseni için konu (subject) görevi görür.
-    """
-    def __init__(self, order_id: str, customer: Customer, products: List[Tuple[Product, int]]):
-        self.order_id = order_id
-        self.customer = customer
-        self.products = products  # (ürün, adet) tuple'larından oluşan liste
-        self.total = self.calculate_total() # Kargo ve ek hizmetler hariç temel toplam
-        self.status: OrderStatus = OrderStatus.PREPARING # Başlangıç durumu Enum olarak
-        self.shipping_strategy = None # Kargo stratejisi
-        self._subject = OrderSubject()
-        self._subject.attach(customer)  # Müşteri, sipariş durumu değişikliklerini dinlemek için bağlanır
-
-    def calculate_total(self) -> float:
-        """
-        Siparişin ürün maliyetini hesaplar.
-        """
-        return sum(product.price * qty for product, qty in self.products)
-
-    def set_shipping_strategy(self, strategy):
-        """
-        Sipariş için kargo stratejisini ayarlar.
-        """
-        self.shipping_strategy = strategy
-
-    def get_shipping_cost(self) -> float:
-        """
-        Seçilen kargo stratejisine göre kargo maliyetini hesaplar.
-        """
-        if self.shipping_strategy is None:
-            raise Exception("Kargo stratejisi seçilmedi.")
-        return self.shipping_strategy.calculate(self) # Sipariş objesi, kargo stratejisine gönderilir
-
-    def update_status(self, new_status: OrderStatus):
-        """
-        Siparişin durumunu günceller ve gözlemcilere (müşteriye) bildirim gönderir.
-        """
-        if not isinstance(new_status, OrderStatus):
-            raise ValueError("Geçersiz sipariş durumu. Lütfen OrderStatus enum'ından bir değer kullanın.")
-        self.status = new_status
-        self._subject.notify(self) # Gözlemcilere bildirim gönderilir
-
-    def get_type(self) -> str:
-        """
-        Siparişin genel türünü döndürür. Alt sınıflar override edebilir.
-        """
-        return "Standard"
-
-    def __str__(self):
-        """
-        Sipariş bilgilerini özetleyen string temsilini döndürür.
-        """
-        product_names = ", ".join([f"{p.name} (x{q})" for p, q in self.products])
-        return (f"Sipariş ID: {self.order_id} | Müşteri: {self.customer.name} | "
-                f"Ürünler: [{product_names}] | Toplam: {self.total:.2f}₺ | Durum: {self.status.value}")
-
-# --- Sipariş Alt Sınıfları (Factory Method için) ---
-
-class ExpressOrder(Order):
-    """
-    Ekspres sipariş sınıfı. Ekstra ücret veya farklı hesaplama içerebilir.
-    """
-    def calculate_total(self) -> float:
-        base_total = super().calculate_total()
-        return base_total * 1.10 # %10 ek ücret (örneğin hızlandırılmış işlem için)
-
-    def get_type(self) -> str:
-        return "Express"
-
-class SubscriptionOrder(Order):
-    """
-    Abonelik siparişi sınıfı. Belirli bir indirim veya farklı işleme mantığı olabilir.
-    """
-    def calculate_total(self) -> float:
-        return super().calculate_total() * 0.85  # %15 indirim
-
-    def get_type(self) -> str:
-        return "Subscription"
-
-class PreOrder(Order):
-    """
-    Ön sipariş sınıfı. Tahmini teslim tarihi gibi ek bilgiler içerir.
-    """
-    def __init__(self, order_id: str, customer: Customer, products: List[Tuple[Product, int]], expected_delivery_date: str):
-        super().__init__(order_id, customer, products)
-        self.expected_delivery_date = expected_delivery_date
-
-    def get_type(self) -> str:
-        return "PreOrder"
-
-    def __str__(self):
-        base_str = super().__str__()
-        return f"{base_str} - Tahmini Teslim: {self.expected_delivery_date}"
-
-class GiftOrder(Order):
-    """
-    Hediye siparişi sınıfı. Hediye notu gibi ek bilgiler içerir.
-    """
-    def __init__(self, order_id: str, customer: Customer, products: List[Tuple[Product, int]], gift_note: str):
-        super().__init__(order_id, customer, products)
-        self.gift_note = gift_note
-
-    def get_type(self) -> str:
-        return "Gift"
-
-    def __str__(self):
-        base_str = super().__str__()
-        return f"{base_str} - Hediye Notu: '{self.gift_note}'"
-
-
-class BulkOrder(Order):
-    """
-    Toplu sipariş sınıfı. Büyük siparişler için indirim içerebilir.
-    """
-    def calculate_total(self) -> float:
-        base_total = super().calculate_total()
-        if base_total > 1000: # Örnek: 1000 TL üzeri toplu siparişlerde %5 indirim
-            return base_total * 0.95
-        return base_total
-
-    def get_type(self) -> str:
+# order.py
+from order_subject import OrderSubject
+from order_line_store import OrderLineStore
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+from product import Product, next_version # Product: type hinting için
+from enum import Enum # Sipariş durumları için Enum
+from customer import Customer # Type hinting için
+from pricing_rules import PricingRegistry
+
+_pricing = PricingRegistry.get_instance()
+
+class OrderStatus(Enum):
+    """
+    Siparişin mevcut durumlarını temsil eden Enum.
+    """
+    PREPARING = "Hazırlanıyor"
+    SHIPPED = "Kargoya Verildi"
+    DELIVERED = "Teslim Edildi"
+    CANCELLED = "İptal Edildi"
+    RETURNED = "İade Edildi"
+    PENDING_PAYMENT = "Ödeme Bekleniyor"
+
+    # Enum'un Python ile yazılmış __hash__'i yerine kimlik tabanlı C hash'i kullanılır; üyeler tekil
+    # olduğu ve eşitlik kimlikle belirlendiği için sonuç aynıdır. Durum anahtarlı indeksler hızlanır.
+    __hash__ = object.__hash__
+
+    def __str__(self):
+        return self.value
+
+# İzin verilen durum geçişleri: {mevcut durum: gidilebilecek durumlar}.
+# İptal edilen ve iade edilen siparişler son durumdadır; teslim edilen sipariş yalnızca iade edilebilir.
+ALLOWED_TRANSITIONS: Dict[OrderStatus, FrozenSet[OrderStatus]] = {
+    OrderStatus.PENDING_PAYMENT: frozenset({OrderStatus.PREPARING, OrderStatus.CANCELLED}),
+    OrderStatus.PREPARING: frozenset({OrderStatus.PENDING_PAYMENT, OrderStatus.SHIPPED, OrderStatus.CANCELLED}),
+    OrderStatus.SHIPPED: frozenset({OrderStatus.DELIVERED, OrderStatus.RETURNED}),
+    OrderStatus.DELIVERED: frozenset({OrderStatus.RETURNED}),
+    OrderStatus.CANCELLED: frozenset(),
+    OrderStatus.RETURNED: frozenset(),
+}
+
+
+def check_transition(current: OrderStatus, new_status: OrderStatus):
+    """
+    current durumundan new_status durumuna geçiş izinli değilse ValueError fırlatır.
+    """
+    if not isinstance(new_status, OrderStatus):
+        raise ValueError("Geçersiz sipariş durumu. Lütfen OrderStatus enum'ından bir değer kullanın.")
+    if new_status not in ALLOWED_TRANSITIONS[current]:
+        allowed = ", ".join(status.value for status in ALLOWED_TRANSITIONS[current]) or "yok (son durum)"
+        raise ValueError(f"'{current.value}' durumundaki sipariş '{new_status.value}' durumuna geçirilemez. "
+                         f"İzin verilen durumlar: {allowed}.")
+
+class Order:
+    """
+    Sipariş bilgilerini, ürün listesini ve durumunu tutan temel sınıf.
+    Observer deseni için konu (subject) görevi görür.
+
+    Milyonlarca siparişte nesne başına bellek yükünü azaltmak için __slots__ kullanılır.
+    Müşteri siparişin varsayılan gözlemcisidir; OrderSubject'in abonelik tablosunda kayıt
+    yalnızca başka bir gözlemci eklendiğinde ya da müşteri çıkarıldığında oluşturulur.
+
+    version, durum veya satırlar değiştiğinde yenilenir; __str__ metni bu değere göre
+    önbellekten gelir (bkz. table_renderer.order_text_cache).
+
+    cost_version yalnızca maliyeti etkileyen değişikliklerde (satırlar, kargo stratejisi)
+    artırılır; dekorasyon zincirinin maliyet önbelleği bu değere göre geçersiz kılınır
+    (bkz. order_decorator.BaseOrder.get_cost_breakdown).
+    """
+    __slots__ = ("order_id", "customer", "_lines", "_line_offset", "_line_count",
+                 "total", "status", "_shipping_strategy", "version", "cost_version", "__weakref__")
+
+    # Ayarlanırsa yeni siparişlerin satırları bu ortak depoda tutulur (bkz. set_line_store)
+    line_store: 'OrderLineStore | None' = None
+
+    def __init__(self, order_id: str, customer: Customer, products: List[Tuple[Product, int]]):
+        self.version = next_version()
+        self.cost_version = 0
+        self.order_id = order_id
+        self.customer = customer
+        self._lines = products  # (ürün, adet) tuple'larından oluşan liste
+        self.total = self.calculate_total() # Kargo ve ek hizmetler hariç temel toplam
+        if Order.line_store is not None:
+            self._store_lines(products) # Toplam hesaplandıktan sonra satırlar ortak depoya taşınır
+        self.status: OrderStatus = OrderStatus.PREPARING # Başlangıç durumu Enum olarak
+        self._shipping_strategy = None # Kargo stratejisi
+
+    @classmethod
+    def set_line_store(cls, store: 'OrderLineStore | None'):
+        """
+        Bundan sonra oluşturulan siparişlerin satırlarının tutulacağı ortak depoyu ayarlar.
+        None verilirse satırlar yeniden sipariş başına listelerde tutulur.
+        """
+        cls.line_store = store
+
+    @property
+    def products(self) -> List[Tuple[Product, int]]:
+        """
+        Siparişin (ürün, adet) satırları. Satırlar ortak depodaysa her erişimde yeni bir liste
+        oluşturulur; bu listeyi değiştirmek siparişi değiştirmez, yeni liste atanmalıdır.
+        """
+        lines = self._lines
+        if isinstance(lines, OrderLineStore):
+            return lines.lines(self._line_offset, self._line_count)
+        return lines
+
+    @products.setter
+    def products(self, products: List[Tuple[Product, int]]):
+        """
+        Satırları değiştirir; temel toplam geçerli fiyatlama kurallarıyla yeniden hesaplanır.
+        """
+        self._lines = products
+        self.total = self.calculate_total()
+        if Order.line_store is not None:
+            self._store_lines(products)
+        self.version = next_version()
+        self.cost_version += 1
+
+    def _store_lines(self, products: List[Tuple[Product, int]]):
+        self._line_offset, self._line_count = Order.line_store.append(products)
+        self._lines = Order.line_store
+
+    def calculate_total(self) -> float:
+        """
+        Siparişin ürün maliyetini geçerli fiyatlama kurallarıyla hesaplar (tür ayarlamaları ve
+        promosyonlar dahil; bkz. pricing_rules).
+        """
+        return _pricing.plan.order_total(self)
+
+    @property
+    def shipping_strategy(self):
+        """
+        Siparişin kargo stratejisi (seçilmediyse None).
+        """
+        return self._shipping_strategy
+
+    @shipping_strategy.setter
+    def shipping_strategy(self, strategy):
+        self._shipping_strategy = strategy
+        self.cost_version += 1
+
+    def set_shipping_strategy(self, strategy):
+        """
+        Sipariş için kargo stratejisini ayarlar.
+        """
+        self.shipping_strategy = strategy
+
+    def get_shipping_cost(self) -> float:
+        """
+        Seçilen kargo stratejisine göre kargo maliyetini hesaplar.
+        """
+        if self._shipping_strategy is None:
+            raise Exception("Kargo stratejisi seçilmedi.")
+        return self._shipping_strategy.calculate(self) # Sipariş objesi, kargo stratejisine gönderilir
+
+    def __getstate__(self) -> dict:
+        """
+        Kopyalama ve pickle için durum. Ortak depodaki satırlar, deponun tamamı yerine
+        siparişe ait liste olarak alınır.
+        """
+        state = {name: getattr(self, name)
+                 for cls in type(self).__mro__ for name in getattr(cls, "__slots__", ())
+                 if name != "__weakref__" and hasattr(self, name)}
+        if isinstance(state.get("_lines"), OrderLineStore):
+            state["_lines"] = self.products
+            del state["_line_offset"], state["_line_count"]
+        return state
+
+    def __setstate__(self, state: dict):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    def attach(self, observer):
+        """
+        Siparişin durum değişikliklerini dinleyecek yeni bir gözlemci ekler.
+        Gözlemci zayıf referansla tutulur; başka bir yerden referans verilmeyen gözlemci
+        serbest kaldığında aboneliği de kalkar (bkz. OrderSubject).
+        """
+        OrderSubject.subscribe(self, observer)
+
+    def detach(self, observer):
+        """
+        Gözlemciyi siparişin bildirim listesinden çıkarır.
+        """
+        OrderSubject.unsubscribe(self, observer)
+
+    def update_status(self, new_status: OrderStatus):
+        """
+        Siparişin durumunu günceller ve gözlemcilere (müşteriye) bildirim gönderir.
+        Geçiş ALLOWED_TRANSITIONS'ta yoksa ValueError fırlatır.
+        """
+        check_transition(self.status, new_status)
+        self.status = new_status
+        self.version = next_version()
+        # Gözlemcilere bildirim gönderilir
+        OrderSubject.deliver(self, OrderSubject.observers_of(self))
+
+    def observers(self) -> Tuple:
+        """
+        Siparişin kendi gözlemcileri (global gözlemciler hariç).
+        """
+        return OrderSubject.observers_of(self)
+
+    @staticmethod
+    def bulk_update_status(orders: Iterable['Order'], new_status: OrderStatus) -> Tuple[List['Order'], Dict[str, str]]:
+        """
+        Siparişleri tek çağrıda new_status durumuna geçirir.
+
+        Geçişi izinli olmayan siparişler değiştirilmez. Değişen siparişlerin bildirimleri
+        OrderSubject.deliver_many ile toplu gönderilir: her gözlemci (örn. müşteri) kendi
+        siparişlerini tek bir update_many çağrısıyla alır.
+
+        Returns:
+            (durumu değişen siparişler, {order_id: reddedilme nedeni}). Zaten new_status
+            durumunda olan siparişler reddedilenlere "değişiklik yok" nedeniyle eklenir.
+        """
+        if not isinstance(new_status, OrderStatus):
+            raise ValueError("Geçersiz sipariş durumu. Lütfen OrderStatus enum'ından bir değer kullanın.")
+        # Geçerli kaynak durumlar bir kez hesaplanır; sipariş başına yalnızca üyelik kontrol edilir
+        sources = frozenset(status for status, targets in ALLOWED_TRANSITIONS.items() if new_status in targets)
+        changed: List[Order] = []
+        rejected: Dict[str, str] = {}
+        for order in orders:
+            status = order.status
+            if status in sources:
+                order.status = new_status
+                order.version = next_version()
+                changed.append(order)
+            elif status is new_status:
+                rejected[order.order_id] = "Sipariş zaten bu durumda (değişiklik yok)."
+            else:
+                rejected[order.order_id] = f"'{status.value}' durumundan '{new_status.value}' durumuna geçilemez."
+        if changed:
+            OrderSubject.deliver_many(changed)
+        return changed, rejected
+
+    def get_type(self) -> str:
+        """
+        Siparişin genel türünü döndürür. Alt sınıflar override edebilir.
+        """
+        return "Standard"
+
+    def __str__(self):
+        """
+        Sipariş bilgilerini özetleyen string temsilini döndürür. Metin, sipariş değişmediği
+        sürece önbellekten gelir.
+        """
+        from table_renderer import order_text_cache # Görüntüleme modülü; siparişle çalışan süreçler yüklemez
+        return order_text_cache.get(self.order_id, self.version, self)
+
+    def render(self) -> str:
+        """
+        Sipariş metnini önbelleğe bakmadan oluşturur. Alt sınıflar ek bilgileri burada ekler.
+        """
+        product_names = ", ".join([f"{p.name} (x{q})" for p, q in self.products])
+        return (f"Sipariş ID: {self.order_id} | Müşteri: {self.customer.name} | "
+                f"Ürünler: [{product_names}] | Toplam: {self.total:.2f}₺ | Durum: {self.status.value}")
+
+# --- Sipariş Alt Sınıfları (Factory Method için) ---
+
+class ExpressOrder(Order):
+    """
+    Ekspres sipariş sınıfı. Varsayılan kurallarda %10 ek ücret uygulanır (express_surcharge).
+    """
+    __slots__ = ()
+
+    def get_type(self) -> str:
+        return "Express"
+
+class SubscriptionOrder(Order):
+    """
+    Abonelik siparişi sınıfı. Varsayılan kurallarda %15 indirim uygulanır (subscription_discount).
+    """
+    __slots__ = ()
+
+    def get_type(self) -> str:
+        return "Subscription"
+
+class PreOrder(Order):
+    """
+    Ön sipariş sınıfı. Tahmini teslim tarihi gibi ek bilgiler içerir.
+    """
+    __slots__ = ("expected_delivery_date",)
+
+    def __init__(self, order_id: str, customer: Customer, products: List[Tuple[Product, int]], expected_delivery_date: str):
+        super().__init__(order_id, customer, products)
+        self.expected_delivery_date = expected_delivery_date
+
+    def get_type(self) -> str:
+        return "PreOrder"
+
+    def render(self) -> str:
+        return f"{super().render()} - Tahmini Teslim: {self.expected_delivery_date}"
+
+class GiftOrder(Order):
+    """
+    Hediye siparişi sınıfı. Hediye notu gibi ek bilgiler içerir.
+    """
+    __slots__ = ("gift_note",)
+
+    def __init__(self, order_id: str, customer: Customer, products: List[Tuple[Product, int]], gift_note: str):
+        super().__init__(order_id, customer, products)
+        self.gift_note = gift_note
+
+    def get_type(self) -> str:
+        return "Gift"
+
+    def render(self) -> str:
+        return f"{super().render()} - Hediye Notu: '{self.gift_note}'"
+
+
+class BulkOrder(Order):
+    """
+    Toplu sipariş sınıfı. Varsayılan kurallarda 1000 TL üzerinde %5 indirim uygulanır (bulk_discount).
+    """
+    __slots__ = ()
+
+    def get_type(self) -> str:
         return "Bulk"
\ No newline at end of file
@@ -0,0 +1,202 @@
+# order_archive.py
+"""
+Son durumdaki (teslim edilmiş, iptal edilmiş, iade edilmiş) siparişlerin sıkıştırılmış geçmişi.
+
+Customer.archive_orders / CustomerOrderRegistry.archive_orders bu durumdaki siparişleri
+müşterinin sipariş listesinden ve kayıt defterinden çıkarıp buraya yazar; Order nesneleri
+(satırları, kargo stratejisi ve müşteriyle kurdukları referanslarla birlikte) serbest kalır.
+
+Geçmiş sütunlar halinde tutulur: müşteri, tür ve durum kodları, toplamlar ve ürün adetleri
+array'lerde; sipariş ID'leri _CHUNK boyutlu demetlerde (tuple). Müşterinin satırları, her
+satırda aynı müşterinin bir önceki satırını tutan bir zincirle bulunur. Arşivin nesne sayısı
+sipariş veya müşteri sayısıyla artmaz ve GC'nin tarayacağı öğe içermez; milyonlarca
+arşivlenmiş sipariş GC duraklamalarını uzatmaz. Okumalar satırları
+ArchivedOrder nesnesi olarak döndürür.
+
+Teslim edilmiş sipariş arşivlendikten sonra Order API'siyle iade edilemez; iade penceresi
+açık olan siparişler arşivlenmemelidir (archive_orders'a verilen durumlarla seçilir).
+"""
+import threading
+from array import array
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
+from order import ALLOWED_TRANSITIONS, OrderStatus
+
+if TYPE_CHECKING:
+    from order import Order
+
+# Arşivlenebilen durumlar
+ARCHIVABLE_STATUSES = frozenset({OrderStatus.DELIVERED, OrderStatus.CANCELLED, OrderStatus.RETURNED})
+# Başka duruma geçemeyen (iade edilemeyecek) durumlar: iptal edilmiş ve iade edilmiş
+CLOSED_STATUSES = frozenset(status for status in ARCHIVABLE_STATUSES if not ALLOWED_TRANSITIONS[status])
+
+_STATUSES = list(OrderStatus)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES)}
+_CHUNK = 4096 # Sipariş ID'lerinin demetlere aktarıldığı boyut; yalnızca str içeren demetleri GC izlemez
+
+
+def check_archivable(statuses: Iterable[OrderStatus]) -> frozenset:
+    """
+    Durumların arşivlenebilir olduğunu doğrular. Değilse ValueError fırlatır.
+    """
+    statuses = frozenset(statuses)
+    invalid = statuses - ARCHIVABLE_STATUSES
+    if invalid:
+        names = ", ".join(status.value for status in invalid)
+        raise ValueError(f"Yalnızca teslim edilmiş, iptal edilmiş veya iade edilmiş siparişler arşivlenebilir: {names}")
+    return statuses
+
+
+class ArchivedOrder:
+    """
+    Arşivden okunan siparişin özeti.
+    """
+    __slots__ = ("order_id", "customer_id", "order_type", "status", "total", "units")
+
+    def __init__(self, order_id: str, customer_id: str, order_type: str, status: OrderStatus, total: float, units: int):
+        self.order_id = order_id
+        self.customer_id = customer_id
+        self.order_type = order_type
+        self.status = status
+        self.total = total
+        self.units = units
+
+    def __str__(self):
+        return (f"Sipariş ID: {self.order_id} | Tür: {self.order_type} | Ürün adedi: {self.units} | "
+                f"Toplam: {self.total:.2f}₺ | Durum: {self.status.value} (arşiv)")
+
+
+class OrderArchive:
+    """
+    Arşivlenmiş siparişlerin sütunlu deposu (Singleton).
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """
+        Singleton desenini uygulamak için __new__ metodu override edildi.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._lock = threading.Lock()
+                    instance.clear()
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def get_instance() -> "OrderArchive":
+        """
+        Singleton örneğini döndürür.
+        """
+        return OrderArchive()
+
+    def clear(self):
+        """
+        Arşivi boşaltır.
+        """
+        with self._lock:
+            self._id_chunks: List[tuple] = [] # Tamamlanmış ID demetleri
+            self._pending_ids: List[str] = [] # Henüz demete aktarılmamış son ID'ler (en fazla _CHUNK)
+            self._customer_codes = array("l")
+            self._customer_ids: List[str] = [] # Müşteri kodu -> customer_id
+            self._customer_index: Dict[str, int] = {} # {customer_id: müşteri kodu}
+            self._last_rows = array("l") # Müşteri kodu -> müşterinin son satırı
+            self._customer_counts = array("l") # Müşteri kodu -> arşivlenmiş sipariş sayısı
+            self._previous_rows = array("l") # Satır -> aynı müşterinin önceki satırı (yoksa -1)
+            self._type_codes = array("B")
+            self._status_codes = array("B")
+            self._totals = array("d")
+            self._units = array("l")
+            self._types: List[str] = [] # Tür kodu -> get_type() değeri
+            self._type_index: Dict[str, int] = {}
+            self._rows: Dict[str, int] = {} # {order_id: satır}; yalnızca str ve int içerdiğinden GC izlemez
+
+    def archive(self, orders: Iterable['Order']) -> int:
+        """
+        Arşivlenebilir durumdaki siparişleri arşive yazar; daha önce arşivlenenler atlanır.
+        Yazılan sipariş sayısını döndürür.
+        """
+        written = 0
+        with self._lock:
+            rows, type_index, customer_index = self._rows, self._type_index, self._customer_index
+            pending_ids, last_rows, customer_counts = self._pending_ids, self._last_rows, self._customer_counts
+            append_previous = self._previous_rows.append
+            append_customer, append_type = self._customer_codes.append, self._type_codes.append
+            append_status, append_total, append_units = self._status_codes.append, self._totals.append, self._units.append
+            row = len(self._status_codes)
+            for order in orders:
+                order_id, status = order.order_id, order.status
+                if status not in ARCHIVABLE_STATUSES or order_id in rows:
+                    continue
+                order_type = order.get_type()
+                type_code = type_index.get(order_type)
+                if type_code is None:
+                    type_code = type_index[order_type] = len(self._types)
+                    self._types.append(order_type)
+                customer_id = order.customer.customer_id
+                customer_code = customer_index.get(customer_id)
+                if customer_code is None:
+                    customer_code = customer_index[customer_id] = len(self._customer_ids)
+                    self._customer_ids.append(customer_id)
+                    last_rows.append(-1)
+                    customer_counts.append(0)
+                rows[order_id] = row
+                pending_ids.append(order_id)
+                if len(pending_ids) == _CHUNK:
+                    self._id_chunks.append(tuple(pending_ids))
+                    pending_ids.clear()
+                append_customer(customer_code)
+                append_type(type_code)
+                append_status(_STATUS_CODES[status])
+                append_total(order.total)
+                append_units(sum([quantity for _, quantity in order.products]))
+                append_previous(last_rows[customer_code])
+                last_rows[customer_code] = row
+                customer_counts[customer_code] += 1
+                row += 1
+                written += 1
+        return written
+
+    def _read(self, row: int) -> ArchivedOrder:
+        chunk, offset = divmod(row, _CHUNK)
+        order_id = self._id_chunks[chunk][offset] if chunk < len(self._id_chunks) else self._pending_ids[offset]
+        return ArchivedOrder(order_id, self._customer_ids[self._customer_codes[row]], self._types[self._type_codes[row]],
+                             _STATUSES[self._status_codes[row]], self._totals[row], self._units[row])
+
+    def get(self, order_id: str) -> Optional[ArchivedOrder]:
+        """
+        Arşivlenmiş siparişi döndürür. Bulamazsa None döner.
+        """
+        with self._lock:
+            row = self._rows.get(order_id)
+            return None if row is None else self._read(row)
+
+    def customer_history(self, customer_id: str) -> List[ArchivedOrder]:
+        """
+        Müşterinin arşivlenmiş siparişlerini arşivlenme sırasıyla döndürür.
+        """
+        with self._lock:
+            customer_code = self._customer_index.get(customer_id)
+            history = []
+            row = -1 if customer_code is None else self._last_rows[customer_code]
+            while row >= 0:
+                history.append(self._read(row))
+                row = self._previous_rows[row]
+            history.reverse()
+            return history
+
+    def count_by_customer(self, customer_id: str) -> int:
+        """
+        Müşterinin arşivlenmiş sipariş sayısı.
+        """
+        with self._lock:
+            customer_code = self._customer_index.get(customer_id)
+            return 0 if customer_code is None else self._customer_counts[customer_code]
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._rows
+
+    def __len__(self) -> int:
+        return len(self._status_codes)
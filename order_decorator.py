@@ -1,124 +1,312 @@
-# order_decorator.py
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
-
-# Döngüsel bağımlılıkları önlemek için
-if TYPE_CHECKING:
-    from order import Order
-    from customer import Customer
-    from order import OrderStatus
-
-
-class OrderComponent(ABC):
-    """
-    Sipariş bileşenlerinin temel arayüzü. Hem ana sipariş hem de dekoratörler bu arayüzü uygular.
-    """
-    @abstractmethod
-    def get_description(self) -> str:
-        """Siparişin açıklamasını döndürür."""
-        pass
-
-    @abstractmethod
-    def get_total_cost(self) -> float:
-        """Siparişin toplam maliyetini döndürür."""
-        pass
-
-    # __getattr__ için özel bir abstract method tanımlamaya gerek yok,
-    # ancak OrderComponent'ten türeyen tüm sınıfların
-    # Order nesnesinin özelliklerine erişilebilir olmasını sağlamalıyız.
-    # Bu, BaseOrder ve OrderDecorator'da uygulanacak.
-
-
-class BaseOrder(OrderComponent):
-    """
-    Dekorasyon zincirinin temel bileşeni olan gerçek sipariş nesnesini sarar.
-    """
-    def __init__(self, order: 'Order'):
-        self.order = order
-
-    def get_description(self) -> str:
-        """Temel siparişin açıklamasını döndürür."""
-        return str(self.order)
-
-    def get_total_cost(self) -> float:
-        """
-        Temel siparişin toplam maliyetini (kargo dahil) döndürür.
-        """
-        cost = self.order.total
-        if self.order.shipping_strategy:
-            cost += self.order.get_shipping_cost()
-        return cost
-
-    def __getattr__(self, name: str) -> Any:
-        """
-        Dekoratör zinciri aracılığıyla temel Order nesnesinin özelliklerine ve metotlarına erişimi sağlar.
-        """
-        # Temel 'order' nesnesinin özelliklerine erişimi yönlendir
-        if hasattr(self.order, name):
-            return getattr(self.order, name)
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-
-
-class OrderDecorator(OrderComponent):
-    """
-    Tüm sipariş dekoratörleri için temel soyut sınıf.
-    Dekoratörler zincirleme bir şekilde birbirine eklenebilir.
-    """
-    def __init__(self, component: OrderComponent):
-        self.component = component
-
-    def get_description(self) -> str:
-        """Alt bileşenin açıklamasını döndürür."""
-        return self.component.get_description()
-
-    def get_total_cost(self) -> float:
-        """Alt bileşenin maliyetini döndürür."""
-        return self.component.get_total_cost()
-
-    def __getattr__(self, name: str) -> Any:
-        """
-        Dekoratör zinciri aracılığıyla temel Order nesnesinin özelliklerine ve metotlarına erişimi sağlar.
-        Bu, dekore edilmiş nesne üzerinde temel Order'ın özelliklerine erişimi sağlar.
-        """
-        # Eğer attribute alt bileşende varsa, ona yönlendir
-        if hasattr(self.component, name):
-            return getattr(self.component, name)
-        # Eğer alt bileşen de bir OrderComponent ise ve attribute'ı yoksa,
-        # onun içindeki order'a bakması gerekir. Bu zincirleme __getattr__ sayesinde otomatikleşir.
-        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-
-
-class FragileDecorator(OrderDecorator):
-    """
-    Siparişin kırılabilir etiketli olduğunu belirten dekoratör.
-    Maliyete ek ücret ekler.
-    """
-    def get_description(self) -> str:
-        return self.component.get_description() + " + Kırılabilir Etiketi"
-
-    def get_total_cost(self) -> float:
-        return self.component.get_total_cost() + 20  # 20 TL ek ücret
-
-
-class InsuranceDecorator(OrderDecorator):
-    """
-    Siparişin sigortalı gönderim olduğunu belirten dekoratör.
-    Maliyete ek ücret ekler.
-    """
-    def get_description(self) -> str:
-        return self.component.get_description() + " + Sigortalı Gönderim"
-
-    def get_total_cost(self) -> float:
-        return self.component.get_total_cost() + 35  # 35 TL ek ücret
-
-
-class GiftWrapDecorator(OrderDecorator):
-    """
-    Siparişin hediye paketi olduğunu belirten dekoratör.
-    Maliyete ek ücret ekler.
-    """
-    def get_description(self) -> str:
-        return self.component.get_description() + " + Hediye Paketi"
-
-    def get_total_cost(self) -> float:
-        return self.component.get_total_cost() + 15  # 15 TL ek ücret
\ No newline at end of file
+# order_decorator.py
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Tuple
+import metrics
+from pricing_rules import PricingRegistry
+
+# Döngüsel bağımlılıkları önlemek için
+if TYPE_CHECKING:
+    from order import Order
+    from customer import Customer
+    from order import OrderStatus
+
+
+_COST_COMPUTATIONS = metrics.MetricsRegistry.get_instance().counter(
+    "order_cost_computations_total", "Dekoratörlü sipariş maliyeti hesapları (zincirdeki dekoratör sayısına göre)",
+    ("decorators",))
+_COST_CACHE_HITS = metrics.MetricsRegistry.get_instance().counter(
+    "order_cost_cache_hits_total", "Önbellekten okunan dekoratörlü sipariş maliyetleri (zincirdeki dekoratör sayısına göre)",
+    ("decorators",))
+_pricing = PricingRegistry.get_instance()
+
+
+def _forward_to_order(name: str) -> property:
+    """
+    Öznitelik erişimini zincir boyunca gezmeden doğrudan temel Order nesnesine yönlendiren property.
+    """
+    def getter(self):
+        return getattr(self.order, name)
+
+    def setter(self, value):
+        setattr(self.order, name, value)
+
+    return property(getter, setter, doc=f"Temel siparişin '{name}' özniteliği.")
+
+
+class CostBreakdown:
+    """
+    Dekoratörlü sipariş maliyetinin kalemleri.
+
+    base + adjustment siparişin temel toplamına (Order.total) eşittir: base satır kuralları
+    uygulanmış ürün tutarı, adjustment tür ayarlamaları ve sipariş promosyonlarıdır.
+    surcharges zincirdeki dekoratörlerin (kısa ad, ücret) çiftleridir (uygulanma sırasıyla).
+    Nesne maliyet önbelleğiyle paylaşılır; değiştirilmemelidir.
+    """
+    __slots__ = ("base", "adjustment", "shipping", "surcharges", "total")
+
+    def __init__(self, base: float, adjustment: float, shipping: float,
+                 surcharges: Tuple[Tuple[str, float], ...], total: float):
+        self.base = base
+        self.adjustment = adjustment
+        self.shipping = shipping
+        self.surcharges = surcharges
+        self.total = total
+
+    def __repr__(self):
+        return (f"CostBreakdown(base={self.base:.2f}, adjustment={self.adjustment:.2f}, "
+                f"shipping={self.shipping:.2f}, surcharges={self.surcharges!r}, total={self.total:.2f})")
+
+
+class OrderComponent(ABC):
+    """
+    Sipariş bileşenlerinin temel arayüzü. Hem ana sipariş hem de dekoratörler bu arayüzü uygular.
+    """
+    @abstractmethod
+    def get_description(self) -> str:
+        """Siparişin açıklamasını döndürür."""
+        pass
+
+    @abstractmethod
+    def get_total_cost(self) -> float:
+        """Siparişin toplam maliyetini döndürür."""
+        pass
+
+    def get_cost_breakdown(self) -> CostBreakdown:
+        """
+        Maliyetin kalemleri. Kendi maliyet hesabını yapan bileşenler varsayılan olarak
+        tek kalemlidir (tamamı base); BaseOrder ve OrderDecorator kalemleri ayrıştırır.
+        """
+        total = self.get_total_cost()
+        return CostBreakdown(total, 0.0, 0.0, (), total)
+
+    # BaseOrder ve OrderDecorator, zincirin en altındaki gerçek Order nesnesini
+    # doğrudan 'order' özniteliğinde tutar. En sık kullanılan öznitelikler aşağıdaki
+    # property'ler ile tek adımda okunur; geri kalanlar __getattr__ ile yine tek
+    # adımda gerçek Order nesnesine yönlendirilir.
+    order_id = _forward_to_order("order_id")
+    customer = _forward_to_order("customer")
+    status = _forward_to_order("status")
+    products = _forward_to_order("products")
+    total = _forward_to_order("total")
+    shipping_strategy = _forward_to_order("shipping_strategy")
+
+
+def _forward_getattr(self, name: str) -> Any:
+    """
+    Property olarak tanımlanmamış özniteliklere ve metotlara erişimi temel Order nesnesine yönlendirir.
+    """
+    # self.order henüz atanmadıysa (örn. kopyalama sırasında) sonsuz özyinelemeyi önlemek için __dict__ kullanılır
+    order = self.__dict__.get("order")
+    if order is not None and hasattr(order, name):
+        return getattr(order, name)
+    raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+class BaseOrder(OrderComponent):
+    """
+    Dekorasyon zincirinin temel bileşeni olan gerçek sipariş nesnesini sarar.
+
+    Maliyet önbelleği: hesaplanan maliyet (plan, order.cost_version, order.total) anahtarıyla
+    saklanır. Satırlar veya kargo stratejisi değişince cost_version, fiyatlama kuralları
+    değişince plan değişir; toplam doğrudan atanırsa (örn. geri yüklemede) anahtarın toplamı
+    tutmaz. Bu durumların dışında get_total_cost kargo ücretini yeniden hesaplamaz.
+    """
+    def __init__(self, order: 'Order'):
+        self.order = order
+        # Düzleştirilmiş zincir bilgisi: ek ücretler ve açıklama ekleri dekoratörlerde birikir
+        self._base: OrderComponent = self
+        self._decorators: tuple = ()
+        self._description_suffix = ""
+        self._cost_cache = None # (plan, cost_version, toplam, maliyet, kargo)
+        self._breakdown = None # (önbellek kaydı, CostBreakdown)
+
+    def get_description(self) -> str:
+        """Temel siparişin açıklamasını döndürür."""
+        return str(self.order)
+
+    def get_total_cost(self) -> float:
+        """
+        Temel siparişin toplam maliyetini (kargo dahil) döndürür.
+        """
+        return self._cost_entry()[3]
+
+    def _cost_entry(self) -> tuple:
+        """
+        Geçerli önbellek kaydını döndürür; anahtar tutmuyorsa maliyeti yeniden hesaplar.
+        """
+        order, entry = self.order, self._cost_cache
+        if (entry is None or entry[0] is not _pricing.plan or entry[1] != order.cost_version
+                or entry[2] != order.total):
+            return self._compute_cost()
+        return entry
+
+    def _compute_cost(self) -> tuple:
+        order = self.order
+        total = order.total
+        shipping = order.get_shipping_cost() if order._shipping_strategy else 0.0
+        entry = self._cost_cache = (_pricing.plan, order.cost_version, total, total + shipping, shipping)
+        return entry
+
+    def get_cost_breakdown(self) -> CostBreakdown:
+        """
+        Ürün tutarı, tür ayarlaması ve kargo kalemleri. Maliyet önbelleğiyle birlikte geçersiz olur.
+        """
+        entry = self._cost_entry()
+        cached = self._breakdown
+        if cached is not None and cached[0] is entry:
+            return cached[1]
+        base = entry[0].subtotal(self.order)
+        breakdown = CostBreakdown(base, entry[2] - base, entry[4], (), entry[3])
+        self._breakdown = (entry, breakdown)
+        return breakdown
+
+    __getattr__ = _forward_getattr
+
+
+class OrderDecorator(OrderComponent):
+    """
+    Tüm sipariş dekoratörleri için temel soyut sınıf.
+    Dekoratörler zincirleme bir şekilde birbirine eklenebilir.
+
+    Zincir oluşturulurken düzleştirilir: her dekoratör temel bileşeni, o ana kadarki
+    dekoratör sınıflarının listesini ve açıklama eklerini önbellekte tutar. Böylece maliyet ve
+    açıklama hesapları zincir boyunca özyineleme yapmaz. Alt sınıflar yalnızca
+    SURCHARGE ve DESCRIPTION değerlerini tanımlar.
+
+    Ücretler geçerli fiyatlama planından okunur: NAME ile eşleşen surcharge kuralı yoksa
+    SURCHARGE kullanılır (bkz. pricing_rules).
+
+    Temel bileşen BaseOrder ise maliyet (ve get_cost_breakdown kalemleri) BaseOrder ile aynı anahtarla önbellekte
+    tutulur. Zincir değiştirilemez: dekoratör eklemek önbelleği boş yeni bir bileşen oluşturur.
+    Kendi maliyet hesabını yapan bir temel bileşenin maliyeti önbelleğe alınmaz.
+    """
+    NAME: str = "" # Dosyalarda, veritabanında ve fiyatlama kurallarında kullanılan kısa ad (örn. "fragile")
+    SURCHARGE: float = 0 # Kural tanımlanmamışsa dekoratörün maliyete eklediği ücret (TL)
+    DESCRIPTION: str = "" # Açıklamaya eklenen metin
+
+    def __init__(self, component: OrderComponent):
+        self.component = component
+        self.order = component.order
+        if isinstance(component, BaseOrder) or _is_flat(component):
+            self._base = component._base
+            self._decorators = component._decorators + (type(self),)
+            self._description_suffix = component._description_suffix + self.DESCRIPTION
+        else:
+            # get_total_cost/get_description metotlarını kendisi tanımlayan bir bileşen
+            # zincirin yeni temeli kabul edilir; böylece onun hesabı atlanmaz.
+            self._base = component
+            self._decorators = (type(self),)
+            self._description_suffix = self.DESCRIPTION
+        base_cls = type(self._base)
+        self._cacheable = (issubclass(base_cls, BaseOrder) and base_cls.get_total_cost is BaseOrder.get_total_cost
+                           and base_cls.get_cost_breakdown is BaseOrder.get_cost_breakdown)
+        self._cost_cache = None # (plan, cost_version, toplam, maliyet)
+        self._breakdown = None # (önbellek kaydı, CostBreakdown)
+
+    def get_description(self) -> str:
+        """Temel açıklamaya, zincirdeki dekoratörlerin eklerini ekler."""
+        return self._base.get_description() + self._description_suffix
+
+    def get_total_cost(self) -> float:
+        """Temel maliyete, zincirdeki dekoratörlerin ücretlerini sırayla ekler."""
+        return self._cost_entry()[3]
+
+    def _cost_entry(self) -> tuple:
+        """
+        Geçerli önbellek kaydını döndürür; anahtar tutmuyorsa maliyeti yeniden hesaplar.
+        """
+        order, entry = self.order, self._cost_cache
+        if (entry is None or entry[0] is not _pricing.plan or entry[1] != order.cost_version
+                or entry[2] != order.total):
+            return self._compute_cost()
+        if metrics.enabled:
+            _COST_CACHE_HITS.labels(len(self._decorators)).inc()
+        return entry
+
+    def _compute_cost(self) -> tuple:
+        if metrics.enabled:
+            _COST_COMPUTATIONS.labels(len(self._decorators)).inc()
+        order, plan = self.order, _pricing.plan
+        cost = self._base._cost_entry()[3] if self._cacheable else self._base.get_total_cost()
+        for decorator in self._decorators:
+            cost += plan.surcharge(decorator, order)
+        entry = (plan, order.cost_version, order.total, cost)
+        if self._cacheable:
+            self._cost_cache = entry
+        return entry
+
+    def get_cost_breakdown(self) -> CostBreakdown:
+        """
+        Temel bileşenin kalemlerine zincirdeki dekoratörlerin ücretlerini ekler.
+        """
+        entry = self._cost_entry()
+        cached = self._breakdown
+        if cached is not None and cached[0] is entry:
+            return cached[1]
+        base, plan, order = self._base.get_cost_breakdown(), entry[0], self.order
+        surcharges = tuple((decorator.NAME or decorator.__name__, plan.surcharge(decorator, order))
+                           for decorator in self._decorators)
+        breakdown = CostBreakdown(base.base, base.adjustment, base.shipping, base.surcharges + surcharges, entry[3])
+        if self._cacheable:
+            self._breakdown = (entry, breakdown)
+        return breakdown
+
+    __getattr__ = _forward_getattr
+
+
+def _is_flat(component: OrderComponent) -> bool:
+    """
+    Bileşenin düzleştirilmiş maliyet/açıklama hesabını kullanıp kullanmadığını döndürür.
+    """
+    cls = type(component)
+    return (isinstance(component, OrderDecorator)
+            and cls.get_total_cost is OrderDecorator.get_total_cost
+            and cls.get_description is OrderDecorator.get_description)
+
+
+class FragileDecorator(OrderDecorator):
+    """
+    Siparişin kırılabilir etiketli olduğunu belirten dekoratör.
+    Maliyete ek ücret ekler.
+    """
+    NAME = "fragile"
+    SURCHARGE = 20 # 20 TL ek ücret
+    DESCRIPTION = " + Kırılabilir Etiketi"
+
+
+class InsuranceDecorator(OrderDecorator):
+    """
+    Siparişin sigortalı gönderim olduğunu belirten dekoratör.
+    Maliyete ek ücret ekler.
+    """
+    NAME = "insurance"
+    SURCHARGE = 35 # 35 TL ek ücret
+    DESCRIPTION = " + Sigortalı Gönderim"
+
+
+class GiftWrapDecorator(OrderDecorator):
+    """
+    Siparişin hediye paketi olduğunu belirten dekoratör.
+    Maliyete ek ücret ekler.
+    """
+    NAME = "gift_wrap"
+    SURCHARGE = 15 # 15 TL ek ücret
+    DESCRIPTION = " + Hediye Paketi"
+
+
+# Kısa adların dekoratör sınıfı karşılıkları
+DECORATORS = {cls.NAME: cls for cls in (FragileDecorator, InsuranceDecorator, GiftWrapDecorator)}
+
+
+def decorator_names(component: OrderComponent) -> list:
+    """
+    Dekorasyon zincirindeki dekoratörlerin kısa adlarını uygulanma sırasıyla döndürür.
+    Kısa adı olmayan (NAME tanımlamayan) dekoratörler atlanır.
+    """
+    names = []
+    while isinstance(component, OrderDecorator):
+        if component.NAME:
+            names.append(component.NAME)
+        component = component.component
+    names.reverse()
+    return names
\ No newline at end of file
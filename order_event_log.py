@@ -0,0 +1,564 @@
+# order_event_log.py
+"""
+Sipariş olaylarını (müşteri kaydı, sipariş oluşturma, dekoratör uygulama, durum değişikliği)
+yalnızca sona eklenen ikili bir günlüğe yazar; çökme sonrasında son anlık görüntü (snapshot)
+ve günlüğün kalan kısmı yeniden oynatılarak müşteriler, siparişler ve sipariş geçmişleri
+geri kurulur.
+
+Dizin yapısı:
+    orders.log                          8 baytlık başlık (MAGIC) ve ardışık kayıtlar
+    snapshot-<günlük konumu>.pickle     Günlüğün o konumuna kadarki durum
+
+Kayıt biçimi: <crc32: u32><yük uzunluğu: u32><olay türü: u8><yük>
+CRC, uzunluk ve olay türü alanlarını da kapsar; bozuk bir uzunluk alanı da CRC ile yakalanır.
+Açılışta bozuk (yarım kalmış veya CRC'si tutmayan) bir kayıttan sonra geçerli bir kayıt
+yoksa bu kayıt yazma sırasında yarım kalmış kabul edilir ve günlük oradan kesilir; arkasında
+geçerli kayıt bulunan bozulmalar ValueError fırlatır. Eski biçimdeki (OEVLOG01: CRC yalnızca
+yükü kapsar) günlükler açılışta aynı konumlarla yeni biçime dönüştürülür.
+
+Olaylar önce bellekteki tampona yazılır ve group_commit_size olaya ulaşıldığında ya da
+ilk bekleyen olaydan bu yana group_commit_interval saniye geçtiğinde tek bir write + fsync
+ile diske indirilir (group commit). snapshot_every olayda bir anlık görüntü alınır.
+
+Kullanım:
+    event_log = OrderEventLog("data/events")
+    customers, orders = event_log.state.materialize(inventory)
+    event_log.attach() # Durum değişiklikleri global gözlemci olarak kaydedilir
+    event_log.record_customer(customer)
+    event_log.record_order(order_component)
+    ...
+    event_log.close()
+"""
+import gc
+import json
+import os
+import pickle
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from customer import Customer
+from observer import Observer
+from order import Order, OrderStatus
+from order_decorator import OrderComponent, decorator_names
+from order_factory import OrderFactory
+from order_subject import OrderSubject
+from shipping_registry import ShippingRegistry
+
+if TYPE_CHECKING:
+    from inventorymanager import InventoryManager
+
+MAGIC = b"OEVLOG02"
+HEADER = struct.Struct("<IIB") # crc32, yük uzunluğu, olay türü
+_CRC = struct.Struct("<I")
+_CRC_SIZE = _CRC.size # CRC, kaydın bu bayttan sonraki kısmını (uzunluk, olay türü, yük) kapsar
+_BODY_HEADER = struct.Struct("<IB") # yük uzunluğu, olay türü
+LEGACY_MAGIC = b"OEVLOG01"
+LEGACY_HEADER = struct.Struct("<IIB") # yük uzunluğu, yükün crc32'si, olay türü
+
+# Olay türleri
+CUSTOMER_CREATED = 1
+ORDER_CREATED = 2
+DECORATOR_APPLIED = 3
+STATUS_CHANGED = 4
+
+# Durum değişikliği kayıtlarında durum tek baytlık kodla tutulur.
+# Kodlar OrderStatus'taki sıradan gelir; yeni durumlar enum'un yalnızca sonuna eklenmelidir.
+STATUSES = tuple(OrderStatus)
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+# json.loads'un bayt girdisinde yaptığı kodlama tespitini atlamak için yükler önce str'ye çevrilir
+_decode_json = json.JSONDecoder().decode
+
+# EventLogState.orders kayıtlarındaki alanların konumları
+_STATUS = 4
+_DECORATORS = 6
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Çok sayıda uzun ömürlü nesne oluşturulurken çöp toplayıcıyı duraklatır.
+    Aksi halde yüz binlerce liste/nesne oluşturulurken tekrar tekrar çalışıp süreyi katlar.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class EventLogState:
+    """
+    Olayların uygulanmasıyla oluşan, nesne içermeyen sipariş durumu.
+    Anlık görüntü olarak doğrudan saklanır; materialize ile Customer ve Order nesnelerine dönüştürülür.
+    """
+    def __init__(self):
+        self.customers: Dict[str, Tuple[str, str]] = {} # {customer_id: (ad, e-posta)}
+        # {order_id: [customer_id, order_type, [(product_id, adet)], total, OrderStatus, kargo anahtarı,
+        #             [dekoratör adları], expected_delivery_date, gift_note]}
+        self.orders: Dict[str, list] = {}
+        self.events = 0 # Bu duruma uygulanmış toplam olay sayısı
+
+    def apply(self, event_type: int, payload: bytes):
+        """
+        Tek bir olayı duruma uygular. Bilinmeyen siparişlere ait olaylar yok sayılır.
+        """
+        if event_type == STATUS_CHANGED:
+            record = self.orders.get(payload[1:].decode())
+            if record is not None:
+                record[_STATUS] = STATUSES[payload[0]]
+        elif event_type == ORDER_CREATED:
+            order_id, customer_id, order_type, lines, total, status, shipping, expected_delivery_date, gift_note = \
+                _decode_json(payload.decode())
+            self.orders[order_id] = [customer_id, order_type, lines, total, OrderStatus[status], shipping, [],
+                                     expected_delivery_date, gift_note]
+        elif event_type == DECORATOR_APPLIED:
+            order_id, name = payload.decode().split("\0")
+            record = self.orders.get(order_id)
+            if record is not None:
+                record[_DECORATORS].append(name)
+        elif event_type == CUSTOMER_CREATED:
+            customer_id, name, email = _decode_json(payload.decode())
+            self.customers[customer_id] = (name, email)
+        else:
+            raise ValueError(f"Bilinmeyen olay türü: {event_type}")
+        self.events += 1
+
+    def materialize(self, inventory: "InventoryManager",
+                    customers: Iterable[Customer] = ()) -> Tuple[List[Customer], List[OrderComponent]]:
+        """
+        Durumdan Customer ve sipariş nesnelerini kurar, siparişleri müşterilerin geçmişlerine ekler
+        ve dekoratörleri yeniden uygular. Siparişin kayıtlı toplamı korunur; durum, gözlemcilere
+        bildirim gönderilmeden geri yüklenir.
+
+        Args:
+            inventory: Sipariş satırlarındaki ürünlerin okunacağı envanter.
+            customers: Zaten oluşturulmuş müşteriler; aynı ID'li kayıtlar için yenisi oluşturulmaz.
+
+        Returns:
+            (yeni oluşturulan müşteriler, kayıt sırasıyla sipariş bileşenleri)
+        """
+        with _gc_paused():
+            return self._materialize(inventory, customers)
+
+    def _materialize(self, inventory: "InventoryManager",
+                     customers: Iterable[Customer]) -> Tuple[List[Customer], List[OrderComponent]]:
+        customers_by_id = {customer.customer_id: customer for customer in customers}
+        created: List[Customer] = []
+        for customer_id, (name, email) in self.customers.items():
+            if customer_id not in customers_by_id:
+                customer = Customer(customer_id, name, email)
+                customers_by_id[customer_id] = customer
+                created.append(customer)
+
+        components: List[OrderComponent] = []
+        for order_id, (customer_id, order_type, lines, total, status, shipping, decorators,
+                       expected_delivery_date, gift_note) in self.orders.items():
+            component = OrderFactory.restore_component(order_id, customers_by_id, customer_id, order_type, lines,
+                                                       inventory, total, status, shipping, decorators,
+                                                       expected_delivery_date, gift_note)
+            if component is not None:
+                components.append(component)
+        return created, components
+
+
+class ReplayStats:
+    """
+    Açılışta yapılan yeniden oynatmanın özeti.
+    """
+    def __init__(self, snapshot: Optional[str], snapshot_events: int, snapshot_seconds: float,
+                 events: int, seconds: float, truncated_bytes: int):
+        self.snapshot = snapshot # Kullanılan anlık görüntü dosyası (yoksa None)
+        self.snapshot_events = snapshot_events # Anlık görüntüdeki olay sayısı
+        self.snapshot_seconds = snapshot_seconds # Anlık görüntünün yüklenme süresi
+        self.events = events # Günlükten yeniden oynatılan olay sayısı
+        self.seconds = seconds # Günlüğün okunma ve oynatılma süresi
+        self.truncated_bytes = truncated_bytes # Yarım kalmış kayıt nedeniyle kesilen bayt
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.seconds if self.seconds else 0.0
+
+    def display(self):
+        source = os.path.basename(self.snapshot) if self.snapshot else "yok"
+        print(f"Olay günlüğü: anlık görüntü {source} ({self.snapshot_events} olay, {self.snapshot_seconds:.3f} sn), "
+              f"günlükten {self.events} olay {self.seconds:.3f} sn içinde oynatıldı "
+              f"({self.events_per_second:,.0f} olay/sn).")
+        if self.truncated_bytes:
+            print(f"Uyarı: Günlüğün sonundaki {self.truncated_bytes} baytlık yarım kayıt atıldı.")
+
+
+def _encode_record(event_type: int, payload: bytes) -> bytes:
+    """
+    Kaydı başlığıyla birlikte kodlar; CRC uzunluk, olay türü ve yükü kapsar.
+    """
+    body = _BODY_HEADER.pack(len(payload), event_type) + payload
+    return _CRC.pack(zlib.crc32(body)) + body
+
+
+def _find_valid_record(data: bytes, start: int) -> Optional[int]:
+    """
+    data içinde start konumundan itibaren CRC'si tutan ve data'ya sığan ilk kaydın konumunu
+    döndürür; yoksa None. Bozuk bir kaydın günlüğün sonu mu yoksa ortası mı olduğunu ayırt
+    etmek için kullanılır.
+    """
+    unpack_from, header_size, crc32, view = HEADER.unpack_from, HEADER.size, zlib.crc32, memoryview(data)
+    size = len(data)
+    for position in range(start, size - header_size + 1):
+        crc, length, _ = unpack_from(data, position)
+        end = position + header_size + length
+        if end <= size and crc32(view[position + _CRC_SIZE:end]) == crc:
+            return position
+    return None
+
+
+def _replay_into(state: EventLogState, data: bytes, base_offset: int = 0) -> Tuple[int, int]:
+    """
+    data içindeki kayıtları sırayla duruma uygular. base_offset, data'nın günlükteki
+    başlangıç konumudur ve yalnızca hata mesajlarında kullanılır.
+    Geçerli son kaydın bittiği konumu ve uygulanan olay sayısını döndürür.
+
+    Bozuk bir kayıttan (sığmayan uzunluk veya tutmayan CRC) sonra geçerli kayıt yoksa kayıt
+    yazma sırasında yarım kalmıştır ve oynatma orada durur; arkasında geçerli bir kayıt
+    bulunan bozulmalar (günlüğün ortasında) ValueError fırlatır.
+    """
+    unpack_from, header_size, crc32, apply = HEADER.unpack_from, HEADER.size, zlib.crc32, state.apply
+    view = memoryview(data)
+    size = len(data)
+    position = count = 0
+    while position + header_size <= size:
+        crc, length, event_type = unpack_from(data, position)
+        start = position + header_size
+        end = start + length
+        if end > size or crc32(view[position + _CRC_SIZE:end]) != crc:
+            if _find_valid_record(data, position + 1) is None:
+                break
+            raise ValueError(f"Olay günlüğü {base_offset + position}. baytta bozuk "
+                             f"(CRC uyuşmuyor); arkasında geçerli kayıtlar var.")
+        try:
+            apply(event_type, data[start:end])
+        except (ValueError, KeyError, IndexError, UnicodeDecodeError) as e:
+            raise ValueError(f"Olay günlüğündeki {base_offset + position}. bayttaki kayıt okunamadı: {e}")
+        position = end
+        count += 1
+    return position, count
+
+
+def _convert_legacy(data: bytes) -> bytes:
+    """
+    OEVLOG01 biçimindeki günlüğü yeni biçime dönüştürür. Kayıt boyutları değişmediğinden
+    konumlar (ve anlık görüntülerin günlük konumları) aynı kalır. Eski biçimin kuralı
+    korunur: yalnızca son kayıt yarım kalmış veya CRC'si tutmuyorsa atılır.
+    """
+    unpack_from, header_size = LEGACY_HEADER.unpack_from, LEGACY_HEADER.size
+    converted = bytearray(MAGIC)
+    size = len(data)
+    position = len(LEGACY_MAGIC)
+    while position + header_size <= size:
+        length, crc, event_type = unpack_from(data, position)
+        start = position + header_size
+        end = start + length
+        if end > size:
+            break
+        payload = data[start:end]
+        if zlib.crc32(payload) != crc:
+            if end == size:
+                break
+            raise ValueError(f"Olay günlüğü {position}. baytta bozuk (CRC uyuşmuyor).")
+        converted += _encode_record(event_type, payload)
+        position = end
+    return bytes(converted)
+
+
+class OrderEventLog(Observer):
+    """
+    Sipariş olaylarını group commit ile diske yazan, anlık görüntü alan ve açılışta
+    durumu yeniden kuran olay günlüğü.
+
+    Açılışta en yeni okunabilir anlık görüntü yüklenir ve günlüğün o konumdan sonrası
+    oynatılır; sonuç state özniteliğinde tutulur ve yeni olaylarla güncel kalır.
+    attach() ile tüm siparişlerin global gözlemcisi olur ve Order.update_status
+    çağrılarını kendiliğinden kaydeder.
+    """
+    ASYNC_DELIVERY = False # Durum değişikliği, değişiklikle aynı sırada günlüğe girmelidir
+
+    def __init__(self, directory: str, group_commit_size: int = 256, group_commit_interval: float = 0.05,
+                 snapshot_every: int = 10000, keep_snapshots: int = 2):
+        """
+        Args:
+            directory: Günlük ve anlık görüntülerin tutulacağı dizin.
+            group_commit_size: Bu kadar olay biriktiğinde tampon diske yazılır.
+            group_commit_interval: Bekleyen olaylar en fazla bu kadar saniye sonra diske yazılır (0: yalnızca boyut/flush).
+            snapshot_every: Bu kadar olayda bir anlık görüntü alınır (0: otomatik alınmaz).
+            keep_snapshots: Saklanacak en yeni anlık görüntü sayısı.
+        """
+        if group_commit_size <= 0 or keep_snapshots <= 0:
+            raise ValueError("group_commit_size ve keep_snapshots 0'dan büyük olmalıdır.")
+        if group_commit_interval < 0 or snapshot_every < 0:
+            raise ValueError("group_commit_interval ve snapshot_every negatif olamaz.")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.path = os.path.join(directory, "orders.log")
+        self.group_commit_size = group_commit_size
+        self.group_commit_interval = group_commit_interval
+        self.snapshot_every = snapshot_every
+        self.keep_snapshots = keep_snapshots
+
+        self.events_appended = 0
+        self.fsyncs = 0
+        self.bytes_written = 0
+        self.snapshots_taken = 0
+
+        self._lock = threading.RLock()
+        self._buffer = bytearray()
+        self._pending = 0
+        self._first_pending = 0.0
+        self.state, self.replay_stats = self._recover()
+        self._events_since_snapshot = self.replay_stats.events
+        self._file = open(self.path, "ab")
+
+        self._stop = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if group_commit_interval > 0:
+            self._flusher = threading.Thread(target=self._flush_loop, name="order-event-log-flusher", daemon=True)
+            self._flusher.start()
+
+    # --- Açılış ve yeniden oynatma ---
+
+    def _snapshot_paths(self) -> List[str]:
+        names = sorted(name for name in os.listdir(self.directory)
+                       if name.startswith("snapshot-") and name.endswith(".pickle"))
+        return [os.path.join(self.directory, name) for name in names]
+
+    def _recover(self) -> Tuple[EventLogState, ReplayStats]:
+        """
+        En yeni okunabilir anlık görüntüyü yükler, günlüğün kalanını oynatır ve
+        yarım kalmış son kaydı keser.
+        """
+        with _gc_paused():
+            return self._load()
+
+    def _load(self) -> Tuple[EventLogState, ReplayStats]:
+        start_time = time.perf_counter()
+        if not os.path.exists(self.path):
+            with open(self.path, "wb") as f:
+                f.write(MAGIC)
+                f.flush()
+                os.fsync(f.fileno())
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+        if data[:len(LEGACY_MAGIC)] == LEGACY_MAGIC:
+            data = self._replace_log(_convert_legacy(data))
+        if data[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"'{self.path}' bir sipariş olay günlüğü değil.")
+
+        state, offset, snapshot = EventLogState(), len(MAGIC), None
+        for path in reversed(self._snapshot_paths()):
+            try:
+                with open(path, "rb") as f:
+                    snapshot_offset, snapshot_state = pickle.load(f)
+            except (OSError, EOFError, pickle.UnpicklingError, ValueError) as e:
+                print(f"Uyarı: Anlık görüntü okunamadı ({path}): {e}")
+                continue
+            if snapshot_offset > len(data):
+                print(f"Uyarı: Anlık görüntü ({path}) günlükten daha yeni; atlandı.")
+                continue
+            state, offset, snapshot = snapshot_state, snapshot_offset, path
+            break
+        snapshot_events = state.events
+        replay_start = time.perf_counter()
+
+        end, count = _replay_into(state, data[offset:], offset)
+        truncated = len(data) - offset - end
+        if truncated:
+            with open(self.path, "r+b") as f:
+                f.truncate(offset + end)
+                os.fsync(f.fileno())
+        end_time = time.perf_counter()
+        return state, ReplayStats(snapshot, snapshot_events, replay_start - start_time, count,
+                                  end_time - replay_start, truncated)
+
+    def _replace_log(self, data: bytes) -> bytes:
+        """
+        Günlüğü data ile atomik olarak değiştirir (eski biçimden dönüştürme).
+        """
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        return data
+
+    # --- Olay kaydı ---
+
+    def _append(self, event_type: int, payload: bytes):
+        """
+        Olayı duruma uygular ve yazılmak üzere tampona ekler. Çağıran kilidi tutmalıdır.
+        Olay, yeniden oynatmayla aynı apply yolundan geçer; böylece canlı durum ve
+        yeniden kurulan durum birbirinden ayrışamaz.
+        """
+        self.state.apply(event_type, payload)
+        self._buffer += _encode_record(event_type, payload)
+        self.events_appended += 1
+        self._pending += 1
+        if self._pending == 1:
+            self._first_pending = time.monotonic()
+        if self._pending >= self.group_commit_size:
+            self._flush_locked()
+
+    def record_customer(self, customer: Customer):
+        """
+        Müşteri kaydını günlüğe ekler. Daha önce kaydedilmiş müşteriler yok sayılır.
+        """
+        with self._lock:
+            if customer.customer_id in self.state.customers:
+                return
+            payload = json.dumps([customer.customer_id, customer.name, customer.email],
+                                 ensure_ascii=False, separators=(",", ":")).encode()
+            self._append(CUSTOMER_CREATED, payload)
+
+    def record_order(self, component: OrderComponent | Order):
+        """
+        Sipariş oluşturma ve uygulanmış dekoratörleri günlüğe ekler.
+        Müşteri henüz kaydedilmemişse önce müşteri kaydı eklenir. Kayıtlı siparişler yok sayılır.
+        """
+        if isinstance(component, OrderComponent):
+            order, decorators = component.order, decorator_names(component)
+        else:
+            order, decorators = component, []
+        strategy = order.shipping_strategy
+        with self._lock:
+            if order.order_id in self.state.orders:
+                return
+            OrderFactory.check_restorable(order)
+            self.record_customer(order.customer)
+            payload = json.dumps([
+                order.order_id, order.customer.customer_id, order.get_type(),
+                [(product.product_id, quantity) for product, quantity in order.products], order.total,
+                order.status.name, ShippingRegistry.get_instance().key_of(strategy) if strategy is not None else None,
+                getattr(order, "expected_delivery_date", None), getattr(order, "gift_note", None),
+            ], ensure_ascii=False, separators=(",", ":")).encode()
+            self._append(ORDER_CREATED, payload)
+            for name in decorators:
+                self._append(DECORATOR_APPLIED, f"{order.order_id}\0{name}".encode())
+
+    def record_orders(self, components: Iterable[OrderComponent | Order]):
+        with self._lock:
+            for component in components:
+                self.record_order(component)
+
+    def record_status(self, order: Order):
+        """
+        Siparişin güncel durumunu günlüğe ekler. Günlükte olmayan siparişler ve
+        değişmemiş durumlar yok sayılır.
+        """
+        self.record_statuses((order,))
+
+    def record_statuses(self, orders: Iterable[Order]):
+        """
+        Birden fazla siparişin durumunu tek kilit altında günlüğe ekler.
+        """
+        with self._lock:
+            records = self.state.orders
+            for order in orders:
+                record = records.get(order.order_id)
+                if record is None or record[_STATUS] is order.status:
+                    continue
+                self._append(STATUS_CHANGED, bytes((STATUS_CODES[order.status],)) + order.order_id.encode())
+
+    def update(self, order: Order):
+        """
+        Observer arayüzü: Order.update_status çağrılarını günlüğe ekler.
+        """
+        self.record_status(order)
+
+    def update_many(self, orders: List[Order]):
+        """
+        Observer arayüzü: Order.bulk_update_status ile değişen durumları günlüğe ekler.
+        """
+        self.record_statuses(orders)
+
+    def attach(self):
+        OrderSubject.attach_global(self)
+
+    def detach(self):
+        OrderSubject.detach_global(self)
+
+    # --- Diske yazma ve anlık görüntü ---
+
+    def _flush_locked(self):
+        if not self._buffer:
+            return
+        self._file.write(self._buffer)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.fsyncs += 1
+        self.bytes_written += len(self._buffer)
+        self._buffer = bytearray()
+        self._events_since_snapshot += self._pending
+        self._pending = 0
+        if self.snapshot_every and self._events_since_snapshot >= self.snapshot_every:
+            self._snapshot_locked()
+
+    def _flush_loop(self):
+        while not self._stop.wait(self.group_commit_interval):
+            with self._lock:
+                if self._pending and time.monotonic() - self._first_pending >= self.group_commit_interval:
+                    self._flush_locked()
+
+    def flush(self):
+        """
+        Bekleyen olayları diske yazar ve fsync ile kalıcı hale getirir.
+        """
+        with self._lock:
+            self._flush_locked()
+
+    def _snapshot_locked(self):
+        offset = self._file.tell()
+        path = os.path.join(self.directory, f"snapshot-{offset:020d}.pickle")
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump((offset, self.state), f, protocol=pickle.HIGHEST_PROTOCOL)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        self.snapshots_taken += 1
+        self._events_since_snapshot = 0
+        for old_path in self._snapshot_paths()[:-self.keep_snapshots]:
+            os.remove(old_path)
+
+    def snapshot(self):
+        """
+        Bekleyen olayları yazar ve günlüğün geçerli konumu için anlık görüntü alır.
+        """
+        with self._lock:
+            self._flush_locked()
+            self._snapshot_locked()
+
+    def close(self):
+        """
+        Arka plan yazıcısını durdurur, bekleyen olayları yazar ve günlüğü kapatır.
+        """
+        self._stop.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+        self.detach()
+        with self._lock:
+            if not self._file.closed:
+                self._flush_locked()
+                self._file.close()
+
+    def __enter__(self) -> "OrderEventLog":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
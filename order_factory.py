@@ -1,59 +1,305 @@
-# order_factory.py
-import uuid  # UUID modülünü import et
-from typing import List, Tuple, Any
-from order import Order, ExpressOrder, SubscriptionOrder, PreOrder, GiftOrder, BulkOrder
-from product import Product  # Used for type hinting for products in product_data
-from customer import Customer  # Used for type hinting for customer
-
-
-class OrderFactory:
-    """
-    Sipariş nesneleri oluşturmak için Factory Method deseni uygular.
-    Farklı sipariş türlerini (standart, ekspres, abonelik vb.) soyutlar.
-    """
-
-    # _order_counter = 1 # Benzersiz sipariş ID'leri için sayaç (artık UUID kullanılacak)
-
-    @staticmethod
-    def create_order(order_type: str, customer: Customer, product_data: List[Tuple[Product, int]], **kwargs) -> Order:
-        """
-        Belirtilen türe göre bir sipariş nesnesi oluşturur.
-
-        Args:
-            order_type (str): Oluşturulacak siparişin türü (standard, express, subscription, preorder, gift, bulk).
-            customer (Customer): Siparişi veren müşteri nesnesi.
-            product_data (List[Tuple[Product, int]]): (ürün, adet) tuple'larından oluşan liste.
-            **kwargs: Sipariş türüne özgü ek argümanlar (örn. expected_delivery_date, gift_note).
-
-        Returns:
-            Order: Oluşturulan sipariş nesnesi.
-
-        Raises:
-            ValueError: Geçersiz bir sipariş türü belirtildiğinde.
-        """
-        # Benzersiz sipariş ID'si üretimi için UUID kullanıldı
-        order_id = str(uuid.uuid4())
-
-        if order_type == "standard":
-            order = Order(order_id, customer, product_data)
-        elif order_type == "express":
-            order = ExpressOrder(order_id, customer, product_data)
-        elif order_type == "subscription":
-            order = SubscriptionOrder(order_id, customer, product_data)
-        elif order_type == "preorder":
-            expected_delivery_date = kwargs.get("expected_delivery_date")
-            if not expected_delivery_date:
-                raise ValueError("Ön sipariş için tahmini teslim tarihi belirtilmelidir.")
-            order = PreOrder(order_id, customer, product_data, expected_delivery_date)
-        elif order_type == "gift":
-            gift_note = kwargs.get("gift_note", "")
-            order = GiftOrder(order_id, customer, product_data, gift_note)
-        elif order_type == "bulk":
-            order = BulkOrder(order_id, customer, product_data)
-        else:
-            raise ValueError(
-                f"Geçersiz sipariş türü: '{order_type}'. Desteklenen türler: standard, express, subscription, preorder, gift, bulk.")
-
-        # Müşteriye siparişin orijinal halini ekle (Observer deseni için de gerekli)
-        customer.add_order(order)
-        return order
\ No newline at end of file
+# order_factory.py
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Any, TYPE_CHECKING
+from order import Order, OrderStatus, ExpressOrder, SubscriptionOrder, PreOrder, GiftOrder, BulkOrder
+from order_decorator import BaseOrder, DECORATORS, OrderComponent
+from order_ids import IdGenerator, UUIDGenerator
+from product import Product  # Used for type hinting for products in product_data
+from customer import Customer  # Used for type hinting for customer
+from shipping_registry import ShippingRegistry
+import metrics
+
+if TYPE_CHECKING:
+    from inventorymanager import InventoryManager
+
+# Sipariş oluşturucu: (order_id, customer, product_data, seçenekler) -> Order
+OrderBuilder = Callable[[str, Customer, List[Tuple[Product, int]], Dict[str, Any]], Order]
+# create_orders_many için tek sipariş: (sipariş türü, müşteri, (ürün, adet) listesi, seçenekler)
+OrderSpec = Tuple[str, Customer, List[Tuple[Product, int]], Dict[str, Any]]
+
+_CREATE_SECONDS = metrics.MetricsRegistry.get_instance().timer(
+    "order_create_seconds", "OrderFactory.create_order süresi (sipariş türüne göre)", ("order_type",))
+_CREATE_ERRORS = metrics.MetricsRegistry.get_instance().counter(
+    "order_create_errors_total", "Hata ile sonuçlanan OrderFactory.create_order çağrıları", ("order_type",))
+_CREATE_MANY_SECONDS = metrics.MetricsRegistry.get_instance().timer(
+    "order_create_many_seconds", "OrderFactory.create_orders_many çağrısının toplam süresi").labels()
+
+
+class OrderFactory:
+    """
+    Sipariş nesneleri oluşturmak için Factory Method deseni uygular.
+    Farklı sipariş türlerini (standart, ekspres, abonelik vb.) soyutlar.
+
+    Sipariş türleri bir kayıt tablosunda tutulur; yeni türler fabrikayı değiştirmeden
+    register_order_type ile eklenir. Sipariş ID'leri ayarlanabilir bir üreteçten gelir
+    (bkz. order_ids, set_id_generator).
+
+    Kaydedilen türlerin sınıfları get_type() değerleriyle ayrıca tutulur; veritabanı ve olay
+    günlüğü siparişleri bu tablo üzerinden geri yükler (bkz. restore_order).
+    """
+
+    # Oluşturulan her siparişte order_created(order) ile haberdar edilen dinleyiciler (örn. satış toplamları)
+    _listeners: Dict[Any, None] = {}
+    _order_types: Dict[str, OrderBuilder] = {} # {sipariş türü: oluşturucu}
+    _order_classes: Dict[str, type] = {} # {Order.get_type() değeri: sipariş sınıfı}
+    _next_id: IdGenerator = UUIDGenerator()
+
+    @classmethod
+    def add_listener(cls, listener):
+        """
+        Dinleyiciyi yeni oluşturulan siparişlere abone eder. Dinleyici order_created(order) metodunu sağlamalıdır;
+        isteğe bağlı orders_created(orders) metodu create_orders_many'de tüm grup için bir kez çağrılır.
+        """
+        cls._listeners[listener] = None
+
+    @classmethod
+    def remove_listener(cls, listener):
+        """
+        Dinleyicinin aboneliğini kaldırır.
+        """
+        cls._listeners.pop(listener, None)
+
+    @classmethod
+    def register_order_type(cls, order_type: str, factory: "type | OrderBuilder", order_class: Optional[type] = None):
+        """
+        Sipariş türünü kaydeder; aynı adla kayıtlı bir tür varsa yerini alır.
+
+        Args:
+            order_type (str): create_order'a verilecek tür adı (örn. "gift").
+            factory: Order alt sınıfı (order_id, customer, product_data ile oluşturulur) veya
+                türe özgü seçenekleri (**kwargs) okuyan bir oluşturucu:
+                builder(order_id, customer, product_data, options) -> Order.
+            order_class: factory bir oluşturucuysa ürettiği Order alt sınıfı. Verilmezse bu
+                türdeki siparişler kaydedilemez ve geri yüklenemez.
+        """
+        if not order_type:
+            raise ValueError("Sipariş türü adı boş olamaz.")
+        if isinstance(factory, type):
+            order_class = factory
+            factory = lambda order_id, customer, product_data, options: order_class(order_id, customer, product_data)
+        if order_class is not None:
+            if not (isinstance(order_class, type) and issubclass(order_class, Order)):
+                raise ValueError(f"'{getattr(order_class, '__name__', order_class)}' bir Order alt sınıfı değil.")
+            # get_type() sınıfa özgü sabit bir değer döndürür; örnek durumu gerekmez
+            cls._order_classes[order_class.get_type(object.__new__(order_class))] = order_class
+        cls._order_types[order_type] = factory
+
+    @classmethod
+    def unregister_order_type(cls, order_type: str):
+        cls._order_types.pop(order_type, None)
+
+    @classmethod
+    def order_types(cls) -> List[str]:
+        return list(cls._order_types)
+
+    @classmethod
+    def order_class(cls, type_name: str) -> Optional[type]:
+        """
+        get_type() değeri type_name olan kayıtlı sipariş sınıfını döndürür. Yoksa None döner.
+        """
+        return cls._order_classes.get(type_name)
+
+    @classmethod
+    def type_names(cls) -> List[str]:
+        """
+        Kayıtlı sipariş sınıflarının get_type() değerleri, kayıt sırasıyla.
+        """
+        return list(cls._order_classes)
+
+    @classmethod
+    def check_restorable(cls, order: Order):
+        """
+        Siparişin türü kayıtlı değilse (geri yüklenemeyecekse) ValueError fırlatır.
+        Veritabanı ve olay günlüğü siparişi kaydetmeden önce çağırır.
+        """
+        type_name = order.get_type()
+        if cls._order_classes.get(type_name) is not type(order):
+            raise ValueError(f"'{type_name}' türündeki sipariş ({type(order).__name__}) kaydedilemez; "
+                             f"sınıf register_order_type ile kaydedilmemiş.")
+
+    @classmethod
+    def restore_order(cls, type_name: str, order_id: str, customer: Customer, product_data: List[Tuple[Product, int]],
+                      expected_delivery_date: Optional[str] = None, gift_note: Optional[str] = None) -> Order:
+        """
+        Kaydedilmiş siparişi, get_type() değerine karşılık gelen sınıfla yeniden oluşturur.
+        Sipariş müşteriye eklenmez ve dinleyicilere bildirilmez.
+        Tür kayıtlı değilse veya sınıf oluşturulamazsa ValueError fırlatır.
+        """
+        order_class = cls._order_classes.get(type_name)
+        if order_class is None:
+            raise ValueError(f"Kayıtlı olmayan sipariş türü: '{type_name}'.")
+        try:
+            if issubclass(order_class, PreOrder):
+                return order_class(order_id, customer, product_data, expected_delivery_date)
+            if issubclass(order_class, GiftOrder):
+                return order_class(order_id, customer, product_data, gift_note)
+            return order_class(order_id, customer, product_data)
+        except TypeError as e:
+            raise ValueError(f"'{type_name}' türündeki sipariş yeniden oluşturulamadı: {e}")
+
+    @classmethod
+    def restore_component(cls, order_id: str, customers: Dict[str, Customer], customer_id: str, type_name: str,
+                          lines: Iterable[Tuple[int, int]], inventory: "InventoryManager", total: float,
+                          status: OrderStatus, shipping: Optional[str], decorators: Iterable[str],
+                          expected_delivery_date: Optional[str] = None,
+                          gift_note: Optional[str] = None) -> Optional[OrderComponent]:
+        """
+        Veritabanı ve olay günlüğünün ortak geri yükleme adımı: siparişi restore_order ile
+        oluşturur, kayıtlı toplamı ve durumu bildirim göndermeden geri yükler, kargo firmasını
+        atar, siparişi müşteriye ekler ve dekoratörleri kayıt sırasıyla yeniden uygular.
+
+        customers {customer_id: müşteri} tablosudur. Müşteri yoksa veya tür geri yüklenemiyorsa uyarı yazdırılır ve None döner. Envanterde
+        bulunmayan ürünlerin satırları ve kayıtlı olmayan kargo firmaları uyarıyla atlanır.
+        """
+        customer = customers.get(customer_id)
+        if customer is None:
+            print(f"Uyarı: Sipariş {order_id} atlandı; müşteri {customer_id} bulunamadı.")
+            return None
+        products = []
+        for product_id, quantity in lines:
+            product = inventory.get_product(product_id)
+            if product is None:
+                print(f"Uyarı: Sipariş {order_id} içindeki ürün {product_id} envanterde bulunamadı.")
+                continue
+            products.append((product, quantity))
+
+        try:
+            order = cls.restore_order(type_name, order_id, customer, products, expected_delivery_date, gift_note)
+        except ValueError as e:
+            print(f"Uyarı: Sipariş {order_id} atlandı; {e}")
+            return None
+        order.total = total
+        order.status = status
+        if shipping:
+            strategy = ShippingRegistry.get_instance().get_carrier(shipping)
+            if strategy is not None:
+                order.set_shipping_strategy(strategy)
+            else:
+                print(f"Uyarı: Sipariş {order_id} için kayıtlı olmayan kargo firması '{shipping}'; kargo atanmadı.")
+        customer.add_order(order)
+
+        component: OrderComponent = BaseOrder(order)
+        for name in decorators:
+            component = DECORATORS[name](component)
+        return component
+
+    @classmethod
+    def set_id_generator(cls, generator: Callable[[], str]):
+        """
+        Yeni siparişlerin ID üretecini ayarlar (bkz. order_ids.make_id_generator).
+        """
+        cls._next_id = generator
+
+    @classmethod
+    def _unknown_type(cls, order_type: str) -> ValueError:
+        return ValueError(f"Geçersiz sipariş türü: '{order_type}'. Desteklenen türler: {', '.join(cls._order_types)}.")
+
+    @staticmethod
+    def create_order(order_type: str, customer: Customer, product_data: List[Tuple[Product, int]], **kwargs) -> Order:
+        """
+        Belirtilen türe göre bir sipariş nesnesi oluşturur.
+
+        Args:
+            order_type (str): Oluşturulacak siparişin türü (standard, express, subscription, preorder, gift, bulk
+                veya register_order_type ile eklenen bir tür).
+            customer (Customer): Siparişi veren müşteri nesnesi.
+            product_data (List[Tuple[Product, int]]): (ürün, adet) tuple'larından oluşan liste.
+            **kwargs: Sipariş türüne özgü ek argümanlar (örn. expected_delivery_date, gift_note).
+
+        Returns:
+            Order: Oluşturulan sipariş nesnesi.
+
+        Raises:
+            ValueError: Geçersiz bir sipariş türü belirtildiğinde.
+        """
+        start = time.perf_counter() if metrics.enabled else 0.0
+        try:
+            if metrics.profiler is None:
+                order = OrderFactory._build(order_type, customer, product_data, kwargs)
+            else: # Siparişlerin ayarlanan oranı cProfile altında oluşturulur
+                order = metrics.profiler.runcall(OrderFactory._build, order_type, customer, product_data, kwargs)
+        except ValueError:
+            if start:
+                _CREATE_ERRORS.labels(order_type if order_type in OrderFactory._order_types else "unknown").inc()
+            raise
+        if start:
+            _CREATE_SECONDS.labels(order_type).observe(time.perf_counter() - start)
+        return order
+
+    @staticmethod
+    def _build(order_type: str, customer: Customer, product_data: List[Tuple[Product, int]], kwargs: dict) -> Order:
+        """
+        create_order'ın ölçüm dışındaki asıl işi: siparişi oluşturur, müşteriye ekler ve dinleyicilere bildirir.
+        """
+        builder = OrderFactory._order_types.get(order_type)
+        if builder is None:
+            raise OrderFactory._unknown_type(order_type)
+        order = builder(OrderFactory._next_id(), customer, product_data, kwargs)
+
+        # Müşteriye siparişin orijinal halini ekle (Observer deseni için de gerekli)
+        customer.add_order(order)
+        for listener in OrderFactory._listeners:
+            listener.order_created(order)
+        return order
+
+    @staticmethod
+    def create_orders_many(specs: Iterable[OrderSpec]) -> List[Order]:
+        """
+        Birden çok siparişi tek çağrıda oluşturur.
+
+        Tür adları sipariş oluşturulmadan önce bir kez doğrulanır, ID'ler üreteçten toplu
+        alınır ve orders_created metodu olan dinleyiciler tüm grup için tek bildirim alır.
+        Siparişler müşterilere ve dinleyicilere ancak hepsi oluşturulduktan sonra eklenir;
+        bir sipariş hata verirse (örn. tarihsiz ön sipariş) hiçbiri eklenmez.
+
+        Args:
+            specs: (sipariş türü, müşteri, (ürün, adet) listesi, seçenekler) dörtlüleri;
+                seçenekler create_order'ın **kwargs'ı ile aynıdır.
+
+        Returns:
+            List[Order]: Oluşturulan siparişler, specs sırasıyla.
+        """
+        start = time.perf_counter() if metrics.enabled else 0.0
+        specs = list(specs)
+        builders = OrderFactory._order_types
+        for order_type in {spec[0] for spec in specs}:
+            if order_type not in builders:
+                raise OrderFactory._unknown_type(order_type)
+        next_id = OrderFactory._next_id
+        many = getattr(next_id, "many", None) # Düz fonksiyon üreteçlerde many bulunmayabilir
+        order_ids = many(len(specs)) if many is not None else [next_id() for _ in specs]
+        orders = [builders[order_type](order_id, customer, product_data, options)
+                  for order_id, (order_type, customer, product_data, options) in zip(order_ids, specs)]
+
+        for order in orders:
+            order.customer.add_order(order)
+        for listener in OrderFactory._listeners:
+            orders_created = getattr(listener, "orders_created", None)
+            if orders_created is not None:
+                orders_created(orders)
+            else:
+                for order in orders:
+                    listener.order_created(order)
+        if start:
+            _CREATE_MANY_SECONDS.observe(time.perf_counter() - start)
+        return orders
+
+
+def _build_preorder(order_id: str, customer: Customer, product_data: List[Tuple[Product, int]],
+                    options: Dict[str, Any]) -> PreOrder:
+    expected_delivery_date = options.get("expected_delivery_date")
+    if not expected_delivery_date:
+        raise ValueError("Ön sipariş için tahmini teslim tarihi belirtilmelidir.")
+    return PreOrder(order_id, customer, product_data, expected_delivery_date)
+
+
+def _build_gift(order_id: str, customer: Customer, product_data: List[Tuple[Product, int]],
+                options: Dict[str, Any]) -> GiftOrder:
+    return GiftOrder(order_id, customer, product_data, options.get("gift_note", ""))
+
+
+# Yerleşik sipariş türleri
+for _order_type, _factory, _order_class in (
+        ("standard", Order, None), ("express", ExpressOrder, None), ("subscription", SubscriptionOrder, None),
+        ("preorder", _build_preorder, PreOrder), ("gift", _build_gift, GiftOrder), ("bulk", BulkOrder, None)):
+    OrderFactory.register_order_type(_order_type, _factory, _order_class)
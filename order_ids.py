@@ -0,0 +1,187 @@
+# order_ids.py
+"""
+Sipariş ID üreteçleri. OrderFactory.set_id_generator ile dağıtıma göre seçilir.
+
+Üreteç, argümansız çağrıldığında yeni bir ID (str) döndüren herhangi bir nesnedir:
+    uuid     UUIDGenerator: rastgele UUID4 (varsayılan; önceki ID biçimi)
+    counter  CounterIdGenerator: "<düğüm>-<pid>.<başlangıç ms>-<sayaç>"; en hızlısı,
+             düğüm adı dağıtımdaki her makine için benzersiz olmalıdır
+    ulid     ULIDGenerator: 26 karakterlik ULID; oluşturulma zamanına göre sıralanır
+
+Süreç fork edildiğinde (örn. sharded_inventory işçileri) çocuk süreçteki üreteçler yeniden
+başlatılır; ana süreçle aynı ID'leri üretmezler.
+"""
+import itertools
+import os
+import threading
+import time
+import uuid
+import weakref
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+# Fork sonrası çocuk süreçte yeniden başlatılacak üreteçler
+_fork_sensitive: "weakref.WeakSet[IdGenerator]" = weakref.WeakSet()
+
+
+def _reset_after_fork():
+    for generator in list(_fork_sensitive):
+        generator._reset()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+class IdGenerator(ABC):
+    """
+    ID üreteçlerinin temel sınıfı.
+    """
+    NAME = ""
+
+    @abstractmethod
+    def __call__(self) -> str:
+        """
+        Yeni bir ID döndürür.
+        """
+        pass
+
+    def many(self, count: int) -> List[str]:
+        """
+        count adet yeni ID döndürür.
+        """
+        return [self() for _ in range(count)]
+
+    def _reset(self):
+        """
+        Fork sonrası çocuk süreçte çağrılır.
+        """
+
+
+class UUIDGenerator(IdGenerator):
+    NAME = "uuid"
+
+    def __call__(self) -> str:
+        return str(uuid.uuid4())
+
+
+class CounterIdGenerator(IdGenerator):
+    """
+    Düğüm öneki ve süreç içinde artan bir sayaçtan ID üretir.
+    Önek süreç ID'sini ve sürecin başlangıç zamanını (ms) içerir; böylece aynı düğümdeki
+    eşzamanlı süreçler ve yeniden başlatılan bir süreç aynı ID'yi üretmez.
+    """
+    NAME = "counter"
+
+    def __init__(self, node: Optional[str] = None):
+        if node is None:
+            import socket # Yalnızca düğüm adı verilmediğinde gerekir
+            # Makine adları sıkça '-' içerir; '-' ID'de ayraç olduğundan '_' ile değiştirilir
+            node = socket.gethostname().replace("-", "_") or "localhost"
+        elif not node or "-" in node:
+            raise ValueError("Düğüm adı boş olmamalı ve '-' içermemelidir.")
+        self.node = node
+        self._reset()
+        _fork_sensitive.add(self)
+
+    def _reset(self):
+        self._prefix = f"{self.node}-{os.getpid():x}.{time.time_ns() // 1_000_000:x}-"
+        self._next = itertools.count(1).__next__ # next() GIL altında atomiktir; kilit gerekmez
+
+    def __call__(self) -> str:
+        return f"{self._prefix}{self._next()}"
+
+    def many(self, count: int) -> List[str]:
+        prefix, next_value = self._prefix, self._next
+        return [f"{prefix}{next_value()}" for _ in range(count)]
+
+
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ" # ULID'nin kullandığı Crockford base32 alfabesi
+# 10 bitlik her değer için iki karakter; kodlama 5 bitlik gruplar yerine 10 bitlik gruplarla yapılır
+_PAIRS = [high + low for high in _CROCKFORD for low in _CROCKFORD]
+_TIME_SHIFTS = (40, 30, 20, 10, 0) # 48 bit zaman damgası -> 10 karakter
+_RANDOM_SHIFTS = (70, 60, 50, 40, 30, 20, 10, 0) # 80 bit rastgele kısım -> 16 karakter
+_HIGH_SHIFTS = (50, 40, 30, 20, 10, 0) # Rastgele kısmın üst 60 biti -> 12 karakter
+_RANDOM_BITS = 80
+_LOW_BITS = 20
+_LOW_MASK = (1 << _LOW_BITS) - 1
+_HIGH_MASK = (1 << (_RANDOM_BITS - _LOW_BITS)) - 1
+
+
+def _encode_bits(value: int, shifts) -> str:
+    pairs = _PAIRS
+    return "".join([pairs[(value >> shift) & 0x3FF] for shift in shifts])
+
+
+class ULIDGenerator(IdGenerator):
+    """
+    ULID üretir: 48 bit milisaniye zaman damgası + 80 bit rastgele değer, 26 karakter.
+    Aynı milisaniyede üretilen ID'ler rastgele kısmı bir artırılarak sıralı (monotonic) tutulur.
+    Rastgele kısım süreç başında os.urandom ile tohumlanan bir üreteçten gelir; ID'ler
+    tahmin edilemezlik gerektiren amaçlarla (örn. erişim belirteci) kullanılmamalıdır.
+    """
+    NAME = "ulid"
+
+    def __init__(self, clock: Callable[[], int] = time.time_ns):
+        self.clock = clock # Nanosaniye döndürür
+        self._reset()
+        _fork_sensitive.add(self)
+
+    def _reset(self):
+        import random
+        self._getrandbits = random.Random(os.urandom(16)).getrandbits
+        self._lock = threading.Lock()
+        self._last_ms = -1
+        self._high = 0 # Rastgele kısmın üst 60 biti
+        self._low = 0 # Rastgele kısmın alt 20 biti; aynı milisaniyede bir artırılır
+        self._head = "" # Zaman damgası ve üst 60 bitin kodlanmış hali (22 karakter)
+
+    def _start(self, ms: int, high: int):
+        self._last_ms = ms
+        self._high = high
+        self._head = _encode_bits(ms, _TIME_SHIFTS) + _encode_bits(high, _HIGH_SHIFTS)
+
+    def _start_random(self, ms: int):
+        value = self._getrandbits(_RANDOM_BITS)
+        self._start(ms, value >> _LOW_BITS)
+        self._low = value & _LOW_MASK
+
+    def __call__(self) -> str:
+        now = self.clock() // 1_000_000
+        with self._lock:
+            if now > self._last_ms:
+                self._start_random(now)
+            else: # Aynı milisaniye veya geri giden saat: son zaman damgası korunur
+                self._low += 1
+                if self._low > _LOW_MASK: # Alt bitler taştı; elde üst bitlere aktarılır
+                    self._low = 0
+                    if self._high == _HIGH_MASK: # Rastgele kısım tükendi; bir sonraki milisaniyeye geçilir
+                        self._start_random(self._last_ms + 1)
+                    else:
+                        self._start(self._last_ms, self._high + 1)
+            head, low = self._head, self._low
+        # Sıcak yolda yalnızca alt 20 bit (4 karakter) kodlanır; büyük tamsayı işlemi yapılmaz
+        return head + _PAIRS[low >> 10] + _PAIRS[low & 0x3FF]
+
+    @staticmethod
+    def encode(value: int) -> str:
+        """
+        128 bitlik değeri 26 karakterlik Crockford base32 metnine çevirir.
+        """
+        return (_encode_bits(value >> _RANDOM_BITS, _TIME_SHIFTS)
+                + _encode_bits(value & ((1 << _RANDOM_BITS) - 1), _RANDOM_SHIFTS))
+
+
+ID_GENERATORS: Dict[str, type] = {cls.NAME: cls for cls in (UUIDGenerator, CounterIdGenerator, ULIDGenerator)}
+
+
+def make_id_generator(kind: str, node: Optional[str] = None) -> IdGenerator:
+    """
+    Adı verilen üreteci oluşturur (uuid, counter, ulid). node yalnızca counter için kullanılır.
+    """
+    cls = ID_GENERATORS.get(kind)
+    if cls is None:
+        raise ValueError(f"Geçersiz ID üreteci: '{kind}'. Desteklenenler: {', '.join(ID_GENERATORS)}.")
+    if cls is CounterIdGenerator:
+        return cls(node)
+    return cls()
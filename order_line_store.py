@@ -0,0 +1,63 @@
+# order_line_store.py
+import threading
+from array import array
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from product import Product
+
+class OrderLineStore:
+    """
+    Siparişlerin (ürün, adet) satırlarını tüm siparişler için ortak, dizi tabanlı sütunlarda tutar.
+
+    Her satır yalnızca 16 bayt (ürün ID'si + adet) yer kaplar; sipariş başına liste ve tuple
+    nesneleri oluşturulmaz. Ürün nesneleri ID'lerine göre bir kez tutulur ve satırlar okunurken
+    bu tablodan çözülür. Aynı ID ile daha yeni bir ürün nesnesi eklenirse tablo güncellenir.
+
+    Depo yalnızca ekleme yapar: bir siparişin satırları değiştirildiğinde yeni satırlar sona
+    eklenir, eski satırların yeri geri kazanılmaz.
+    Order.set_line_store ile etkinleştirilir.
+    """
+    def __init__(self):
+        self.product_ids = array("q")
+        self.quantities = array("q")
+        self._products: Dict[int, 'Product'] = {} # {product_id: Product}
+        self._lock = threading.Lock()
+
+    def append(self, lines: Iterable[Tuple['Product', int]]) -> Tuple[int, int]:
+        """
+        Satırları depoya ekler ve (başlangıç konumu, satır sayısı) döndürür.
+        """
+        with self._lock:
+            offset = len(self.product_ids)
+            for product, quantity in lines:
+                self._products[product.product_id] = product
+                self.product_ids.append(product.product_id)
+                self.quantities.append(quantity)
+            return offset, len(self.product_ids) - offset
+
+    def lines(self, offset: int, count: int) -> List[Tuple['Product', int]]:
+        """
+        Konum aralığındaki satırları (ürün, adet) listesi olarak döndürür.
+        """
+        end = offset + count
+        products = self._products
+        return [(products[product_id], quantity)
+                for product_id, quantity in zip(self.product_ids[offset:end], self.quantities[offset:end])]
+
+    def raw_lines(self, offset: int, count: int) -> List[Tuple[int, int]]:
+        """
+        Konum aralığındaki satırları ürün nesnelerini çözmeden (ürün ID'si, adet) olarak döndürür.
+        """
+        end = offset + count
+        return list(zip(self.product_ids[offset:end], self.quantities[offset:end]))
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Satır sütunlarının kapladığı bayt miktarı.
+        """
+        return self.product_ids.itemsize * len(self.product_ids) + self.quantities.itemsize * len(self.quantities)
+
+    def __len__(self) -> int:
+        return len(self.product_ids)
@@ -1,37 +1,152 @@
-# order_subject.py
-from observer import Observer # Import Observer for type hinting
-from typing import List, TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from order import Order # Döngüsel bağımlılığı önlemek için
-
-class OrderSubject:
-    """
-    Sipariş durum değişikliklerini gözlemcilere (müşterilere) bildirmekten sorumlu konu nesnesi.
-    Observer desenini uygular.
-    """
-    def __init__(self):
-        self.observers: List[Observer] = [] # Gözlemcileri (müşterileri) tutacak liste
-
-    def attach(self, observer: Observer):
-        """
-        Yeni bir gözlemciyi (müşteriyi) konuya ekler.
-        """
-        if observer not in self.observers:
-            self.observers.append(observer)
-            # print(f"'{observer.name}' gözlemci olarak eklendi.") # Opsiyonel: hata ayıklama için
-
-    def detach(self, observer: Observer):
-        """
-        Bir gözlemciyi (müşteriyi) konudan kaldırır.
-        """
-        if observer in self.observers:
-            self.observers.remove(observer)
-            # print(f"'{observer.name}' gözlemci olarak kaldırıldı.")
-
-    def notify(self, order: 'Order'):
-        """
-        Tüm kayıtlı gözlemcilere (müşterilere) siparişin durumu hakkında bildirim gönderir.
-        """
-        for observer in list(self.observers):
-            observer.update(order) # Her bir gözlemciye sipariş objesi ile bildirim gönderilir
\ No newline at end of file
+# order_subject.py
+import time
+import weakref
+from observer import Observer # Import Observer for type hinting
+from typing import Dict, List, TYPE_CHECKING
+import metrics
+
+if TYPE_CHECKING:
+    from order import Order # Döngüsel bağımlılığı önlemek için
+    from notification_dispatcher import NotificationDispatcher
+
+_NOTIFY_SECONDS = metrics.MetricsRegistry.get_instance().timer(
+    "order_notify_seconds", "Bir durum değişikliğinin gözlemcilere dağıtılma süresi").labels()
+
+
+class OrderSubject:
+    """
+    Sipariş durum değişikliklerini gözlemcilere (müşterilere) bildirmekten sorumlu konu.
+    Observer desenini uygular.
+
+    Siparişin varsayılan gözlemcisi müşterisidir (order.customer); bunun için kayıt tutulmaz.
+    Siparişe başka gözlemci eklendiğinde veya müşteri çıkarıldığında abonelikler sipariş
+    ID'sine göre tek bir merkezi tabloda tutulur. Tablo gözlemcilere ve siparişlere güçlü
+    referans vermez: gözlemciler zayıf referansla (weakref) tutulur ve sipariş nesnesi
+    serbest kaldığında kaydı tablodan silinir. Böylece abonelikler siparişleri veya
+    gözlemcileri bellekte tutmaz ve sipariş başına referans döngüsü oluşturmaz.
+    Gözlemciler zayıf referansı desteklemelidir (__slots__ kullanan sınıflarda "__weakref__").
+    """
+    __slots__ = ()
+
+    _dispatcher: 'NotificationDispatcher | None' = None # Tüm siparişler için ortak asenkron bildirim kanalı
+    _global_observers: Dict[Observer, None] = {} # Tüm siparişlerin bildirimlerini alan gözlemciler
+    # {order_id: {gözlemci: None}}; gözlemciler ekleme sırasıyla, zayıf referansla tutulur
+    _subscriptions: Dict[str, 'weakref.WeakKeyDictionary[Observer, None]'] = {}
+
+    @classmethod
+    def set_dispatcher(cls, dispatcher: 'NotificationDispatcher | None'):
+        """
+        Asenkron bildirim kanalını ayarlar. None verilirse bildirimler yeniden senkron yapılır.
+        """
+        cls._dispatcher = dispatcher
+
+    @classmethod
+    def attach_global(cls, observer: Observer):
+        """
+        Gözlemciyi tüm siparişlerin durum değişikliklerine abone eder (örn. indeksler).
+        Sipariş başına gözlemci eklemekten farklı olarak abonelik tablosunda kayıt oluşturmaz.
+        """
+        cls._global_observers[observer] = None
+
+    @classmethod
+    def detach_global(cls, observer: Observer):
+        """
+        Gözlemcinin tüm siparişlere olan aboneliğini kaldırır.
+        """
+        cls._global_observers.pop(observer, None)
+
+    @classmethod
+    def _subscribers(cls, order: 'Order') -> 'weakref.WeakKeyDictionary[Observer, None]':
+        """
+        Siparişin abonelik kaydını döndürür; yoksa müşteri ilk gözlemci olacak şekilde oluşturur.
+        """
+        subscribers = cls._subscriptions.get(order.order_id)
+        if subscribers is None:
+            subscribers = cls._subscriptions[order.order_id] = weakref.WeakKeyDictionary()
+            subscribers[order.customer] = None # Müşteri, sipariş durumu değişikliklerini dinlemek için bağlanır
+            # Sipariş nesnesi serbest kalınca kaydı silinir (aynı ID ile yeniden yüklenen siparişin kaydına dokunulmaz)
+            weakref.finalize(order, cls._drop, order.order_id, subscribers)
+        return subscribers
+
+    @classmethod
+    def _drop(cls, order_id: str, subscribers):
+        if cls._subscriptions.get(order_id) is subscribers:
+            del cls._subscriptions[order_id]
+
+    @classmethod
+    def subscribe(cls, order: 'Order', observer: Observer):
+        """
+        Gözlemciyi siparişin durum değişikliklerine abone eder.
+        """
+        cls._subscribers(order)[observer] = None
+
+    @classmethod
+    def unsubscribe(cls, order: 'Order', observer: Observer):
+        """
+        Gözlemcinin siparişe olan aboneliğini kaldırır (müşteri de çıkarılabilir).
+        """
+        cls._subscribers(order).pop(observer, None)
+
+    @classmethod
+    def observers_of(cls, order: 'Order') -> tuple:
+        """
+        Siparişin kendi gözlemcileri (global gözlemciler hariç).
+        """
+        subscribers = cls._subscriptions.get(order.order_id)
+        if subscribers is None:
+            return (order.customer,)
+        return tuple(subscribers)
+
+    @classmethod
+    def subscription_count(cls) -> int:
+        """
+        Abonelik tablosundaki sipariş sayısı.
+        """
+        return len(cls._subscriptions)
+
+    @classmethod
+    def deliver(cls, order: 'Order', observers):
+        """
+        Bildirimi verilen gözlemcilere ve global gözlemcilere teslim eder.
+        Konu nesnesi olmayan siparişler de bu metodu doğrudan kullanır.
+        Bildirim kanalı ayarlıysa ASYNC_DELIVERY gözlemcileri kanala devredilir.
+        """
+        start = time.perf_counter() if metrics.enabled else 0.0
+        dispatcher = cls._dispatcher
+        deferred = []
+        for observer in (*observers, *cls._global_observers):
+            if dispatcher is not None and observer.ASYNC_DELIVERY:
+                deferred.append(observer)
+            else:
+                observer.update(order) # Her bir gözlemciye sipariş objesi ile bildirim gönderilir
+        if deferred:
+            dispatcher.submit(order, deferred)
+        if start:
+            _NOTIFY_SECONDS.observe(time.perf_counter() - start)
+
+    @classmethod
+    def deliver_many(cls, orders: List['Order']):
+        """
+        Toplu durum değişikliğinin bildirimlerini teslim eder. Siparişler gözlemcilerine göre
+        gruplanır ve her gözlemci kendi siparişleriyle bir kez update_many ile çağrılır;
+        global gözlemciler tüm listeyi alır. Bildirim kanalı ayarlıysa ASYNC_DELIVERY
+        gözlemcilerinin grupları kanala gözlemci başına tek bildirim olarak devredilir.
+        """
+        dispatcher = cls._dispatcher
+        grouped: Dict[Observer, List['Order']] = {}
+        subscriptions = cls._subscriptions
+        for order in orders:
+            subscribers = subscriptions.get(order.order_id)
+            for observer in ((order.customer,) if subscribers is None else tuple(subscribers)):
+                group = grouped.get(observer)
+                if group is None:
+                    grouped[observer] = [order]
+                else:
+                    group.append(order)
+        for observer in cls._global_observers:
+            grouped[observer] = orders
+        for observer, group in grouped.items():
+            if dispatcher is not None and observer.ASYNC_DELIVERY:
+                dispatcher.submit_many(group, observer)
+            else:
+                observer.update_many(group)
\ No newline at end of file
@@ -0,0 +1,418 @@
+# pricing_rules.py
+"""
+Bildirimsel fiyatlama ve promosyon kuralları.
+
+Kurallar üç kapsamda tanımlanır:
+    line       Koşula uyan satırların tutarını değiştirir (örn. kategori indirimi).
+               Koşullar: categories, product_ids, product_types, order_types, customer_ids,
+               min_quantity (satırdaki adet).
+    order      Satırlar toplandıktan sonra sipariş toplamını değiştirir (örn. ekspres ek ücreti).
+               Koşullar: order_types, customer_ids, min_quantity (siparişteki toplam adet),
+               subtotal_over (satır kurallarından sonraki ara toplam bu değerden büyükse).
+    surcharge  Dekoratörün (fragile, insurance, gift_wrap...) ücretini belirler; koşula uyan ilk
+               kural geçerlidir, hiçbiri uymazsa dekoratörün SURCHARGE değeri kullanılır.
+               Koşullar: decorator (zorunlu), order_types, customer_ids, min_quantity, subtotal_over.
+
+percent tutarı yüzde olarak değiştirir (-10: %10 indirim, 10: %10 ek ücret); amount sabit tutar
+ekler (negatifse indirim; satır kurallarında birim başına). Surcharge kurallarında ücret
+amount + sipariş toplamının percent yüzdesidir. Kurallar priority değerine (küçük önce),
+eşitse tanımlanma sırasına göre uygulanır; satır ve sipariş tutarları sıfırın altına inmez.
+
+Kural kümesi PricingPlan ile derlenir: satır kuralları ürün ID'si, kategori ve ürün türüne göre,
+sipariş kuralları sipariş türü ve müşteriye göre indekslenir. Bir satıra uyabilecek kurallar
+ürün ve sipariş türü başına bir kez belirlenip saklanır; böylece sepet başına maliyet kural
+sayısıyla değil, sepete gerçekten uyan kural sayısıyla artar. Satır kuralı yoksa ara toplam önceki
+sum(fiyat * adet) hesabıyla birebir aynıdır.
+
+Yeni kurallar kod değişikliği gerekmeden JSON dosyasından yüklenebilir:
+
+    {
+        "replace_defaults": false,
+        "rules": [
+            {"name": "okula_donus", "scope": "line", "categories": ["Kırtasiye"], "percent": -10},
+            {"name": "vip", "scope": "order", "customer_ids": ["c-42"], "percent": -5, "priority": 200},
+            {"name": "hediye_paketi_bedava", "scope": "surcharge", "decorator": "gift_wrap",
+             "subtotal_over": 500, "amount": 0}
+        ]
+    }
+
+Aynı adlı kural mevcut kuralın yerini alır (örn. "express_surcharge" yeniden tanımlanabilir).
+Kurallar değiştiğinde mevcut siparişlerin Order.total değeri yeniden hesaplanmaz; dekoratör
+ücretleri ise her maliyet hesabında geçerli plandan okunur.
+
+Kullanım:
+    registry = PricingRegistry.get_instance()
+    registry.add_rules([PricingRule("kalem_kampanyasi", "line", product_ids=[7], amount=-2)])
+    registry.plan.order_total(order)
+    registry.load_config("pricing.json")
+"""
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+SCOPES = ("line", "order", "surcharge")
+DEFAULT_PRIORITY = 100
+
+
+def _names(values: Optional[Iterable]) -> frozenset:
+    if values is None:
+        return frozenset()
+    if isinstance(values, (str, int)):
+        values = (values,)
+    return frozenset(values)
+
+
+class PricingRule:
+    """
+    Tek bir fiyatlama kuralı. Boş bırakılan koşullar her değere uyar.
+    """
+    __slots__ = ("name", "scope", "percent", "amount", "multiplier", "categories", "product_ids",
+                 "product_types", "order_types", "customer_ids", "min_quantity", "subtotal_over",
+                 "decorator", "priority")
+
+    def __init__(self, name: str, scope: str, *, percent: float = 0.0, amount: float = 0.0,
+                 categories: Optional[Iterable[str]] = None, product_ids: Optional[Iterable[int]] = None,
+                 product_types: Optional[Iterable[str]] = None, order_types: Optional[Iterable[str]] = None,
+                 customer_ids: Optional[Iterable[str]] = None, min_quantity: int = 0,
+                 subtotal_over: Optional[float] = None, decorator: Optional[str] = None,
+                 priority: int = DEFAULT_PRIORITY):
+        if not name:
+            raise ValueError("Fiyatlama kuralının bir adı olmalıdır.")
+        if scope not in SCOPES:
+            raise ValueError(f"Geçersiz kural kapsamı: '{scope}'. Desteklenenler: {', '.join(SCOPES)}.")
+        self.name = name
+        self.scope = scope
+        self.percent = float(percent)
+        self.amount = float(amount)
+        self.multiplier = 1 + self.percent / 100
+        self.categories = _names(categories)
+        self.product_ids = _names(product_ids)
+        self.product_types = _names(product_types)
+        self.order_types = _names(order_types)
+        self.customer_ids = _names(customer_ids)
+        self.min_quantity = int(min_quantity)
+        self.subtotal_over = None if subtotal_over is None else float(subtotal_over)
+        self.decorator = decorator
+        self.priority = int(priority)
+
+        if self.percent < -100:
+            raise ValueError(f"'{name}' kuralı: yüzde -100'den küçük olamaz.")
+        if self.min_quantity < 0:
+            raise ValueError(f"'{name}' kuralı: en az adet negatif olamaz.")
+        if scope != "line" and (self.categories or self.product_ids or self.product_types):
+            raise ValueError(f"'{name}' kuralı: ürün koşulları yalnızca satır (line) kurallarında kullanılabilir.")
+        if scope == "line" and self.subtotal_over is not None:
+            raise ValueError(f"'{name}' kuralı: subtotal_over satır (line) kurallarında kullanılamaz.")
+        if (scope == "surcharge") != (decorator is not None):
+            raise ValueError(f"'{name}' kuralı: decorator yalnızca ve mutlaka surcharge kurallarında belirtilmelidir.")
+
+    @property
+    def unconditional(self) -> bool:
+        """
+        Siparişe bakmadan uygulanan, sabit tutarlı kural (percent yok, koşul yok).
+        """
+        return not (self.percent or self.order_types or self.customer_ids or self.min_quantity
+                    or self.subtotal_over is not None or self.categories or self.product_ids or self.product_types)
+
+    @classmethod
+    def from_dict(cls, entry: Mapping[str, Any]) -> "PricingRule":
+        """
+        JSON yapılandırmasındaki kural tanımından kural oluşturur.
+        """
+        try:
+            options = {key: value for key, value in entry.items() if key not in ("name", "scope")}
+            return cls(str(entry["name"]), str(entry["scope"]), **options)
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Geçersiz fiyatlama kuralı tanımı: {dict(entry)} ({e})")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Kuralı from_dict ile geri okunabilecek sözlüğe çevirir; varsayılan değerler yazılmaz.
+        """
+        entry: Dict[str, Any] = {"name": self.name, "scope": self.scope}
+        for key in ("categories", "product_ids", "product_types", "order_types", "customer_ids"):
+            values = getattr(self, key)
+            if values:
+                entry[key] = sorted(values)
+        for key, default in (("percent", 0.0), ("amount", 0.0), ("min_quantity", 0), ("subtotal_over", None),
+                             ("decorator", None), ("priority", DEFAULT_PRIORITY)):
+            value = getattr(self, key)
+            if value != default:
+                entry[key] = value
+        return entry
+
+    def __repr__(self):
+        return f"PricingRule({self.to_dict()})"
+
+
+# Önceden Order alt sınıflarına gömülü olan tür ayarlamaları
+DEFAULT_RULES: Tuple[PricingRule, ...] = (
+    PricingRule("express_surcharge", "order", order_types=["Express"], percent=10),
+    PricingRule("subscription_discount", "order", order_types=["Subscription"], percent=-15),
+    PricingRule("bulk_discount", "order", order_types=["Bulk"], subtotal_over=1000, percent=-5),
+)
+
+
+class PricingPlan:
+    """
+    Kural kümesinin derlenmiş, değiştirilemez değerlendirme planı.
+    """
+    def __init__(self, rules: Sequence[PricingRule]):
+        self.rules: Tuple[PricingRule, ...] = tuple(sorted(rules, key=lambda rule: rule.priority)) # sorted kararlıdır
+        self._rank = {rule: rank for rank, rule in enumerate(self.rules)}
+
+        # Satır kuralları en seçici koşullarına göre indekslenir
+        self._line_by_product: Dict[int, Tuple[PricingRule, ...]] = {}
+        self._line_by_category: Dict[str, Tuple[PricingRule, ...]] = {}
+        self._line_by_product_type: Dict[str, Tuple[PricingRule, ...]] = {}
+        line_any = []
+        order_any, order_by_type, order_by_customer = [], {}, {}
+        surcharges: Dict[str, List[PricingRule]] = {}
+        for rule in self.rules:
+            if rule.scope == "line":
+                if rule.product_ids:
+                    index, keys = self._line_by_product, rule.product_ids
+                elif rule.categories:
+                    index, keys = self._line_by_category, rule.categories
+                elif rule.product_types:
+                    index, keys = self._line_by_product_type, rule.product_types
+                else:
+                    line_any.append(rule)
+                    continue
+                for key in keys:
+                    index[key] = index.get(key, ()) + (rule,)
+            elif rule.scope == "order":
+                if rule.customer_ids:
+                    for customer_id in rule.customer_ids:
+                        order_by_customer.setdefault(customer_id, []).append(rule)
+                elif rule.order_types:
+                    for order_type in rule.order_types:
+                        order_by_type.setdefault(order_type, []).append(rule)
+                else:
+                    order_any.append(rule)
+            else:
+                surcharges.setdefault(rule.decorator, []).append(rule)
+
+        self._line_any = tuple(line_any)
+        self.has_line_rules = bool(self._line_any or self._line_by_product or self._line_by_category
+                                   or self._line_by_product_type)
+        # Türe özgü kurallar, türden bağımsız olanlarla sıralı olarak birleştirilir
+        self._order_any = tuple(order_any)
+        self._order_by_type = {order_type: self._merge(rules, order_any) for order_type, rules in order_by_type.items()}
+        self._order_by_customer = {customer_id: tuple(rules) for customer_id, rules in order_by_customer.items()}
+        self._surcharges = {name: tuple(rules) for name, rules in surcharges.items()}
+        # Değerlendirme sırasında doldurulan önbellekler (plan değiştirilemez olduğu için geçerli kalırlar)
+        # {product_id: (kategori, ürün sınıfı, uyan satır kuralları, {sipariş türü: uyan satır kuralları})}
+        self._product_rules: Dict[int, tuple] = {}
+        self._fixed_fees: Dict[type, float] = {} # {dekoratör sınıfı: siparişten bağımsız ücret}
+
+    def _merge(self, *groups: Iterable[PricingRule]) -> Tuple[PricingRule, ...]:
+        return tuple(sorted({rule: None for group in groups for rule in group}, key=self._rank.__getitem__))
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    # --- Satırlar ---
+
+    def _rules_for_product(self, product, order_type: str) -> Tuple[PricingRule, ...]:
+        """
+        Ürünün ve sipariş türünün koşullarına uyan satır kurallarını döndürür; sonuç ürün ve
+        sipariş türü başına saklanır.
+        """
+        cached = self._product_rules.get(product.product_id)
+        if cached is None or cached[0] != product.category or cached[1] is not type(product):
+            product_id, category, product_type = product.product_id, product.category, product.get_type()
+            candidates = (self._line_by_product.get(product_id, ()) + self._line_by_category.get(category, ())
+                          + self._line_by_product_type.get(product_type, ()) + self._line_any)
+            rules = self._merge(rule for rule in candidates
+                                if (not rule.product_ids or product_id in rule.product_ids)
+                                and (not rule.categories or category in rule.categories)
+                                and (not rule.product_types or product_type in rule.product_types))
+            cached = self._product_rules[product_id] = (category, type(product), rules, {})
+        by_order_type = cached[3]
+        rules = by_order_type.get(order_type)
+        if rules is None:
+            rules = by_order_type[order_type] = tuple(
+                rule for rule in cached[2] if not rule.order_types or order_type in rule.order_types)
+        return rules
+
+    def subtotal(self, order, lines: Optional[Sequence] = None) -> float:
+        """
+        Satır kuralları uygulanmış satır tutarlarının toplamı.
+        """
+        if lines is None:
+            lines = order.products
+        if not self.has_line_rules:
+            return sum(product.price * qty for product, qty in lines)
+        order_type, customer_id = order.get_type(), order.customer.customer_id
+        subtotal = 0
+        for product, qty in lines:
+            amount = product.price * qty
+            rules = self._rules_for_product(product, order_type)
+            if rules:
+                for rule in rules:
+                    if (rule.customer_ids and customer_id not in rule.customer_ids) or qty < rule.min_quantity:
+                        continue
+                    amount = amount * rule.multiplier + rule.amount * qty if rule.amount else amount * rule.multiplier
+                if amount < 0:
+                    amount = 0.0
+            subtotal += amount
+        return subtotal
+
+    # --- Sipariş ---
+
+    def _order_rules(self, order, order_type: str) -> Tuple[PricingRule, ...]:
+        rules = self._order_by_type.get(order_type, self._order_any)
+        if self._order_by_customer:
+            customer_rules = self._order_by_customer.get(order.customer.customer_id)
+            if customer_rules:
+                rules = self._merge(rules, customer_rules)
+        return rules
+
+    @staticmethod
+    def _order_rule_applies(rule: PricingRule, order_type: str, subtotal: float, lines: Sequence) -> bool:
+        if rule.order_types and order_type not in rule.order_types:
+            return False
+        if rule.subtotal_over is not None and not subtotal > rule.subtotal_over:
+            return False
+        return not rule.min_quantity or sum(qty for _, qty in lines) >= rule.min_quantity
+
+    def order_total(self, order) -> float:
+        """
+        Siparişin kargo ve ek hizmetler hariç toplamı: satır ve sipariş kuralları uygulanmış tutar.
+        """
+        lines = order.products
+        subtotal = self.subtotal(order, lines)
+        order_type = order.get_type()
+        total = subtotal
+        for rule in self._order_rules(order, order_type):
+            if self._order_rule_applies(rule, order_type, subtotal, lines):
+                total = total * rule.multiplier + rule.amount if rule.amount else total * rule.multiplier
+        return total if total > 0 else 0.0
+
+    def type_adjustments(self, order_type: str) -> Tuple[Tuple[Optional[float], float, float], ...]:
+        """
+        Yalnızca sipariş türüne ve ara toplama bağlı kurallardan oluşan planlarda türün
+        (subtotal_over, çarpan, tutar) ayarlamalarını uygulama sırasıyla döndürür (bkz.
+        batch_pricing). Satır, müşteri veya adet koşullu kural varsa ValueError fırlatır.
+        """
+        if self.has_line_rules or self._order_by_customer or any(
+                rule.min_quantity for rule in self.rules if rule.scope == "order"):
+            raise ValueError("Fiyatlama planı satır, müşteri veya adet koşullu kurallar içeriyor; "
+                             "siparişler tek tek fiyatlanmalıdır.")
+        return tuple((rule.subtotal_over, rule.multiplier, rule.amount)
+                     for rule in self._order_by_type.get(order_type, self._order_any))
+
+    # --- Dekoratör ücretleri ---
+
+    def surcharge(self, decorator: type, order) -> float:
+        """
+        Dekoratörün sipariş için ücreti. Koşula uyan ilk surcharge kuralı, yoksa decorator.SURCHARGE.
+        """
+        fee = self._fixed_fees.get(decorator)
+        if fee is not None:
+            return fee
+        rules = self._surcharges.get(decorator.NAME, ()) if decorator.NAME else ()
+        if not rules or rules[0].unconditional:
+            fee = rules[0].amount if rules else decorator.SURCHARGE
+            self._fixed_fees[decorator] = fee
+            return fee
+        order_type, customer_id = order.get_type(), order.customer.customer_id
+        lines = order.products
+        for rule in rules:
+            if rule.customer_ids and customer_id not in rule.customer_ids:
+                continue
+            if self._order_rule_applies(rule, order_type, order.total, lines):
+                return rule.amount + order.total * rule.percent / 100 if rule.percent else rule.amount
+        return decorator.SURCHARGE
+
+
+class PricingRegistry:
+    """
+    Geçerli fiyatlama kurallarını ve derlenmiş planı tutan Singleton.
+
+    Plan değiştirilemez bir nesnedir ve güncellemelerde tek atamayla yenisiyle değiştirilir;
+    böylece okuyucular kilit almadan tutarlı bir plan görür.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._lock = threading.Lock()
+                    instance.reset()
+                    cls._instance = instance
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls) -> "PricingRegistry":
+        return cls()
+
+    def reset(self):
+        """
+        Varsayılan kuralları (sipariş türü ayarlamaları) yükler.
+        """
+        self.set_rules(DEFAULT_RULES)
+
+    def set_rules(self, rules: Iterable[PricingRule]):
+        """
+        Kural kümesini verilen kurallarla değiştirir. Kural adları benzersiz olmalıdır.
+        """
+        rules = list(rules)
+        names = [rule.name for rule in rules]
+        if len(set(names)) != len(names):
+            duplicate = next(name for name in names if names.count(name) > 1)
+            raise ValueError(f"Fiyatlama kuralı adları benzersiz olmalıdır: '{duplicate}'.")
+        plan = PricingPlan(rules)
+        with self._lock:
+            self._rules = rules
+            self.plan = plan
+
+    def add_rules(self, rules: Iterable[PricingRule]):
+        """
+        Kuralları ekler; aynı adlı mevcut kuralların yerini alır.
+        """
+        with self._lock:
+            merged = {rule.name: rule for rule in self._rules}
+        for rule in rules:
+            merged[rule.name] = rule
+        self.set_rules(merged.values())
+
+    def remove_rule(self, name: str) -> bool:
+        """
+        Adı verilen kuralı kaldırır. Kural yoksa False döner.
+        """
+        rules = [rule for rule in self._rules if rule.name != name]
+        if len(rules) == len(self._rules):
+            return False
+        self.set_rules(rules)
+        return True
+
+    def get_rules(self) -> List[PricingRule]:
+        return list(self._rules)
+
+    def apply_config(self, config: Mapping[str, Any]):
+        """
+        "rules" (ve isteğe bağlı "replace_defaults") anahtarlarını içeren yapılandırmayı uygular.
+        Yapılandırma hatalıysa kurallar değişmeden kalır.
+        """
+        rules = [PricingRule.from_dict(entry) for entry in config.get("rules", [])]
+        if config.get("replace_defaults", False):
+            self.set_rules(rules)
+        else:
+            self.add_rules(rules)
+
+    def load_config(self, path: str):
+        """
+        Kuralları JSON dosyasından yükler.
+        """
+        import json # Yapılandırma dosyası nadiren okunur; modülü kullanan süreçlerin açılışını yavaşlatmasın
+        try:
+            with open(path, encoding="utf-8") as f:
+                config = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Fiyatlama yapılandırması okunamadı ({path}): {e}")
+        self.apply_config(config)
+        print(f"Fiyatlama yapılandırması yüklendi: {len(self._rules)} kural.")
@@ -1,39 +1,63 @@
-# product_console.py
-from inventorymanager import InventoryManager
-from product_manager import ProductManager # ProductManager import edildi
-
-def run_product_menu():
-    """
-    Ürün yönetimi için interaktif konsol menüsünü çalıştırır.
-    """
-    inventory_manager = InventoryManager.get_instance() # Singleton örneği
-    product_manager = ProductManager() # ProductManager örneği
-
-    while True:
-        print("\n--- ÜRÜN YÖNETİM PANELİ ---")
-        print("1. Tüm Ürünleri Listele (Envanter)")
-        print("2. Kategoriye Göre Ürünleri Filtrele")
-        print("3. Ürün ID ile Ürün Bul")
-        print("4. Mevcut Kategorileri Listele") # Yeni seçenek
-        print("0. Ana Menüye Dön")
-
-        secim = input("Seçiminiz: ").strip()
-
-        if secim == "1":
-            inventory_manager.get_stock_info()
-        elif secim == "2":
-            category_name = input("Filtrelemek istediğiniz kategori adını girin: ").strip()
-            product_manager.filter_products_by_category(category_name)
-        elif secim == "3":
-            try:
-                product_id = int(input("Bulmak istediğiniz ürün ID'sini girin: "))
-                product_manager.search_product_by_id(product_id)
-            except ValueError:
-                print("Hata: Lütfen geçerli bir sayı girin.")
-        elif secim == "4": # Yeni seçenek
-            product_manager.list_categories()
-        elif secim == "0":
-            print("Ürün Yönetim Paneli'nden çıkılıyor.")
-            break
-        else:
+# product_console.py
+from inventorymanager import InventoryManager
+from product_manager import ProductManager # ProductManager import edildi
+
+PAGE_SIZE = 50 # Uzun listelerde sayfa başına gösterilecek ürün sayısı
+
+def run_product_menu():
+    """
+    Ürün yönetimi için interaktif konsol menüsünü çalıştırır.
+    """
+    inventory_manager = InventoryManager.get_instance() # Singleton örneği
+    product_manager = ProductManager() # ProductManager örneği
+
+    while True:
+        print("\n--- ÜRÜN YÖNETİM PANELİ ---")
+        print("1. Tüm Ürünleri Listele (Envanter)")
+        print("2. Kategoriye Göre Ürünleri Filtrele")
+        print("3. Ürün ID ile Ürün Bul")
+        print("4. Mevcut Kategorileri Listele") # Yeni seçenek
+        print("5. Türe Göre Ürünleri Filtrele")
+        print("6. Fiyat Aralığına Göre Ürünleri Filtrele")
+        print("7. Stoğu Tükenen Ürünleri Listele")
+        print("8. Ürün Adında Ara")
+        print("0. Ana Menüye Dön")
+
+        secim = input("Seçiminiz: ").strip()
+
+        if secim == "1":
+            inventory_manager.get_stock_info(page_size=PAGE_SIZE)
+        elif secim == "2":
+            category_name = input("Filtrelemek istediğiniz kategori adını girin: ").strip()
+            product_manager.filter_products_by_category(category_name)
+        elif secim == "3":
+            try:
+                product_id = int(input("Bulmak istediğiniz ürün ID'sini girin: "))
+                product_manager.search_product_by_id(product_id)
+            except ValueError:
+                print("Hata: Lütfen geçerli bir sayı girin.")
+        elif secim == "4": # Yeni seçenek
+            product_manager.list_categories()
+        elif secim == "5":
+            product_type = input("Filtrelemek istediğiniz ürün türünü girin (Physical/Digital/Service): ").strip()
+            product_manager.filter_products_by_type(product_type)
+        elif secim == "6":
+            try:
+                min_price = float(input("En düşük fiyat: ").strip())
+                max_price = float(input("En yüksek fiyat: ").strip())
+                product_manager.filter_products_by_price_range(min_price, max_price)
+            except ValueError:
+                print("Hata: Lütfen geçerli bir sayı girin.")
+        elif secim == "7":
+            product_manager.list_out_of_stock_products()
+        elif secim == "8":
+            query = input("Aranacak kelime(ler) (örn. kitap pyt): ").strip()
+            if query:
+                product_manager.search_products_by_name(query)
+            else:
+                print("Hata: Arama metni boş olamaz.")
+        elif secim == "0":
+            print("Ürün Yönetim Paneli'nden çıkılıyor.")
+            break
+        else:
             print("Geçersiz seçim. Lütfen tekrar deneyin.")
\ No newline at end of file
@@ -1,35 +1,75 @@
-# product_factory.py
-from product import PhysicalProduct, DigitalProduct, ServiceProduct
-from typing import Any
-
-class ProductFactory:
-    """
-    Farklı türde ürün nesneleri oluşturmak için Factory Method deseni uygular.
-    """
-    @staticmethod
-    def create_product(product_type: str, *args, **kwargs) -> Any:
-        """
-        Belirtilen türe göre bir ürün nesnesi oluşturur.
-
-        Args:
-            product_type (str): Oluşturulacak ürünün türü ('physical', 'digital', 'service').
-            *args: Ürün sınıfının yapıcı metoduna iletilecek konum bağımsız değişkenleri.
-            **kwargs: Ürün sınıfının yapıcı metoduna iletilecek anahtar kelime bağımsız değişkenleri.
-
-        Returns:
-            Product: Oluşturulan ürün nesnesi.
-
-        Raises:
-            ValueError: Geçersiz bir ürün türü belirtildiğinde.
-        """
-        if product_type == "physical":
-            # PhysicalProduct(product_id, name, category, price, stock)
-            return PhysicalProduct(*args, **kwargs) # <-- BURASI DA DOĞRU OLACAK!
-        elif product_type == "digital":
-            # DigitalProduct(product_id, name, category, price, download_link)
-            return DigitalProduct(*args, **kwargs)
-        elif product_type == "service":
-            # ServiceProduct(product_id, name, category, price, duration)
-            return ServiceProduct(*args, **kwargs)
-        else:
-            raise ValueError(f"Geçersiz ürün türü: '{product_type}'. Desteklenen türler: 'physical', 'digital', 'service'.")
\ No newline at end of file
+# product_factory.py
+from product import Product, PhysicalProduct, DigitalProduct, ServiceProduct
+from typing import Any, Dict, Iterable, List, Sequence
+
+class ProductFactory:
+    """
+    Farklı türde ürün nesneleri oluşturmak için Factory Method deseni uygular.
+    Ürün türleri bir kayıt tablosunda tutulur; yeni türler fabrikayı değiştirmeden
+    register_product_type ile eklenir.
+    """
+    _product_types: Dict[str, type] = {} # {ürün türü: Product alt sınıfı}
+
+    @classmethod
+    def register_product_type(cls, product_type: str, product_class: type):
+        """
+        Ürün türünü kaydeder; aynı adla kayıtlı bir tür varsa yerini alır.
+        """
+        if not product_type:
+            raise ValueError("Ürün türü adı boş olamaz.")
+        if not (isinstance(product_class, type) and issubclass(product_class, Product)):
+            raise ValueError(f"'{product_class!r}' bir Product alt sınıfı değil.")
+        cls._product_types[product_type] = product_class
+
+    @classmethod
+    def unregister_product_type(cls, product_type: str):
+        cls._product_types.pop(product_type, None)
+
+    @classmethod
+    def product_types(cls) -> List[str]:
+        return list(cls._product_types)
+
+    @classmethod
+    def _product_class(cls, product_type: str) -> type:
+        product_class = cls._product_types.get(product_type)
+        if product_class is None:
+            raise ValueError(f"Geçersiz ürün türü: '{product_type}'. "
+                             f"Desteklenen türler: {', '.join(repr(name) for name in cls._product_types)}.")
+        return product_class
+
+    @staticmethod
+    def create_product(product_type: str, *args, **kwargs) -> Any:
+        """
+        Belirtilen türe göre bir ürün nesnesi oluşturur.
+
+        Args:
+            product_type (str): Oluşturulacak ürünün türü ('physical', 'digital', 'service' veya
+                register_product_type ile eklenen bir tür).
+            *args: Ürün sınıfının yapıcı metoduna iletilecek konum bağımsız değişkenleri.
+            **kwargs: Ürün sınıfının yapıcı metoduna iletilecek anahtar kelime bağımsız değişkenleri.
+
+        Returns:
+            Product: Oluşturulan ürün nesnesi.
+
+        Raises:
+            ValueError: Geçersiz bir ürün türü belirtildiğinde.
+        """
+        # physical: PhysicalProduct(product_id, name, category, price, stock)
+        # digital: DigitalProduct(product_id, name, category, price, download_link)
+        # service: ServiceProduct(product_id, name, category, price, duration)
+        return ProductFactory._product_class(product_type)(*args, **kwargs)
+
+    @staticmethod
+    def create_products_many(product_type: str, rows: Iterable[Sequence]) -> List[Product]:
+        """
+        Aynı türden birden çok ürünü oluşturur; tür yalnızca bir kez doğrulanır.
+        Her satır, ürün sınıfının yapıcı metoduna konum değişkenleri olarak iletilir.
+        """
+        product_class = ProductFactory._product_class(product_type)
+        return [product_class(*row) for row in rows]
+
+
+# Yerleşik ürün türleri
+for _product_type, _product_class in (("physical", PhysicalProduct), ("digital", DigitalProduct),
+                                      ("service", ServiceProduct)):
+    ProductFactory.register_product_type(_product_type, _product_class)
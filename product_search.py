@@ -0,0 +1,251 @@
+# product_search.py
+"""
+Ürün adları üzerinde ters indeks (inverted index) ile kelime ve önek araması.
+
+Her ürün adı Türkçe kurallarına göre küçük harfe çevrilip (İ -> i, I -> ı) kelimelere
+ayrılır; her kelime için o kelimeyi içeren ürün ID'leri tutulur. Kelimeler ayrıca sıralı
+bir listede saklanır, böylece önek araması tüm katalog yerine yalnızca ikili arama (bisect)
+ile bulunan kelime aralığını tarar.
+
+Sıralama: sorgu kelimelerinin tamamını içeren ürünler döner. Tam kelime eşleşmesi önek
+eşleşmesinden yüksek puan alır; eşit puanlarda daha az kelimeden oluşan (sorguya daha
+yakın) adlar, ardından küçük ID'ler öne çıkar. Her kelimenin ürün listesi bu ikincil
+sıraya göre sıralanmış olarak önbelleğe alınır; adaylar bu sırayla tarandığı için en
+yüksek puanlı ilk `limit` sonuç bulununca arama durur ve sık geçen kelimelerde bile
+tüm eşleşmeler taranmaz.
+
+Kullanım:
+    index = ProductSearchIndex()
+    index.build((p.product_id, p.name) for p in products)
+    index.search("kitap pyt", limit=10)  # [(product_id, puan), ...]
+"""
+import heapq
+import re
+from bisect import bisect_left, insort
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+_TOKEN = re.compile(r"\w+")
+_PREFIX_END = "\U0010ffff" # Önek aralığının üst sınırı için en büyük karakter
+_MERGE_LIMIT = 64 # Bu sayıdan fazla kelimeye açılan önekler sıralı birleştirme yerine toplu sıralanır
+_STREAM_BUDGET = 2048 # Küme kesişimine geçmeden önce sıralı taranacak en fazla aday
+
+# Sorgu kelimesi başına puanlar
+EXACT_SCORE = 2
+PREFIX_SCORE = 1
+
+
+def turkish_casefold(text: str) -> str:
+    """
+    Metni Türkçe kurallarına uygun olarak büyük/küçük harf duyarsız hale getirir.
+    str.casefold "İ" harfini "i" + birleşik nokta, "I" harfini "i" yaptığı için bu iki harf önce çevrilir.
+    """
+    return text.replace("İ", "i").replace("I", "ı").casefold()
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Metni Türkçe küçük harfe çevrilmiş kelimelere ayırır.
+    """
+    return _TOKEN.findall(turkish_casefold(text))
+
+
+class ProductSearchIndex:
+    """
+    Ürün adları için ters indeks. Ekleme ve silme, ürünün kelime sayısı kadar işlemle yapılır.
+    """
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, None]] = {} # {kelime: {product_id: None}}
+        self._lengths: Dict[int, int] = {} # {product_id: addaki kelime sayısı}
+        self._terms: List[str] | None = None # Sıralı kelime listesi, ilk önek aramasında kurulur
+        self._ranked: Dict[str, List[int]] = {} # {kelime: (kelime sayısı, ID) sırasına göre ID'ler}, aramada kurulur
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def _rank_key(self, product_id: int) -> Tuple[int, int]:
+        return self._lengths[product_id], product_id
+
+    def build(self, rows: Iterable[Tuple[int, str]]):
+        """
+        İndeksi (product_id, ad) satırlarından toplu kurar.
+        """
+        postings, lengths, findall = self._postings, self._lengths, _TOKEN.findall
+        for product_id, name in rows:
+            terms = findall(name.replace("İ", "i").replace("I", "ı").casefold())
+            lengths[product_id] = len(terms)
+            for term in terms:
+                bucket = postings.get(term)
+                if bucket is None:
+                    bucket = postings[term] = {}
+                bucket[product_id] = None
+        self._terms = None
+        self._ranked.clear()
+
+    def add(self, product_id: int, name: str):
+        """
+        Ürünü indekse ekler. Aynı ID daha önce eklendiyse önce remove çağrılmalıdır.
+        """
+        terms = tokenize(name)
+        self._lengths[product_id] = len(terms)
+        for term in dict.fromkeys(terms):
+            bucket = self._postings.get(term)
+            if bucket is None:
+                bucket = self._postings[term] = {}
+                if self._terms is not None:
+                    insort(self._terms, term)
+            bucket[product_id] = None
+            ranked = self._ranked.get(term)
+            if ranked is not None:
+                insort(ranked, product_id, key=self._rank_key)
+
+    def remove(self, product_id: int, name: str):
+        """
+        Ürünü, indekse eklendiği addaki kelimelerle indeksten çıkarır.
+        """
+        if product_id not in self._lengths:
+            return
+        for term in dict.fromkeys(tokenize(name)):
+            bucket = self._postings.get(term)
+            if bucket is None or product_id not in bucket:
+                continue
+            del bucket[product_id]
+            ranked = self._ranked.get(term)
+            if ranked is not None:
+                del ranked[bisect_left(ranked, self._rank_key(product_id), key=self._rank_key)]
+            if not bucket:
+                del self._postings[term]
+                self._ranked.pop(term, None)
+                if self._terms is not None:
+                    del self._terms[bisect_left(self._terms, term)]
+        del self._lengths[product_id]
+
+    def _sorted_terms(self) -> List[str]:
+        if self._terms is None:
+            self._terms = sorted(self._postings)
+        return self._terms
+
+    def _ranked_ids(self, term: str) -> List[int]:
+        """
+        Kelimeyi içeren ürün ID'lerini (kelime sayısı, ID) sırasıyla döndürür.
+        """
+        ranked = self._ranked.get(term)
+        if ranked is None:
+            ranked = self._ranked[term] = sorted(self._postings[term], key=self._rank_key)
+        return ranked
+
+    def _matches(self, token: str, prefix: bool) -> List[Tuple[str, Dict[int, None], int]]:
+        """
+        Sorgu kelimesine uyan (kelime, ürün ID'leri, puan) üçlülerini döndürür; tam eşleşme ilk sıradadır.
+        """
+        postings = self._postings
+        exact = postings.get(token)
+        matches = [(token, exact, EXACT_SCORE)] if exact is not None else []
+        if prefix:
+            terms = self._sorted_terms()
+            start = bisect_left(terms, token)
+            end = bisect_left(terms, token + _PREFIX_END, start)
+            matches.extend((term, postings[term], PREFIX_SCORE) for term in terms[start:end] if term != token)
+        return matches
+
+    def _candidates(self, matches: List[Tuple[str, Dict[int, None], int]]) -> Iterator[int]:
+        """
+        Kelimelerden herhangi birini içeren ürünleri (kelime sayısı, ID) sırasıyla, tekrarsız üretir.
+        """
+        if len(matches) == 1:
+            return iter(self._ranked_ids(matches[0][0]))
+        if len(matches) > _MERGE_LIMIT:
+            union = {product_id: None for _, ids, _ in matches for product_id in ids}
+            return iter(sorted(union, key=self._rank_key))
+        merged = heapq.merge(*(self._ranked_ids(term) for term, _, _ in matches), key=self._rank_key)
+        return _unique_adjacent(merged)
+
+    @staticmethod
+    def _scorer(matches: List[Tuple[str, Dict[int, None], int]]) -> Callable[[int], int]:
+        """
+        Ürünün sorgu kelimesinden aldığı puanı (eşleşmiyorsa 0) döndüren fonksiyonu oluşturur.
+        """
+        if len(matches) > _MERGE_LIMIT:
+            union: Dict[int, int] = {}
+            for _, ids, score in matches:
+                for product_id in ids:
+                    union.setdefault(product_id, score)
+            return lambda product_id: union.get(product_id, 0)
+
+        def score_of(product_id: int) -> int:
+            for _, ids, score in matches:
+                if product_id in ids:
+                    return score
+            return 0
+        return score_of
+
+    def search(self, query: str, limit: int | None = 20, prefix: bool = True) -> List[Tuple[int, int]]:
+        """
+        Sorgudaki tüm kelimeleri (prefix=True ise kelime öneklerini) içeren ürünleri puanıyla döndürür.
+
+        Args:
+            query: Aranacak metin; kelimeler Türkçe küçük harf kurallarıyla karşılaştırılır.
+            limit: Döndürülecek en fazla sonuç sayısı; None ise tüm sonuçlar döner.
+            prefix: False ise yalnızca tam kelime eşleşmeleri aranır.
+
+        Returns:
+            En iyi eşleşmeden başlayarak (product_id, puan) listesi.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens or limit == 0:
+            return []
+        token_matches = [self._matches(token, prefix) for token in tokens]
+        if not all(token_matches):
+            return []
+        # Her kelimenin ilk eşleşmesi en yüksek puanlısıdır
+        max_score = sum(matches[0][2] for matches in token_matches)
+        # Adaylar en seçici kelimeden üretilir, diğer kelimeler yalnızca puanlanır
+        token_matches.sort(key=lambda matches: sum(len(ids) for _, ids, _ in matches))
+        scorers = [self._scorer(matches) for matches in token_matches]
+        lengths = self._lengths
+        # Her sorgu kelimesi tek bir kelimeye denk geliyorsa eşleşmeler küme kesişimiyle de bulunabilir;
+        # ortak ürünler seyrekse sıralı tarama uzun süreceği için tarama _STREAM_BUDGET adayla sınırlanır
+        intersectable = len(token_matches) > 1 and all(len(matches) == 1 for matches in token_matches)
+        candidates = self._candidates(token_matches[0])
+        if intersectable:
+            candidates = islice(candidates, _STREAM_BUDGET)
+
+        # Adaylar (kelime sayısı, ID) sırasıyla geldiği için eşit puanlı sonraki aday öndekini geçemez.
+        # heap'te en kötü sonuç en üsttedir: (puan, -kelime sayısı, -ID)
+        heap: List[Tuple[int, int, int]] = []
+        scanned = 0
+        for scanned, product_id in enumerate(candidates, 1):
+            score = 0
+            for score_of in scorers:
+                token_score = score_of(product_id)
+                if not token_score:
+                    break
+                score += token_score
+            else:
+                if limit is None or len(heap) < limit:
+                    heapq.heappush(heap, (score, -lengths[product_id], -product_id))
+                elif score > heap[0][0]:
+                    heapq.heapreplace(heap, (score, -lengths[product_id], -product_id))
+                if limit is not None and len(heap) == limit and heap[0][0] == max_score:
+                    break
+        else:
+            if intersectable and scanned == _STREAM_BUDGET:
+                common = token_matches[0][0][1].keys()
+                for matches in token_matches[1:]:
+                    common = common & matches[0][1].keys()
+                ranked = sorted(common, key=self._rank_key) if limit is None else \
+                    heapq.nsmallest(limit, common, key=self._rank_key)
+                return [(product_id, max_score) for product_id in ranked]
+        heap.sort(reverse=True)
+        return [(-negative_id, score) for score, _, negative_id in heap]
+
+
+def _unique_adjacent(ordered: Iterable[int]) -> Iterator[int]:
+    """
+    Sıralı akıştaki ardışık tekrarları atlar.
+    """
+    previous = None
+    for item in ordered:
+        if item != previous:
+            previous = item
+            yield item
@@ -0,0 +1,331 @@
+# product_store.py
+from array import array
+from bisect import bisect_left
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, List
+from product import Product, PhysicalProduct, DigitalProduct, ServiceProduct
+
+# Ürün türlerinin sütunlarda tutulan kodları
+_PHYSICAL = 0
+_DIGITAL = 1
+_SERVICE = 2
+_DELETED = -1
+
+
+class _ColumnarProductView:
+    """
+    Sütunlu depodaki bir satırı Product arayüzüyle sunan hafif görünüm.
+    Tüm alanlar depodaki dizilerden okunur ve dizilere yazılır; kopya tutulmaz.
+    """
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: "ColumnarProductStore", row: int):
+        self._store = store
+        self._row = row
+
+    @property
+    def product_id(self) -> int:
+        return self._store._ids[self._row]
+
+    @product_id.setter
+    def product_id(self, value: int):
+        raise AttributeError("Sütunlu depoda ürün ID'si değiştirilemez.")
+
+    @property
+    def name(self) -> str:
+        return self._store._read_text(self._store._names[self._row])
+
+    @name.setter
+    def name(self, value: str):
+        self._store._replace_text(self._store._names, self._row, value)
+
+    @property
+    def category(self) -> str:
+        return self._store._strings[self._store._categories[self._row]]
+
+    @category.setter
+    def category(self, value: str):
+        self._store._categories[self._row] = self._store._intern(value)
+
+    @property
+    def price(self) -> float:
+        return self._store._prices[self._row]
+
+    @price.setter
+    def price(self, value: float):
+        self._store._prices[self._row] = value
+
+    @property
+    def stock(self) -> int:
+        return self._store._stocks[self._row]
+
+    @stock.setter
+    def stock(self, value: int):
+        self._store._stocks[self._row] = value
+
+    @property
+    def version(self) -> int:
+        return self._store._versions[self._row]
+
+    @version.setter
+    def version(self, value: int):
+        self._store._versions[self._row] = value
+
+
+class PhysicalProductView(_ColumnarProductView, PhysicalProduct):
+    """
+    Sütunlu depodaki fiziksel ürün satırının görünümü.
+    """
+    __slots__ = ()
+
+
+class DigitalProductView(_ColumnarProductView, DigitalProduct):
+    """
+    Sütunlu depodaki dijital ürün satırının görünümü.
+    """
+    __slots__ = ()
+
+    @property
+    def download_link(self) -> str:
+        return self._store._read_text(self._store._extras[self._row])
+
+    @download_link.setter
+    def download_link(self, value: str):
+        self._store._replace_text(self._store._extras, self._row, value)
+
+
+class ServiceProductView(_ColumnarProductView, ServiceProduct):
+    """
+    Sütunlu depodaki hizmet ürünü satırının görünümü.
+    """
+    __slots__ = ()
+
+    @property
+    def duration(self) -> int:
+        return self._store._extras[self._row]
+
+    @duration.setter
+    def duration(self, value: int):
+        self._store._extras[self._row] = value
+
+
+_VIEW_CLASSES = {_PHYSICAL: PhysicalProductView, _DIGITAL: DigitalProductView, _SERVICE: ServiceProductView}
+
+
+class ColumnarProductStore(MutableMapping):
+    """
+    InventoryManager için dizi tabanlı (sütunlu) ürün deposu.
+    ID, fiyat ve stok değerleri tipli dizilerde tutulur. Az sayıda farklı değeri olan
+    kategoriler string havuzunda paylaşılır (interning); çoğunlukla benzersiz olan isim
+    ve link metinleri ise tek bir UTF-8 bayt bloğunda saklanır. get/[] işlemleri her
+    seferinde depoya bağlı hafif bir Product görünümü döndürür.
+    Varsayılan dict deposuyla aynı Mapping arayüzünü sağlar.
+    """
+    def __init__(self):
+        self._ids = array("q")
+        self._prices = array("d")
+        self._stocks = array("q")
+        self._kinds = array("b")
+        self._names = array("q") # Metin bloğundaki konumlar
+        self._categories = array("i") # String havuzundaki indeksler
+        self._extras = array("q") # Dijital: link'in metin bloğundaki konumu, Hizmet: süre
+        self._versions = array("Q") # Ürün sürümleri (bkz. Product.version)
+        self._text = bytearray() # Uzunluk önekli UTF-8 metinler
+        self._dead_text = 0 # Bloktaki artık hiçbir satırın göstermediği bayt sayısı
+        self._strings: List[str] = []
+        self._string_index: Dict[str, int] = {}
+        self._ids_sorted = True # ID'ler artan sırada eklendikçe satır araması bisect ile yapılır
+        self._row_index: Dict[int, int] | None = None # Sıra bozulursa kurulan {product_id: satır} sözlüğü
+        self._live = 0
+
+    def _intern(self, value: str) -> int:
+        """
+        Metni string havuzuna ekler (zaten varsa tekrar eklemez) ve indeksini döndürür.
+        """
+        index = self._string_index.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(value)
+            self._string_index[value] = index
+        return index
+
+    def _append_text(self, value: str) -> int:
+        """
+        Metni uzunluk önekiyle bayt bloğuna ekler ve başlangıç konumunu döndürür.
+        """
+        encoded = value.encode("utf-8")
+        offset = len(self._text)
+        self._text += len(encoded).to_bytes(4, "little")
+        self._text += encoded
+        return offset
+
+    def _text_size(self, offset: int) -> int:
+        """
+        Konumdaki metnin önekle birlikte bayt blokta kapladığı yer.
+        """
+        return 4 + int.from_bytes(self._text[offset:offset + 4], "little")
+
+    def _replace_text(self, column: array, row: int, value: str):
+        """
+        Satırın column sütunundaki metnini değiştirir. Yeni metin eskisinin yerine sığıyorsa
+        üzerine yazılır; sığmıyorsa sona eklenir.
+        """
+        encoded = value.encode("utf-8")
+        offset = column[row]
+        old_size = self._text_size(offset)
+        if 4 + len(encoded) <= old_size:
+            self._text[offset:offset + 4 + len(encoded)] = len(encoded).to_bytes(4, "little") + encoded
+            self._dead_text += old_size - 4 - len(encoded)
+        else:
+            column[row] = self._append_text(value)
+            self._dead_text += old_size
+        self._maybe_compact()
+
+    def _release_text(self, row: int):
+        """
+        Satırın metinlerini boşa çıkmış olarak sayar (silinen veya türü değişen satırlar).
+        """
+        self._dead_text += self._text_size(self._names[row])
+        if self._kinds[row] == _DIGITAL:
+            self._dead_text += self._text_size(self._extras[row])
+
+    def _maybe_compact(self):
+        """
+        Boşa çıkan baytlar bloğun yarısını (ve 4 KiB'ı) aşınca bloğu sıkıştırır. Metinleri
+        değiştiren veya boşa çıkaran her işlemin sonunda çağrılır.
+        """
+        if self._dead_text > 4096 and self._dead_text * 2 > len(self._text):
+            self._compact_text()
+
+    def _compact_text(self):
+        """
+        Canlı satırların metinlerini yeni bir bloğa kopyalar ve konumlarını günceller.
+        """
+        text = bytearray()
+
+        def move(offset: int) -> int:
+            size = self._text_size(offset)
+            text.extend(self._text[offset:offset + size])
+            return len(text) - size
+
+        for row, kind in enumerate(self._kinds):
+            if kind == _DELETED:
+                continue
+            self._names[row] = move(self._names[row])
+            if kind == _DIGITAL:
+                self._extras[row] = move(self._extras[row])
+        self._text = text
+        self._dead_text = 0
+
+    def _read_text(self, offset: int) -> str:
+        """
+        Bayt bloğunda belirtilen konumdaki metni çözer.
+        """
+        length = int.from_bytes(self._text[offset:offset + 4], "little")
+        return self._text[offset + 4:offset + 4 + length].decode("utf-8")
+
+    def _find_row(self, product_id: int) -> int:
+        """
+        Ürün ID'sine ait satır numarasını döndürür, yoksa -1.
+        """
+        if self._row_index is not None:
+            return self._row_index.get(product_id, -1)
+        row = bisect_left(self._ids, product_id)
+        if row < len(self._ids) and self._ids[row] == product_id:
+            return row
+        return -1
+
+    def _write_row(self, row: int, product: Product):
+        """
+        Ürün nesnesinin alanlarını belirtilen satıra yazar. Satırın önceki metinleri (varsa)
+        boşa çıkmış sayılır.
+        """
+        if isinstance(product, PhysicalProduct):
+            kind, extra = _PHYSICAL, 0
+        elif isinstance(product, DigitalProduct):
+            kind, extra = _DIGITAL, self._append_text(product.download_link)
+        elif isinstance(product, ServiceProduct):
+            kind, extra = _SERVICE, product.duration
+        else:
+            raise ValueError(f"Sütunlu depo bu ürün türünü desteklemiyor: '{type(product).__name__}'.")
+        if self._kinds[row] != _DELETED:
+            self._release_text(row)
+        self._prices[row] = product.price
+        self._stocks[row] = product.stock
+        self._kinds[row] = kind
+        self._names[row] = self._append_text(product.name)
+        self._categories[row] = self._intern(product.category)
+        self._extras[row] = extra
+        self._versions[row] = product.version
+        self._maybe_compact()
+
+    def __setitem__(self, product_id: int, product: Product):
+        if product_id != product.product_id:
+            raise ValueError("Anahtar ile ürün ID'si aynı olmalıdır.")
+        row = self._find_row(product_id)
+        if row >= 0:
+            was_deleted = self._kinds[row] == _DELETED
+            self._write_row(row, product)
+            if was_deleted:
+                self._live += 1
+            return
+
+        row = len(self._ids)
+        if self._ids_sorted and row and product_id < self._ids[-1]:
+            # Sıra dışı ekleme: bundan sonra satırlar sözlük üzerinden bulunur
+            self._ids_sorted = False
+            self._row_index = {pid: index for index, pid in enumerate(self._ids)}
+        self._ids.append(product_id)
+        for column in (self._prices, self._stocks, self._names, self._categories, self._extras, self._versions):
+            column.append(0)
+        self._kinds.append(_DELETED) # Henüz metni olmayan satır; _write_row türünü yazar
+        if self._row_index is not None:
+            self._row_index[product_id] = row
+        self._live += 1
+        try:
+            self._write_row(row, product)
+        except ValueError:
+            self._kinds[row] = _DELETED
+            self._live -= 1
+            raise
+
+    def __getitem__(self, product_id: int) -> Product:
+        row = self._find_row(product_id)
+        if row < 0 or self._kinds[row] == _DELETED:
+            raise KeyError(product_id)
+        return _VIEW_CLASSES[self._kinds[row]](self, row)
+
+    def __delitem__(self, product_id: int):
+        row = self._find_row(product_id)
+        if row < 0 or self._kinds[row] == _DELETED:
+            raise KeyError(product_id)
+        # Satır silinmiş olarak işaretlenir; aynı ID tekrar eklenirse satır yeniden kullanılır
+        self._release_text(row)
+        self._kinds[row] = _DELETED
+        self._live -= 1
+        self._maybe_compact()
+
+    def __iter__(self) -> Iterator[int]:
+        kinds = self._kinds
+        for row, product_id in enumerate(self._ids):
+            if kinds[row] != _DELETED:
+                yield product_id
+
+    def __len__(self) -> int:
+        return self._live
+
+    def __contains__(self, product_id) -> bool:
+        row = self._find_row(product_id)
+        return row >= 0 and self._kinds[row] != _DELETED
+
+    def values(self):
+        """
+        Tüm ürünlerin görünümlerini satır sırasıyla döndürür.
+        """
+        return [_VIEW_CLASSES[kind](self, row) for row, kind in enumerate(self._kinds) if kind != _DELETED]
+
+    def items(self):
+        """
+        (product_id, görünüm) çiftlerini satır sırasıyla döndürür.
+        """
+        return [(self._ids[row], _VIEW_CLASSES[kind](self, row)) for row, kind in enumerate(self._kinds) if kind != _DELETED]
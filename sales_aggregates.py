@@ -0,0 +1,382 @@
+# sales_aggregates.py
+"""
+Satış raporları için artımlı (incremental) toplamlar.
+
+Toplamlar sipariş geçmişi yeniden taranarak değil, olaylar geldikçe güncellenir:
+- Sipariş oluşturma: OrderFactory.create_order dinleyicilere order_created ile haber verir.
+- Durum değişikliği: SalesAggregates tüm siparişlerin global gözlemcisidir (Order.update_status).
+
+Tutulan boyutlar: müşteri, kategori, sipariş türü (get_type()), durum (OrderStatus) ve
+zaman kovaları (varsayılan saatlik ve günlük). Her okuma tek bir dict erişimidir.
+
+Gelir olarak siparişin temel toplamı (Order.total; tür indirimi/ek ücreti dahil, kargo ve
+dekoratör ücretleri hariç) kullanılır. Kategori geliri, sipariş toplamı satır tutarlarına
+oranlanarak dağıtılır; böylece kategorilerin toplamı sipariş toplamına eşit olur.
+İptal edilen veya iade edilen siparişlerin geliri silinmez, "refunded" alanına yazılır;
+net gelir revenue - refunded'dır. Sipariş bu durumlardan çıkarsa iade geri alınır.
+
+Zaman kovaları olayın gerçekleştiği ana göre tutulur: sipariş oluşturulduğu kovada,
+iadesi iptal/iade edildiği kovada görünür.
+
+Kullanım:
+    aggregates = SalesAggregates.get_instance()
+    aggregates.record_orders(mevcut_siparisler) # Açılışta yüklenen siparişler için
+    aggregates.customer_totals("c-1").net_revenue
+    aggregates.bucket_totals(3600, last=24)
+"""
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
+
+from observer import Observer
+from order import OrderStatus
+from order_factory import OrderFactory
+from order_subject import OrderSubject
+
+if TYPE_CHECKING:
+    from order import Order
+    from order_decorator import OrderComponent
+
+# Gelirin iade edilmiş sayıldığı durumlar
+REFUND_STATUSES = frozenset((OrderStatus.CANCELLED, OrderStatus.RETURNED))
+
+DEFAULT_GRANULARITIES = (3600, 86400) # Saatlik ve günlük kovalar (saniye)
+DEFAULT_RETENTION = 24 * 90 # Her ayrıntı düzeyinde tutulacak en fazla kova sayısı
+
+
+class SalesTotals:
+    """
+    Bir boyut değeri (örn. bir müşteri veya kategori) için sipariş, adet ve gelir sayaçları.
+    """
+    __slots__ = ("orders", "units", "revenue", "refunded")
+
+    def __init__(self, orders: int = 0, units: int = 0, revenue: float = 0.0, refunded: float = 0.0):
+        self.orders = orders
+        self.units = units
+        self.revenue = revenue
+        self.refunded = refunded
+
+    @property
+    def net_revenue(self) -> float:
+        return self.revenue - self.refunded
+
+    def copy(self) -> "SalesTotals":
+        return SalesTotals(self.orders, self.units, self.revenue, self.refunded)
+
+    def __repr__(self):
+        return (f"SalesTotals(orders={self.orders}, units={self.units}, "
+                f"revenue={self.revenue:.2f}, refunded={self.refunded:.2f})")
+
+
+def _unwrap(order: 'OrderComponent | Order') -> 'Order':
+    """
+    Dekore edilmiş siparişlerde zincirin altındaki gerçek Order nesnesini döndürür.
+    """
+    return getattr(order, "order", order)
+
+
+def _category_shares(order: 'Order') -> Dict[str, Tuple[int, float]]:
+    """
+    Siparişin {kategori: (adet, gelir)} dağılımı. Gelir, sipariş toplamının satır tutarlarına oranıdır.
+    """
+    lines: Dict[str, List] = {}
+    base = 0.0
+    for product, quantity in order.products:
+        amount = product.price * quantity
+        base += amount
+        entry = lines.get(product.category)
+        if entry is None:
+            lines[product.category] = [quantity, amount]
+        else:
+            entry[0] += quantity
+            entry[1] += amount
+    ratio = order.total / base if base else 0.0
+    return {category: (units, amount * ratio) for category, (units, amount) in lines.items()}
+
+
+class SalesAggregates(Observer):
+    """
+    Müşteri, kategori, sipariş türü, durum ve zaman kovası bazında satış toplamları. Singleton deseni uygular.
+
+    Sipariş başına yalnızca son görülen durum tutulur; bir siparişin katkısı gerektiğinde
+    (iptal/iade) sipariş nesnesinden yeniden hesaplanır.
+    """
+    ASYNC_DELIVERY = False # Toplamlar, durum değişikliğiyle aynı anda güncellenmelidir
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        """
+        Singleton deseni için __new__ metodu override edildi.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._lock = threading.Lock()
+                    instance.clock = time.time # Kovaların zaman kaynağı; yeniden oynatmada değiştirilebilir
+                    instance.configure_buckets()
+                    OrderSubject.attach_global(instance)
+                    OrderFactory.add_listener(instance)
+                    cls._instance = instance
+        return cls._instance
+
+    @staticmethod
+    def get_instance() -> "SalesAggregates":
+        """
+        SalesAggregates'in tek örneğini döndürür (Singleton deseni).
+        """
+        return SalesAggregates()
+
+    def configure_buckets(self, granularities: Iterable[int] = DEFAULT_GRANULARITIES,
+                          retention: int = DEFAULT_RETENTION):
+        """
+        Zaman kovalarının ayrıntı düzeylerini (saniye) ve saklama sınırını ayarlar; tüm toplamları sıfırlar.
+        """
+        granularities = tuple(granularities)
+        if not granularities or any(seconds <= 0 for seconds in granularities):
+            raise ValueError("Kova süreleri pozitif olmalıdır.")
+        if retention < 1:
+            raise ValueError("Saklanacak kova sayısı en az 1 olmalıdır.")
+        self.granularities = granularities
+        self.retention = retention
+        self.clear()
+
+    def clear(self):
+        """
+        Tüm toplamları ve bilinen siparişleri sıfırlar.
+        """
+        with self._lock:
+            self._order_status: Dict[str, OrderStatus] = {} # {order_id: toplamlara işlendiği durum}
+            self._overall = SalesTotals()
+            self._by_customer: Dict[str, SalesTotals] = {}
+            self._by_category: Dict[str, SalesTotals] = {}
+            self._by_type: Dict[str, SalesTotals] = {}
+            self._by_status: Dict[OrderStatus, SalesTotals] = {status: SalesTotals() for status in OrderStatus}
+            # {kova süresi: {kova başlangıcı: SalesTotals}}; kovalar zaman sırasıyla eklenir
+            self._buckets: Dict[int, Dict[int, SalesTotals]] = {seconds: {} for seconds in self.granularities}
+            self._window: Tuple[float, float, List[SalesTotals]] = (0.0, 0.0, []) # Şu anki kovalar ve geçerli oldukları aralık
+
+    # --- Olaylar ---
+
+    def order_created(self, order: 'Order'):
+        """
+        OrderFactory.create_order tarafından çağrılır.
+        """
+        self.record_orders((order,))
+
+    def orders_created(self, orders: List['Order']):
+        """
+        OrderFactory.create_orders_many tarafından grup için bir kez çağrılır.
+        """
+        self.record_orders(orders)
+
+    def record_orders(self, orders: Iterable['OrderComponent | Order']):
+        """
+        Siparişleri mevcut durumlarıyla toplamlara ekler (örn. veritabanından veya olay
+        günlüğünden yüklenen siparişler). Daha önce eklenmiş siparişler atlanır.
+        """
+        now = self.clock()
+        with self._lock:
+            for order in orders:
+                order = _unwrap(order)
+                if order.order_id in self._order_status:
+                    continue
+                self._order_status[order.order_id] = order.status
+                self._add_order(order, now)
+
+    def forget_orders(self, order_ids: Iterable[str]):
+        """
+        Arşivlenen siparişlerin durum kaydını siler; toplamlar değişmez.
+        Bu siparişlerin sonraki durum değişiklikleri ve yeniden eklenmeleri artık ayırt edilemez.
+        """
+        with self._lock:
+            order_status = self._order_status
+            for order_id in order_ids:
+                order_status.pop(order_id, None)
+
+    def update(self, order: 'Order'): # Observer arayüzü uygulaması
+        """
+        Sipariş durumu değiştiğinde çağrılır; durum sayaçlarını ve gerekiyorsa iadeleri günceller.
+        Toplamlara eklenmemiş siparişlerin bildirimleri yok sayılır.
+        """
+        self.update_many((order,))
+
+    def update_many(self, orders: Iterable['Order']):
+        """
+        Toplu durum değişikliğinde tüm siparişleri tek kilit altında işler.
+        """
+        with self._lock:
+            order_status = self._order_status
+            for order in orders:
+                old_status = order_status.get(order.order_id)
+                new_status = order.status
+                if old_status is None or old_status is new_status:
+                    continue
+                order_status[order.order_id] = new_status
+                total = order.total
+                self._move_status(old_status, new_status, sum(quantity for _, quantity in order.products), total)
+                was_refunded, is_refunded = old_status in REFUND_STATUSES, new_status in REFUND_STATUSES
+                if was_refunded != is_refunded:
+                    self._refund(order, total if is_refunded else -total)
+
+    def _add_order(self, order: 'Order', now: float):
+        total = order.total
+        shares = _category_shares(order)
+        units = sum(units for units, _ in shares.values())
+        refunded = total if order.status in REFUND_STATUSES else 0.0
+        status_totals = self._by_status[order.status]
+        status_totals.orders += 1
+        status_totals.units += units
+        status_totals.revenue += total
+        customer_totals = self._by_customer.get(order.customer.customer_id)
+        if customer_totals is None:
+            customer_totals = self._by_customer[order.customer.customer_id] = SalesTotals()
+        for totals in (self._overall, customer_totals, self._totals(self._by_type, order.get_type()),
+                       *self._current_buckets(now)):
+            totals.orders += 1
+            totals.units += units
+            totals.revenue += total
+            totals.refunded += refunded
+        by_category = self._by_category
+        for category, (category_units, revenue) in shares.items():
+            totals = by_category.get(category)
+            if totals is None:
+                totals = by_category[category] = SalesTotals()
+            totals.orders += 1
+            totals.units += category_units
+            totals.revenue += revenue
+            if refunded:
+                totals.refunded += revenue
+
+    def _move_status(self, old_status: OrderStatus, new_status: OrderStatus, units: int, total: float):
+        """
+        Siparişin katkısını eski durumun sayaçlarından yenisine taşır.
+        Durum boyutunda iade tutulmaz; iptal/iade edilenler kendi durumlarında görünür.
+        """
+        old, new = self._by_status[old_status], self._by_status[new_status]
+        old.orders -= 1
+        old.units -= units
+        old.revenue -= total
+        new.orders += 1
+        new.units += units
+        new.revenue += total
+
+    def _refund(self, order: 'Order', amount: float):
+        """
+        amount kadar geliri iade olarak işler (negatifse iadeyi geri alır).
+        """
+        for totals in (self._overall, self._totals(self._by_customer, order.customer.customer_id),
+                       self._totals(self._by_type, order.get_type()), *self._current_buckets(self.clock())):
+            totals.refunded += amount
+        ratio = amount / order.total if order.total else 0.0
+        for category, (_, revenue) in _category_shares(order).items():
+            self._totals(self._by_category, category).refunded += revenue * ratio
+
+    @staticmethod
+    def _totals(index: Dict, key) -> SalesTotals:
+        totals = index.get(key)
+        if totals is None:
+            totals = index[key] = SalesTotals()
+        return totals
+
+    def _current_buckets(self, now: float) -> List[SalesTotals]:
+        """
+        Her ayrıntı düzeyi için şu anki kovayı döndürür; saklama sınırını aşan en eski kovalar atılır.
+        """
+        window_start, window_end, current = self._window
+        if window_start <= now < window_end:
+            return current # Kovalar değişmediyse sipariş başına kova hesabı yapılmaz
+        current = []
+        window_start, window_end = float("-inf"), float("inf")
+        retention = self.retention
+        for seconds, buckets in self._buckets.items():
+            start = int(now // seconds) * seconds
+            totals = buckets.get(start)
+            if totals is None:
+                totals = buckets[start] = SalesTotals()
+                while len(buckets) > retention:
+                    del buckets[next(iter(buckets))]
+            current.append(totals)
+            window_start, window_end = max(window_start, start), min(window_end, start + seconds)
+        self._window = (window_start, window_end, current)
+        return current
+
+    # --- Okuma ---
+
+    def overall(self) -> SalesTotals:
+        with self._lock:
+            return self._overall.copy()
+
+    def customer_totals(self, customer_id: str) -> SalesTotals:
+        with self._lock:
+            totals = self._by_customer.get(customer_id)
+            return totals.copy() if totals is not None else SalesTotals()
+
+    def category_totals(self, category: str) -> SalesTotals:
+        with self._lock:
+            totals = self._by_category.get(category)
+            return totals.copy() if totals is not None else SalesTotals()
+
+    def type_totals(self, order_type: str) -> SalesTotals:
+        """
+        order_type, Order.get_type() değeridir (örn. "Express").
+        """
+        with self._lock:
+            totals = self._by_type.get(order_type)
+            return totals.copy() if totals is not None else SalesTotals()
+
+    def status_totals(self, status: OrderStatus) -> SalesTotals:
+        """
+        Şu anda verilen durumda olan siparişlerin sayısı ve geliri.
+        """
+        with self._lock:
+            return self._by_status[status].copy()
+
+    def breakdown(self, dimension: str) -> Dict:
+        """
+        Bir boyutun tüm değerlerinin toplamlarını döndürür.
+        dimension: "customer", "category", "type" veya "status".
+        """
+        indexes = {"customer": self._by_customer, "category": self._by_category,
+                   "type": self._by_type, "status": self._by_status}
+        if dimension not in indexes:
+            raise ValueError(f"Geçersiz boyut: '{dimension}'. Desteklenenler: {', '.join(indexes)}.")
+        with self._lock:
+            return {key: totals.copy() for key, totals in indexes[dimension].items()}
+
+    def bucket_totals(self, granularity: int, last: int | None = None) -> List[Tuple[int, SalesTotals]]:
+        """
+        Verilen ayrıntı düzeyindeki kovaları (başlangıç zamanı, toplamlar) olarak zaman sırasıyla döndürür.
+        last verilirse yalnızca en son last kova döner.
+        """
+        if granularity not in self._buckets:
+            raise ValueError(f"{granularity} saniyelik kova tutulmuyor. Tutulanlar: {self.granularities}.")
+        with self._lock:
+            items = list(self._buckets[granularity].items())
+        if last is not None:
+            items = items[-last:] if last > 0 else []
+        return [(start, totals.copy()) for start, totals in items]
+
+    def display(self, top: int = 5):
+        """
+        Satış özetini yazdırır.
+        """
+        overall = self.overall()
+        print("\n--- Satış Özeti ---")
+        print(f"Sipariş: {overall.orders} | Adet: {overall.units} | Ciro: {overall.revenue:.2f}₺ | "
+              f"İade: {overall.refunded:.2f}₺ | Net: {overall.net_revenue:.2f}₺")
+        for title, dimension in (("Duruma Göre", "status"), ("Sipariş Türüne Göre", "type"),
+                                 ("Kategoriye Göre", "category"), ("Müşteriye Göre", "customer")):
+            rows = sorted(self.breakdown(dimension).items(), key=lambda item: item[1].net_revenue, reverse=True)
+            if dimension != "status":
+                rows = rows[:top]
+            print(f"\n{title}:")
+            for key, totals in rows:
+                if totals.orders:
+                    print(f"  {str(key):<25} | {totals.orders:>6} sipariş | {totals.net_revenue:>12.2f}₺")
+        hourly = self.granularities[0]
+        print(f"\nSon kovalar ({hourly} sn):")
+        for start, totals in self.bucket_totals(hourly, last=top):
+            print(f"  {time.strftime('%Y-%m-%d %H:%M', time.localtime(start))} | {totals.orders:>6} sipariş | "
+                  f"{totals.net_revenue:>12.2f}₺")
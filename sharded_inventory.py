@@ -0,0 +1,442 @@
+# sharded_inventory.py
+"""
+Ürünleri product_id'ye göre bölümlere (shard) ayıran, her bölümü ayrı bir işçi süreçte
+tutan envanter. InventoryManager süreç başına tek örnek (Singleton) olduğundan her işçi
+kendi InventoryManager'ına sahiptir; böylece sipariş alımı birden fazla çekirdeğe yayılır.
+
+Yönlendirici (ShardedInventory) siparişleri sepetlerindeki ürünlerin bölümlerine gönderir:
+
+- Tek bölüme düşen sepet: o bölümün işçisi stok rezervasyonu, OrderFactory.create_order,
+  kargo seçimi ve rezervasyonun kesinleştirilmesini tek mesajda yapar.
+- Birden fazla bölüme düşen sepet: iki aşamalı rezervasyon. Önce her bölüm kendi
+  satırlarını rezerve eder (prepare) ve ürün kopyalarını döndürür. Tüm bölümler başarılıysa
+  sipariş yönlendiricide oluşturulur ve rezervasyonlar kesinleştirilir (commit); herhangi
+  biri başarısızsa diğer bölümlerin rezervasyonları bırakılır (abort). Hiçbir bölüm diğerinin
+  kararını beklerken stok düşmediği için satış fazlası (overselling) oluşmaz.
+
+Mesaj sayısını azaltmak için siparişler toplu (place_orders) gönderilir; her toplu işte
+her bölüme en fazla iki mesaj gider ve bölümler paralel çalışır.
+
+İşçiler siparişlerin kendisini saklamaz; sonuçlar OrderResult kayıtları olarak döner.
+
+Kullanım:
+    with ShardedInventory(shard_count=4) as inventory:
+        inventory.load_products(products)
+        results = inventory.place_orders([OrderRequest("c-1", "Ali", "ali@example.com", "standard", [(1, 2)])])
+"""
+import itertools
+import multiprocessing
+import os
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from customer import Customer
+from inventorymanager import InventoryManager
+from order_factory import OrderFactory
+from product import Product
+from shipping_registry import ShippingRegistry
+from shipping_selector import choose_optimal_shipping_strategy
+
+
+class OrderRequest:
+    """
+    Yönlendiriciye gönderilen sipariş isteği. Müşteri nesnesi yerine bilgileri taşınır;
+    böylece istek sipariş geçmişiyle birlikte süreçler arasında kopyalanmaz.
+    """
+    __slots__ = ("customer_id", "customer_name", "customer_email", "order_type", "lines", "kwargs")
+
+    def __init__(self, customer_id: str, customer_name: str, customer_email: str, order_type: str,
+                 lines: Sequence[Tuple[int, int]], kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            lines: (product_id, adet) çiftleri.
+            kwargs: OrderFactory.create_order'a iletilecek ek argümanlar (örn. gift_note).
+        """
+        self.customer_id = customer_id
+        self.customer_name = customer_name
+        self.customer_email = customer_email
+        self.order_type = order_type
+        self.lines = list(lines)
+        self.kwargs = kwargs or {}
+
+    def __reduce__(self):
+        # Süreçler arası kopyalamada __slots__ durumu yerine yapıcı argümanları kullanılır (daha hızlı)
+        return OrderRequest, (self.customer_id, self.customer_name, self.customer_email, self.order_type,
+                              self.lines, self.kwargs)
+
+
+class OrderResult:
+    """
+    İşlenen sipariş isteğinin sonucu. error None değilse sipariş oluşturulmamıştır ve
+    hiçbir bölümde stok düşülmemiştir.
+    """
+    __slots__ = ("order_id", "customer_id", "order_type", "total", "shipping_key", "shards", "error")
+
+    def __init__(self, order_id: Optional[str], customer_id: str, order_type: str, total: float = 0.0,
+                 shipping_key: Optional[str] = None, shards: int = 1, error: Optional[str] = None):
+        self.order_id = order_id
+        self.customer_id = customer_id
+        self.order_type = order_type
+        self.total = total
+        self.shipping_key = shipping_key
+        self.shards = shards # Siparişin dokunduğu bölüm sayısı
+        self.error = error
+
+    def __reduce__(self):
+        return OrderResult, (self.order_id, self.customer_id, self.order_type, self.total, self.shipping_key,
+                             self.shards, self.error)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @classmethod
+    def rejected(cls, request: OrderRequest, error: str, shards: int = 1) -> "OrderResult":
+        return cls(None, request.customer_id, request.order_type, shards=shards, error=error)
+
+
+def _create_order(request: OrderRequest, cart: List[Tuple[Product, int]], shards: int) -> OrderResult:
+    """
+    Rezerve edilmiş sepet için siparişi OrderFactory ile oluşturur ve kargo stratejisini seçer.
+
+    Raises:
+        ValueError: Sipariş türü veya türe özgü argümanlar geçersizse.
+    """
+    customer = Customer(request.customer_id, request.customer_name, request.customer_email)
+    order = OrderFactory.create_order(request.order_type, customer, cart, **request.kwargs)
+    strategy = choose_optimal_shipping_strategy(order, verbose=False)
+    order.set_shipping_strategy(strategy)
+    shipping_key = ShippingRegistry.get_instance().key_of(strategy) or type(strategy).__name__
+    return OrderResult(order.order_id, request.customer_id, request.order_type, order.total, shipping_key, shards)
+
+
+class _ShardWorker:
+    """
+    Bir bölümün işçi sürecinde çalışan tarafı. Bölümün ürünlerini sürecin kendi
+    InventoryManager'ında tutar ve yönlendiriciden gelen mesajları sırayla işler.
+    """
+    def __init__(self):
+        # fork ile başlatılan süreç ana sürecin envanterini devralır; bölüm boş bir envanterle başlar
+        InventoryManager._instance = None
+        self.inventory = InventoryManager.get_instance()
+        self.prepared: Dict[int, int] = {} # {işlem_id: rezervasyon_id}
+        self.orders_placed = 0
+
+    def _cart(self, lines: Sequence[Tuple[int, int]]) -> List[Tuple[Product, int]]:
+        cart = []
+        for product_id, quantity in lines:
+            product = self.inventory.get_product(product_id)
+            if product is None:
+                raise ValueError(f"unknown_product: {product_id}")
+            cart.append((product, quantity))
+        return cart
+
+    def _reserve(self, lines: Sequence[Tuple[int, int]]) -> Tuple[int, List[Tuple[Product, int]]]:
+        cart = self._cart(lines)
+        try:
+            return self.inventory.reserve_stock(cart), cart
+        except ValueError as e:
+            raise ValueError(f"insufficient_stock: {e}")
+
+    def place_local(self, request: OrderRequest) -> OrderResult:
+        """
+        Tüm satırları bu bölümde olan siparişi baştan sona işler.
+        Beklenmeyen hatalar yalnızca bu isteği "shard_error" ile reddeder: toplu işte önceki
+        isteklerin stoğu kesinleşmiş olduğundan hata tüm yanıtı düşürmemelidir.
+        """
+        try:
+            reservation_id, cart = self._reserve(request.lines)
+        except ValueError as e:
+            return OrderResult.rejected(request, str(e))
+        except Exception as e:
+            return OrderResult.rejected(request, f"shard_error: {type(e).__name__}: {e}")
+        try:
+            result = _create_order(request, cart, 1)
+            self.inventory.commit_reservation(reservation_id, verbose=False)
+        except Exception as e:
+            # commit_reservation başarısız olursa rezervasyon açık kalır; her durumda bırakılır
+            self.inventory.release_reservation(reservation_id)
+            if isinstance(e, (ValueError, TypeError)): # TypeError: türe uymayan kwargs
+                return OrderResult.rejected(request, f"invalid_order: {e}")
+            return OrderResult.rejected(request, f"shard_error: {type(e).__name__}: {e}")
+        self.orders_placed += 1
+        return result
+
+    def prepare(self, transaction_id: int, lines: Sequence[Tuple[int, int]]):
+        """
+        İki aşamalı rezervasyonun ilk aşaması: satırları rezerve eder ve ürünlerin kopyalarını döndürür.
+        """
+        try:
+            reservation_id, cart = self._reserve(lines)
+        except ValueError as e:
+            return transaction_id, str(e), None
+        except Exception as e: # place_local gibi: hata yalnızca bu işlemi düşürür
+            return transaction_id, f"shard_error: {type(e).__name__}: {e}", None
+        self.prepared[transaction_id] = reservation_id
+        return transaction_id, None, cart
+
+    def finish(self, commits: Iterable[int], aborts: Iterable[int]):
+        """
+        İki aşamalı rezervasyonun ikinci aşaması: hazırlanan işlemleri kesinleştirir veya bırakır.
+        """
+        for transaction_id in commits:
+            self.inventory.commit_reservation(self.prepared.pop(transaction_id), verbose=False)
+        for transaction_id in aborts: # Bırakma tekrarlanabilir; hazırlanmamış işlemler atlanır
+            reservation_id = self.prepared.pop(transaction_id, None)
+            if reservation_id is not None:
+                self.inventory.release_reservation(reservation_id)
+
+    def handle(self, message: Tuple) -> Any:
+        command = message[0]
+        if command == "batch":
+            _, requests, prepares = message
+            return ([self.place_local(request) for request in requests],
+                    [self.prepare(transaction_id, lines) for transaction_id, lines in prepares])
+        if command == "finish":
+            self.finish(message[1], message[2])
+            return None
+        if command == "load":
+            for product in message[1]:
+                self.inventory.add_product(product, verbose=False)
+            return len(self.inventory.stock)
+        if command == "stock":
+            return {product_id: self.inventory.get_available_stock(product_id) for product_id in message[1]}
+        if command == "stats":
+            products = self.inventory.get_all_products()
+            return {"products": len(products), "orders": self.orders_placed, "prepared": len(self.prepared),
+                    "min_stock": min((product.stock for product in products), default=0)}
+        raise ValueError(f"Bilinmeyen bölüm komutu: '{command}'.")
+
+
+def _run_shard(connection):
+    """
+    İşçi sürecinin giriş noktası. "stop" mesajı gelene veya bağlantı kapanana kadar çalışır.
+    """
+    worker = _ShardWorker()
+    while True:
+        try:
+            message = connection.recv()
+        except EOFError:
+            break
+        if message[0] == "stop":
+            break
+        try:
+            connection.send(("ok", worker.handle(message)))
+        except Exception as e: # Hata yönlendiriciye iletilir, işçi çalışmaya devam eder
+            connection.send(("error", f"{type(e).__name__}: {e}"))
+    connection.close()
+
+
+class ShardedInventory:
+    """
+    Bölümlenmiş envanterin yönlendiricisi. Ürünler product_id % shard_count ile bölümlere dağıtılır.
+    Yönlendirici tek bir iş parçacığından kullanılmalıdır.
+    """
+    def __init__(self, shard_count: Optional[int] = None, start_method: Optional[str] = None):
+        """
+        Args:
+            shard_count: Bölüm (işçi süreç) sayısı; verilmezse çekirdek sayısı.
+            start_method: multiprocessing başlatma yöntemi ("fork", "spawn"...). "spawn" ile
+                işçiler kargo yapılandırmasını (ShippingRegistry) ve sipariş ID üretecini
+                (OrderFactory.set_id_generator) devralmaz, varsayılanları kullanır.
+        """
+        self.shard_count = shard_count or os.cpu_count() or 1
+        if self.shard_count < 1:
+            raise ValueError("Bölüm sayısı en az 1 olmalıdır.")
+        context = multiprocessing.get_context(start_method)
+        self._connections = []
+        self._processes = []
+        for shard in range(self.shard_count):
+            parent_end, child_end = context.Pipe()
+            process = context.Process(target=_run_shard, args=(child_end,), name=f"inventory-shard-{shard}", daemon=True)
+            process.start()
+            child_end.close()
+            self._connections.append(parent_end)
+            self._processes.append(process)
+        self._transaction_ids = itertools.count(1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        İşçi süreçleri durdurur.
+        """
+        for connection in self._connections:
+            try:
+                connection.send(("stop",))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        for connection in self._connections:
+            connection.close()
+        self._connections, self._processes = [], []
+
+    def shard_of(self, product_id: int) -> int:
+        return product_id % self.shard_count
+
+    # --- Mesajlaşma ---
+
+    def _exchange(self, messages: Dict[int, Tuple]) -> Dict[int, Tuple[str, Any]]:
+        """
+        Mesajları önce tüm bölümlere gönderir, ardından yanıtları toplar; bölümler paralel çalışır.
+        Yanıtlar (durum, içerik) çiftleridir: "ok", işçinin bildirdiği hata için "error" veya
+        bağlantısı kopan bölüm için "lost". Bir bölümün hatası diğerlerinin yanıtlarını etkilemez.
+        """
+        replies: Dict[int, Tuple[str, Any]] = {}
+        for shard, message in messages.items():
+            try:
+                self._connections[shard].send(message)
+            except OSError as e:
+                replies[shard] = ("lost", f"{type(e).__name__}: {e}")
+            except Exception as e: # Kopyalanamayan (pickle) mesaj; gönderimden önce oluşur, bağlantı sağlamdır
+                replies[shard] = ("error", f"{type(e).__name__}: {e}")
+        for shard in messages:
+            if shard in replies:
+                continue
+            try:
+                replies[shard] = self._connections[shard].recv()
+            except (EOFError, OSError) as e:
+                replies[shard] = ("lost", f"{type(e).__name__}: {e}")
+        return replies
+
+    def _broadcast(self, messages: Dict[int, Tuple]) -> Dict[int, Any]:
+        """
+        Mesajları tüm bölümlere gönderir ve yanıtların içeriklerini döndürür.
+
+        Raises:
+            RuntimeError: Bir bölüm mesajı işlerken beklenmeyen bir hata verdiyse veya bağlantısı koptuysa.
+        """
+        replies = {}
+        errors = []
+        for shard, (status, payload) in self._exchange(messages).items():
+            if status != "ok":
+                errors.append(f"bölüm {shard}: {payload}")
+            replies[shard] = payload
+        if errors:
+            raise RuntimeError(f"Envanter bölümü hata verdi: {'; '.join(errors)}")
+        return replies
+
+    # --- Envanter işlemleri ---
+
+    def load_products(self, products: Iterable[Product]) -> int:
+        """
+        Ürünleri bölümlerine dağıtır ve bölümlerdeki toplam ürün sayısını döndürür.
+        """
+        partitions: Dict[int, List[Product]] = {shard: [] for shard in range(self.shard_count)}
+        for product in products:
+            partitions[self.shard_of(product.product_id)].append(product)
+        replies = self._broadcast({shard: ("load", batch) for shard, batch in partitions.items()})
+        return sum(replies.values())
+
+    def get_available_stock(self, product_id: int) -> int | None:
+        """
+        Ürünün bölümündeki rezerve edilmemiş stoğunu döndürür. Ürün yoksa None.
+        """
+        shard = self.shard_of(product_id)
+        return self._broadcast({shard: ("stock", [product_id])})[shard][product_id]
+
+    def stats(self) -> List[Dict[str, int]]:
+        """
+        Her bölüm için ürün sayısı, işlenen tek bölümlü sipariş sayısı, bekleyen iki aşamalı işlem
+        sayısı ve en düşük stok.
+        """
+        replies = self._broadcast({shard: ("stats",) for shard in range(self.shard_count)})
+        return [replies[shard] for shard in range(self.shard_count)]
+
+    # --- Sipariş alımı ---
+
+    def place_order(self, request: OrderRequest) -> OrderResult:
+        return self.place_orders([request])[0]
+
+    def place_orders(self, requests: Sequence[OrderRequest]) -> List[OrderResult]:
+        """
+        Sipariş isteklerini bölümlerine yönlendirir ve sonuçları istek sırasıyla döndürür.
+        Aynı toplu iş içinde her bölüm önce tek bölümlü siparişleri, ardından çok bölümlü
+        siparişlerin rezervasyonlarını işler; stok yetmediğinde hangi isteğin reddedileceği
+        bu sıraya bağlıdır.
+
+        Toplu işi işleyemeyen bölümün istekleri "shard_error" ile reddedilir; bu isteklerin
+        diğer bölümlerde hazırlanan rezervasyonları bırakılır ve diğer bölümlerin sonuçları
+        korunur.
+
+        Raises:
+            RuntimeError: İkinci aşamada (commit/abort) bir bölüm hata verdiyse.
+        """
+        results: List[Optional[OrderResult]] = [None] * len(requests)
+        local: Dict[int, List[int]] = {} # {bölüm: [istek sırası]}
+        prepares: Dict[int, List[Tuple[int, List[Tuple[int, int]]]]] = {} # {bölüm: [(işlem_id, satırlar)]}
+        transactions: Dict[int, Tuple[int, List[int]]] = {} # {işlem_id: (istek sırası, bölümler)}
+
+        for index, request in enumerate(requests):
+            if not request.lines:
+                results[index] = OrderResult.rejected(request, "empty_cart: siparişte ürün yok", 0)
+                continue
+            parts: Dict[int, List[Tuple[int, int]]] = {}
+            for product_id, quantity in request.lines:
+                parts.setdefault(self.shard_of(product_id), []).append((product_id, quantity))
+            if len(parts) == 1:
+                local.setdefault(next(iter(parts)), []).append(index)
+                continue
+            transaction_id = next(self._transaction_ids)
+            transactions[transaction_id] = (index, list(parts))
+            for shard, lines in parts.items():
+                prepares.setdefault(shard, []).append((transaction_id, lines))
+
+        shards = set(local) | set(prepares)
+        replies = self._exchange({shard: ("batch", [requests[index] for index in local.get(shard, ())],
+                                          prepares.get(shard, [])) for shard in shards})
+
+        # Faz 1 sonuçları: bölümlerden gelen ürün kopyaları, sepetin orijinal satır sırasıyla birleştirilir
+        prepared: Dict[int, Dict[int, Product]] = {transaction_id: {} for transaction_id in transactions}
+        failures: Dict[int, str] = {}
+        failed_shards: Dict[int, List[int]] = {} # {işlem_id: rezervasyonu başarısız olan bölümler}
+        for shard, (status, payload) in replies.items():
+            if status != "ok":
+                error = f"shard_error: bölüm {shard}: {payload}"
+                for index in local.get(shard, ()):
+                    results[index] = OrderResult.rejected(requests[index], error)
+                for transaction_id, _ in prepares.get(shard, ()):
+                    failures.setdefault(transaction_id, error)
+                    if status == "lost": # Yanıt veren bölüm, yarıda kalan hazırlıkları için yine de abort alır
+                        failed_shards.setdefault(transaction_id, []).append(shard)
+                continue
+            local_results, prepare_results = payload
+            for index, result in zip(local.get(shard, ()), local_results):
+                results[index] = result
+            for transaction_id, error, cart in prepare_results:
+                if error is not None:
+                    failures.setdefault(transaction_id, error)
+                    failed_shards.setdefault(transaction_id, []).append(shard)
+                else:
+                    prepared[transaction_id].update((product.product_id, product) for product, _ in cart)
+
+        # Faz 2: tüm bölümleri başarılı olan siparişler oluşturulup kesinleştirilir, diğerleri bırakılır
+        commits: Dict[int, List[int]] = {}
+        aborts: Dict[int, List[int]] = {}
+        for transaction_id, (index, touched) in transactions.items():
+            request = requests[index]
+            error = failures.get(transaction_id)
+            if error is None:
+                products = prepared[transaction_id]
+                cart = [(products[product_id], quantity) for product_id, quantity in request.lines]
+                try:
+                    results[index] = _create_order(request, cart, len(touched))
+                except (ValueError, TypeError) as e:
+                    error = f"invalid_order: {e}"
+            if error is None:
+                for shard in touched:
+                    commits.setdefault(shard, []).append(transaction_id)
+            else:
+                results[index] = OrderResult.rejected(request, error, len(touched))
+                failed = failed_shards.get(transaction_id, ())
+                for shard in touched:
+                    if shard not in failed:
+                        aborts.setdefault(shard, []).append(transaction_id)
+        if commits or aborts:
+            self._broadcast({shard: ("finish", commits.get(shard, []), aborts.get(shard, []))
+                             for shard in set(commits) | set(aborts)})
+        return results
@@ -0,0 +1,265 @@
+# shipping_registry.py
+"""
+Kargo stratejilerinin paylaşılan örneklerini ve sipariş toplamına göre kargo kademelerini tutar.
+
+Stratejiler durum tutmadığı için her firma için tek bir örnek oluşturulur ve tüm siparişler
+bu örneği paylaşır. Kademeler bildirimsel bir tabloda (alt sınır, firma) tutulur; seçim
+if/elif zinciri yerine sıralı sınırlar üzerinde ikili arama (bisect) ile yapılır.
+
+Yeni firmalar ve kademeler kod değişikliği gerekmeden JSON dosyasından yüklenebilir:
+
+    {
+        "carriers": [
+            {"key": "courier", "name": "Kurye", "base_fee": 20, "rate": 0.03}
+        ],
+        "tiers": [
+            {"min_total": 0, "carrier": "cheap"},
+            {"min_total": 300, "carrier": "courier"},
+            {"min_total": 1000, "carrier": "fast"}
+        ]
+    }
+
+Kullanım:
+    registry = ShippingRegistry.get_instance()
+    strategy = registry.select(order.total)
+    tiers, costs = registry.quote_many(totals)
+    registry.load_config("shipping.json")
+"""
+import threading
+from bisect import bisect_right
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from shippingstrategy import ShippingStrategy, FastShipping, CheapShipping, DroneShipping, ConfiguredShipping
+
+_numpy = None # load_numpy ilk çağrıldığında modül veya (kurulu değilse) False
+
+
+def load_numpy():
+    """
+    NumPy'ı ilk ihtiyaçta içe aktarır ve döndürür; kurulu değilse None. NumPy isteğe bağlıdır
+    ve açılışta yüklenmez: kargo seçimi yapan süreçler içe aktarma maliyetini ödemez.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+# Varsayılan kargo kademelerinin alt sınırları (sipariş toplamı, ₺)
+FAST_SHIPPING_THRESHOLD = 1000
+DRONE_SHIPPING_THRESHOLD = 500
+
+
+class ShippingTierTable:
+    """
+    Sipariş toplamının alt sınırlarına göre sıralanmış, değiştirilemez kargo kademe tablosu.
+
+    i. kademe, toplam tiers[i] alt sınırına eşit veya büyükse ve bir sonraki kademenin
+    sınırından küçükse seçilir. İlk kademenin alt sınırının altındaki toplamlar da ilk
+    kademeye düşer.
+    """
+    def __init__(self, tiers: Sequence[Tuple[float, ShippingStrategy]]):
+        """
+        Args:
+            tiers: Alt sınıra göre artan sırada (alt sınır, strateji) çiftleri.
+        """
+        if not tiers:
+            raise ValueError("Kargo kademe tablosu en az bir kademe içermelidir.")
+        thresholds = [float(min_total) for min_total, _ in tiers]
+        if any(low >= high for low, high in zip(thresholds, thresholds[1:])):
+            raise ValueError("Kargo kademelerinin alt sınırları artan sırada ve benzersiz olmalıdır.")
+        self.thresholds: Tuple[float, ...] = tuple(thresholds)
+        self.strategies: Tuple[ShippingStrategy, ...] = tuple(strategy for _, strategy in tiers)
+        self._bounds = self.thresholds[1:] # İlk kademenin sınırı arama için gerekmez
+        self._linear = all(strategy.is_linear() for strategy in self.strategies)
+
+    def tier_index(self, total: float) -> int:
+        """
+        Toplamın düştüğü kademenin indeksini döndürür.
+        """
+        return bisect_right(self._bounds, total)
+
+    def select(self, total: float) -> ShippingStrategy:
+        """
+        Toplam için kademenin paylaşılan strateji örneğini döndürür.
+        """
+        return self.strategies[bisect_right(self._bounds, total)]
+
+    def quote_many(self, totals: Sequence[float], use_numpy: Optional[bool] = None):
+        """
+        Toplamların her biri için kademe indeksini ve kargo ücretini hesaplar.
+
+        Tüm kademeler BASE_FEE + RATE * toplam biçimindeyse ve NumPy kuruluysa hesap
+        vektörel yapılır; sonuçlar stratejilerin quote metoduyla birebir aynıdır.
+
+        Returns:
+            (kademe indeksleri, kargo ücretleri): NumPy yolunda ndarray, diğerinde liste.
+        """
+        np = load_numpy() if use_numpy or (use_numpy is None and self._linear) else None
+        if use_numpy and np is None:
+            raise ImportError("NumPy kurulu değil; use_numpy=False ile saf Python yolu kullanılabilir.")
+        if use_numpy is None:
+            use_numpy = np is not None
+        if use_numpy and self._linear:
+            values = np.asarray(totals, dtype=np.float64)
+            tiers = np.searchsorted(np.asarray(self._bounds, dtype=np.float64), values, side="right")
+            base_fees = np.array([strategy.BASE_FEE for strategy in self.strategies], dtype=np.float64)
+            rates = np.array([strategy.RATE for strategy in self.strategies], dtype=np.float64)
+            return tiers, base_fees[tiers] + rates[tiers] * values
+
+        bounds, strategies = self._bounds, self.strategies
+        tiers = [bisect_right(bounds, total) for total in totals]
+        return tiers, [strategies[tier].quote(total) for tier, total in zip(tiers, totals)]
+
+    def __len__(self) -> int:
+        return len(self.strategies)
+
+
+class ShippingRegistry:
+    """
+    Kargo firmalarının paylaşılan strateji örneklerini ve geçerli kademe tablosunu tutan Singleton.
+
+    Kademe tablosu değiştirilemez bir nesnedir ve güncellemelerde tek atamayla yenisiyle
+    değiştirilir; böylece okuyucular kilit almadan tutarlı bir tablo görür.
+    """
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance._lock = threading.Lock()
+                    instance.reset()
+                    cls._instance = instance
+        return cls._instance
+
+    @classmethod
+    def get_instance(cls) -> "ShippingRegistry":
+        return cls()
+
+    def reset(self):
+        """
+        Varsayılan firmaları (Hızlı, Drone, Ekonomik) ve kademeleri yükler.
+        """
+        with self._lock:
+            self._carriers: Dict[str, ShippingStrategy] = {}
+            for strategy in (FastShipping(), DroneShipping(), CheapShipping()):
+                self._carriers[strategy.KEY] = strategy
+            self.table = ShippingTierTable([
+                (0, self._carriers[CheapShipping.KEY]),
+                (DRONE_SHIPPING_THRESHOLD, self._carriers[DroneShipping.KEY]),
+                (FAST_SHIPPING_THRESHOLD, self._carriers[FastShipping.KEY]),
+            ])
+
+    def register_carrier(self, strategy: ShippingStrategy, key: Optional[str] = None):
+        """
+        Firmayı kaydeder. Aynı anahtarla kayıtlı bir firma varsa yerini alır;
+        kademe tablosu bu değişiklikten etkilenmez, set_tiers ile yeniden kurulmalıdır.
+        """
+        key = key or strategy.KEY
+        if not key:
+            raise ValueError(f"'{strategy.get_name()}' stratejisi için bir anahtar belirtilmelidir.")
+        with self._lock:
+            self._carriers[key] = strategy
+
+    def get_carrier(self, key: str) -> Optional[ShippingStrategy]:
+        return self._carriers.get(key)
+
+    def get_carriers(self) -> Dict[str, ShippingStrategy]:
+        return dict(self._carriers)
+
+    def key_of(self, strategy: ShippingStrategy) -> Optional[str]:
+        """
+        Strateji örneğinin kayıtlı olduğu anahtarı döndürür.
+        """
+        for key, carrier in self._carriers.items():
+            if carrier is strategy:
+                return key
+        return None
+
+    def set_tiers(self, tiers: Sequence[Tuple[float, str]]):
+        """
+        Kademe tablosunu (alt sınır, firma anahtarı) çiftlerinden yeniden kurar.
+        """
+        with self._lock:
+            resolved = []
+            for min_total, key in sorted(tiers, key=lambda tier: tier[0]):
+                strategy = self._carriers.get(key)
+                if strategy is None:
+                    raise ValueError(f"Kargo kademesi için bilinmeyen firma: '{key}'.")
+                resolved.append((min_total, strategy))
+            self.table = ShippingTierTable(resolved)
+
+    def get_tiers(self) -> List[Tuple[float, str]]:
+        """
+        Geçerli kademeleri (alt sınır, firma anahtarı) listesi olarak döndürür.
+        """
+        table = self.table
+        return [(min_total, self.key_of(strategy)) for min_total, strategy in zip(table.thresholds, table.strategies)]
+
+    def select(self, total: float) -> ShippingStrategy:
+        return self.table.select(total)
+
+    def quote(self, total: float) -> Tuple[ShippingStrategy, float]:
+        """
+        Toplam için seçilen stratejiyi ve kargo ücretini döndürür.
+        """
+        strategy = self.table.select(total)
+        return strategy, strategy.quote(total)
+
+    def quote_many(self, totals: Sequence[float], use_numpy: Optional[bool] = None):
+        """
+        ShippingTierTable.quote_many'nin geçerli tablo üzerindeki kısayolu.
+        """
+        return self.table.quote_many(totals, use_numpy)
+
+    def apply_config(self, config: Mapping[str, Any]):
+        """
+        "carriers" ve "tiers" anahtarlarını içeren yapılandırmayı uygular.
+        Yapılandırma hatalıysa kayıt defteri değişmeden kalır.
+        """
+        carriers = []
+        for entry in config.get("carriers", []):
+            try:
+                carriers.append(ConfiguredShipping(str(entry["key"]), str(entry["name"]),
+                                                   float(entry["base_fee"]), float(entry.get("rate", 0))))
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Geçersiz kargo firması tanımı: {entry} ({e})")
+        tiers = []
+        for entry in config.get("tiers", []):
+            try:
+                tiers.append((float(entry["min_total"]), str(entry["carrier"])))
+            except (KeyError, TypeError) as e:
+                raise ValueError(f"Geçersiz kargo kademesi tanımı: {entry} ({e})")
+
+        known = set(self._carriers) | {carrier.KEY for carrier in carriers}
+        unknown = [key for _, key in tiers if key not in known]
+        if unknown:
+            raise ValueError(f"Kargo kademesi için bilinmeyen firma: '{unknown[0]}'.")
+        if tiers:
+            thresholds = sorted(min_total for min_total, _ in tiers)
+            if len(set(thresholds)) != len(thresholds):
+                raise ValueError("Kargo kademelerinin alt sınırları benzersiz olmalıdır.")
+
+        for carrier in carriers:
+            self.register_carrier(carrier)
+        if tiers:
+            self.set_tiers(tiers)
+
+    def load_config(self, path: str):
+        """
+        Firmaları ve kademeleri JSON dosyasından yükler.
+        """
+        import json # Yapılandırma dosyası nadiren okunur; modülü kullanan süreçlerin açılışını yavaşlatmasın
+        try:
+            with open(path, encoding="utf-8") as f:
+                config = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Kargo yapılandırması okunamadı ({path}): {e}")
+        self.apply_config(config)
+        print(f"Kargo yapılandırması yüklendi: {len(self._carriers)} firma, {len(self.table)} kademe.")
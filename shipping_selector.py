@@ -1,23 +1,48 @@
 # shipping_selector.py
-from shippingstrategy import FastShipping, CheapShipping, DroneShipping, ShippingStrategy
-from order import Order  # Type hinting için
+from shippingstrategy import ShippingStrategy
+from shipping_registry import ShippingRegistry, FAST_SHIPPING_THRESHOLD, DRONE_SHIPPING_THRESHOLD
+from typing import TYPE_CHECKING
+import metrics
 
+if TYPE_CHECKING:
+    from order import Order # Yalnızca tip ipucu; modül yüklenirken order'ı içe aktarmaz
 
-def choose_optimal_shipping_strategy(order: Order) -> ShippingStrategy:
+# Varsayılan firmaların paylaşılan örnekleri (ShippingRegistry'de kayıtlı)
+_registry = ShippingRegistry.get_instance()
+FAST_SHIPPING = _registry.get_carrier("fast")
+DRONE_SHIPPING = _registry.get_carrier("drone")
+CHEAP_SHIPPING = _registry.get_carrier("cheap")
+
+_TIER_SELECTIONS = metrics.MetricsRegistry.get_instance().counter(
+    "shipping_tier_selections_total", "Otomatik kargo seçiminde kademe dağılımı", ("tier", "carrier"))
+
+
+def choose_optimal_shipping_strategy(order: "Order", verbose: bool = True) -> ShippingStrategy:
     """
     Sipariş özelliklerine göre en uygun kargo stratejisini otomatik olarak seçer.
+    Kademeler ShippingRegistry'deki tablodan ikili arama ile bulunur.
+    Toplu işlemlerde verbose=False ile bilgi mesajları kapatılabilir.
     """
-    print("\nOtomatik kargo stratejisi belirleniyor...")
+    table = _registry.table
+    if not metrics.enabled:
+        if not verbose:
+            return table.select(order.total)
+        tier = table.tier_index(order.total)
+        strategy = table.strategies[tier]
+    else:
+        tier = table.tier_index(order.total)
+        strategy = table.strategies[tier]
+        _TIER_SELECTIONS.labels(tier, strategy.get_name()).inc()
+        if not verbose:
+            return strategy
 
-    if order.total >= 1000:
-        strategy = FastShipping()
+    print("\nOtomatik kargo stratejisi belirleniyor...")
+    if tier == len(table) - 1 and tier > 0:
         print(f"Siparişinizin toplam maliyeti ({order.total:.2f}₺) yüksek olduğu için '{strategy.get_name()}' seçildi.")
-    elif order.total >= 500:
-        strategy = DroneShipping()
+    elif tier > 0:
         print(
             f"Siparişinizin toplam maliyeti ({order.total:.2f}₺) orta seviyede olduğu için '{strategy.get_name()}' seçildi.")
     else:
-        strategy = CheapShipping()
         print(f"Siparişinizin toplam maliyeti ({order.total:.2f}₺) düşük olduğu için '{strategy.get_name()}' seçildi.")
 
     return strategy
\ No newline at end of file
@@ -1,61 +1,126 @@
-# shippingstrategy.py
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from order import Order # Döngüsel bağımlılığı önlemek için
-
-class ShippingStrategy(ABC):
-    """
-    Kargo ücreti hesaplama stratejileri için soyut temel sınıf.
-    Strategy desenini uygular.
-    """
-    @abstractmethod
-    def calculate(self, order: 'Order') -> float:
-        """
-        Belirtilen sipariş için kargo ücretini hesaplar.
-        """
-        pass
-
-    @abstractmethod
-    def get_name(self) -> str:
-        """
-        Kargo stratejisinin adını döndürür.
-        """
-        pass
-
-
-class FastShipping(ShippingStrategy):
-    """
-    Hızlı kargo stratejisi. Sabit ücret ve sipariş toplamının belirli bir yüzdesi.
-    """
-    def calculate(self, order: 'Order') -> float:
-        return 30 + 0.05 * order.total  # Sabit 30₺ + %5 sipariş tutarı
-
-    def get_name(self) -> str:
-        return "Hızlı Kargo"
-
-class CheapShipping(ShippingStrategy):
-    """
-    Ekonomik kargo stratejisi. Sabit ücret ve sipariş toplamının daha düşük bir yüzdesi.
-    """
-    def calculate(self, order: 'Order') -> float:
-        return 10 + 0.02 * order.total  # Sabit 10₺ + %2 sipariş tutarı
-
-    def get_name(self) -> str:
-        return "Ekonomik Kargo"
-
-class DroneShipping(ShippingStrategy):
-    """
-    Drone kargo stratejisi. Belirli koşullar (örneğin sipariş ağırlığı) için uygun olabilir.
-    """
-    def calculate(self, order: 'Order') -> float:
-        # Drone kargosu sadece küçük ve hafif siparişler için uygundur.
-        # Burada siparişin toplam ağırlığı, hacmi gibi gerçekçi kriterler eklenebilir.
-        # Basitlik için sadece sabit bir ücret.
-        # if sum(p.weight * q for p, q in order.products) > 5: # Örnek kontrol
-        #     raise ValueError("Drone kargosu bu sipariş için uygun değil.")
-        return 50 # Sabit 50₺ drone kargo ücreti
-
-    def get_name(self) -> str:
-        return "Drone Kargo"
\ No newline at end of file
+# shippingstrategy.py
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from order import Order # Döngüsel bağımlılığı önlemek için
+
+class ShippingStrategy(ABC):
+    """
+    Kargo ücreti hesaplama stratejileri için soyut temel sınıf.
+    Strategy desenini uygular.
+
+    Stratejiler durum tutmaz; ShippingRegistry her strateji için tek bir örneği paylaştırır.
+    Kademe tablosu ve toplu fiyatlama ücreti sipariş toplamından quote ile hesaplar;
+    BASE_FEE + RATE * toplam biçimindeki stratejiler toplu hesaplarda vektörel fiyatlanır.
+    """
+    KEY: str = "" # ShippingRegistry'deki varsayılan anahtar
+    BASE_FEE: float | None = None
+    RATE: float | None = None
+
+    @abstractmethod
+    def calculate(self, order: 'Order') -> float:
+        """
+        Belirtilen sipariş için kargo ücretini hesaplar.
+        """
+        pass
+
+    @abstractmethod
+    def get_name(self) -> str:
+        """
+        Kargo stratejisinin adını döndürür.
+        """
+        pass
+
+    @abstractmethod
+    def quote(self, total: float) -> float:
+        """
+        Verilen sipariş toplamı için kargo ücretini döndürür.
+        """
+        pass
+
+    def is_linear(self) -> bool:
+        """
+        Ücretin BASE_FEE + RATE * toplam biçiminde olup olmadığını döndürür.
+        """
+        return self.BASE_FEE is not None and self.RATE is not None
+
+
+class FastShipping(ShippingStrategy):
+    """
+    Hızlı kargo stratejisi. Sabit ücret ve sipariş toplamının belirli bir yüzdesi.
+    """
+    KEY = "fast"
+    BASE_FEE = 30 # Sabit 30₺
+    RATE = 0.05 # %5 sipariş tutarı
+
+    def calculate(self, order: 'Order') -> float:
+        return self.quote(order.total)
+
+    def quote(self, total: float) -> float:
+        return self.BASE_FEE + self.RATE * total
+
+    def get_name(self) -> str:
+        return "Hızlı Kargo"
+
+class CheapShipping(ShippingStrategy):
+    """
+    Ekonomik kargo stratejisi. Sabit ücret ve sipariş toplamının daha düşük bir yüzdesi.
+    """
+    KEY = "cheap"
+    BASE_FEE = 10 # Sabit 10₺
+    RATE = 0.02 # %2 sipariş tutarı
+
+    def calculate(self, order: 'Order') -> float:
+        return self.quote(order.total)
+
+    def quote(self, total: float) -> float:
+        return self.BASE_FEE + self.RATE * total
+
+    def get_name(self) -> str:
+        return "Ekonomik Kargo"
+
+class DroneShipping(ShippingStrategy):
+    """
+    Drone kargo stratejisi. Belirli koşullar (örneğin sipariş ağırlığı) için uygun olabilir.
+    """
+    KEY = "drone"
+    BASE_FEE = 50 # Sabit 50₺ drone kargo ücreti
+    RATE = 0 # Sipariş tutarından bağımsız
+
+    def calculate(self, order: 'Order') -> float:
+        # Drone kargosu sadece küçük ve hafif siparişler için uygundur.
+        # Burada siparişin toplam ağırlığı, hacmi gibi gerçekçi kriterler eklenebilir.
+        # Basitlik için sadece sabit bir ücret.
+        # if sum(p.weight * q for p, q in order.products) > 5: # Örnek kontrol
+        #     raise ValueError("Drone kargosu bu sipariş için uygun değil.")
+        return self.quote(order.total)
+
+    def quote(self, total: float) -> float:
+        return self.BASE_FEE
+
+    def get_name(self) -> str:
+        return "Drone Kargo"
+
+
+class ConfiguredShipping(ShippingStrategy):
+    """
+    Kod değişikliği gerekmeden, yapılandırma dosyasından tanımlanan kargo firması.
+    Ücret: base_fee + rate * sipariş toplamı.
+    """
+    def __init__(self, key: str, name: str, base_fee: float, rate: float = 0):
+        if base_fee < 0 or rate < 0:
+            raise ValueError(f"'{name}' için ücret ve oran negatif olamaz.")
+        self.KEY = key
+        self.BASE_FEE = base_fee
+        self.RATE = rate
+        self._name = name
+
+    def calculate(self, order: 'Order') -> float:
+        return self.quote(order.total)
+
+    def quote(self, total: float) -> float:
+        return self.BASE_FEE + self.RATE * total
+
+    def get_name(self) -> str:
+        return self._name
\ No newline at end of file
@@ -0,0 +1,433 @@
+# sqlite_repository.py
+"""
+Ürünleri, müşterileri ve siparişleri SQLite veritabanında saklayan depo (repository) katmanı.
+
+- Veritabanı WAL kipinde açılır; okumalar yazmaları beklemez.
+- Yazmalar executemany ile toplu halde ve tek işlem (transaction) içinde yapılır.
+- Sorgular sabit, parametreli SQL metinleridir; sqlite3 modülü bunları hazırlanmış
+  ifade (prepared statement) önbelleğinde tutar ve tekrar derlemez.
+- Ürün kataloğu SQLiteProductStore ile tembel (lazy) yüklenir: InventoryManager bu depoyu
+  set_storage_backend ile kullanır ve başlangıçta tüm katalog belleğe alınmaz.
+
+Kullanım:
+    repository = SQLiteRepository("magaza.db")
+    inventory.set_storage_backend(repository.product_store())
+    customers = repository.load_customers()
+    orders = repository.load_orders(customers, inventory)
+"""
+import sqlite3
+import threading
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from customer import Customer
+from order import Order, OrderStatus
+from order_factory import OrderFactory
+from order_decorator import OrderComponent, decorator_names
+from product import Product, PhysicalProduct, DigitalProduct, ServiceProduct
+from product_factory import ProductFactory
+from shipping_registry import ShippingRegistry
+
+if TYPE_CHECKING:
+    from inventorymanager import InventoryManager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    product_id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    category TEXT NOT NULL,
+    price REAL NOT NULL,
+    stock INTEGER,
+    download_link TEXT,
+    duration INTEGER
+);
+CREATE TABLE IF NOT EXISTS customers (
+    customer_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS orders (
+    order_id TEXT PRIMARY KEY,
+    customer_id TEXT NOT NULL,
+    order_type TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total REAL NOT NULL,
+    shipping TEXT,
+    decorators TEXT NOT NULL DEFAULT '',
+    expected_delivery_date TEXT,
+    gift_note TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_orders_customer_id ON orders (customer_id);
+CREATE INDEX IF NOT EXISTS idx_orders_status ON orders (status);
+CREATE TABLE IF NOT EXISTS order_lines (
+    order_id TEXT NOT NULL,
+    line_no INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    PRIMARY KEY (order_id, line_no)
+) WITHOUT ROWID;
+"""
+
+_UPSERT_PRODUCT = (
+    "INSERT INTO products (product_id, kind, name, category, price, stock, download_link, duration) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (product_id) DO UPDATE SET kind = excluded.kind, name = excluded.name, "
+    "category = excluded.category, price = excluded.price, stock = excluded.stock, "
+    "download_link = excluded.download_link, duration = excluded.duration"
+)
+_SELECT_PRODUCT = (
+    "SELECT product_id, kind, name, category, price, stock, download_link, duration "
+    "FROM products WHERE product_id = ?"
+)
+_SELECT_PRODUCTS = (
+    "SELECT product_id, kind, name, category, price, stock, download_link, duration "
+    "FROM products ORDER BY product_id"
+)
+_SELECT_INDEX_ROWS = (
+    "SELECT product_id, category, kind, price, kind = 'physical' AND stock <= 0 "
+    "FROM products ORDER BY product_id"
+)
+_UPSERT_CUSTOMER = (
+    "INSERT INTO customers (customer_id, name, email) VALUES (?, ?, ?) "
+    "ON CONFLICT (customer_id) DO UPDATE SET name = excluded.name, email = excluded.email"
+)
+# Sipariş güncellenirken satır silinip yeniden eklenmez; böylece rowid (kayıt sırası) korunur
+_UPSERT_ORDER = (
+    "INSERT INTO orders (order_id, customer_id, order_type, status, total, shipping, decorators, "
+    "expected_delivery_date, gift_note) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+    "ON CONFLICT (order_id) DO UPDATE SET customer_id = excluded.customer_id, "
+    "order_type = excluded.order_type, status = excluded.status, total = excluded.total, "
+    "shipping = excluded.shipping, decorators = excluded.decorators, "
+    "expected_delivery_date = excluded.expected_delivery_date, gift_note = excluded.gift_note"
+)
+_DELETE_ORDER_LINES = "DELETE FROM order_lines WHERE order_id = ?"
+_INSERT_ORDER_LINE = "INSERT INTO order_lines (order_id, line_no, product_id, quantity) VALUES (?, ?, ?, ?)"
+_UPDATE_ORDER_STATUS = "UPDATE orders SET status = ? WHERE order_id = ?"
+
+# Veritabanındaki ürün türü -> Product.get_type() değeri
+PRODUCT_TYPES = {"physical": "Physical", "digital": "Digital", "service": "Service"}
+
+# Kargo stratejileri ShippingRegistry anahtarlarıyla saklanır; yüklenen siparişler kayıtlı örnekleri paylaşır.
+# Anahtarlardan önce yazılmış kayıtlardaki sınıf adları da okunabilir.
+LEGACY_SHIPPING_KEYS = {"FastShipping": "fast", "CheapShipping": "cheap", "DroneShipping": "drone"}
+
+
+def _product_row(product: Product) -> Tuple:
+    """
+    Ürün nesnesini products tablosunun bir satırına çevirir.
+    """
+    stock = download_link = duration = None
+    if isinstance(product, PhysicalProduct):
+        kind, stock = "physical", product.stock
+    elif isinstance(product, DigitalProduct):
+        kind, download_link = "digital", product.download_link
+    elif isinstance(product, ServiceProduct):
+        kind, duration = "service", product.duration
+    else:
+        raise ValueError(f"Desteklenmeyen ürün türü: {type(product).__name__}")
+    return (product.product_id, kind, product.name, product.category, product.price, stock, download_link, duration)
+
+
+def _product_from_row(row: Tuple) -> Product:
+    """
+    products tablosunun bir satırından ProductFactory ile ürün nesnesi oluşturur.
+    """
+    product_id, kind, name, category, price, stock, download_link, duration = row
+    detail = {"physical": stock, "digital": download_link, "service": duration}[kind]
+    return ProductFactory.create_product(kind, product_id, name, category, price, detail)
+
+
+class SQLiteRepository:
+    """
+    Ürün, müşteri ve sipariş kayıtlarını tek bir SQLite veritabanı dosyasında tutar.
+    Bağlantı iş parçacıkları arasında paylaşılır; erişim bir kilitle sıralanır.
+    """
+    def __init__(self, path: str, batch_size: int = 500):
+        if batch_size <= 0:
+            raise ValueError("batch_size 0'dan büyük olmalıdır.")
+        self.path = path
+        self.batch_size = batch_size
+        self.lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL") # WAL kipinde her işlemde fsync gerekmez
+        with self.lock, self.connection:
+            self.connection.executescript(SCHEMA)
+        self._product_store: Optional[SQLiteProductStore] = None
+
+    def product_store(self) -> "SQLiteProductStore":
+        """
+        InventoryManager.set_storage_backend ile kullanılacak tembel ürün deposunu döndürür.
+        """
+        if self._product_store is None:
+            self._product_store = SQLiteProductStore(self, self.batch_size)
+        return self._product_store
+
+    def flush(self):
+        """
+        Ürün deposunda bekleyen değişiklikleri veritabanına yazar.
+        """
+        if self._product_store is not None:
+            self._product_store.flush()
+
+    def close(self):
+        """
+        Bekleyen değişiklikleri yazar ve bağlantıyı kapatır.
+        """
+        self.flush()
+        with self.lock:
+            self.connection.close()
+
+    def _write_many(self, statement: str, rows: List[Tuple]):
+        """
+        Satırları tek işlem içinde, batch_size büyüklüğünde parçalar halinde yazar.
+        """
+        with self.lock, self.connection:
+            for start in range(0, len(rows), self.batch_size):
+                self.connection.executemany(statement, rows[start:start + self.batch_size])
+
+    # --- Ürünler ---
+
+    def save_products(self, products: Iterable[Product]):
+        """
+        Ürünleri ekler veya günceller.
+        """
+        self._write_many(_UPSERT_PRODUCT, [_product_row(product) for product in products])
+
+    def load_product(self, product_id: int) -> Optional[Product]:
+        """
+        Tek bir ürünü veritabanından okur. Bulamazsa None döner.
+        """
+        with self.lock:
+            row = self.connection.execute(_SELECT_PRODUCT, (product_id,)).fetchone()
+        return _product_from_row(row) if row is not None else None
+
+    def has_products(self) -> bool:
+        """
+        Veritabanında en az bir ürün olup olmadığını döndürür.
+        """
+        with self.lock:
+            return self.connection.execute("SELECT 1 FROM products LIMIT 1").fetchone() is not None
+
+    # --- Müşteriler ---
+
+    def save_customers(self, customers: Iterable[Customer]):
+        """
+        Müşterileri ekler veya günceller.
+        """
+        self._write_many(_UPSERT_CUSTOMER, [(c.customer_id, c.name, c.email) for c in customers])
+
+    def load_customers(self) -> List[Customer]:
+        """
+        Tüm müşterileri kayıt sırasıyla okur.
+        """
+        with self.lock:
+            rows = self.connection.execute("SELECT customer_id, name, email FROM customers ORDER BY rowid").fetchall()
+        return [Customer(customer_id, name, email) for customer_id, name, email in rows]
+
+    # --- Siparişler ---
+
+    def save_orders(self, orders: Iterable[OrderComponent | Order]):
+        """
+        Siparişleri (satırları ve dekoratör adlarıyla birlikte) ekler veya günceller.
+        Dekore edilmiş siparişler ya da doğrudan Order nesneleri verilebilir.
+        """
+        shipping_registry = ShippingRegistry.get_instance()
+        order_rows = []
+        line_rows = []
+        order_ids = []
+        for component in orders:
+            if isinstance(component, OrderComponent):
+                order, decorators = component.order, decorator_names(component)
+            else:
+                order, decorators = component, []
+            OrderFactory.check_restorable(order)
+            strategy = order.shipping_strategy
+            shipping = (shipping_registry.key_of(strategy) or type(strategy).__name__) if strategy is not None else None
+            order_rows.append((
+                order.order_id, order.customer.customer_id, order.get_type(), order.status.name, order.total,
+                shipping, ",".join(decorators),
+                getattr(order, "expected_delivery_date", None), getattr(order, "gift_note", None),
+            ))
+            order_ids.append((order.order_id,))
+            line_rows.extend((order.order_id, line_no, product.product_id, quantity)
+                             for line_no, (product, quantity) in enumerate(order.products))
+
+        with self.lock, self.connection:
+            self.connection.executemany(_UPSERT_ORDER, order_rows)
+            self.connection.executemany(_DELETE_ORDER_LINES, order_ids)
+            self.connection.executemany(_INSERT_ORDER_LINE, line_rows)
+
+    def update_order_status(self, order: OrderComponent | Order):
+        """
+        Yalnızca siparişin durum sütununu günceller.
+        """
+        with self.lock, self.connection:
+            self.connection.execute(_UPDATE_ORDER_STATUS, (order.status.name, order.order_id))
+
+    def update_order_statuses(self, orders: Iterable[OrderComponent | Order]):
+        """
+        Toplu durum değişikliğinden sonra siparişlerin durum sütunlarını tek işlemde günceller.
+        """
+        rows = [(order.status.name, order.order_id) for order in orders]
+        with self.lock, self.connection:
+            self.connection.executemany(_UPDATE_ORDER_STATUS, rows)
+
+    def load_orders(self, customers: Iterable[Customer], inventory: "InventoryManager") -> List[OrderComponent]:
+        """
+        Tüm siparişleri kayıt sırasıyla okur, dekoratörlerini yeniden uygular ve
+        müşterilerin sipariş geçmişlerine ekler.
+
+        Siparişin kayıtlı toplamı korunur (ürün fiyatları sonradan değişmiş olabilir) ve
+        durum, gözlemcilere bildirim gönderilmeden geri yüklenir. Ürünler envanterden
+        okunduğu için yalnızca siparişlerde geçen ürünler belleğe yüklenir.
+        """
+        customers_by_id = {customer.customer_id: customer for customer in customers}
+        with self.lock:
+            line_rows = self.connection.execute(
+                "SELECT order_id, product_id, quantity FROM order_lines ORDER BY order_id, line_no").fetchall()
+            order_rows = self.connection.execute(
+                "SELECT order_id, customer_id, order_type, status, total, shipping, decorators, "
+                "expected_delivery_date, gift_note FROM orders ORDER BY rowid").fetchall()
+
+        lines_by_order: Dict[str, List[Tuple[int, int]]] = {}
+        for order_id, product_id, quantity in line_rows:
+            lines_by_order.setdefault(order_id, []).append((product_id, quantity))
+
+        loaded: List[OrderComponent] = []
+        for (order_id, customer_id, order_type, status, total, shipping, decorators,
+             expected_delivery_date, gift_note) in order_rows:
+            component = OrderFactory.restore_component(
+                order_id, customers_by_id, customer_id, order_type, lines_by_order.get(order_id, ()), inventory,
+                total, OrderStatus[status], LEGACY_SHIPPING_KEYS.get(shipping, shipping) if shipping else shipping,
+                filter(None, decorators.split(",")), expected_delivery_date, gift_note)
+            if component is not None:
+                loaded.append(component)
+        return loaded
+
+
+class SQLiteProductStore(MutableMapping):
+    """
+    InventoryManager için SQLite tabanlı, tembel yüklenen ürün deposu.
+
+    Ürün nesneleri ilk erişildiklerinde veritabanından okunup önbelleğe alınır; aynı ID
+    için her zaman aynı nesne döner. Eklenen veya yerinde değiştirilen (mark_dirty)
+    ürünler bekleyen yazmalar olarak tutulur ve batch_size'a ulaşınca ya da flush()
+    çağrıldığında tek işlemde yazılır.
+    """
+    def __init__(self, repository: SQLiteRepository, batch_size: int = 500):
+        self._repository = repository
+        self._batch_size = batch_size
+        self._cache: Dict[int, Product] = {}
+        self._dirty: Dict[int, None] = {} # Yazılmayı bekleyen ürün ID'leri (ekleme sırasıyla)
+
+    def flush(self):
+        """
+        Bekleyen ürün yazmalarını tek işlemde veritabanına yazar.
+        """
+        with self._repository.lock:
+            if not self._dirty:
+                return
+            products = [self._cache[product_id] for product_id in self._dirty]
+            self._repository.save_products(products)
+            self._dirty.clear()
+
+    def mark_dirty(self, product_id: int):
+        """
+        Önbellekteki ürünün yerinde değiştiğini (örn. stok düşümü) kaydeder.
+        """
+        with self._repository.lock:
+            if product_id in self._cache:
+                self._dirty[product_id] = None
+                if len(self._dirty) >= self._batch_size:
+                    self.flush()
+
+    def index_rows(self) -> Iterator[Tuple[int, str, str, float, bool]]:
+        """
+        İkincil indeksler için (product_id, kategori, tür, fiyat, stok_tükendi_mi) satırlarını
+        ürün nesneleri oluşturmadan döndürür.
+        """
+        self.flush()
+        with self._repository.lock:
+            rows = self._repository.connection.execute(_SELECT_INDEX_ROWS).fetchall()
+        for product_id, category, kind, price, out_of_stock in rows:
+            yield product_id, category, PRODUCT_TYPES[kind], price, bool(out_of_stock)
+
+    def name_rows(self) -> Iterator[Tuple[int, str]]:
+        """
+        Arama indeksi için (product_id, ad) satırlarını ürün nesneleri oluşturmadan döndürür.
+        """
+        self.flush()
+        with self._repository.lock:
+            rows = self._repository.connection.execute("SELECT product_id, name FROM products").fetchall()
+        return iter(rows)
+
+    def __getitem__(self, product_id: int) -> Product:
+        product = self._cache.get(product_id)
+        if product is None:
+            with self._repository.lock:
+                product = self._cache.get(product_id)
+                if product is None:
+                    product = self._repository.load_product(product_id)
+                    if product is None:
+                        raise KeyError(product_id)
+                    self._cache[product_id] = product
+        return product
+
+    def __setitem__(self, product_id: int, product: Product):
+        with self._repository.lock:
+            self._cache[product_id] = product
+            self._dirty[product_id] = None
+            if len(self._dirty) >= self._batch_size:
+                self.flush()
+
+    def __delitem__(self, product_id: int):
+        with self._repository.lock:
+            if product_id not in self:
+                raise KeyError(product_id)
+            self._cache.pop(product_id, None)
+            self._dirty.pop(product_id, None)
+            with self._repository.connection:
+                self._repository.connection.execute("DELETE FROM products WHERE product_id = ?", (product_id,))
+
+    def __contains__(self, product_id) -> bool:
+        if product_id in self._cache:
+            return True
+        try:
+            self[product_id]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[int]:
+        self.flush()
+        with self._repository.lock:
+            rows = self._repository.connection.execute("SELECT product_id FROM products ORDER BY product_id").fetchall()
+        return (product_id for (product_id,) in rows)
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._repository.lock:
+            return self._repository.connection.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def _load_all(self) -> List[Product]:
+        """
+        Tüm ürünleri tek sorguda okur; önbellekte olanlar için mevcut nesne kullanılır.
+        """
+        self.flush()
+        with self._repository.lock:
+            rows = self._repository.connection.execute(_SELECT_PRODUCTS).fetchall()
+            products = []
+            for row in rows:
+                product = self._cache.get(row[0])
+                if product is None:
+                    product = self._cache[row[0]] = _product_from_row(row)
+                products.append(product)
+        return products
+
+    def values(self) -> List[Product]:
+        return self._load_all()
+
+    def items(self) -> List[Tuple[int, Product]]:
+        return [(product.product_id, product) for product in self._load_all()]
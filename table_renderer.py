@@ -0,0 +1,141 @@
+# table_renderer.py
+"""
+Ürün ve sipariş tablolarının satır önbellekli, sayfalı çıktısı.
+
+Biçimlendirilmiş satırlar nesnenin anahtarı (ürün ID'si, sipariş ID'si) ile birlikte nesnenin
+sürümüne (Product.version, Order.version) göre önbelleğe alınır. Sürüm update_stock ve
+update_status ile yenilendiği için yalnızca değişen satırlar yeniden biçimlendirilir.
+Sürümler tüm nesneler için ortak sayaçtan alındığından aynı ID ile yeniden oluşturulan
+bir ürün de eski satırı kullanmaz.
+
+Tablolar satır satır üretilir ve sayfa sayfa yazdırılır; 100 bin ürünlük bir listede bile
+bellekte yalnızca bir sayfalık metin birikir.
+
+Kullanım:
+    print_paginated(product_table_header(), product_rows(inventory.iter_products()), page_size=50)
+    str(order)  # order_text_cache üzerinden
+"""
+import threading
+from itertools import islice
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from product import Product, PhysicalProduct, DigitalProduct, ServiceProduct
+
+PRODUCT_TABLE_WIDTH = 90
+DEFAULT_CACHE_CAPACITY = 200_000 # Önbellekte tutulacak en fazla satır
+STREAM_CHUNK = 1000 # Sayfalama yokken tek seferde yazdırılan satır sayısı
+
+
+class RenderCache:
+    """
+    {anahtar: (sürüm, metin)} biçiminde, kapasitesi sınırlı satır önbelleği.
+    Kapasite aşıldığında en eski eklenen satır atılır. Okuma ve ekleme kilit altında yapılır;
+    metin kilit dışında üretilir.
+    """
+    def __init__(self, render: Callable[[Any], str], capacity: int = DEFAULT_CACHE_CAPACITY):
+        """
+        Args:
+            render: Önbellekte olmayan veya sürümü eskimiş nesne için metni üreten fonksiyon.
+            capacity: Önbellekte tutulacak en fazla satır sayısı.
+        """
+        if capacity < 1:
+            raise ValueError("Önbellek kapasitesi en az 1 olmalıdır.")
+        self._render = render
+        self._entries: Dict[Hashable, Tuple[int, str]] = {}
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, version: int, obj: Any) -> str:
+        """
+        Nesnenin metnini döndürür; önbellekteki satırın sürümü farklıysa yeniden üretir.
+        """
+        entries = self._entries
+        with self._lock:
+            entry = entries.get(key)
+            if entry is not None and entry[0] == version:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        text = self._render(obj)
+        with self._lock:
+            # Metin üretilirken başka bir iş parçacığı aynı anahtarı eklemiş olabilir
+            if key not in entries and len(entries) >= self.capacity:
+                del entries[next(iter(entries))]
+            entries[key] = (version, text)
+        return text
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def product_detail(product: Product) -> str:
+    """
+    Tablonun "Stok/Detay" sütunu: fiziksel ürünlerde stok, dijitalde kısaltılmış link, hizmette süre.
+    """
+    if isinstance(product, PhysicalProduct):
+        return str(product.stock)
+    if isinstance(product, DigitalProduct):
+        return f"Link: {product.download_link[:10]}..." # Link kısaltıldı
+    if isinstance(product, ServiceProduct):
+        return f"Süre: {product.duration} gün"
+    return "N/A"
+
+
+def format_product_row(product: Product) -> str:
+    return (f"{product.product_id:<4} | {product.name:<25} | {product.get_type():<10} | "
+            f"{product.category:<15} | {product.price:<8.2f} | {product_detail(product):<15}")
+
+
+def product_table_header() -> List[str]:
+    return [f"{'ID':<4} | {'Ürün Adı':<25} | {'Tür':<10} | {'Kategori':<15} | {'Fiyat':<8} | {'Stok/Detay':<15}",
+            "-" * PRODUCT_TABLE_WIDTH]
+
+
+# Envanter ve ürün yönetimi tablolarının paylaştığı satır önbelleği
+product_row_cache = RenderCache(format_product_row)
+
+
+def product_rows(products: Iterable[Product], cache: RenderCache = product_row_cache) -> Iterator[str]:
+    """
+    Ürünlerin tablo satırlarını sırayla üretir; değişmemiş ürünlerin satırları önbellekten gelir.
+    """
+    get = cache.get
+    for product in products:
+        yield get(product.product_id, product.version, product)
+
+
+# Order.__str__ metinlerinin önbelleği; sipariş ID'si ve Order.version ile anahtarlanır
+order_text_cache = RenderCache(lambda order: order.render())
+
+
+def print_paginated(header: List[str], rows: Iterable[str], page_size: Optional[int] = None,
+                    prompt: Callable[[str], str] = input) -> int:
+    """
+    Satırları sayfa sayfa yazdırır ve yazdırılan satır sayısını döndürür.
+
+    page_size verilirse her sayfanın başında başlık tekrarlanır ve sonraki sayfadan önce
+    kullanıcıya sorulur; "q" girilirse çıktı kesilir. Verilmezse tüm satırlar soru sormadan,
+    STREAM_CHUNK satırlık parçalar halinde yazdırılır.
+    """
+    rows = iter(rows)
+    chunk_size = page_size or STREAM_CHUNK
+    printed = 0
+    page = list(islice(rows, chunk_size))
+    while page:
+        if printed == 0 or page_size:
+            print("\n".join(header))
+        print("\n".join(page))
+        printed += len(page)
+        page = list(islice(rows, chunk_size))
+        if page and page_size:
+            answer = prompt(f"-- {printed} satır gösterildi. Devam için Enter, çıkmak için 'q': ")
+            if answer.strip().lower() == "q":
+                break
+    return printed
@@ -0,0 +1,69 @@
+# tests/test_batch_pricing.py
+"""
+register_order_type ile sınıfıyla eklenen sipariş türlerinin toplu fiyatlanabildiğini ve
+sonuçların nesne tabanlı yol ile aynı olduğunu, kayıtsız türlerin reddedildiğini ve 127'den
+fazla kargo kademesinin kademe indekslerini taşırmadığını doğrular.
+
+Kullanım:
+    python -m pytest tests/test_batch_pricing.py
+"""
+import os
+import sys
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from batch_pricing import OrderBatch, price_batch
+from customer import Customer
+from order import Order
+from order_factory import OrderFactory
+from product import PhysicalProduct
+from shipping_registry import ShippingRegistry
+
+
+class RushOrder(Order):
+    __slots__ = ()
+
+    def get_type(self) -> str:
+        return "Rush"
+
+
+class BatchPricingTest(unittest.TestCase):
+    def setUp(self):
+        OrderFactory.register_order_type("rush", RushOrder)
+        self.customer = Customer("batch-c", "Test Müşteri", "batch@example.com")
+        self.product = PhysicalProduct(94401, "Test Kalemi", "Kırtasiye", 12.5, 10**6)
+
+    def tearDown(self):
+        OrderFactory.unregister_order_type("rush")
+
+    def test_plugin_order_type_matches_object_path(self):
+        orders = [OrderFactory.create_order(order_type, self.customer, [(self.product, quantity)])
+                  for order_type, quantity in (("rush", 3), ("express", 2), ("standard", 40), ("rush", 100))]
+        batch = OrderBatch.from_orders(orders)
+        self.assertEqual(batch.type_names, ["Rush", "Express", "Standard"])
+
+        result = price_batch(batch, use_numpy=False)
+        self.assertEqual(list(result.totals), [order.total for order in orders])
+
+    def test_unregistered_type_is_rejected(self):
+        with self.assertRaises(ValueError):
+            OrderBatch().add("x-1", "Unregistered", [(1.0, 1)])
+
+    def test_many_shipping_tiers(self):
+        registry = ShippingRegistry.get_instance()
+        tiers = registry.get_tiers()
+        registry.set_tiers([(float(i), "cheap") for i in range(300)])
+        try:
+            batch = OrderBatch()
+            for i, price in enumerate((0.5, 150.5, 299.5, 1000.0)):
+                batch.add(f"tier-{i}", "Standard", [(price, 1)])
+            result = price_batch(batch, use_numpy=False)
+        finally:
+            registry.set_tiers(tiers)
+        self.assertEqual(list(result.shipping_tiers), [0, 150, 299, 299])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+# tests/test_bulk_order_pipeline.py
+"""
+Toplu alım hattının hatalı türdeki alanları içeren satırları çalışmayı durdurmadan
+reddettiğini doğrular.
+
+Kullanım:
+    python -m pytest tests/test_bulk_order_pipeline.py
+"""
+import json
+import os
+import sys
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bulk_order_pipeline import BulkOrderPipeline
+from customer import Customer
+from inventorymanager import InventoryManager
+from product import PhysicalProduct
+
+PRODUCT_ID = 94001
+
+
+class BulkOrderPipelineValidationTest(unittest.TestCase):
+    def setUp(self):
+        inventory = InventoryManager.get_instance()
+        if inventory.get_product(PRODUCT_ID) is None:
+            inventory.add_product(PhysicalProduct(PRODUCT_ID, "Test Defteri", "Kırtasiye", 10.0, 10**6), verbose=False)
+        self.customers = {"c-1": Customer("c-1", "Test Müşteri", "test@example.com")}
+
+    def line(self, **fields) -> str:
+        record = {"customer_id": "c-1", "items": [{"product_id": PRODUCT_ID, "quantity": 1}]}
+        record.update(fields)
+        return json.dumps(record)
+
+    def test_bad_field_types_are_rejected_without_stopping_the_run(self):
+        lines = [
+            self.line(order_type=5),
+            self.line(decorators="fragile"),
+            self.line(decorators=[1]),
+            self.line(customer_id=["c-1"]),
+            self.line(items={"product_id": PRODUCT_ID}),
+            self.line(gift_note={"not": "x"}, order_type="gift"),
+            self.line(),
+        ]
+        sink = []
+        report = BulkOrderPipeline(self.customers).run(enumerate(lines, start=1), sink=sink)
+
+        self.assertEqual(report.accepted, 1)
+        self.assertEqual(report.rejected, 6)
+        self.assertEqual(len(sink), 1)
+        reasons = {reason.split(":")[0] for reason in report.reject_reasons}
+        self.assertEqual(reasons, {"invalid_field", "invalid_decorators", "invalid_items"})
+
+
+if __name__ == "__main__":
+    unittest.main()
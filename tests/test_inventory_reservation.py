@@ -0,0 +1,61 @@
+# tests/test_inventory_reservation.py
+"""
+Stok rezervasyonunun kesinleştirilmesi başarısız olduğunda hiçbir stoğun düşülmediğini ve
+rezervasyonun bırakılabilir şekilde açık kaldığını doğrular.
+
+Kullanım:
+    python -m pytest tests/test_inventory_reservation.py
+"""
+import os
+import sys
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inventorymanager import InventoryManager
+from product import DigitalProduct, PhysicalProduct
+
+FIRST_ID, SECOND_ID, DIGITAL_ID = 94201, 94202, 94203
+
+
+class CommitReservationTest(unittest.TestCase):
+    def setUp(self):
+        self.inventory = InventoryManager.get_instance()
+        for product in (PhysicalProduct(FIRST_ID, "Test Kalemi", "Kırtasiye", 5.0, 10),
+                        PhysicalProduct(SECOND_ID, "Test Silgisi", "Kırtasiye", 2.0, 10),
+                        DigitalProduct(DIGITAL_ID, "Test E-Kitabı", "Kitap", 20.0, "https://example.com/e")):
+            if self.inventory.get_product(product.product_id) is None:
+                self.inventory.add_product(product, verbose=False)
+        self.first = self.inventory.get_product(FIRST_ID)
+        self.second = self.inventory.get_product(SECOND_ID)
+        self.first.stock = self.second.stock = 10
+
+    def test_failed_commit_changes_nothing_and_can_be_released(self):
+        reservation_id = self.inventory.reserve_stock([(self.first, 3), (self.second, 4)])
+        self.second.stock = 2 # Rezervasyondan sonra stok dışarıdan azaltıldı
+
+        with self.assertRaises(ValueError):
+            self.inventory.commit_reservation(reservation_id, verbose=False)
+        self.assertEqual((self.first.stock, self.second.stock), (10, 2))
+
+        self.inventory.release_reservation(reservation_id)
+        self.assertEqual(self.inventory.get_available_stock(FIRST_ID), 10)
+        self.assertEqual(self.inventory.get_available_stock(SECOND_ID), 2)
+
+    def test_successful_commit_finalizes_once(self):
+        reservation_id = self.inventory.reserve_stock([(self.first, 3)])
+        self.inventory.commit_reservation(reservation_id, verbose=False)
+        self.assertEqual(self.first.stock, 7)
+        with self.assertRaises(ValueError):
+            self.inventory.commit_reservation(reservation_id, verbose=False)
+        with self.assertRaises(ValueError):
+            self.inventory.release_reservation(reservation_id)
+        self.assertEqual(self.inventory.get_available_stock(FIRST_ID), 7)
+
+    def test_untracked_products_have_unlimited_stock(self):
+        self.assertEqual(self.inventory.get_available_stock(DIGITAL_ID), float("inf"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+# tests/test_metrics.py
+"""
+Sayaç artışlarının ve histogram gözlemlerinin kilitsiz iş parçacığı parçalarında kaybolmadan
+toplandığını ve dışa aktarımda doğru göründüğünü doğrular.
+
+Kullanım:
+    python -m pytest tests/test_metrics.py
+"""
+import os
+import sys
+import threading
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import MetricsRegistry
+
+
+class HistogramTest(unittest.TestCase):
+    def setUp(self):
+        self.histogram = MetricsRegistry.get_instance().histogram(
+            "test_histogram_values", "Test histogramı", buckets=(1, 10, 100))
+        self.histogram.reset()
+
+    def test_observations_from_many_threads_are_all_counted(self):
+        child = self.histogram.labels()
+
+        def observe_many():
+            for value in (0.5, 5, 50, 500) * 2500:
+                child.observe(value)
+
+        threads = [threading.Thread(target=observe_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(child.counts, [10_000] * 4)
+        self.assertEqual(child.count, 40_000)
+        self.assertAlmostEqual(child.sum, 555.5 * 10_000)
+        exported = MetricsRegistry.get_instance().to_dict()["test_histogram_values"]["samples"][0]
+        self.assertEqual(exported["buckets"], {"1.0": 10_000, "10.0": 20_000, "100.0": 30_000, "+Inf": 40_000})
+
+    def test_reset_keeps_prefetched_child_usable(self):
+        child = self.histogram.labels()
+        child.observe(5)
+        self.histogram.reset()
+        self.assertEqual((child.count, child.sum), (0, 0))
+        child.observe(5)
+        self.assertEqual(child.counts, [0, 1, 0, 0])
+
+
+class CounterTest(unittest.TestCase):
+    def setUp(self):
+        self.counter = MetricsRegistry.get_instance().counter("test_counter_values", "Test sayacı")
+        self.counter.reset()
+
+    def test_increments_from_many_threads_are_all_counted(self):
+        child = self.counter.labels()
+
+        def increment_many():
+            for _ in range(10_000):
+                child.inc()
+            child.add(2.5)
+
+        threads = [threading.Thread(target=increment_many) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(child.value, 40_010.0)
+        exported = MetricsRegistry.get_instance().to_dict()["test_counter_values"]["samples"][0]
+        self.assertEqual(exported["value"], 40_010.0)
+
+    def test_reset_keeps_prefetched_child_usable(self):
+        child = self.counter.labels()
+        child.inc()
+        self.counter.reset()
+        self.assertEqual(child.value, 0)
+        child.inc()
+        self.assertEqual(child.value, 1)
+        with self.assertRaises(ValueError):
+            child.add(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
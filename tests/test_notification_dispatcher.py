@@ -0,0 +1,77 @@
+# tests/test_notification_dispatcher.py
+"""
+Bildirim kanalının gecikme yüzdeliklerini gözlenen en büyük değerle sınırladığını ve
+durdurulduktan sonra gelen bildirimleri beklemeden teslim ettiğini doğrular.
+
+Kullanım:
+    python -m pytest tests/test_notification_dispatcher.py
+"""
+import os
+import sys
+import threading
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from notification_dispatcher import LatencyHistogram, NotificationDispatcher
+
+
+class _Order:
+    def __init__(self, order_id: str):
+        self.order_id = order_id
+
+
+class _Observer:
+    def __init__(self):
+        self.received = []
+
+    def update(self, order):
+        self.received.append(order.order_id)
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_percentiles_do_not_exceed_max(self):
+        histogram = LatencyHistogram()
+        for milliseconds in [1.0] * 98 + [40.0, 53.5]:
+            histogram.observe(milliseconds / 1000)
+        for fraction in (0.5, 0.95, 0.99, 1.0):
+            self.assertLessEqual(histogram.percentile(fraction), histogram.max_ms)
+        self.assertEqual(histogram.percentile(1.0), 53.5)
+
+    def test_percentiles_are_monotonic(self):
+        histogram = LatencyHistogram()
+        for milliseconds in range(1, 400):
+            histogram.observe(milliseconds / 1000)
+        values = [histogram.percentile(fraction / 100) for fraction in range(1, 101)]
+        self.assertEqual(values, sorted(values))
+
+
+class NotificationDispatcherStopTest(unittest.TestCase):
+    def test_submit_after_stop_delivers_synchronously(self):
+        dispatcher = NotificationDispatcher(workers=1, max_queue=1, coalesce_window=0).start()
+        dispatcher.stop()
+        observer = _Observer()
+        done = threading.Event()
+
+        def submit_many():
+            for i in range(5): # Kuyruk kapasitesinden fazla
+                dispatcher.submit(_Order(str(i)), [observer])
+            done.set()
+
+        threading.Thread(target=submit_many, daemon=True).start()
+        self.assertTrue(done.wait(5), "stop sonrasında submit beklemede kaldı")
+        self.assertEqual(observer.received, ["0", "1", "2", "3", "4"])
+        self.assertEqual(dispatcher.queue_depth, 0)
+
+    def test_stop_delivers_queued_notifications(self):
+        observer = _Observer()
+        with NotificationDispatcher(workers=2, max_queue=100, coalesce_window=0.01) as dispatcher:
+            for i in range(20):
+                dispatcher.submit(_Order(str(i)), [observer])
+        self.assertEqual(sorted(observer.received, key=int), [str(i) for i in range(20)])
+        self.assertEqual(dispatcher.metrics.delivered, 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
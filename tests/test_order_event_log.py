@@ -0,0 +1,116 @@
+# tests/test_order_event_log.py
+"""
+Olay günlüğünün açılışta yarım kalmış son kaydı kesmesini ve günlüğün ortasındaki
+bozulmalarda veri silmeden hata vermesini doğrular.
+
+Kullanım:
+    python -m pytest tests/test_order_event_log.py
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import zlib
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from order_event_log import HEADER, LEGACY_HEADER, LEGACY_MAGIC, MAGIC, OrderEventLog
+
+
+class OrderEventLogRecoveryTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="order-event-log-")
+        self.path = os.path.join(self.directory, "orders.log")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def open_log(self) -> OrderEventLog:
+        return OrderEventLog(self.directory, group_commit_interval=0, snapshot_every=0)
+
+    def write_customers(self, count: int):
+        with self.open_log() as event_log:
+            for i in range(count):
+                event_log.record_customer(Customer(f"c-{i}", f"Müşteri {i}", f"m{i}@example.com"))
+
+    def read_log(self) -> bytes:
+        with open(self.path, "rb") as f:
+            return f.read()
+
+    def write_log(self, data: bytes):
+        with open(self.path, "wb") as f:
+            f.write(data)
+
+    def record_offsets(self, data: bytes) -> list:
+        offsets, position = [], len(MAGIC)
+        while position < len(data):
+            offsets.append(position)
+            _, length, _ = HEADER.unpack_from(data, position)
+            position += HEADER.size + length
+        return offsets
+
+    def test_torn_tail_is_truncated(self):
+        self.write_customers(5)
+        data = self.read_log()
+        last = self.record_offsets(data)[-1]
+        self.write_log(data[:last + HEADER.size + 3]) # Son kaydın yükü yarım kalmış
+
+        with self.open_log() as event_log:
+            self.assertEqual(len(event_log.state.customers), 4)
+            self.assertEqual(event_log.replay_stats.truncated_bytes, HEADER.size + 3)
+        self.assertEqual(self.read_log(), data[:last])
+
+    def test_torn_tail_with_corrupted_length_is_truncated(self):
+        self.write_customers(5)
+        data = bytearray(self.read_log())
+        last = self.record_offsets(data)[-1]
+        data[last + 4] ^= 0xFF # Son kaydın uzunluk alanı
+        self.write_log(bytes(data))
+
+        with self.open_log() as event_log:
+            self.assertEqual(len(event_log.state.customers), 4)
+        self.assertEqual(len(self.read_log()), last)
+
+    def test_mid_log_length_corruption_raises_without_truncating(self):
+        self.write_customers(5)
+        data = bytearray(self.read_log())
+        data[len(MAGIC) + 4] ^= 0x01 # İlk kaydın uzunluk alanı
+        self.write_log(bytes(data))
+
+        with self.assertRaises(ValueError):
+            self.open_log()
+        self.assertEqual(self.read_log(), bytes(data))
+
+    def test_mid_log_payload_corruption_raises_without_truncating(self):
+        self.write_customers(5)
+        data = bytearray(self.read_log())
+        second = self.record_offsets(data)[1]
+        data[second + HEADER.size + 2] ^= 0x20 # İkinci kaydın yükü
+        self.write_log(bytes(data))
+
+        with self.assertRaises(ValueError):
+            self.open_log()
+        self.assertEqual(self.read_log(), bytes(data))
+
+    def test_legacy_log_is_converted(self):
+        payloads = [f'["c-{i}", "Müşteri {i}", "m{i}@example.com"]'.encode() for i in range(3)]
+        legacy = bytearray(LEGACY_MAGIC)
+        for payload in payloads:
+            legacy += LEGACY_HEADER.pack(len(payload), zlib.crc32(payload), 1) + payload
+        self.write_log(bytes(legacy))
+
+        with self.open_log() as event_log:
+            self.assertEqual(sorted(event_log.state.customers), ["c-0", "c-1", "c-2"])
+            event_log.record_customer(Customer("c-3", "Müşteri 3", "m3@example.com"))
+        data = self.read_log()
+        self.assertTrue(data.startswith(MAGIC))
+        self.assertEqual(self.record_offsets(data)[-1], len(legacy)) # Konumlar korunur
+        with self.open_log() as event_log:
+            self.assertEqual(len(event_log.state.customers), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
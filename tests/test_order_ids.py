@@ -0,0 +1,36 @@
+# tests/test_order_ids.py
+"""
+CounterIdGenerator'ın '-' içeren makine adlarını düğüm adı olarak kullanılabilir hale
+getirdiğini, açıkça verilen geçersiz düğüm adlarını ise reddettiğini doğrular.
+
+Kullanım:
+    python -m pytest tests/test_order_ids.py
+"""
+import os
+import socket
+import sys
+import unittest
+from unittest import mock
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order_ids import CounterIdGenerator
+
+
+class CounterIdGeneratorTest(unittest.TestCase):
+    def test_default_node_replaces_dashes_in_hostname(self):
+        with mock.patch.object(socket, "gethostname", return_value="web-01-prod"):
+            generator = CounterIdGenerator()
+        self.assertEqual(generator.node, "web_01_prod")
+        self.assertTrue(generator().startswith("web_01_prod-"))
+
+    def test_explicit_node_with_dash_is_rejected(self):
+        with self.assertRaises(ValueError):
+            CounterIdGenerator("web-01")
+        with self.assertRaises(ValueError):
+            CounterIdGenerator("")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# tests/test_order_restore.py
+"""
+register_order_type ile eklenen sipariş türlerinin SQLite deposundan ve olay günlüğünden
+geri yüklenebildiğini, kayıtsız türlerin kaydedilirken reddedildiğini ve bilinmeyen türdeki
+kayıtların açılışı durdurmadığını doğrular.
+
+Kullanım:
+    python -m pytest tests/test_order_restore.py
+"""
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from inventorymanager import InventoryManager
+from order import Order
+from order_event_log import OrderEventLog
+from order_factory import OrderFactory
+from product import PhysicalProduct
+from sqlite_repository import SQLiteRepository
+
+PRODUCT_ID = 94101
+
+
+class RushOrder(Order):
+    __slots__ = ()
+
+    def get_type(self) -> str:
+        return "Rush"
+
+
+class UnregisteredOrder(Order):
+    __slots__ = ()
+
+    def get_type(self) -> str:
+        return "Unregistered"
+
+
+class OrderRestoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="order-restore-")
+        self.inventory = InventoryManager.get_instance()
+        if self.inventory.get_product(PRODUCT_ID) is None:
+            self.inventory.add_product(PhysicalProduct(PRODUCT_ID, "Test Kalemi", "Kırtasiye", 12.5, 10**6), verbose=False)
+        self.product = self.inventory.get_product(PRODUCT_ID)
+        self.customer = Customer("rush-c", "Test Müşteri", "rush@example.com")
+        OrderFactory.register_order_type("rush", RushOrder)
+
+    def tearDown(self):
+        OrderFactory.unregister_order_type("rush")
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_plugin_order_type_survives_event_log_reload(self):
+        order = OrderFactory.create_order("rush", self.customer, [(self.product, 2)])
+        with OrderEventLog(self.directory, group_commit_interval=0, snapshot_every=0) as event_log:
+            event_log.record_order(order)
+        with OrderEventLog(self.directory, group_commit_interval=0, snapshot_every=0) as event_log:
+            _, components = event_log.state.materialize(self.inventory)
+        self.assertEqual(len(components), 1)
+        self.assertIs(type(components[0].order), RushOrder)
+        self.assertEqual(components[0].order.total, order.total)
+
+    def test_plugin_order_type_survives_sqlite_reload(self):
+        order = OrderFactory.create_order("rush", self.customer, [(self.product, 2)])
+        repository = SQLiteRepository(os.path.join(self.directory, "shop.db"))
+        repository.save_customers([self.customer])
+        repository.save_orders([order])
+        components = repository.load_orders(repository.load_customers(), self.inventory)
+        repository.close()
+        self.assertEqual([type(component.order) for component in components], [RushOrder])
+
+    def test_unregistered_order_type_is_rejected_at_record_time(self):
+        order = UnregisteredOrder("u-1", self.customer, [(self.product, 1)])
+        with OrderEventLog(self.directory, group_commit_interval=0, snapshot_every=0) as event_log:
+            with self.assertRaises(ValueError):
+                event_log.record_order(order)
+            self.assertNotIn("u-1", event_log.state.orders)
+        repository = SQLiteRepository(os.path.join(self.directory, "shop.db"))
+        with self.assertRaises(ValueError):
+            repository.save_orders([order])
+        repository.close()
+
+    def test_unknown_order_type_is_skipped_on_load(self):
+        repository = SQLiteRepository(os.path.join(self.directory, "shop.db"))
+        repository.save_customers([self.customer])
+        repository.save_orders([OrderFactory.create_order("standard", self.customer, [(self.product, 1)])])
+        with repository.connection:
+            repository.connection.execute("UPDATE orders SET order_type = 'Ghost'")
+        components = repository.load_orders(repository.load_customers(), self.inventory)
+        repository.close()
+        self.assertEqual(components, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# tests/test_order_status.py
+"""
+Sipariş durum geçiş tablosunun izinsiz geçişleri reddettiğini ve toplu durum değişikliğinde
+her müşterinin, bildirim kanalı ayarlı olsa da olmasa da, tek bir bildirim aldığını doğrular.
+
+Kullanım:
+    python -m pytest tests/test_order_status.py
+"""
+import os
+import sys
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from customer import Customer
+from notification_dispatcher import NotificationDispatcher
+from order import ALLOWED_TRANSITIONS, Order, OrderStatus, check_transition
+from order_subject import OrderSubject
+from product import PhysicalProduct
+
+
+class _CountingCustomer(Customer):
+    def __init__(self, customer_id: str):
+        super().__init__(customer_id, "Test Müşteri", f"{customer_id}@example.com")
+        self.notifications = 0
+        self.notified_orders = []
+
+    def update(self, order):
+        self.notifications += 1
+        self.notified_orders.append(order.order_id)
+
+    def update_many(self, orders):
+        self.notifications += 1
+        self.notified_orders.extend(order.order_id for order in orders)
+
+
+class TransitionTableTest(unittest.TestCase):
+    def test_every_status_has_an_entry(self):
+        self.assertEqual(set(ALLOWED_TRANSITIONS), set(OrderStatus))
+
+    def test_terminal_status_rejects_transition(self):
+        with self.assertRaises(ValueError):
+            check_transition(OrderStatus.CANCELLED, OrderStatus.PREPARING)
+        check_transition(OrderStatus.SHIPPED, OrderStatus.DELIVERED)
+
+    def test_update_status_keeps_status_on_rejection(self):
+        order = Order("status-1", _CountingCustomer("status-c0"), [])
+        with self.assertRaises(ValueError):
+            order.update_status(OrderStatus.DELIVERED)
+        self.assertIs(order.status, OrderStatus.PREPARING)
+
+
+class BulkUpdateStatusTest(unittest.TestCase):
+    def setUp(self):
+        product = PhysicalProduct(94301, "Test Defteri", "Kırtasiye", 5.0, 10)
+        self.customers = [_CountingCustomer(f"bulk-c{i}") for i in range(3)]
+        self.orders = [Order(f"bulk-{i}", self.customers[i % 3], [(product, 1)]) for i in range(12)]
+        self.orders[0].status = OrderStatus.CANCELLED # Son durumdaki sipariş reddedilmelidir
+
+    def tearDown(self):
+        OrderSubject.set_dispatcher(None)
+
+    def _assert_one_notification_per_customer(self):
+        changed, rejected = Order.bulk_update_status(self.orders, OrderStatus.SHIPPED)
+        self.assertEqual(len(changed), 11)
+        self.assertEqual(list(rejected), ["bulk-0"])
+        self.assertIs(self.orders[0].status, OrderStatus.CANCELLED)
+        return changed
+
+    def test_sync_delivery_groups_per_customer(self):
+        self._assert_one_notification_per_customer()
+        for customer in self.customers:
+            self.assertEqual(customer.notifications, 1)
+        self.assertEqual(len(self.customers[0].notified_orders), 3)
+
+    def test_dispatcher_delivers_one_grouped_notification_per_customer(self):
+        dispatcher = NotificationDispatcher(workers=2, coalesce_window=0).start()
+        OrderSubject.set_dispatcher(dispatcher)
+        try:
+            self._assert_one_notification_per_customer()
+        finally:
+            dispatcher.stop()
+        for customer in self.customers:
+            self.assertEqual(customer.notifications, 1)
+        self.assertEqual(sorted(self.customers[1].notified_orders), ["bulk-1", "bulk-10", "bulk-4", "bulk-7"])
+        self.assertEqual(dispatcher.metrics.submitted, 3)
+        self.assertEqual(dispatcher.metrics.delivered, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+# tests/test_product_store.py
+"""
+Sütunlu ürün deposunda isim ve link güncellemelerinin metin bloğunu sınırsız büyütmediğini
+ve sıkıştırmadan sonra tüm metinlerin doğru okunduğunu doğrular.
+
+Kullanım:
+    python -m pytest tests/test_product_store.py
+"""
+import os
+import sys
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from product import DigitalProduct, PhysicalProduct
+from product_store import ColumnarProductStore
+
+
+class ColumnarTextTest(unittest.TestCase):
+    def setUp(self):
+        self.store = ColumnarProductStore()
+        for product_id in range(100):
+            if product_id % 2:
+                self.store[product_id] = DigitalProduct(product_id, f"E-Kitap {product_id}", "Kitap", 20.0,
+                                                        f"https://example.com/{product_id}")
+            else:
+                self.store[product_id] = PhysicalProduct(product_id, f"Defter {product_id}", "Kırtasiye", 10.0, 5)
+        self.initial_size = len(self.store._text)
+
+    def test_shorter_text_is_overwritten_in_place(self):
+        view = self.store[1]
+        view.name = "Kısa"
+        view.download_link = "https://e.co/1"
+        self.assertEqual(len(self.store._text), self.initial_size)
+        self.assertEqual((view.name, view.download_link), ("Kısa", "https://e.co/1"))
+
+    def test_repeated_renames_keep_text_block_bounded(self):
+        for step in range(20_000):
+            view = self.store[step % 100]
+            view.name = f"Yeniden adlandırılmış ürün {step}"
+            if step % 2:
+                view.download_link = f"https://example.com/indir/{step}"
+        self.assertLess(len(self.store._text), 4 * self.initial_size + 8192)
+        for product_id in range(100):
+            step = 19_900 + product_id
+            self.assertEqual(self.store[product_id].name, f"Yeniden adlandırılmış ürün {step}")
+            if product_id % 2:
+                self.assertEqual(self.store[product_id].download_link, f"https://example.com/indir/{step}")
+
+    def test_overwrite_and_delete_churn_keeps_text_block_bounded(self):
+        for step in range(20_000):
+            product_id = step % 10
+            self.store[product_id] = DigitalProduct(product_id, f"Yeniden eklenen ürün {step}", "Kitap", 20.0,
+                                                    f"https://example.com/yeni/{step}")
+            del self.store[50 + step % 10]
+            self.store[50 + step % 10] = PhysicalProduct(50 + step % 10, f"Geri gelen ürün {step}", "Kırtasiye", 1.0, 1)
+        self.assertLess(len(self.store._text), 4 * self.initial_size + 8192)
+        self.assertEqual(len(self.store), 100)
+        for product_id in range(10):
+            step = 19_990 + product_id
+            self.assertEqual(self.store[product_id].name, f"Yeniden eklenen ürün {step}")
+            self.assertEqual(self.store[product_id].download_link, f"https://example.com/yeni/{step}")
+            self.assertEqual(self.store[50 + product_id].name, f"Geri gelen ürün {step}")
+        self.assertEqual(self.store[99].name, "E-Kitap 99")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+# tests/test_sharded_inventory.py
+"""
+Bir bölüm toplu işi işleyemediğinde o bölümün isteklerinin reddedildiğini, diğer bölümlerde
+hazırlanan rezervasyonların bırakıldığını ve diğer bölümlerin sonuçlarının korunduğunu; tek bir
+istekte beklenmeyen hata çıktığında yalnızca o isteğin reddedildiğini doğrular.
+
+Kullanım:
+    python -m pytest tests/test_sharded_inventory.py
+"""
+import os
+import sys
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from order import Order
+from order_factory import OrderFactory
+from product import PhysicalProduct
+from sharded_inventory import OrderRequest, ShardedInventory
+
+
+class ExplodingOrder(Order):
+    __slots__ = ()
+
+    def __init__(self, order_id, customer, products):
+        raise RuntimeError("beklenmeyen hata")
+
+
+def request(lines, order_type: str = "standard", **kwargs) -> OrderRequest:
+    return OrderRequest("c-1", "Test Müşteri", "test@example.com", order_type, lines, kwargs)
+
+
+class ShardErrorTest(unittest.TestCase):
+    def setUp(self):
+        self.inventory = ShardedInventory(shard_count=2, start_method="fork")
+        self.inventory.load_products([PhysicalProduct(product_id, f"Ürün {product_id}", "Kırtasiye", 10.0, 100)
+                                      for product_id in (10, 11, 12, 13)])
+
+    def tearDown(self):
+        self.inventory.close()
+
+    def test_failing_shard_rejects_its_requests_and_aborts_the_others(self):
+        requests = [
+            request([(10, 1)], callback=lambda: None), # Bölüm 0'a kopyalanamayan istek: tüm toplu iş başarısız
+            request([(11, 2)]), # Bölüm 1'de tek bölümlü
+            request([(12, 3), (13, 4)]), # Bölüm 0 ve 1'de iki aşamalı
+        ]
+        results = self.inventory.place_orders(requests)
+
+        self.assertTrue(results[0].error.startswith("shard_error: bölüm 0"))
+        self.assertTrue(results[1].ok)
+        self.assertTrue(results[2].error.startswith("shard_error: bölüm 0"))
+        self.assertEqual([self.inventory.get_available_stock(product_id) for product_id in (10, 11, 12, 13)],
+                         [100, 98, 100, 100]) # Bölüm 1'de hazırlanan 13 rezervasyonu bırakıldı
+        self.assertEqual([stats["prepared"] for stats in self.inventory.stats()], [0, 0])
+
+        retry = self.inventory.place_orders([request([(12, 3), (13, 4)])])
+        self.assertTrue(retry[0].ok)
+        self.assertEqual(self.inventory.get_available_stock(13), 96)
+
+
+class RequestErrorTest(unittest.TestCase):
+    def setUp(self):
+        OrderFactory.register_order_type("exploding", ExplodingOrder) # fork ile işçilere de geçer
+        self.inventory = ShardedInventory(shard_count=2, start_method="fork")
+        self.inventory.load_products([PhysicalProduct(product_id, f"Ürün {product_id}", "Kırtasiye", 10.0, 100)
+                                      for product_id in (10, 12)])
+
+    def tearDown(self):
+        self.inventory.close()
+        OrderFactory.unregister_order_type("exploding")
+
+    def test_unexpected_error_rejects_only_that_request(self):
+        results = self.inventory.place_orders([
+            request([(10, 1)]),
+            request([(12, 5)], order_type="exploding"),
+            request([(12, 2)]),
+        ])
+
+        self.assertTrue(results[0].ok)
+        self.assertEqual(results[1].error, "shard_error: RuntimeError: beklenmeyen hata")
+        self.assertTrue(results[2].ok)
+        self.assertEqual([self.inventory.get_available_stock(product_id) for product_id in (10, 12)], [99, 98])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+# tests/test_table_renderer.py
+"""
+Satır önbelleğinin eşzamanlı okuma ve eklemelerde kapasiteyi aşmadığını, hata vermediğini ve
+isabet/ıska sayılarını kaybetmediğini doğrular.
+
+Kullanım:
+    python -m pytest tests/test_table_renderer.py
+"""
+import os
+import sys
+import threading
+import unittest
+
+# Proje kök dizinindeki modülleri import edebilmek için
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from table_renderer import RenderCache
+
+
+class RenderCacheTest(unittest.TestCase):
+    def test_concurrent_gets_respect_capacity(self):
+        cache = RenderCache(str, capacity=8)
+        errors = []
+
+        def render_many(offset: int):
+            try:
+                for i in range(50000):
+                    key = (i * 7 + offset) % 32
+                    self.assertEqual(cache.get(key, 1, key), str(key))
+            except Exception as e: # İş parçacığındaki hata ana iş parçacığında raporlanır
+                errors.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6) # İş parçacıklarının get içinde sık sık yer değiştirmesi için
+        try:
+            threads = [threading.Thread(target=render_many, args=(offset,)) for offset in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(cache), 8)
+        self.assertEqual(cache.hits + cache.misses, 200_000)
+
+
+if __name__ == "__main__":
+    unittest.main()